@@ -5,14 +5,26 @@ from keryxflow.aegis.guardrails import (
     GuardrailCheckResult,
     GuardrailEnforcer,
     GuardrailViolation,
+    PortfolioSnapshot,
     TradingGuardrails,
     get_guardrail_enforcer,
     get_guardrails,
 )
+from keryxflow.aegis.metrics import (
+    DrawdownStats,
+    EquityWindow,
+    drawdown_series,
+    rolling_calmar,
+    rolling_sharpe,
+    rolling_sortino,
+    summarize_drawdown,
+    underwater_curve,
+)
 from keryxflow.aegis.portfolio import PortfolioState, PositionState, create_portfolio_state
 from keryxflow.aegis.profiles import get_risk_profile
 from keryxflow.aegis.quant import QuantEngine, get_quant_engine
-from keryxflow.aegis.risk import RiskManager, get_risk_manager
+from keryxflow.aegis.risk import ApprovalResult, OrderRequest, RiskManager, get_risk_manager
+from keryxflow.aegis.stops import StopBook, StopLevels, StopTrigger
 from keryxflow.aegis.trailing import (
     TrailingStopManager,
     TrailingStopState,
@@ -27,9 +39,19 @@ __all__ = [
     "GuardrailCheckResult",
     "GuardrailEnforcer",
     "GuardrailViolation",
+    "PortfolioSnapshot",
     "TradingGuardrails",
     "get_guardrail_enforcer",
     "get_guardrails",
+    # Metrics
+    "DrawdownStats",
+    "EquityWindow",
+    "drawdown_series",
+    "rolling_calmar",
+    "rolling_sharpe",
+    "rolling_sortino",
+    "summarize_drawdown",
+    "underwater_curve",
     # Portfolio
     "PortfolioState",
     "PositionState",
@@ -40,8 +62,14 @@ __all__ = [
     "QuantEngine",
     "get_quant_engine",
     # Risk
+    "ApprovalResult",
+    "OrderRequest",
     "RiskManager",
     "get_risk_manager",
+    # Stops
+    "StopBook",
+    "StopLevels",
+    "StopTrigger",
     # Trailing stop
     "TrailingStopManager",
     "TrailingStopState",
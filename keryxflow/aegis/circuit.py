@@ -1,10 +1,11 @@
 """Circuit breaker for automatic trading shutdown."""
 
 from dataclasses import dataclass, field
-from datetime import UTC, datetime, timedelta
+from datetime import datetime, timedelta
 from enum import Enum
 from typing import Any
 
+from keryxflow.core.clock import Clock
 from keryxflow.core.events import EventType, get_event_bus, system_event
 from keryxflow.core.logging import get_logger
 
@@ -93,6 +94,9 @@ class CircuitBreaker:
     daily_starting_balance: float = 0.0
     last_reset_date: str = ""
 
+    # Time source for cooldowns, loss windows and daily resets
+    clock: Clock = field(default_factory=Clock, repr=False)
+
     def __post_init__(self):
         """Initialize event bus."""
         self.event_bus = get_event_bus()
@@ -163,7 +167,7 @@ class CircuitBreaker:
 
     def _record_loss(self, loss_pct: float) -> None:
         """Record a loss for rapid loss tracking."""
-        now = datetime.now(UTC)
+        now = self.clock.now()
         self.recent_losses.append((now, loss_pct))
 
         # Clean old losses outside window
@@ -172,7 +176,7 @@ class CircuitBreaker:
 
     def _check_daily_reset(self) -> None:
         """Check if daily tracking needs reset."""
-        today = datetime.now(UTC).strftime("%Y-%m-%d")
+        today = self.clock.now().strftime("%Y-%m-%d")
         if self.last_reset_date != today:
             self.daily_starting_balance = self.current_balance
             self.last_reset_date = today
@@ -237,7 +241,7 @@ class CircuitBreaker:
 
         self.state = CircuitState.OPEN
         self.trip_reason = reason
-        self.trip_time = datetime.now(UTC)
+        self.trip_time = self.clock.now()
 
         event = TripEvent(
             timestamp=self.trip_time,
@@ -305,8 +309,9 @@ class CircuitBreaker:
         # Check cooldown
         if not force and self.trip_time:
             cooldown_end = self.trip_time + timedelta(minutes=self.config.cooldown_minutes)
-            if datetime.now(UTC) < cooldown_end:
-                remaining = (cooldown_end - datetime.now(UTC)).seconds // 60
+            now = self.clock.now()
+            if now < cooldown_end:
+                remaining = (cooldown_end - now).seconds // 60
                 logger.warning("circuit_breaker_cooldown", minutes_remaining=remaining)
                 return False
 
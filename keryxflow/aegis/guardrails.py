@@ -100,6 +100,49 @@ def get_guardrails() -> TradingGuardrails:
     return _guardrails
 
 
+@dataclass
+class PortfolioSnapshot:
+    """
+    Point-in-time copy of the portfolio figures that guardrails read.
+
+    Aggregates such as total exposure are summed over positions once, when
+    the snapshot is taken, so a batch of orders can be validated without
+    recomputing them. ``reserve()`` books an approved order into the
+    snapshot so later orders in the batch see the combined exposure.
+    """
+
+    total_value: Decimal
+    cash_available: Decimal
+    total_exposure: Decimal
+    total_risk_at_stop: Decimal
+    daily_pnl: Decimal
+    daily_starting_value: Decimal
+    weekly_pnl: Decimal
+    weekly_starting_value: Decimal
+    consecutive_losses: int
+    trades_today: int
+    trades_this_hour: int
+    allowed_symbols: tuple[str, ...]
+
+    def reserve(self, quantity: float, entry_price: float, stop_loss: float | None) -> None:
+        """
+        Account for an approved order as if it had been filled.
+
+        Args:
+            quantity: Order quantity
+            entry_price: Entry price
+            stop_loss: Stop loss price
+        """
+        position_value = Decimal(str(quantity)) * Decimal(str(entry_price))
+        self.total_exposure += position_value
+        self.cash_available -= position_value
+        if stop_loss is not None:
+            risk_per_unit = abs(Decimal(str(entry_price)) - Decimal(str(stop_loss)))
+            self.total_risk_at_stop += risk_per_unit * Decimal(str(quantity))
+        self.trades_today += 1
+        self.trades_this_hour += 1
+
+
 @dataclass
 class GuardrailCheckResult:
     """Result of a guardrail check."""
@@ -132,6 +175,35 @@ class GuardrailEnforcer:
         """
         self.guardrails = guardrails or get_guardrails()
 
+    def snapshot(self, portfolio: "PortfolioState") -> PortfolioSnapshot:
+        """
+        Capture the portfolio figures and allowed symbols for validation.
+
+        Args:
+            portfolio: Current portfolio state
+
+        Returns:
+            PortfolioSnapshot to pass to validate_order()
+        """
+        from keryxflow.config import get_settings
+
+        # Use settings symbols, fallback to hardcoded
+        allowed_symbols = tuple(get_settings().system.symbols) or self.guardrails.ALLOWED_SYMBOLS
+        return PortfolioSnapshot(
+            total_value=portfolio.total_value,
+            cash_available=portfolio.cash_available,
+            total_exposure=portfolio.total_exposure,
+            total_risk_at_stop=portfolio.total_risk_at_stop,
+            daily_pnl=portfolio.daily_pnl,
+            daily_starting_value=portfolio.daily_starting_value,
+            weekly_pnl=portfolio.weekly_pnl,
+            weekly_starting_value=portfolio.weekly_starting_value,
+            consecutive_losses=portfolio.consecutive_losses,
+            trades_today=portfolio.trades_today,
+            trades_this_hour=portfolio.trades_this_hour,
+            allowed_symbols=allowed_symbols,
+        )
+
     def validate_order(
         self,
         symbol: str,
@@ -139,7 +211,8 @@ class GuardrailEnforcer:
         quantity: float,
         entry_price: float,
         stop_loss: float | None,
-        portfolio: "PortfolioState",
+        portfolio: "PortfolioState | None" = None,
+        snapshot: PortfolioSnapshot | None = None,
     ) -> GuardrailCheckResult:
         """
         Validate an order against all guardrails.
@@ -151,17 +224,21 @@ class GuardrailEnforcer:
             entry_price: Entry price
             stop_loss: Stop loss price
             portfolio: Current portfolio state
+            snapshot: Pre-computed snapshot to validate against instead of
+                ``portfolio`` (used when validating a batch)
 
         Returns:
             GuardrailCheckResult with allowed status and any violation details
         """
-        from keryxflow.config import get_settings
+        if snapshot is None:
+            if portfolio is None:
+                raise ValueError("validate_order requires a portfolio or a snapshot")
+            snapshot = self.snapshot(portfolio)
 
         g = self.guardrails
-        settings = get_settings()
 
-        # Check symbol allowed (use settings symbols, fallback to hardcoded)
-        allowed_symbols = tuple(settings.system.symbols) or g.ALLOWED_SYMBOLS
+        # Check symbol allowed
+        allowed_symbols = snapshot.allowed_symbols
         if symbol not in allowed_symbols:
             return GuardrailCheckResult(
                 allowed=False,
@@ -179,7 +256,7 @@ class GuardrailEnforcer:
 
         # Calculate position value
         position_value = Decimal(str(quantity)) * Decimal(str(entry_price))
-        total_value = portfolio.total_value
+        total_value = snapshot.total_value
 
         if total_value <= 0:
             return GuardrailCheckResult(
@@ -203,7 +280,7 @@ class GuardrailEnforcer:
             )
 
         # Check total exposure
-        new_exposure = portfolio.total_exposure + position_value
+        new_exposure = snapshot.total_exposure + position_value
         exposure_pct = new_exposure / total_value
         if exposure_pct > g.MAX_TOTAL_EXPOSURE_PCT:
             return GuardrailCheckResult(
@@ -211,7 +288,7 @@ class GuardrailEnforcer:
                 violation=GuardrailViolation.TOTAL_EXPOSURE_EXCEEDED,
                 message=f"Total exposure {exposure_pct:.1%} would exceed max {g.MAX_TOTAL_EXPOSURE_PCT:.1%}",
                 details={
-                    "current_exposure": float(portfolio.total_exposure),
+                    "current_exposure": float(snapshot.total_exposure),
                     "new_exposure": float(new_exposure),
                     "exposure_pct": float(exposure_pct),
                     "max_pct": float(g.MAX_TOTAL_EXPOSURE_PCT),
@@ -219,7 +296,7 @@ class GuardrailEnforcer:
             )
 
         # Check cash reserve
-        remaining_cash = portfolio.cash_available - position_value
+        remaining_cash = snapshot.cash_available - position_value
         reserve_pct = remaining_cash / total_value
         if reserve_pct < g.MIN_CASH_RESERVE_PCT:
             return GuardrailCheckResult(
@@ -252,7 +329,7 @@ class GuardrailEnforcer:
                 )
 
             # Check aggregate risk (Issue #9 fix)
-            new_total_risk = portfolio.total_risk_at_stop + trade_risk
+            new_total_risk = snapshot.total_risk_at_stop + trade_risk
             new_total_risk_pct = new_total_risk / total_value
 
             if new_total_risk_pct > g.MAX_DAILY_LOSS_PCT:
@@ -261,7 +338,7 @@ class GuardrailEnforcer:
                     violation=GuardrailViolation.DAILY_LOSS_EXCEEDED,
                     message=f"Aggregate risk {new_total_risk_pct:.1%} would exceed daily limit {g.MAX_DAILY_LOSS_PCT:.1%}",
                     details={
-                        "current_risk": float(portfolio.total_risk_at_stop),
+                        "current_risk": float(snapshot.total_risk_at_stop),
                         "new_trade_risk": float(trade_risk),
                         "total_risk": float(new_total_risk),
                         "total_risk_pct": float(new_total_risk_pct),
@@ -270,66 +347,66 @@ class GuardrailEnforcer:
                 )
 
         # Check daily loss
-        if portfolio.daily_pnl < 0:
-            daily_loss_pct = abs(portfolio.daily_pnl) / portfolio.daily_starting_value
+        if snapshot.daily_pnl < 0:
+            daily_loss_pct = abs(snapshot.daily_pnl) / snapshot.daily_starting_value
             if Decimal(str(daily_loss_pct)) >= g.MAX_DAILY_LOSS_PCT:
                 return GuardrailCheckResult(
                     allowed=False,
                     violation=GuardrailViolation.DAILY_LOSS_EXCEEDED,
                     message=f"Daily loss {daily_loss_pct:.1%} has reached limit {g.MAX_DAILY_LOSS_PCT:.1%}",
                     details={
-                        "daily_pnl": float(portfolio.daily_pnl),
+                        "daily_pnl": float(snapshot.daily_pnl),
                         "daily_loss_pct": float(daily_loss_pct),
                         "max_pct": float(g.MAX_DAILY_LOSS_PCT),
                     },
                 )
 
         # Check weekly loss
-        if portfolio.weekly_pnl < 0:
-            weekly_loss_pct = abs(portfolio.weekly_pnl) / portfolio.weekly_starting_value
+        if snapshot.weekly_pnl < 0:
+            weekly_loss_pct = abs(snapshot.weekly_pnl) / snapshot.weekly_starting_value
             if Decimal(str(weekly_loss_pct)) >= g.MAX_WEEKLY_LOSS_PCT:
                 return GuardrailCheckResult(
                     allowed=False,
                     violation=GuardrailViolation.WEEKLY_LOSS_EXCEEDED,
                     message=f"Weekly loss {weekly_loss_pct:.1%} has reached limit {g.MAX_WEEKLY_LOSS_PCT:.1%}",
                     details={
-                        "weekly_pnl": float(portfolio.weekly_pnl),
+                        "weekly_pnl": float(snapshot.weekly_pnl),
                         "weekly_loss_pct": float(weekly_loss_pct),
                         "max_pct": float(g.MAX_WEEKLY_LOSS_PCT),
                     },
                 )
 
         # Check consecutive losses
-        if portfolio.consecutive_losses >= g.CONSECUTIVE_LOSSES_HALT:
+        if snapshot.consecutive_losses >= g.CONSECUTIVE_LOSSES_HALT:
             return GuardrailCheckResult(
                 allowed=False,
                 violation=GuardrailViolation.CONSECUTIVE_LOSSES_HALT,
-                message=f"Trading halted after {portfolio.consecutive_losses} consecutive losses",
+                message=f"Trading halted after {snapshot.consecutive_losses} consecutive losses",
                 details={
-                    "consecutive_losses": portfolio.consecutive_losses,
+                    "consecutive_losses": snapshot.consecutive_losses,
                     "limit": g.CONSECUTIVE_LOSSES_HALT,
                 },
             )
 
         # Check trade rate limits
-        if portfolio.trades_today >= g.MAX_TRADES_PER_DAY:
+        if snapshot.trades_today >= g.MAX_TRADES_PER_DAY:
             return GuardrailCheckResult(
                 allowed=False,
                 violation=GuardrailViolation.TRADE_RATE_EXCEEDED,
-                message=f"Daily trade limit reached: {portfolio.trades_today}/{g.MAX_TRADES_PER_DAY}",
+                message=f"Daily trade limit reached: {snapshot.trades_today}/{g.MAX_TRADES_PER_DAY}",
                 details={
-                    "trades_today": portfolio.trades_today,
+                    "trades_today": snapshot.trades_today,
                     "max_trades": g.MAX_TRADES_PER_DAY,
                 },
             )
 
-        if portfolio.trades_this_hour >= g.MAX_TRADES_PER_HOUR:
+        if snapshot.trades_this_hour >= g.MAX_TRADES_PER_HOUR:
             return GuardrailCheckResult(
                 allowed=False,
                 violation=GuardrailViolation.TRADE_RATE_EXCEEDED,
-                message=f"Hourly trade limit reached: {portfolio.trades_this_hour}/{g.MAX_TRADES_PER_HOUR}",
+                message=f"Hourly trade limit reached: {snapshot.trades_this_hour}/{g.MAX_TRADES_PER_HOUR}",
                 details={
-                    "trades_this_hour": portfolio.trades_this_hour,
+                    "trades_this_hour": snapshot.trades_this_hour,
                     "max_trades": g.MAX_TRADES_PER_HOUR,
                 },
             )
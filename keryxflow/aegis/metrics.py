@@ -0,0 +1,342 @@
+"""Vectorized performance metrics over equity curves.
+
+All functions accept any array-like of equity values (lists, NumPy arrays,
+or ``EquityCurve``) and avoid Python-level loops, so they scale to curves
+with tens of millions of points. Rolling metrics return arrays aligned with
+their input, padded with NaN until the window is full.
+"""
+
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+# Upper bound on temporary elements when evaluating windowed drawdowns
+_CHUNK_ELEMENTS = 4_000_000
+
+
+@dataclass
+class DrawdownStats:
+    """Summary of drawdown behaviour for an equity curve."""
+
+    current_drawdown: float  # as decimal
+    max_drawdown: float  # as decimal
+    max_duration: int  # longest run of periods below the running peak
+    current_duration: int  # periods since the last peak (0 if at a peak)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            "current_drawdown": self.current_drawdown,
+            "max_drawdown": self.max_drawdown,
+            "max_duration": self.max_duration,
+            "current_duration": self.current_duration,
+        }
+
+
+def as_array(values: Any) -> np.ndarray:
+    """Get a float64 view of array-like values, copying only if required."""
+    return np.asarray(values, dtype=np.float64)
+
+
+def simple_returns(equity: Any) -> np.ndarray:
+    """
+    Calculate period-over-period returns.
+
+    Args:
+        equity: Equity values over time
+
+    Returns:
+        Array of length len(equity) - 1
+    """
+    eq = as_array(equity)
+    if len(eq) < 2:
+        return np.empty(0, dtype=np.float64)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.diff(eq) / eq[:-1]
+
+
+def drawdown_series(equity: Any) -> np.ndarray:
+    """
+    Calculate drawdown from the running peak at every period.
+
+    Args:
+        equity: Equity values over time
+
+    Returns:
+        Drawdown as decimals in [0, 1]; negative equity counts as total loss
+    """
+    eq = as_array(equity)
+    if len(eq) == 0:
+        return np.empty(0, dtype=np.float64)
+
+    peak = np.maximum.accumulate(eq)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        drawdown = (peak - eq) / peak
+    np.clip(drawdown, 0.0, 1.0, out=drawdown)
+    return np.nan_to_num(drawdown, copy=False, nan=0.0, posinf=1.0, neginf=0.0)
+
+
+def underwater_curve(equity: Any) -> np.ndarray:
+    """
+    Calculate the underwater curve (equity relative to its running peak).
+
+    Args:
+        equity: Equity values over time
+
+    Returns:
+        Values in [-1, 0]; 0 at new highs
+    """
+    return -drawdown_series(equity)
+
+
+def drawdown_runs(equity: Any) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Find every drawdown period using run-length encoding.
+
+    A period is in drawdown when equity is strictly below its running peak.
+
+    Args:
+        equity: Equity values over time
+
+    Returns:
+        Tuple of (start_indices, lengths), one entry per drawdown run
+    """
+    eq = as_array(equity)
+    if len(eq) == 0:
+        empty = np.empty(0, dtype=np.int64)
+        return empty, empty
+
+    in_dd = eq < np.maximum.accumulate(eq)
+    # +1 marks a run start, -1 marks the period after a run ends
+    edges = np.diff(np.concatenate(([0], in_dd.view(np.int8), [0])))
+    starts = np.flatnonzero(edges == 1)
+    ends = np.flatnonzero(edges == -1)
+    return starts, ends - starts
+
+
+def summarize_drawdown(equity: Any) -> DrawdownStats:
+    """
+    Calculate drawdown depth and duration statistics.
+
+    Args:
+        equity: Equity values over time
+
+    Returns:
+        DrawdownStats for the curve
+    """
+    eq = as_array(equity)
+    if len(eq) == 0:
+        return DrawdownStats(0.0, 0.0, 0, 0)
+
+    drawdown = drawdown_series(eq)
+    starts, lengths = drawdown_runs(eq)
+
+    current_duration = 0
+    if len(starts) and starts[-1] + lengths[-1] == len(eq):
+        current_duration = int(lengths[-1])
+
+    return DrawdownStats(
+        current_drawdown=float(drawdown[-1]),
+        max_drawdown=float(drawdown.max()),
+        max_duration=int(lengths.max()) if len(lengths) else 0,
+        current_duration=current_duration,
+    )
+
+
+def _rolling_sum(values: np.ndarray, window: int) -> np.ndarray:
+    """Sum over trailing windows, NaN-padded to the input length."""
+    out = np.full(len(values), np.nan)
+    if window <= 0 or len(values) < window:
+        return out
+    cumsum = np.concatenate(([0.0], np.cumsum(values)))
+    out[window - 1 :] = cumsum[window:] - cumsum[:-window]
+    return out
+
+
+def rolling_sharpe(
+    returns: Any,
+    window: int,
+    risk_free_rate: float = 0.0,
+    periods_per_year: int = 252,
+) -> np.ndarray:
+    """
+    Calculate an annualized Sharpe ratio over trailing windows.
+
+    Matches QuantEngine.calculate_sharpe_ratio applied to each window.
+
+    Args:
+        returns: Period returns
+        window: Number of returns per window (>= 2)
+        risk_free_rate: Risk-free rate (annualized)
+        periods_per_year: Number of periods per year
+
+    Returns:
+        Array aligned with returns; NaN until the first full window
+    """
+    r = as_array(returns)
+    if window < 2:
+        raise ValueError("window must be at least 2")
+
+    rf_period = risk_free_rate / periods_per_year
+    # Center on the global mean so cumulative sums stay well conditioned
+    shift = float(r.mean()) if len(r) else 0.0
+    centered = r - shift
+
+    total = _rolling_sum(centered, window)
+    total_sq = _rolling_sum(centered**2, window)
+
+    mean = total / window
+    var = (total_sq - total * mean) / (window - 1)
+    std = np.sqrt(np.maximum(var, 0.0))
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        sharpe = (mean + shift - rf_period) / std * np.sqrt(periods_per_year)
+    # Flat windows have no defined ratio; QuantEngine reports 0.0
+    sharpe[std < 1e-12] = 0.0
+    return sharpe
+
+
+def rolling_sortino(
+    returns: Any,
+    window: int,
+    risk_free_rate: float = 0.0,
+    periods_per_year: int = 252,
+) -> np.ndarray:
+    """
+    Calculate an annualized Sortino ratio over trailing windows.
+
+    Matches QuantEngine.calculate_sortino_ratio applied to each window:
+    downside deviation is the RMS of returns below the per-period target.
+
+    Args:
+        returns: Period returns
+        window: Number of returns per window (>= 2)
+        risk_free_rate: Risk-free rate (annualized)
+        periods_per_year: Number of periods per year
+
+    Returns:
+        Array aligned with returns; NaN until the first full window
+    """
+    r = as_array(returns)
+    if window < 2:
+        raise ValueError("window must be at least 2")
+
+    rf_period = risk_free_rate / periods_per_year
+    is_down = r < rf_period
+    downside = np.where(is_down, r - rf_period, 0.0)
+
+    mean = _rolling_sum(r, window) / window
+    down_count = _rolling_sum(is_down.astype(np.float64), window)
+    down_sq = _rolling_sum(downside**2, window)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        downside_std = np.sqrt(np.maximum(down_sq, 0.0) / down_count)
+        sortino = (mean - rf_period) / downside_std * np.sqrt(periods_per_year)
+    sortino[(down_count == 0) | (downside_std == 0)] = 0.0
+    return sortino
+
+
+def rolling_max_drawdown(equity: Any, window: int) -> np.ndarray:
+    """
+    Calculate the maximum drawdown inside each trailing window of equity.
+
+    Windows are evaluated in bounded-size chunks, so memory stays flat for
+    long curves at the cost of O(len * window) arithmetic.
+
+    Args:
+        equity: Equity values over time
+        window: Number of equity points per window (>= 2)
+
+    Returns:
+        Array aligned with equity; NaN until the first full window
+    """
+    eq = as_array(equity)
+    if window < 2:
+        raise ValueError("window must be at least 2")
+
+    out = np.full(len(eq), np.nan)
+    if len(eq) < window:
+        return out
+
+    windows = sliding_window_view(eq, window)
+    chunk = max(1, _CHUNK_ELEMENTS // window)
+    for begin in range(0, len(windows), chunk):
+        block = windows[begin : begin + chunk]
+        peak = np.maximum.accumulate(block, axis=1)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            dd = (peak - block) / peak
+        np.clip(dd, 0.0, 1.0, out=dd)
+        dd = np.nan_to_num(dd, copy=False, nan=0.0, posinf=1.0, neginf=0.0)
+        out[window - 1 + begin : window - 1 + begin + len(block)] = dd.max(axis=1)
+    return out
+
+
+def rolling_calmar(equity: Any, window: int, periods_per_year: int = 252) -> np.ndarray:
+    """
+    Calculate a Calmar ratio over trailing windows of equity.
+
+    Matches QuantEngine.calculate_calmar_ratio applied to each window.
+
+    Args:
+        equity: Equity values over time
+        window: Number of equity points per window (>= 2)
+        periods_per_year: Number of periods per year
+
+    Returns:
+        Array aligned with equity; NaN until the first full window
+    """
+    eq = as_array(equity)
+    max_dd = rolling_max_drawdown(eq, window)
+    out = np.full(len(eq), np.nan)
+    if len(eq) < window:
+        return out
+
+    years = (window - 1) / periods_per_year
+    with np.errstate(divide="ignore", invalid="ignore"):
+        total_return = eq[window - 1 :] / eq[: len(eq) - window + 1]
+        annualized = np.power(total_return, 1 / years) - 1
+        calmar = annualized / max_dd[window - 1 :]
+    calmar[max_dd[window - 1 :] == 0] = 0.0
+    out[window - 1 :] = calmar
+    return out
+
+
+class EquityWindow:
+    """Fixed-capacity ring buffer of recent equity values.
+
+    Used for live metrics where only the most recent ``capacity`` samples
+    matter. ``values()`` returns the samples oldest-first.
+    """
+
+    def __init__(self, capacity: int = 10_000):
+        """Initialize the buffer.
+
+        Args:
+            capacity: Maximum number of samples retained
+        """
+        if capacity < 1:
+            raise ValueError("capacity must be positive")
+        self._buffer = np.empty(capacity, dtype=np.float64)
+        self._capacity = capacity
+        self._count = 0
+
+    def append(self, value: float) -> None:
+        """Add a sample, overwriting the oldest when full."""
+        self._buffer[self._count % self._capacity] = value
+        self._count += 1
+
+    def values(self) -> np.ndarray:
+        """Get the retained samples, oldest first."""
+        if self._count <= self._capacity:
+            return self._buffer[: self._count]
+        split = self._count % self._capacity
+        return np.concatenate((self._buffer[split:], self._buffer[:split]))
+
+    def clear(self) -> None:
+        """Drop all samples."""
+        self._count = 0
+
+    def __len__(self) -> int:
+        return min(self._count, self._capacity)
@@ -3,16 +3,63 @@
 This module provides classes to track the current state of the portfolio
 including all open positions and their aggregate risk metrics. This is
 essential for the guardrails to enforce portfolio-level limits.
+
+Prices and values are exposed as ``Decimal`` but mirrored as float64: the
+per-tick path (``update_prices``) only touches floats and keeps running
+aggregates, while exact ``Decimal`` sums are computed when a guardrail
+decision needs them.
 """
 
 from dataclasses import dataclass, field
-from datetime import UTC, datetime
+from datetime import UTC, datetime, timedelta
 from decimal import Decimal
+from typing import Any
 
+from keryxflow.core.clock import Clock
 from keryxflow.core.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Marks a Decimal that must be rebuilt from its float mirror
+_STALE = object()
+_MISSING = object()
+
+
+class _FloatBacked:
+    """
+    Dataclass field descriptor: a Decimal value with a float64 mirror.
+
+    Assigning stores the Decimal exactly and refreshes ``_<name>_f``. Hot
+    paths write ``_<name>_f`` directly and set ``_<name>_dec`` to
+    ``_STALE``; the Decimal is then rebuilt from the float on next read.
+    """
+
+    def __init__(self, default: Any = _MISSING):
+        self._default = default
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self._name = name
+        self._dec = f"_{name}_dec"
+        self._flt = f"_{name}_f"
+
+    def __get__(self, obj: Any, objtype: type | None = None) -> Any:
+        if obj is None:
+            # Class access: dataclasses read the field default here
+            if self._default is _MISSING:
+                raise AttributeError(self._name)
+            return self._default
+        value = obj.__dict__[self._dec]
+        if value is _STALE:
+            value = Decimal(str(obj.__dict__[self._flt]))
+            obj.__dict__[self._dec] = value
+        return value
+
+    def __set__(self, obj: Any, value: Any) -> None:
+        if value is not None and not isinstance(value, Decimal):
+            value = Decimal(str(value))
+        obj.__dict__[self._dec] = value
+        obj.__dict__[self._flt] = None if value is None else float(value)
+
 
 @dataclass
 class PositionState:
@@ -20,14 +67,15 @@ class PositionState:
     State of an individual position.
 
     Tracks entry details and calculates risk metrics for a single position.
+    Price fields are Decimal with float64 mirrors (see ``_FloatBacked``).
     """
 
     symbol: str
     side: str  # "long" or "short"
-    quantity: Decimal
-    entry_price: Decimal
-    current_price: Decimal
-    stop_loss: Decimal | None = None
+    quantity: Decimal = _FloatBacked()
+    entry_price: Decimal = _FloatBacked()
+    current_price: Decimal = _FloatBacked()
+    stop_loss: Decimal | None = _FloatBacked(None)
     take_profit: Decimal | None = None
     opened_at: datetime = field(default_factory=lambda: datetime.now(UTC))
 
@@ -104,8 +152,31 @@ class PositionState:
         return reward / risk
 
     def update_price(self, price: float | Decimal) -> None:
-        """Update current price."""
-        self.current_price = Decimal(str(price))
+        """Update current price; floats skip the Decimal conversion."""
+        if isinstance(price, Decimal):
+            self.current_price = price
+        else:
+            self._current_price_f = float(price)
+            self._current_price_dec = _STALE
+
+    def _float_value(self) -> float:
+        """position_value as float64."""
+        return self._quantity_f * self._current_price_f
+
+    def _float_pnl(self) -> float:
+        """unrealized_pnl as float64."""
+        diff = (self._current_price_f - self._entry_price_f) * self._quantity_f
+        return diff if self.side == "long" else -diff
+
+    def _float_risk(self) -> float:
+        """risk_to_stop as float64."""
+        if self._stop_loss_f is None:
+            return self._float_value()
+        if self.side == "long":
+            per_unit = self._entry_price_f - self._stop_loss_f
+        else:
+            per_unit = self._stop_loss_f - self._entry_price_f
+        return max(0.0, per_unit) * self._quantity_f
 
 
 @dataclass
@@ -115,18 +186,29 @@ class PortfolioState:
 
     Tracks all open positions and calculates portfolio-level risk metrics.
     This is the primary input to the GuardrailEnforcer for validating orders.
+
+    Float64 running totals of exposure, risk at stop and unrealized P&L are
+    updated incrementally by ``update_prices`` and rebuilt whenever a
+    position opens or closes; ``metrics()`` reads them without touching
+    the positions. The Decimal properties always sum the positions exactly.
+    Change positions through ``add_position``, ``close_position`` and
+    ``update_prices``, or call ``recalculate()`` afterwards.
     """
 
     # Core values
-    total_value: Decimal = Decimal("10000")
-    cash_available: Decimal = Decimal("10000")
+    total_value: Decimal = _FloatBacked(Decimal("10000"))
+    cash_available: Decimal = _FloatBacked(Decimal("10000"))
 
     # Peak tracking for drawdown
-    peak_value: Decimal = Decimal("10000")
+    peak_value: Decimal = _FloatBacked(Decimal("10000"))
 
     # Open positions
     positions: list[PositionState] = field(default_factory=list)
 
+    # Free balances per venue and currency (multi-venue mode); total_value
+    # and cash_available hold the sum, so limits apply across venues
+    venue_balances: dict[str, dict[str, float]] = field(default_factory=dict)
+
     # Daily tracking
     daily_starting_value: Decimal = Decimal("10000")
     daily_pnl: Decimal = Decimal("0")
@@ -147,6 +229,29 @@ class PortfolioState:
     last_updated: datetime = field(default_factory=lambda: datetime.now(UTC))
     daily_reset_date: datetime = field(default_factory=lambda: datetime.now(UTC).date())
 
+    # Time source for resets and timestamps
+    clock: Clock = field(default_factory=Clock, repr=False, compare=False)
+
+    # Running float64 aggregates and symbol index
+    _exposure: float = field(default=0.0, init=False, repr=False, compare=False)
+    _risk: float = field(default=0.0, init=False, repr=False, compare=False)
+    _pnl: float = field(default=0.0, init=False, repr=False, compare=False)
+    _by_symbol: dict[str, list[PositionState]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        self.recalculate()
+
+    def recalculate(self) -> None:
+        """Rebuild the running aggregates and symbol index from ``positions``."""
+        self._by_symbol = {}
+        for pos in self.positions:
+            self._by_symbol.setdefault(pos.symbol, []).append(pos)
+        self._exposure = sum(p._float_value() for p in self.positions)
+        self._risk = sum(p._float_risk() for p in self.positions)
+        self._pnl = sum(p._float_pnl() for p in self.positions)
+
     @property
     def total_exposure(self) -> Decimal:
         """Sum of all open position values."""
@@ -203,6 +308,15 @@ class PortfolioState:
         """Number of open positions."""
         return len(self.positions)
 
+    def set_venue_balances(self, balances: dict[str, dict[str, float]]) -> None:
+        """
+        Record the free balance of each venue.
+
+        Args:
+            balances: Free amount per currency, keyed by venue
+        """
+        self.venue_balances = {venue: dict(free) for venue, free in balances.items()}
+
     def add_position(self, position: PositionState) -> None:
         """
         Add a new position to the portfolio.
@@ -213,8 +327,11 @@ class PortfolioState:
         self.positions.append(position)
         self.cash_available -= position.entry_value
         self.trades_today += 1
+        if self.clock.now() - self.hour_start >= timedelta(hours=1):
+            self.reset_hourly()
         self.trades_this_hour += 1
-        self._update_total_value()
+        self.recalculate()
+        self._update_total_value(exact=True)
         logger.info(
             "position_added",
             symbol=position.symbol,
@@ -237,70 +354,98 @@ class PortfolioState:
         """
         exit_price = Decimal(str(exit_price))
 
-        for i, pos in enumerate(self.positions):
-            if pos.symbol == symbol:
-                # Calculate realized P&L
-                pos.current_price = exit_price
-                realized_pnl = pos.unrealized_pnl
+        held = self._by_symbol.get(symbol)
+        if not held:
+            logger.warning("position_not_found", symbol=symbol)
+            return None
+
+        pos = held[0]
+        i = next(i for i, p in enumerate(self.positions) if p is pos)
 
-                # Update cash
-                self.cash_available += pos.entry_value + realized_pnl
+        # Calculate realized P&L
+        pos.current_price = exit_price
+        realized_pnl = pos.unrealized_pnl
 
-                # Update P&L tracking
-                self.daily_pnl += realized_pnl
-                self.weekly_pnl += realized_pnl
+        # Update cash
+        self.cash_available += pos.entry_value + realized_pnl
 
-                # Update consecutive losses
-                if realized_pnl < 0:
-                    self.consecutive_losses += 1
-                else:
-                    self.consecutive_losses = 0
+        # Update P&L tracking
+        self.daily_pnl += realized_pnl
+        self.weekly_pnl += realized_pnl
 
-                # Remove position
-                self.positions.pop(i)
-                self._update_total_value()
+        # Update consecutive losses
+        if realized_pnl < 0:
+            self.consecutive_losses += 1
+        else:
+            self.consecutive_losses = 0
 
-                logger.info(
-                    "position_closed",
-                    symbol=symbol,
-                    realized_pnl=float(realized_pnl),
-                    daily_pnl=float(self.daily_pnl),
-                    consecutive_losses=self.consecutive_losses,
-                )
+        # Remove position
+        self.positions.pop(i)
+        self.recalculate()
+        self._update_total_value(exact=True)
 
-                return realized_pnl
+        logger.info(
+            "position_closed",
+            symbol=symbol,
+            realized_pnl=float(realized_pnl),
+            daily_pnl=float(self.daily_pnl),
+            consecutive_losses=self.consecutive_losses,
+        )
 
-        logger.warning("position_not_found", symbol=symbol)
-        return None
+        return realized_pnl
 
     def update_prices(self, prices: dict[str, float | Decimal]) -> None:
         """
         Update current prices for all positions.
 
+        Only positions in the updated symbols are visited, and the running
+        aggregates are adjusted by each position's change in float64.
+
         Args:
             prices: Dict mapping symbol to current price
         """
-        for pos in self.positions:
-            if pos.symbol in prices:
-                pos.update_price(prices[pos.symbol])
+        for symbol, price in prices.items():
+            held = self._by_symbol.get(symbol)
+            if not held:
+                continue
+            exact = price if isinstance(price, Decimal) else _STALE
+            price = float(price)
+            for pos in held:
+                delta = (price - pos._current_price_f) * pos._quantity_f
+                pos._current_price_f = price
+                pos._current_price_dec = exact
+                self._exposure += delta
+                self._pnl += delta if pos.side == "long" else -delta
+                if pos._stop_loss_f is None:
+                    self._risk += delta
 
         self._update_total_value()
 
-    def _update_total_value(self) -> None:
-        """Recalculate total portfolio value."""
-        self.total_value = self.cash_available + self.total_exposure
-        self.last_updated = datetime.now(UTC)
+    def _update_total_value(self, exact: bool = False) -> None:
+        """Recalculate total portfolio value.
+
+        Args:
+            exact: Sum positions in Decimal instead of using the float
+                running total (done when positions open or close)
+        """
+        if exact:
+            self.total_value = self.cash_available + self.total_exposure
+        else:
+            self._total_value_f = self._cash_available_f + self._exposure
+            self._total_value_dec = _STALE
+        self.last_updated = self.clock.now()
 
         # Update peak if new high
-        if self.total_value > self.peak_value:
-            self.peak_value = self.total_value
+        if self._total_value_f > self._peak_value_f:
+            self._peak_value_f = self._total_value_f
+            self._peak_value_dec = self._total_value_dec
 
     def reset_daily(self) -> None:
         """Reset daily tracking metrics."""
         self.daily_starting_value = self.total_value
         self.daily_pnl = Decimal("0")
         self.trades_today = 0
-        self.daily_reset_date = datetime.now(UTC).date()
+        self.daily_reset_date = self.clock.now().date()
         logger.info("daily_reset", starting_value=float(self.daily_starting_value))
 
     def reset_weekly(self) -> None:
@@ -312,7 +457,7 @@ class PortfolioState:
     def reset_hourly(self) -> None:
         """Reset hourly rate limiting."""
         self.trades_this_hour = 0
-        self.hour_start = datetime.now(UTC)
+        self.hour_start = self.clock.now()
 
     def reset_consecutive_losses(self) -> None:
         """Manually reset consecutive losses counter."""
@@ -321,24 +466,35 @@ class PortfolioState:
 
     def get_position(self, symbol: str) -> PositionState | None:
         """Get position by symbol."""
-        for pos in self.positions:
-            if pos.symbol == symbol:
-                return pos
-        return None
+        held = self._by_symbol.get(symbol)
+        return held[0] if held else None
+
+    def metrics(self) -> dict[str, float]:
+        """
+        Aggregate metrics as float64 from the running totals.
+
+        Cheap enough to call on every tick; use the Decimal properties for
+        exact values.
+        """
+        total = self._total_value_f
+        peak = self._peak_value_f
+        return {
+            "total_value": total,
+            "cash_available": self._cash_available_f,
+            "peak_value": peak,
+            "total_exposure": self._exposure,
+            "total_risk_at_stop": self._risk,
+            "unrealized_pnl": self._pnl,
+            "exposure_pct": self._exposure / total if total else 0.0,
+            "risk_at_stop_pct": self._risk / total if total else 0.0,
+            "cash_reserve_pct": self._cash_available_f / total if total else 0.0,
+            "drawdown_pct": (peak - total) / peak if peak else 0.0,
+        }
 
     def to_dict(self) -> dict:
         """Convert to dictionary for serialization."""
         return {
-            "total_value": float(self.total_value),
-            "cash_available": float(self.cash_available),
-            "peak_value": float(self.peak_value),
-            "total_exposure": float(self.total_exposure),
-            "total_risk_at_stop": float(self.total_risk_at_stop),
-            "exposure_pct": float(self.exposure_pct),
-            "risk_at_stop_pct": float(self.risk_at_stop_pct),
-            "cash_reserve_pct": float(self.cash_reserve_pct),
-            "unrealized_pnl": float(self.unrealized_pnl),
-            "drawdown_pct": float(self.drawdown_pct),
+            **self.metrics(),
             "daily_pnl": float(self.daily_pnl),
             "weekly_pnl": float(self.weekly_pnl),
             "trades_today": self.trades_today,
@@ -348,34 +504,43 @@ class PortfolioState:
                 {
                     "symbol": p.symbol,
                     "side": p.side,
-                    "quantity": float(p.quantity),
-                    "entry_price": float(p.entry_price),
-                    "current_price": float(p.current_price),
-                    "unrealized_pnl": float(p.unrealized_pnl),
-                    "risk_to_stop": float(p.risk_to_stop),
+                    "quantity": p._quantity_f,
+                    "entry_price": p._entry_price_f,
+                    "current_price": p._current_price_f,
+                    "unrealized_pnl": p._float_pnl(),
+                    "risk_to_stop": p._float_risk(),
                 }
                 for p in self.positions
             ],
+            "venue_balances": self.venue_balances,
         }
 
 
 def create_portfolio_state(
     initial_balance: float = 10000.0,
+    clock: Clock | None = None,
 ) -> PortfolioState:
     """
     Create a new portfolio state with initial balance.
 
     Args:
         initial_balance: Starting balance
+        clock: Time source (default: wall clock)
 
     Returns:
         New PortfolioState instance
     """
     balance = Decimal(str(initial_balance))
+    clock = clock or Clock()
+    now = clock.now()
     return PortfolioState(
         total_value=balance,
         cash_available=balance,
         peak_value=balance,
         daily_starting_value=balance,
         weekly_starting_value=balance,
+        hour_start=now,
+        last_updated=now,
+        daily_reset_date=now.date(),
+        clock=clock,
     )
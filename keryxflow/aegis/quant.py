@@ -4,6 +4,7 @@ from dataclasses import dataclass
 
 import numpy as np
 
+from keryxflow.aegis.metrics import summarize_drawdown
 from keryxflow.core.logging import get_logger
 
 logger = get_logger(__name__)
@@ -323,49 +324,23 @@ class QuantEngine:
 
     def calculate_drawdown(
         self,
-        equity_curve: list[float],
+        equity_curve: list[float] | np.ndarray,
     ) -> tuple[float, float, int]:
         """
         Calculate drawdown metrics from equity curve.
 
         Args:
-            equity_curve: List of equity values over time
+            equity_curve: Equity values over time (float64 arrays are not copied)
 
         Returns:
             Tuple of (current_drawdown, max_drawdown, max_drawdown_duration)
         """
-        if not equity_curve:
-            return (0.0, 0.0, 0)
-
-        equity = np.array(equity_curve)
-        peak = np.maximum.accumulate(equity)
-
-        # Avoid division by zero and handle negative equity
-        with np.errstate(divide="ignore", invalid="ignore"):
-            drawdown = (peak - equity) / peak
-            # Cap drawdown at 1.0 (100%) - equity going negative is total loss
-            drawdown = np.clip(drawdown, 0.0, 1.0)
-            drawdown = np.nan_to_num(drawdown, nan=0.0, posinf=1.0, neginf=0.0)
-
-        max_drawdown = float(np.max(drawdown))
-        current_drawdown = float(drawdown[-1])
-
-        # Calculate max drawdown duration
-        in_drawdown = equity < peak
-        duration = 0
-        max_duration = 0
-        for is_dd in in_drawdown:
-            if is_dd:
-                duration += 1
-                max_duration = max(max_duration, duration)
-            else:
-                duration = 0
-
-        return (float(current_drawdown), float(max_drawdown), max_duration)
+        stats = summarize_drawdown(equity_curve)
+        return (stats.current_drawdown, stats.max_drawdown, stats.max_duration)
 
     def calculate_sharpe_ratio(
         self,
-        returns: list[float],
+        returns: list[float] | np.ndarray,
         risk_free_rate: float = 0.0,
         periods_per_year: int = 252,
     ) -> float:
@@ -385,7 +360,7 @@ class QuantEngine:
         if len(returns) < 2:
             return 0.0
 
-        returns_arr = np.array(returns)
+        returns_arr = np.asarray(returns, dtype=np.float64)
         mean_return = np.mean(returns_arr)
         std_return = np.std(returns_arr, ddof=1)
 
@@ -401,7 +376,7 @@ class QuantEngine:
 
     def calculate_sortino_ratio(
         self,
-        returns: list[float],
+        returns: list[float] | np.ndarray,
         risk_free_rate: float = 0.0,
         periods_per_year: int = 252,
     ) -> float:
@@ -421,7 +396,7 @@ class QuantEngine:
         if len(returns) < 2:
             return 0.0
 
-        returns_arr = np.array(returns)
+        returns_arr = np.asarray(returns, dtype=np.float64)
         mean_return = np.mean(returns_arr)
 
         # Downside deviation: std of returns below target (risk-free rate per period)
@@ -442,19 +417,20 @@ class QuantEngine:
 
     def calculate_calmar_ratio(
         self,
-        equity_curve: list[float],
+        equity_curve: list[float] | np.ndarray,
         periods_per_year: int = 252,
     ) -> float:
         """
         Calculate Calmar ratio (annualized return / max drawdown).
 
         Args:
-            equity_curve: List of equity values over time
+            equity_curve: Equity values over time
             periods_per_year: Number of periods per year (252 for daily)
 
         Returns:
             Calmar ratio
         """
+        equity_curve = np.asarray(equity_curve, dtype=np.float64)
         if len(equity_curve) < 2:
             return 0.0
 
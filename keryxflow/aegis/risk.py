@@ -1,19 +1,27 @@
 """Risk manager for order approval and validation."""
 
 from dataclasses import dataclass
-from datetime import UTC, datetime
 from decimal import Decimal
 from enum import Enum
 from typing import Any
 
 from keryxflow.aegis.guardrails import (
     GuardrailViolation,
+    PortfolioSnapshot,
     get_guardrail_enforcer,
 )
+from keryxflow.aegis.metrics import (
+    EquityWindow,
+    rolling_sharpe,
+    rolling_sortino,
+    simple_returns,
+    summarize_drawdown,
+)
 from keryxflow.aegis.portfolio import PortfolioState, PositionState, create_portfolio_state
 from keryxflow.aegis.profiles import get_risk_profile
 from keryxflow.aegis.quant import get_quant_engine
 from keryxflow.config import get_settings
+from keryxflow.core.clock import Clock
 from keryxflow.core.logging import get_logger
 from keryxflow.core.models import RiskProfile
 
@@ -59,6 +67,20 @@ class OrderRequest:
     entry_price: float
     stop_loss: float | None = None
     take_profit: float | None = None
+    confidence: float | None = None  # Signal confidence, 0.0 to 1.0
+
+    @property
+    def expected_value(self) -> float:
+        """
+        Confidence-weighted reward minus risk, in quote currency.
+
+        Uses the distance to take profit and stop loss; a missing confidence
+        counts as a coin flip and a missing target or stop as zero.
+        """
+        p = 0.5 if self.confidence is None else self.confidence
+        reward = abs(self.take_profit - self.entry_price) if self.take_profit else 0.0
+        risk = abs(self.entry_price - self.stop_loss) if self.stop_loss else 0.0
+        return (p * reward - (1 - p) * risk) * self.quantity
 
 
 @dataclass
@@ -104,6 +126,7 @@ class RiskManager:
         self,
         risk_profile: RiskProfile = RiskProfile.CONSERVATIVE,
         initial_balance: float = 10000.0,
+        clock: Clock | None = None,
     ):
         """
         Initialize the risk manager.
@@ -111,14 +134,16 @@ class RiskManager:
         Args:
             risk_profile: Risk profile to use
             initial_balance: Starting balance for drawdown calculation
+            clock: Time source for daily resets (default: wall clock)
         """
         self.settings = get_settings()
+        self.clock = clock or Clock()
         self.profile = get_risk_profile(risk_profile)
         self.quant = get_quant_engine(self.profile.risk_per_trade)
 
         # Immutable guardrails (Phase 1 - Issue #9 fix)
         self._guardrail_enforcer = get_guardrail_enforcer()
-        self._portfolio_state = create_portfolio_state(initial_balance)
+        self._portfolio_state = create_portfolio_state(initial_balance, clock=self.clock)
 
         # State tracking
         self._initial_balance = initial_balance
@@ -129,9 +154,40 @@ class RiskManager:
         self._circuit_breaker_active = False
         self._last_reset_date: str | None = None
 
+        # Recent equity samples for live performance metrics
+        self._equity_window = EquityWindow()
+        self._equity_window.append(initial_balance)
+
     def update_balance(self, balance: float) -> None:
         """Update current balance."""
         self._current_balance = balance
+        self._equity_window.append(balance)
+
+    def get_equity_metrics(self, window: int = 30) -> dict[str, Any]:
+        """
+        Get drawdown and rolling ratios over recently recorded balances.
+
+        Args:
+            window: Number of returns used for the rolling Sharpe/Sortino
+
+        Returns:
+            Dict with drawdown statistics and the latest rolling ratios
+            (None until enough samples have been recorded)
+        """
+        equity = self._equity_window.values()
+        returns = simple_returns(equity)
+        metrics = summarize_drawdown(equity).to_dict()
+        metrics["samples"] = len(equity)
+
+        if len(returns) >= window >= 2:
+            tail = returns[-window:]
+            metrics["rolling_sharpe"] = float(rolling_sharpe(tail, window)[-1])
+            metrics["rolling_sortino"] = float(rolling_sortino(tail, window)[-1])
+        else:
+            metrics["rolling_sharpe"] = None
+            metrics["rolling_sortino"] = None
+
+        return metrics
 
     def update_daily_pnl(self, pnl: float) -> None:
         """Update daily PnL."""
@@ -181,6 +237,7 @@ class RiskManager:
             current_price=Decimal(str(entry_price)),
             stop_loss=Decimal(str(stop_loss)) if stop_loss else None,
             take_profit=Decimal(str(take_profit)) if take_profit else None,
+            opened_at=self.clock.now(),
         )
         self._portfolio_state.add_position(position)
         self._open_positions = self._portfolio_state.position_count
@@ -228,7 +285,7 @@ class RiskManager:
 
     def _check_daily_reset(self) -> None:
         """Check if we need to reset daily tracking."""
-        today = datetime.now(UTC).strftime("%Y-%m-%d")
+        today = self.clock.now().strftime("%Y-%m-%d")
         if self._last_reset_date != today:
             self._daily_starting_balance = self._current_balance
             self._daily_pnl = 0.0
@@ -281,7 +338,80 @@ class RiskManager:
         self._check_daily_reset()
 
         balance = current_balance or self._current_balance
+        snapshot = self._guardrail_enforcer.snapshot(self._portfolio_state)
+        return self._evaluate(order, balance, snapshot, self._open_positions, balance)
+
+    def approve_batch(
+        self,
+        orders: list[OrderRequest],
+        current_balance: float | None = None,
+    ) -> list[ApprovalResult]:
+        """
+        Evaluate several orders together, e.g. signals from one candle close.
+
+        Orders are ranked by expected value (ties broken by symbol, then
+        input position) and approved in that order against one portfolio
+        snapshot. Each approval is booked into the snapshot, so exposure,
+        aggregate risk, cash reserve, trade-rate and position-count limits
+        apply to the batch cumulatively: when limits bind, the best orders
+        win, and the same batch always gets the same answer.
+
+        Args:
+            orders: Candidate orders
+            current_balance: Current account balance (optional, uses tracked)
+
+        Returns:
+            One ApprovalResult per order, in the same order as ``orders``
+        """
+        self._check_daily_reset()
+
+        balance = current_balance or self._current_balance
+        snapshot = self._guardrail_enforcer.snapshot(self._portfolio_state)
+        open_positions = self._open_positions
+        available = balance
+
+        ranking = sorted(
+            range(len(orders)),
+            key=lambda i: (-orders[i].expected_value, orders[i].symbol, i),
+        )
+        results: list[ApprovalResult | None] = [None] * len(orders)
+        for i in ranking:
+            order = orders[i]
+            result = self._evaluate(order, balance, snapshot, open_positions, available)
+            if result.approved:
+                snapshot.reserve(order.quantity, order.entry_price, order.stop_loss)
+                open_positions += 1
+                available -= order.quantity * order.entry_price
+            results[i] = result
+
+        logger.info(
+            "order_batch_evaluated",
+            orders=len(orders),
+            approved=sum(1 for r in results if r is not None and r.approved),
+        )
+        return [r for r in results if r is not None]
 
+    def _evaluate(
+        self,
+        order: OrderRequest,
+        balance: float,
+        snapshot: PortfolioSnapshot,
+        open_positions: int,
+        available: float,
+    ) -> ApprovalResult:
+        """
+        Run both validation layers for one order.
+
+        Args:
+            order: The order request to evaluate
+            balance: Account balance used for position sizing
+            snapshot: Guardrail view of the portfolio
+            open_positions: Positions counted against the profile limit
+            available: Balance left to fund the order
+
+        Returns:
+            ApprovalResult with approval status and details
+        """
         # =================================================================
         # LAYER 1: Immutable Guardrails (Issue #9 fix - aggregate risk)
         # These checks cannot be bypassed under any circumstances
@@ -292,7 +422,7 @@ class RiskManager:
             quantity=order.quantity,
             entry_price=order.entry_price,
             stop_loss=order.stop_loss,
-            portfolio=self._portfolio_state,
+            snapshot=snapshot,
         )
 
         if not guardrail_result.allowed:
@@ -351,12 +481,12 @@ class RiskManager:
             )
 
         # Check max positions
-        if self._open_positions >= self.profile.max_open_positions:
+        if open_positions >= self.profile.max_open_positions:
             return ApprovalResult(
                 approved=False,
                 reason=RejectionReason.MAX_POSITIONS_REACHED,
                 simple_message=f"Maximum trades ({self.profile.max_open_positions}) already open. Close one first.",
-                technical_message=f"Open positions {self._open_positions} >= max {self.profile.max_open_positions}",
+                technical_message=f"Open positions {open_positions} >= max {self.profile.max_open_positions}",
             )
 
         # Check symbol is allowed
@@ -433,12 +563,12 @@ class RiskManager:
 
         # Check sufficient balance
         position_value = order.quantity * order.entry_price
-        if position_value > balance:
+        if position_value > available:
             return ApprovalResult(
                 approved=False,
                 reason=RejectionReason.INSUFFICIENT_BALANCE,
-                simple_message=f"Not enough balance. Need ${position_value:,.2f}, have ${balance:,.2f}",
-                technical_message=f"Position value ${position_value:,.2f} > balance ${balance:,.2f}",
+                simple_message=f"Not enough balance. Need ${position_value:,.2f}, have ${available:,.2f}",
+                technical_message=f"Position value ${position_value:,.2f} > balance ${available:,.2f}",
             )
 
         # Order approved
@@ -489,6 +619,7 @@ class RiskManager:
     def get_status(self) -> dict[str, Any]:
         """Get current risk manager status."""
         portfolio = self._portfolio_state
+        metrics = portfolio.metrics()
         return {
             "profile": self.profile.name,
             "balance": self._current_balance,
@@ -500,9 +631,9 @@ class RiskManager:
             "circuit_breaker_active": self._circuit_breaker_active,
             "risk_per_trade": self.profile.risk_per_trade,
             # Portfolio state (Issue #9 - aggregate risk)
-            "aggregate_risk_pct": float(portfolio.risk_at_stop_pct),
-            "total_exposure_pct": float(portfolio.exposure_pct),
-            "cash_reserve_pct": float(portfolio.cash_reserve_pct),
+            "aggregate_risk_pct": metrics["risk_at_stop_pct"],
+            "total_exposure_pct": metrics["exposure_pct"],
+            "cash_reserve_pct": metrics["cash_reserve_pct"],
             "consecutive_losses": portfolio.consecutive_losses,
         }
 
@@ -0,0 +1,333 @@
+"""Array-backed stop book for trailing and fixed stop evaluation.
+
+Every tracked symbol owns one slot in a set of parallel float64 arrays
+(side sign, entry, trailing parameters, peak, stop level, fixed stop-loss
+and take-profit). ``evaluate()`` marks a whole batch of prices against all
+of those levels in one vectorized pass, so checking stops costs roughly
+the same whether one position is open or hundreds.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from dataclasses import dataclass
+from typing import Literal
+
+import numpy as np
+
+from keryxflow.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+StopReason = Literal["stop_loss", "trailing_stop", "take_profit"]
+
+_INITIAL_CAPACITY = 16
+
+# Below this many symbols per batch the scalar path beats numpy call overhead
+_VECTOR_MIN_BATCH = 32
+
+
+@dataclass(frozen=True)
+class StopTrigger:
+    """A stop level crossed by a price update."""
+
+    symbol: str
+    side: Literal["buy", "sell"]
+    price: float
+    stop_price: float
+    reason: StopReason
+
+
+@dataclass(frozen=True)
+class StopLevels:
+    """Read-only view of one slot in the stop book."""
+
+    symbol: str
+    side: Literal["buy", "sell"]
+    entry_price: float
+    trail_pct: float | None
+    activation_pct: float
+    peak_price: float
+    trailing_stop: float | None
+    activated: bool
+    stop_loss: float | None
+    take_profit: float | None
+
+
+def _optional(value: float) -> float | None:
+    """Map the NaN sentinel back to None."""
+    return None if np.isnan(value) else float(value)
+
+
+class StopBook:
+    """Trailing and fixed stops for all open positions, held in arrays.
+
+    Long slots trail below the highest price seen and short slots trail
+    above the lowest, once the position has moved ``activation_pct`` into
+    profit. Fixed stop-loss and take-profit levels are checked on every
+    evaluation. Unset levels are stored as NaN, which never compares true,
+    so no per-slot branching is needed.
+    """
+
+    def __init__(self, capacity: int = _INITIAL_CAPACITY) -> None:
+        """Initialize an empty stop book.
+
+        Args:
+            capacity: Initial number of slots; the arrays grow as needed
+        """
+        self._index: dict[str, int] = {}
+        self._symbols: list[str | None] = []
+        self._free: list[int] = []
+        self._allocate(max(1, capacity))
+
+    def _allocate(self, capacity: int) -> None:
+        """Grow the arrays to ``capacity`` slots, keeping existing ones."""
+        old = len(self._symbols)
+
+        def grow(name: str, fill: float | bool, dtype: type) -> None:
+            array = np.full(capacity, fill, dtype=dtype)
+            if old:
+                array[:old] = getattr(self, name)
+            setattr(self, name, array)
+
+        grow("_sign", 0.0, np.float64)
+        grow("_entry", np.nan, np.float64)
+        grow("_trail", np.nan, np.float64)
+        grow("_activation", 0.0, np.float64)
+        grow("_peak", np.nan, np.float64)
+        grow("_stop", np.nan, np.float64)
+        grow("_activated", False, np.bool_)
+        grow("_stop_loss", np.nan, np.float64)
+        grow("_take_profit", np.nan, np.float64)
+
+        self._symbols.extend([None] * (capacity - old))
+        self._free.extend(range(capacity - 1, old - 1, -1))
+
+    def track(
+        self,
+        symbol: str,
+        side: Literal["buy", "sell"],
+        entry_price: float,
+        trail_pct: float | None = None,
+        activation_pct: float = 0.0,
+        stop_loss: float | None = None,
+        take_profit: float | None = None,
+    ) -> None:
+        """Start (or restart) tracking stops for a symbol.
+
+        Args:
+            symbol: Trading pair symbol
+            side: Position side ("buy" for long, "sell" for short)
+            entry_price: Position entry price
+            trail_pct: Trailing distance as fraction, or None for no trailing stop
+            activation_pct: Minimum profit before trailing activates
+            stop_loss: Fixed stop-loss price, if any
+            take_profit: Fixed take-profit price, if any
+        """
+        slot = self._index.get(symbol)
+        if slot is None:
+            if not self._free:
+                self._allocate(len(self._symbols) * 2)
+            slot = self._free.pop()
+            self._index[symbol] = slot
+            self._symbols[slot] = symbol
+
+        self._sign[slot] = 1.0 if side == "buy" else -1.0
+        self._entry[slot] = entry_price
+        self._trail[slot] = np.nan if trail_pct is None else trail_pct
+        self._activation[slot] = activation_pct
+        self._peak[slot] = entry_price
+        self._stop[slot] = np.nan
+        self._activated[slot] = False
+        self._stop_loss[slot] = np.nan if stop_loss is None else stop_loss
+        self._take_profit[slot] = np.nan if take_profit is None else take_profit
+
+    def remove(self, symbol: str) -> bool:
+        """Stop tracking a symbol.
+
+        Returns:
+            True if the symbol was tracked
+        """
+        slot = self._index.pop(symbol, None)
+        if slot is None:
+            return False
+        self._symbols[slot] = None
+        self._sign[slot] = 0.0
+        self._trail[slot] = np.nan
+        self._stop[slot] = np.nan
+        self._activated[slot] = False
+        self._stop_loss[slot] = np.nan
+        self._take_profit[slot] = np.nan
+        self._free.append(slot)
+        return True
+
+    def clear(self) -> None:
+        """Stop tracking every symbol."""
+        for symbol in list(self._index):
+            self.remove(symbol)
+
+    def __contains__(self, symbol: object) -> bool:
+        return symbol in self._index
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    @property
+    def symbols(self) -> list[str]:
+        """Symbols currently tracked."""
+        return list(self._index)
+
+    def levels(self, symbol: str) -> StopLevels | None:
+        """Current levels for a symbol, or None if it is not tracked."""
+        slot = self._index.get(symbol)
+        if slot is None:
+            return None
+        return StopLevels(
+            symbol=symbol,
+            side="buy" if self._sign[slot] > 0 else "sell",
+            entry_price=float(self._entry[slot]),
+            trail_pct=_optional(self._trail[slot]),
+            activation_pct=float(self._activation[slot]),
+            peak_price=float(self._peak[slot]),
+            trailing_stop=_optional(self._stop[slot]),
+            activated=bool(self._activated[slot]),
+            stop_loss=_optional(self._stop_loss[slot]),
+            take_profit=_optional(self._take_profit[slot]),
+        )
+
+    def evaluate(self, prices: Mapping[str, float]) -> list[StopTrigger]:
+        """Mark a batch of prices and return the stops they cross.
+
+        Trailing peaks and stop levels are advanced first, then every slot
+        is checked against its stop-loss, trailing stop and take-profit.
+        Untracked symbols are ignored. Triggered slots stay tracked; the
+        caller removes them once the position is closed.
+
+        Args:
+            prices: Latest price per symbol
+
+        Returns:
+            One trigger per crossed symbol, in ``prices`` order
+        """
+        symbols = [symbol for symbol in prices if symbol in self._index]
+        if not symbols:
+            return []
+        if len(symbols) < _VECTOR_MIN_BATCH:
+            scalar = (
+                self._evaluate_slot(symbol, self._index[symbol], float(prices[symbol]))
+                for symbol in symbols
+            )
+            return [trigger for trigger in scalar if trigger is not None]
+
+        slots = np.fromiter((self._index[s] for s in symbols), dtype=np.intp, count=len(symbols))
+        px = np.fromiter((prices[s] for s in symbols), dtype=np.float64, count=len(symbols))
+        sign = self._sign[slots]
+
+        # Activation: trailing slots that reached the profit threshold
+        trailing = ~np.isnan(self._trail[slots])
+        profit = sign * (px - self._entry[slots]) / self._entry[slots]
+        was_active = self._activated[slots]
+        active = was_active | (trailing & (profit >= self._activation[slots]))
+        self._activated[slots] = active
+
+        # Peak (trough for shorts) and the stop level trailing it
+        peak = self._peak[slots]
+        peak = np.where(active & (sign * px > sign * peak), px, peak)
+        stop = np.where(active, peak * (1.0 - sign * self._trail[slots]), self._stop[slots])
+        self._peak[slots] = peak
+        self._stop[slots] = stop
+
+        # NaN levels never compare true, so unset stops cannot fire
+        with np.errstate(invalid="ignore"):
+            stop_loss = self._stop_loss[slots]
+            take_profit = self._take_profit[slots]
+            sl_hit = sign * (px - stop_loss) <= 0
+            ts_hit = active & (sign * (px - stop) <= 0)
+            tp_hit = sign * (px - take_profit) >= 0
+
+        for i in np.flatnonzero(active & ~was_active):
+            logger.info(
+                "trailing_stop_activated",
+                symbol=symbols[i],
+                price=float(px[i]),
+                profit_pct=float(profit[i]),
+            )
+
+        triggers: list[StopTrigger] = []
+        for i in np.flatnonzero(sl_hit | ts_hit | tp_hit):
+            if sl_hit[i]:
+                reason: StopReason = "stop_loss"
+                level = stop_loss[i]
+            elif ts_hit[i]:
+                reason, level = "trailing_stop", stop[i]
+            else:
+                reason, level = "take_profit", take_profit[i]
+            triggers.append(
+                StopTrigger(
+                    symbol=symbols[i],
+                    side="buy" if sign[i] > 0 else "sell",
+                    price=float(px[i]),
+                    stop_price=float(level),
+                    reason=reason,
+                )
+            )
+        return triggers
+
+    def _evaluate_slot(self, symbol: str, slot: int, price: float) -> StopTrigger | None:
+        """Scalar equivalent of ``evaluate()`` for one slot (small batches)."""
+        sign = self._sign.item(slot)
+        entry = self._entry.item(slot)
+        trail = self._trail.item(slot)
+        active = self._activated.item(slot)
+
+        if not active and trail == trail:  # trailing slot (not NaN)
+            profit = sign * (price - entry) / entry
+            if profit >= self._activation.item(slot):
+                active = True
+                self._activated[slot] = True
+                logger.info(
+                    "trailing_stop_activated", symbol=symbol, price=price, profit_pct=profit
+                )
+
+        stop = self._stop.item(slot)
+        if active:
+            peak = self._peak.item(slot)
+            if sign * price > sign * peak:
+                peak = price
+                self._peak[slot] = peak
+            stop = peak * (1.0 - sign * trail)
+            self._stop[slot] = stop
+
+        stop_loss = self._stop_loss.item(slot)
+        take_profit = self._take_profit.item(slot)
+        if sign * (price - stop_loss) <= 0:
+            reason: StopReason = "stop_loss"
+            level = stop_loss
+        elif active and sign * (price - stop) <= 0:
+            reason, level = "trailing_stop", stop
+        elif sign * (price - take_profit) >= 0:
+            reason, level = "take_profit", take_profit
+        else:
+            return None
+        return StopTrigger(
+            symbol=symbol,
+            side="buy" if sign > 0 else "sell",
+            price=price,
+            stop_price=level,
+            reason=reason,
+        )
+
+    def trailing_triggered(self, symbol: str, price: float) -> bool:
+        """Whether ``price`` crosses the symbol's active trailing stop."""
+        slot = self._index.get(symbol)
+        if slot is None or not self._activated.item(slot):
+            return False
+        return self._sign.item(slot) * (price - self._stop.item(slot)) <= 0
+
+    def trailing_stop(self, symbol: str) -> float | None:
+        """Current trailing stop level, or None if not tracked or not active."""
+        slot = self._index.get(symbol)
+        if slot is None:
+            return None
+        stop = self._stop.item(slot)
+        return None if stop != stop else stop
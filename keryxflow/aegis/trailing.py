@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
+from collections.abc import Mapping
 from dataclasses import dataclass, field
 from typing import Literal
 
+from keryxflow.aegis.stops import StopBook
 from keryxflow.core.logging import get_logger
 
 logger = get_logger(__name__)
@@ -12,7 +14,7 @@ logger = get_logger(__name__)
 
 @dataclass
 class TrailingStopState:
-    """State for a single trailing stop being tracked."""
+    """Snapshot of a single trailing stop being tracked."""
 
     symbol: str
     side: Literal["buy", "sell"]
@@ -40,11 +42,23 @@ class TrailingStopManager:
 
     Activation threshold gates when trailing begins — only after
     the position has moved a minimum percentage in profit.
+
+    State lives in a :class:`StopBook`, which also carries any fixed
+    stop-loss/take-profit levels and evaluates whole price batches at once.
     """
 
-    def __init__(self) -> None:
-        """Initialize the trailing stop manager."""
-        self._states: dict[str, TrailingStopState] = {}
+    def __init__(self, book: StopBook | None = None) -> None:
+        """Initialize the trailing stop manager.
+
+        Args:
+            book: Stop book to store state in (a new one by default)
+        """
+        self._book = book if book is not None else StopBook()
+
+    @property
+    def book(self) -> StopBook:
+        """The underlying stop book."""
+        return self._book
 
     def start_tracking(
         self,
@@ -56,6 +70,9 @@ class TrailingStopManager:
     ) -> None:
         """Start tracking a trailing stop for a symbol.
 
+        Fixed stop-loss/take-profit levels already in the book for the
+        same side are kept.
+
         Args:
             symbol: Trading pair symbol
             side: Position side ("buy" for long, "sell" for short)
@@ -63,12 +80,16 @@ class TrailingStopManager:
             trail_pct: Trailing distance as fraction (0.02 = 2%)
             activation_pct: Minimum profit before trailing activates (0.01 = 1%)
         """
-        self._states[symbol] = TrailingStopState(
-            symbol=symbol,
-            side=side,
-            entry_price=entry_price,
+        existing = self._book.levels(symbol)
+        keep = existing is not None and existing.side == side
+        self._book.track(
+            symbol,
+            side,
+            entry_price,
             trail_pct=trail_pct,
             activation_pct=activation_pct,
+            stop_loss=existing.stop_loss if keep else None,
+            take_profit=existing.take_profit if keep else None,
         )
         logger.info(
             "trailing_stop_tracking_started",
@@ -81,13 +102,12 @@ class TrailingStopManager:
 
     def stop_tracking(self, symbol: str) -> None:
         """Stop tracking a trailing stop for a symbol."""
-        if symbol in self._states:
-            del self._states[symbol]
+        if self._book.remove(symbol):
             logger.info("trailing_stop_tracking_stopped", symbol=symbol)
 
     def stop_tracking_all(self) -> None:
         """Stop tracking all trailing stops."""
-        self._states.clear()
+        self._book.clear()
         logger.info("trailing_stop_tracking_all_stopped")
 
     def update_price(self, symbol: str, price: float) -> None:
@@ -97,46 +117,22 @@ class TrailingStopManager:
             symbol: Trading pair symbol
             price: Current market price
         """
-        state = self._states.get(symbol)
-        if state is None:
-            return
-
-        if state.side == "buy":
-            # Long position: check if activation threshold reached
-            profit_pct = (price - state.entry_price) / state.entry_price
-            if not state.activated and profit_pct >= state.activation_pct:
-                state.activated = True
-                logger.info(
-                    "trailing_stop_activated",
-                    symbol=symbol,
-                    price=price,
-                    profit_pct=profit_pct,
-                )
-
-            if state.activated:
-                # Update peak (highest price seen)
-                if price > state.peak_price:
-                    state.peak_price = price
-                # Compute stop level: trail below peak
-                state.current_stop = state.peak_price * (1 - state.trail_pct)
-        else:
-            # Short position: check if activation threshold reached
-            profit_pct = (state.entry_price - price) / state.entry_price
-            if not state.activated and profit_pct >= state.activation_pct:
-                state.activated = True
-                logger.info(
-                    "trailing_stop_activated",
-                    symbol=symbol,
-                    price=price,
-                    profit_pct=profit_pct,
-                )
-
-            if state.activated:
-                # Update trough (lowest price seen)
-                if price < state.peak_price:
-                    state.peak_price = price
-                # Compute stop level: trail above trough
-                state.current_stop = state.peak_price * (1 + state.trail_pct)
+        self._book.evaluate({symbol: price})
+
+    def update_prices(self, prices: Mapping[str, float]) -> list[str]:
+        """Update a batch of prices and return symbols whose trailing stop fired.
+
+        Args:
+            prices: Latest price per symbol
+
+        Returns:
+            Symbols whose trailing stop was crossed
+        """
+        return [
+            trigger.symbol
+            for trigger in self._book.evaluate(prices)
+            if trigger.reason == "trailing_stop"
+        ]
 
     def should_trigger_stop(self, symbol: str, price: float) -> bool:
         """Check if the trailing stop should trigger for a symbol.
@@ -148,16 +144,7 @@ class TrailingStopManager:
         Returns:
             True if the stop should trigger
         """
-        state = self._states.get(symbol)
-        if state is None or not state.activated or state.current_stop is None:
-            return False
-
-        if state.side == "buy":
-            # Long: trigger if price falls to or below stop
-            return price <= state.current_stop
-        else:
-            # Short: trigger if price rises to or above stop
-            return price >= state.current_stop
+        return self._book.trailing_triggered(symbol, price)
 
     def get_stop_price(self, symbol: str) -> float | None:
         """Get the current trailing stop price for a symbol.
@@ -165,18 +152,32 @@ class TrailingStopManager:
         Returns:
             The stop price, or None if not tracking or not activated
         """
-        state = self._states.get(symbol)
-        if state is None:
-            return None
-        return state.current_stop
+        return self._book.trailing_stop(symbol)
 
     def is_tracking(self, symbol: str) -> bool:
         """Check if a symbol is being tracked."""
-        return symbol in self._states
+        levels = self._book.levels(symbol)
+        return levels is not None and levels.trail_pct is not None
 
     def get_all_states(self) -> dict[str, TrailingStopState]:
-        """Get all trailing stop states."""
-        return dict(self._states)
+        """Get a snapshot of all trailing stop states."""
+        states: dict[str, TrailingStopState] = {}
+        for symbol in self._book.symbols:
+            levels = self._book.levels(symbol)
+            if levels is None or levels.trail_pct is None:
+                continue
+            state = TrailingStopState(
+                symbol=symbol,
+                side=levels.side,
+                entry_price=levels.entry_price,
+                trail_pct=levels.trail_pct,
+                activation_pct=levels.activation_pct,
+            )
+            state.peak_price = levels.peak_price
+            state.current_stop = levels.trailing_stop
+            state.activated = levels.activated
+            states[symbol] = state
+        return states
 
 
 # Global singleton
@@ -25,75 +25,143 @@ Learning & Reflection:
 - TaskScheduler: Scheduled tasks for reflections
 """
 
-from keryxflow.agent.analyst_agent import AnalystAgent
-from keryxflow.agent.base_agent import (
-    AgentRole,
-    ExecutionResult,
-    MarketAnalysis,
-    RiskAssessment,
-    SpecializedAgent,
-)
-from keryxflow.agent.cognitive import (
-    AgentDecision,
-    AgentResponse,
-    AgentStats,
-    CognitiveAgent,
-    CycleResult,
-    CycleStatus,
-    DecisionType,
-    get_cognitive_agent,
-)
-from keryxflow.agent.executor import ToolExecutor, get_tool_executor
-from keryxflow.agent.executor_agent import ExecutorAgent
-from keryxflow.agent.orchestrator import AgentOrchestrator, get_agent_orchestrator
-from keryxflow.agent.reflection import (
-    DailyReflectionResult,
-    PostMortemResult,
-    ReflectionEngine,
-    ReflectionType,
-    WeeklyReflectionResult,
-    get_reflection_engine,
-)
-from keryxflow.agent.risk_agent import RiskAgent
-from keryxflow.agent.scheduler import (
-    ScheduledTask,
-    TaskFrequency,
-    TaskResult,
-    TaskScheduler,
-    TaskStatus,
-    get_task_scheduler,
-    setup_default_tasks,
-)
-from keryxflow.agent.session import (
-    SessionState,
-    SessionStats,
-    TradingSession,
-    get_trading_session,
-)
-from keryxflow.agent.strategy import (
-    MarketRegime,
-    StrategyConfig,
-    StrategyManager,
-    StrategySelection,
-    StrategyType,
-    get_strategy_manager,
-)
-from keryxflow.agent.strategy_gen import (
-    StrategyGenerationResult,
-    StrategyGenerator,
-    StrategyGenStats,
-    get_strategy_generator,
-)
-from keryxflow.agent.tools import (
-    BaseTool,
-    ToolCategory,
-    ToolParameter,
-    ToolResult,
-    TradingToolkit,
-    create_tool,
-    get_trading_toolkit,
-    register_all_tools,
-)
+from typing import TYPE_CHECKING
+
+from keryxflow.core.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from keryxflow.agent.analyst_agent import AnalystAgent
+    from keryxflow.agent.base_agent import (
+        AgentRole,
+        ExecutionResult,
+        MarketAnalysis,
+        RiskAssessment,
+        SpecializedAgent,
+    )
+    from keryxflow.agent.cognitive import (
+        AgentDecision,
+        AgentResponse,
+        AgentStats,
+        CognitiveAgent,
+        CycleResult,
+        CycleStatus,
+        DecisionType,
+        get_cognitive_agent,
+    )
+    from keryxflow.agent.cron import CronExpression
+    from keryxflow.agent.executor import ToolExecutor, get_tool_executor
+    from keryxflow.agent.executor_agent import ExecutorAgent
+    from keryxflow.agent.orchestrator import AgentOrchestrator, get_agent_orchestrator
+    from keryxflow.agent.reflection import (
+        DailyReflectionResult,
+        PostMortemResult,
+        ReflectionEngine,
+        ReflectionType,
+        WeeklyReflectionResult,
+        get_reflection_engine,
+    )
+    from keryxflow.agent.risk_agent import RiskAgent
+    from keryxflow.agent.scheduler import (
+        ScheduledTask,
+        TaskFrequency,
+        TaskResult,
+        TaskScheduler,
+        TaskStatus,
+        get_task_scheduler,
+        setup_default_tasks,
+    )
+    from keryxflow.agent.session import (
+        SessionState,
+        SessionStats,
+        TradingSession,
+        get_trading_session,
+    )
+    from keryxflow.agent.strategy import (
+        MarketRegime,
+        StrategyConfig,
+        StrategyManager,
+        StrategySelection,
+        StrategyType,
+        get_strategy_manager,
+    )
+    from keryxflow.agent.strategy_gen import (
+        StrategyGenerationResult,
+        StrategyGenerator,
+        StrategyGenStats,
+        get_strategy_generator,
+    )
+    from keryxflow.agent.tools import (
+        BaseTool,
+        ToolCategory,
+        ToolParameter,
+        ToolResult,
+        TradingToolkit,
+        create_tool,
+        get_trading_toolkit,
+        register_all_tools,
+    )
+
+# Public name -> defining submodule, imported on first access
+_LAZY_EXPORTS = {
+    "AnalystAgent": "analyst_agent",
+    "AgentRole": "base_agent",
+    "ExecutionResult": "base_agent",
+    "MarketAnalysis": "base_agent",
+    "RiskAssessment": "base_agent",
+    "SpecializedAgent": "base_agent",
+    "AgentDecision": "cognitive",
+    "AgentResponse": "cognitive",
+    "AgentStats": "cognitive",
+    "CognitiveAgent": "cognitive",
+    "CycleResult": "cognitive",
+    "CycleStatus": "cognitive",
+    "DecisionType": "cognitive",
+    "get_cognitive_agent": "cognitive",
+    "ToolExecutor": "executor",
+    "get_tool_executor": "executor",
+    "ExecutorAgent": "executor_agent",
+    "AgentOrchestrator": "orchestrator",
+    "get_agent_orchestrator": "orchestrator",
+    "DailyReflectionResult": "reflection",
+    "PostMortemResult": "reflection",
+    "ReflectionEngine": "reflection",
+    "ReflectionType": "reflection",
+    "WeeklyReflectionResult": "reflection",
+    "get_reflection_engine": "reflection",
+    "RiskAgent": "risk_agent",
+    "CronExpression": "cron",
+    "ScheduledTask": "scheduler",
+    "TaskFrequency": "scheduler",
+    "TaskResult": "scheduler",
+    "TaskScheduler": "scheduler",
+    "TaskStatus": "scheduler",
+    "get_task_scheduler": "scheduler",
+    "setup_default_tasks": "scheduler",
+    "SessionState": "session",
+    "SessionStats": "session",
+    "TradingSession": "session",
+    "get_trading_session": "session",
+    "MarketRegime": "strategy",
+    "StrategyConfig": "strategy",
+    "StrategyManager": "strategy",
+    "StrategySelection": "strategy",
+    "StrategyType": "strategy",
+    "get_strategy_manager": "strategy",
+    "StrategyGenerationResult": "strategy_gen",
+    "StrategyGenerator": "strategy_gen",
+    "StrategyGenStats": "strategy_gen",
+    "get_strategy_generator": "strategy_gen",
+    "BaseTool": "tools",
+    "ToolCategory": "tools",
+    "ToolParameter": "tools",
+    "ToolResult": "tools",
+    "TradingToolkit": "tools",
+    "create_tool": "tools",
+    "get_trading_toolkit": "tools",
+    "register_all_tools": "tools",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _LAZY_EXPORTS)
 
 __all__ = [
     # Base classes
@@ -152,6 +220,7 @@ __all__ = [
     "TaskResult",
     "TaskFrequency",
     "TaskStatus",
+    "CronExpression",
     # Strategy Generator
     "StrategyGenerator",
     "get_strategy_generator",
@@ -75,7 +75,7 @@ class CalculateIndicatorsTool(BaseTool):
             from keryxflow.exchange import get_exchange_adapter
 
             client = get_exchange_adapter()
-            ohlcv = await client.fetch_ohlcv(symbol, timeframe, limit=limit)
+            ohlcv = await client.get_ohlcv(symbol, timeframe, limit=limit)
 
             if len(ohlcv) < 30:
                 return ToolResult(
@@ -735,7 +735,7 @@ class CalculateStopLossTool(BaseTool):
                 from keryxflow.exchange import get_exchange_adapter
 
                 client = get_exchange_adapter()
-                ohlcv = await client.fetch_ohlcv(symbol, "1h", limit=20)
+                ohlcv = await client.get_ohlcv(symbol, "1h", limit=20)
 
                 if len(ohlcv) < 15:
                     return ToolResult(
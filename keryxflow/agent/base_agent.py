@@ -4,8 +4,11 @@ Provides the SpecializedAgent ABC, AgentRole enum, and shared data structures
 for the multi-agent architecture (Analyst → Risk → Executor pipeline).
 """
 
+import asyncio
+import functools
 import json
 from abc import ABC, abstractmethod
+from concurrent.futures import Executor
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from enum import StrEnum
@@ -99,6 +102,7 @@ class SpecializedAgent(ABC):
         self._event_bus = get_event_bus()
         self._initialized = False
         self._client: Any = None
+        self.request_executor: Executor | None = None  # Threads for Claude requests
 
     @property
     @abstractmethod
@@ -187,13 +191,18 @@ class SpecializedAgent(ABC):
         max_iter = max_iterations or self.settings.max_tool_calls_per_cycle
 
         for _iteration in range(max_iter):
-            response = self._client.messages.create(
-                model=self._get_model(),
-                max_tokens=self.settings.max_tokens,
-                temperature=self.settings.temperature,
-                system=system,
-                tools=tools,
-                messages=messages,
+            # The client is synchronous; a worker thread lets agents run concurrently
+            response = await asyncio.get_running_loop().run_in_executor(
+                self.request_executor,
+                functools.partial(
+                    self._client.messages.create,
+                    model=self._get_model(),
+                    max_tokens=self.settings.max_tokens,
+                    temperature=self.settings.temperature,
+                    system=system,
+                    tools=tools,
+                    messages=messages,
+                ),
             )
 
             total_tokens += response.usage.input_tokens + response.usage.output_tokens
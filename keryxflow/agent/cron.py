@@ -0,0 +1,171 @@
+"""Cron expressions for scheduled agent tasks.
+
+Supports the standard five fields (minute, hour, day of month, month,
+day of week) with ``*``, lists, ranges, ``/`` steps, month and weekday
+names, and the ``@hourly``/``@daily``/``@weekly``/``@monthly``/``@yearly``
+shortcuts. Times are evaluated in UTC, like the rest of the scheduler.
+"""
+
+from bisect import bisect_left
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+
+_ALIASES = {
+    "@hourly": "0 * * * *",
+    "@daily": "0 0 * * *",
+    "@midnight": "0 0 * * *",
+    "@weekly": "0 0 * * 0",
+    "@monthly": "0 0 1 * *",
+    "@yearly": "0 0 1 1 *",
+    "@annually": "0 0 1 1 *",
+}
+
+_MONTHS = {
+    name: i
+    for i, name in enumerate(
+        ["jan", "feb", "mar", "apr", "may", "jun", "jul", "aug", "sep", "oct", "nov", "dec"],
+        start=1,
+    )
+}
+_WEEKDAYS = {name: i for i, name in enumerate(["sun", "mon", "tue", "wed", "thu", "fri", "sat"])}
+
+# Far enough to reach the next 29 February
+_SEARCH_LIMIT = timedelta(days=366 * 8)
+
+
+def _parse_value(text: str, names: dict[str, int]) -> int:
+    """Parse a number or a month/weekday name."""
+    text = text.lower()
+    if text in names:
+        return names[text]
+    if not text.isdigit():
+        raise ValueError(f"Invalid cron value: {text!r}")
+    return int(text)
+
+
+def _parse_field(text: str, low: int, high: int, names: dict[str, int]) -> tuple[int, ...]:
+    """Parse one cron field into its sorted allowed values."""
+    values: set[int] = set()
+    for part in text.split(","):
+        step = 1
+        stepped = "/" in part
+        if stepped:
+            part, step_text = part.split("/", 1)
+            step = _parse_value(step_text, {})
+            if step < 1:
+                raise ValueError(f"Invalid cron step: {step_text!r}")
+
+        if part == "*":
+            start, end = low, high
+        elif "-" in part:
+            first, last = part.split("-", 1)
+            start, end = _parse_value(first, names), _parse_value(last, names)
+        else:
+            start = _parse_value(part, names)
+            end = high if stepped else start  # "5/15" means 5-max/15
+
+        if not low <= start <= end <= high:
+            raise ValueError(f"Cron field {text!r} out of range {low}-{high}")
+        values.update(range(start, end + 1, step))
+    return tuple(sorted(values))
+
+
+@dataclass(frozen=True)
+class CronExpression:
+    """
+    A parsed five-field cron expression.
+
+    Example:
+        cron = CronExpression.parse("*/15 9-17 * * mon-fri")
+        next_run = cron.next_after(datetime.now(UTC))
+    """
+
+    expression: str
+    minutes: tuple[int, ...]
+    hours: tuple[int, ...]
+    days: tuple[int, ...]
+    months: tuple[int, ...]
+    weekdays: tuple[int, ...]  # 0 = Sunday
+    day_restricted: bool
+    weekday_restricted: bool
+
+    @classmethod
+    def parse(cls, expression: str) -> "CronExpression":
+        """
+        Parse a cron expression.
+
+        Args:
+            expression: Five fields or an ``@`` shortcut
+
+        Returns:
+            Parsed expression
+
+        Raises:
+            ValueError: If the expression is malformed
+        """
+        fields = _ALIASES.get(expression.strip().lower(), expression).split()
+        if len(fields) != 5:
+            raise ValueError(f"Cron expression needs 5 fields: {expression!r}")
+        minute, hour, day, month, weekday = fields
+
+        # 7 is also Sunday
+        weekdays = tuple(sorted({d % 7 for d in _parse_field(weekday, 0, 7, _WEEKDAYS)}))
+        return cls(
+            expression=expression,
+            minutes=_parse_field(minute, 0, 59, {}),
+            hours=_parse_field(hour, 0, 23, {}),
+            days=_parse_field(day, 1, 31, {}),
+            months=_parse_field(month, 1, 12, _MONTHS),
+            weekdays=weekdays,
+            day_restricted=not day.startswith("*"),
+            weekday_restricted=not weekday.startswith("*"),
+        )
+
+    def _day_matches(self, when: datetime) -> bool:
+        """Check the day-of-month and day-of-week fields."""
+        day_ok = when.day in self.days
+        weekday_ok = (when.weekday() + 1) % 7 in self.weekdays
+        # As in cron: when both are restricted, either may match
+        if self.day_restricted and self.weekday_restricted:
+            return day_ok or weekday_ok
+        return day_ok and weekday_ok
+
+    def next_after(self, after: datetime) -> datetime:
+        """
+        Get the first matching minute strictly after a time.
+
+        Args:
+            after: Reference time (its timezone is kept)
+
+        Returns:
+            Next matching time
+
+        Raises:
+            ValueError: If the expression never matches (e.g. 30 February)
+        """
+        when = after.replace(second=0, microsecond=0) + timedelta(minutes=1)
+        limit = after + _SEARCH_LIMIT
+
+        while when <= limit:
+            if when.month not in self.months:
+                year, month = (
+                    (when.year + 1, 1) if when.month == 12 else (when.year, when.month + 1)
+                )
+                when = when.replace(year=year, month=month, day=1, hour=0, minute=0)
+                continue
+            if not self._day_matches(when):
+                when = (when + timedelta(days=1)).replace(hour=0, minute=0)
+                continue
+            i = bisect_left(self.hours, when.hour)
+            if i == len(self.hours):
+                when = (when + timedelta(days=1)).replace(hour=0, minute=0)
+                continue
+            if self.hours[i] != when.hour:
+                when = when.replace(hour=self.hours[i], minute=0)
+            i = bisect_left(self.minutes, when.minute)
+            if i == len(self.minutes):
+                when = (when + timedelta(hours=1)).replace(minute=0)
+                continue
+            return when.replace(minute=self.minutes[i])
+
+        raise ValueError(f"Cron expression never matches: {self.expression!r}")
@@ -4,10 +4,15 @@ Coordinates the Analyst → Risk → Executor pipeline, returning
 CycleResult for drop-in compatibility with TradingEngine.
 """
 
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from typing import Any
 
 from keryxflow.agent.analyst_agent import AnalystAgent
+from keryxflow.agent.base_agent import MarketAnalysis
 from keryxflow.agent.cognitive import (
     AgentDecision,
     AgentStats,
@@ -19,6 +24,7 @@ from keryxflow.agent.executor import ToolExecutor, get_tool_executor
 from keryxflow.agent.executor_agent import ExecutorAgent
 from keryxflow.agent.risk_agent import RiskAgent
 from keryxflow.agent.tools import (
+    ToolResult,
     TradingToolkit,
     get_trading_toolkit,
     register_all_tools,
@@ -30,20 +36,81 @@ from keryxflow.memory.manager import MemoryManager, get_memory_manager
 
 logger = get_logger(__name__)
 
+# Pipeline stages timed in get_stats()["stages"]
+STAGES = ("context", "analyst", "queue_wait", "risk", "executor", "cycle")
+
+
+@dataclass
+class StageStats:
+    """Latency and token totals for one pipeline stage."""
+
+    runs: int = 0
+    total_ms: float = 0.0
+    max_ms: float = 0.0
+    last_ms: float = 0.0
+    tokens: int = 0
+
+    def record(self, elapsed_ms: float, tokens: int = 0) -> None:
+        """Record one run of the stage."""
+        self.runs += 1
+        self.total_ms += elapsed_ms
+        self.max_ms = max(self.max_ms, elapsed_ms)
+        self.last_ms = elapsed_ms
+        self.tokens += tokens
+
+    @property
+    def avg_tokens(self) -> float:
+        """Average tokens per run."""
+        return self.tokens / self.runs if self.runs else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            "runs": self.runs,
+            "avg_ms": self.total_ms / self.runs if self.runs else 0.0,
+            "max_ms": self.max_ms,
+            "last_ms": self.last_ms,
+            "tokens": self.tokens,
+        }
+
+
+@dataclass
+class _CycleState:
+    """Progress of one cycle, shared by its analyst tasks and the trade queue."""
+
+    started_at: datetime
+    context: dict[str, Any]
+    tokens: int = 0
+    tool_results: list[ToolResult] = field(default_factory=list)
+    results: list[CycleResult] = field(default_factory=list)
+    analyses_in_flight: int = 0
+    analyses_skipped: int = 0
+
+
+def _elapsed_ms(start: float) -> float:
+    """Milliseconds since a perf_counter reading."""
+    return (time.perf_counter() - start) * 1000
+
 
 class AgentOrchestrator:
     """Orchestrates the multi-agent trading pipeline.
 
     Pipeline: AnalystAgent → RiskAgent → ExecutorAgent
 
-    The orchestrator manages the sequential pipeline with early exit:
-    1. AnalystAgent analyzes market → MarketAnalysis
-    2. If signal is "hold", pipeline stops (no action)
-    3. RiskAgent evaluates the proposed trade → RiskAssessment
-    4. If not approved, pipeline stops (rejected)
+    Each cycle runs the pipeline for every symbol:
+    1. AnalystAgent analyzes each symbol → MarketAnalysis. Analyses run
+       concurrently, at most ``analyst_concurrency`` at a time, and no new
+       one starts once the cycle would exceed the daily token budget
+    2. If signal is "hold", that symbol stops (no action)
+    3. Other analyses join a queue as they finish. One trade at a time,
+       RiskAgent evaluates the proposed trade → RiskAssessment, seeing the
+       trades already executed in the cycle
+    4. If not approved, that symbol stops (rejected)
     5. ExecutorAgent executes the trade → ExecutionResult
 
-    Returns CycleResult for compatibility with TradingEngine.
+    Returns CycleResult for compatibility with TradingEngine: the first
+    executed trade, else the first rejection, else a hold. Per-stage
+    latency is reported in get_stats().
     """
 
     def __init__(
@@ -76,15 +143,27 @@ class AgentOrchestrator:
             settings=self.settings,
         )
 
+        self._request_pool: ThreadPoolExecutor | None = None
+        self._open_request_pool()
+
         self._initialized = False
         self._stats = AgentStats()
+        self._stages = {stage: StageStats() for stage in STAGES}
+        self._analyses_skipped = 0
         self._cycle_history: list[CycleResult] = []
+        self.budget_exceeded: bool = False
+
+        # Risk and execution see the portfolio one trade at a time, across cycles too
+        self._trade_lock = asyncio.Lock()
 
     async def initialize(self) -> None:
         """Initialize all agents."""
         if self._initialized:
             return
 
+        if self._request_pool is None:
+            self._open_request_pool()
+
         # Ensure tools are registered
         if self.toolkit.tool_count == 0:
             register_all_tools(self.toolkit)
@@ -96,6 +175,25 @@ class AgentOrchestrator:
         self._initialized = True
         logger.info("agent_orchestrator_initialized")
 
+    def close(self) -> None:
+        """Shut down the request threads; initialize() starts new ones."""
+        if self._request_pool is not None:
+            self._request_pool.shutdown(wait=False)
+            self._request_pool = None
+        for agent in (self.analyst, self.risk_agent, self.executor_agent):
+            agent.request_executor = None
+        self._initialized = False
+
+    def _open_request_pool(self) -> None:
+        """Start the threads the agents make Claude requests from."""
+        # Claude requests block a thread each: one per concurrent analysis plus the trade queue
+        self._request_pool = ThreadPoolExecutor(
+            max_workers=self.settings.analyst_concurrency + 1,
+            thread_name_prefix="agent-request",
+        )
+        for agent in (self.analyst, self.risk_agent, self.executor_agent):
+            agent.request_executor = self._request_pool
+
     async def run_cycle(self, symbols: list[str] | None = None) -> CycleResult:
         """Run a full multi-agent cycle.
 
@@ -109,38 +207,34 @@ class AgentOrchestrator:
             await self.initialize()
 
         started_at = datetime.now(UTC)
+        cycle_start = time.perf_counter()
         symbols = symbols or get_settings().system.symbols
-        total_tokens = 0
+
+        # Check token budget before calling Claude
+        if self.budget_exceeded and self.settings.daily_token_budget > 0:
+            logger.warning(
+                "token_budget_exceeded_skipping_cycle",
+                total_tokens=self._stats.total_tokens_used,
+                budget=self.settings.daily_token_budget,
+            )
+            return CycleResult(
+                status=CycleStatus.RATE_LIMITED,
+                error="Daily token budget exceeded",
+                started_at=started_at,
+                completed_at=datetime.now(UTC),
+            )
 
         try:
             # Build context for all symbols
+            stage_start = time.perf_counter()
             context = await self._build_context(symbols)
+            self._stages["context"].record(_elapsed_ms(stage_start))
 
-            # Run pipeline for each symbol
-            for symbol in symbols:
-                result = await self._run_pipeline(symbol, context, started_at, total_tokens)
-                if result is not None:
-                    self._update_stats(result)
-                    self._stats.consecutive_errors = 0
-                    await self._publish_cycle_event(result)
-                    return result
-
-            # No actionable signal for any symbol
-            completed_at = datetime.now(UTC)
-            duration_ms = (completed_at - started_at).total_seconds() * 1000
-
-            result = CycleResult(
-                status=CycleStatus.NO_ACTION,
-                decision=AgentDecision(
-                    decision_type=DecisionType.HOLD,
-                    reasoning="No actionable signal found by analyst",
-                ),
-                duration_ms=duration_ms,
-                tokens_used=total_tokens,
-                started_at=started_at,
-                completed_at=completed_at,
-            )
+            cycle = _CycleState(started_at=started_at, context=context)
+            await self._run_pipelines(symbols, cycle)
 
+            result = self._cycle_result(cycle, len(symbols))
+            self._stages["cycle"].record(_elapsed_ms(cycle_start), cycle.tokens)
             self._update_stats(result)
             self._stats.consecutive_errors = 0
             await self._publish_cycle_event(result)
@@ -160,21 +254,78 @@ class AgentOrchestrator:
             self._update_stats(result)
             return result
 
-    async def _run_pipeline(
-        self,
-        symbol: str,
-        context: dict[str, Any],
-        started_at: datetime,
-        total_tokens: int,
-    ) -> CycleResult | None:
-        """Run the Analyst → Risk → Executor pipeline for a symbol.
-
-        Returns CycleResult if a decision was made, None to continue to next symbol.
+    async def _run_pipelines(self, symbols: list[str], cycle: _CycleState) -> None:
+        """Analyze all symbols concurrently and feed trades through one queue.
+
+        Analyst stages run at most ``analyst_concurrency`` at a time. Each
+        actionable analysis is queued as soon as it finishes, and a single
+        worker runs the risk and executor stages for queued trades in turn,
+        so sizing sees the trades executed before it.
+        """
+        semaphore = asyncio.Semaphore(self.settings.analyst_concurrency)
+        queue: asyncio.Queue[tuple[MarketAnalysis, float] | None] = asyncio.Queue()
+
+        async def analyze(symbol: str) -> None:
+            async with semaphore:
+                if not self._within_budget(cycle):
+                    cycle.analyses_skipped += 1
+                    logger.warning("orchestrator_analysis_skipped_budget", symbol=symbol)
+                    return
+                cycle.analyses_in_flight += 1
+                try:
+                    analysis = await self._analyze(symbol, cycle)
+                finally:
+                    cycle.analyses_in_flight -= 1
+
+            if analysis is not None:
+                await queue.put((analysis, time.perf_counter()))
+
+        async def trade_worker() -> None:
+            while (item := await queue.get()) is not None:
+                analysis, queued_at = item
+                async with self._trade_lock:
+                    self._stages["queue_wait"].record(_elapsed_ms(queued_at))
+                    cycle.results.append(await self._run_trade(analysis, cycle))
+
+        worker = asyncio.create_task(trade_worker())
+        analysts = [asyncio.create_task(analyze(symbol)) for symbol in symbols]
+        try:
+            await asyncio.gather(*analysts)
+            await queue.put(None)
+            await worker
+        except BaseException:
+            tasks = [*analysts, worker]
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+
+    def _within_budget(self, cycle: _CycleState) -> bool:
+        """Check whether another analysis fits in the daily token budget.
+
+        Analyses still running are counted at the average analyst cost.
+        """
+        budget = self.settings.daily_token_budget
+        if budget <= 0:
+            return True
+
+        average = self._stages["analyst"].avg_tokens
+        projected = (
+            self._stats.total_tokens_used + cycle.tokens + (cycle.analyses_in_flight + 1) * average
+        )
+        return projected <= budget
+
+    async def _analyze(self, symbol: str, cycle: _CycleState) -> MarketAnalysis | None:
+        """Run the analyst stage for a symbol.
+
+        Returns the analysis if it proposes a trade, None to skip the symbol.
         """
-        # Stage 1: Analyst
         logger.info("orchestrator_analyst_start", symbol=symbol)
-        analysis = await self.analyst.analyze(symbol, context)
-        total_tokens += analysis.tokens_used
+        stage_start = time.perf_counter()
+        analysis = await self.analyst.analyze(symbol, cycle.context)
+        self._stages["analyst"].record(_elapsed_ms(stage_start), analysis.tokens_used)
+        cycle.tokens += analysis.tokens_used
+        cycle.tool_results += analysis.tool_results
 
         await self._event_bus.publish(
             Event(
@@ -188,7 +339,7 @@ class AgentOrchestrator:
             )
         )
 
-        # If hold, skip to next symbol
+        # If hold, skip this symbol
         if analysis.signal == "hold" or analysis.confidence < 0.3:
             logger.info(
                 "orchestrator_hold",
@@ -198,10 +349,24 @@ class AgentOrchestrator:
             )
             return None
 
+        return analysis
+
+    async def _run_trade(self, analysis: MarketAnalysis, cycle: _CycleState) -> CycleResult:
+        """Run the Risk → Executor stages for an analyzed symbol.
+
+        Called for one trade at a time; executed trades are added to the
+        context's ``cycle_trades`` for the risk stage of later ones.
+        """
+        symbol = analysis.symbol
+
         # Stage 2: Risk Assessment
         logger.info("orchestrator_risk_start", symbol=symbol, signal=analysis.signal)
-        assessment = await self.risk_agent.assess(analysis, context)
-        total_tokens += assessment.tokens_used
+        stage_start = time.perf_counter()
+        assessment = await self.risk_agent.assess(analysis, cycle.context)
+        self._stages["risk"].record(_elapsed_ms(stage_start), assessment.tokens_used)
+        cycle.tokens += assessment.tokens_used
+        cycle.tool_results += assessment.tool_results
+        tokens = analysis.tokens_used + assessment.tokens_used
 
         await self._event_bus.publish(
             Event(
@@ -223,7 +388,7 @@ class AgentOrchestrator:
                 reasoning=assessment.reasoning[:100],
             )
             completed_at = datetime.now(UTC)
-            duration_ms = (completed_at - started_at).total_seconds() * 1000
+            duration_ms = (completed_at - cycle.started_at).total_seconds() * 1000
 
             return CycleResult(
                 status=CycleStatus.NO_ACTION,
@@ -235,8 +400,8 @@ class AgentOrchestrator:
                 ),
                 tool_results=analysis.tool_results + assessment.tool_results,
                 duration_ms=duration_ms,
-                tokens_used=total_tokens,
-                started_at=started_at,
+                tokens_used=tokens,
+                started_at=cycle.started_at,
                 completed_at=completed_at,
             )
 
@@ -246,8 +411,12 @@ class AgentOrchestrator:
             symbol=symbol,
             quantity=assessment.position_size,
         )
-        execution = await self.executor_agent.execute_trade(analysis, assessment, context)
-        total_tokens += execution.tokens_used
+        stage_start = time.perf_counter()
+        execution = await self.executor_agent.execute_trade(analysis, assessment, cycle.context)
+        self._stages["executor"].record(_elapsed_ms(stage_start), execution.tokens_used)
+        cycle.tokens += execution.tokens_used
+        cycle.tool_results += execution.tool_results
+        tokens += execution.tokens_used
 
         await self._event_bus.publish(
             Event(
@@ -262,10 +431,17 @@ class AgentOrchestrator:
         )
 
         completed_at = datetime.now(UTC)
-        duration_ms = (completed_at - started_at).total_seconds() * 1000
+        duration_ms = (completed_at - cycle.started_at).total_seconds() * 1000
 
         # Determine decision type
         if execution.executed:
+            cycle.context.setdefault("cycle_trades", []).append(
+                {
+                    "symbol": symbol,
+                    "side": execution.side or ("buy" if analysis.signal == "long" else "sell"),
+                    "quantity": execution.quantity or assessment.position_size,
+                }
+            )
             if analysis.signal == "long":
                 decision_type = DecisionType.ENTRY_LONG
             else:
@@ -287,8 +463,51 @@ class AgentOrchestrator:
             ),
             tool_results=all_tool_results,
             duration_ms=duration_ms,
-            tokens_used=total_tokens,
-            started_at=started_at,
+            tokens_used=tokens,
+            started_at=cycle.started_at,
+            completed_at=completed_at,
+        )
+
+    def _cycle_result(self, cycle: _CycleState, symbol_count: int) -> CycleResult:
+        """Combine the per-symbol results of a cycle into one CycleResult.
+
+        Reports the first executed trade, else the first trade that reached
+        the risk stage, else a hold. Tokens and tool results cover the whole
+        cycle.
+        """
+        self._analyses_skipped += cycle.analyses_skipped
+        completed_at = datetime.now(UTC)
+        duration_ms = (completed_at - cycle.started_at).total_seconds() * 1000
+
+        executed = [r for r in cycle.results if r.status == CycleStatus.SUCCESS]
+        if len(executed) > 1:
+            logger.info(
+                "orchestrator_multiple_trades",
+                symbols=[r.decision.symbol for r in executed if r.decision],
+            )
+
+        if executed or cycle.results:
+            chosen = (executed or cycle.results)[0]
+            status, decision, error = chosen.status, chosen.decision, None
+        elif symbol_count and cycle.analyses_skipped == symbol_count:
+            status, decision = CycleStatus.RATE_LIMITED, None
+            error = "Daily token budget exceeded"
+        else:
+            # No actionable signal for any symbol
+            status, error = CycleStatus.NO_ACTION, None
+            decision = AgentDecision(
+                decision_type=DecisionType.HOLD,
+                reasoning="No actionable signal found by analyst",
+            )
+
+        return CycleResult(
+            status=status,
+            decision=decision,
+            tool_results=cycle.tool_results,
+            error=error,
+            duration_ms=duration_ms,
+            tokens_used=cycle.tokens,
+            started_at=cycle.started_at,
             completed_at=completed_at,
         )
 
@@ -334,6 +553,16 @@ class AgentOrchestrator:
 
         self._stats.total_tool_calls += len(result.tool_results)
 
+        # Check daily token budget
+        budget = self.settings.daily_token_budget
+        if budget > 0 and self._stats.total_tokens_used >= budget:
+            self.budget_exceeded = True
+            logger.warning(
+                "daily_token_budget_exceeded",
+                total_tokens=self._stats.total_tokens_used,
+                budget=budget,
+            )
+
         self._cycle_history.append(result)
         if len(self._cycle_history) > 100:
             self._cycle_history = self._cycle_history[-100:]
@@ -370,6 +599,10 @@ class AgentOrchestrator:
                 else 0
             ),
             "multi_agent": True,
+            "budget_exceeded": self.budget_exceeded,
+            "analyst_concurrency": self.settings.analyst_concurrency,
+            "analyses_skipped_budget": self._analyses_skipped,
+            "stages": {stage: stats.to_dict() for stage, stats in self._stages.items()},
         }
 
     def get_recent_cycles(self, limit: int = 10) -> list[dict[str, Any]]:
@@ -156,7 +156,7 @@ class GetOHLCVTool(BaseTool):
             from keryxflow.exchange import get_exchange_adapter
 
             client = get_exchange_adapter()
-            ohlcv = await client.fetch_ohlcv(symbol, timeframe, limit=limit)
+            ohlcv = await client.get_ohlcv(symbol, timeframe, limit=limit)
 
             # Format the data
             candles = []
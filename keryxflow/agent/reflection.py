@@ -1,12 +1,15 @@
 """Reflection engine for learning from trading experience.
 
 This module provides capabilities for the agent to learn from past trades:
-- Trade Post-Mortem: Analyze individual closed trades
+- Trade Post-Mortem: Analyze individual closed trades, one at a time or
+  queued and sent to the LLM in batches
 - Daily Reflection: Review the day's trading performance
 - Weekly Reflection: Identify patterns and update rules
 """
 
+import asyncio
 import json
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from datetime import UTC, datetime, timedelta
 from enum import Enum
@@ -184,6 +187,10 @@ class ReflectionStats:
     rules_updated: int = 0
     patterns_identified: int = 0
     total_tokens_used: int = 0
+    batch_requests: int = 0
+    batched_post_mortems: int = 0
+    fallback_post_mortems: int = 0
+    cache_hits: int = 0
     last_reflection_time: datetime | None = None
 
 
@@ -195,6 +202,12 @@ class ReflectionEngine:
     - Daily: End-of-day summary and lessons
     - Weekly: Pattern identification and rule updates
 
+    Post-mortems can also be queued with enqueue_post_mortem() and analyzed
+    by flush_post_mortems(), which sends up to batch_size episodes per LLM
+    request and asks for one JSON object per episode. Episodes the response
+    does not cover, and episodes queued beyond max_pending, get the basic
+    post-mortem instead. Results are cached by episode id.
+
     Example:
         engine = ReflectionEngine()
         await engine.initialize()
@@ -202,6 +215,10 @@ class ReflectionEngine:
         # Analyze a closed trade
         result = await engine.post_mortem(episode_id=123)
 
+        # Or queue it; the scheduler's post_mortem_batch task flushes the queue
+        engine.enqueue_post_mortem(episode_id=124)
+        results = await engine.flush_post_mortems()
+
         # Run daily reflection
         daily = await engine.daily_reflection()
 
@@ -231,6 +248,36 @@ Answer these questions:
 
 Provide your analysis in a structured format."""
 
+    BATCH_POST_MORTEM_PROMPT = """Analyze these {count} closed trades and extract lessons from each.
+
+{trades}
+
+For every trade, answer:
+1. What went well in this trade?
+2. What went wrong or could be improved?
+3. What is the key lesson from this trade?
+4. Would you take this exact trade again?
+5. Should any new rules be created based on this trade?
+
+Respond with only a JSON array holding one object per trade, in this form:
+[{{"episode_id": 1, "lessons_learned": "...", "what_went_well": "...", \
+"what_went_wrong": "...", "would_take_again": true, \
+"new_rules": [{{"name": "...", "condition": "...", "description": "..."}}], \
+"pattern_observations": ["..."]}}]"""
+
+    BATCH_TRADE_TEMPLATE = """Trade {episode_id}:
+- Symbol: {symbol}
+- Entry: ${entry_price:.2f} at {entry_time}
+- Exit: ${exit_price:.2f} at {exit_time}
+- Outcome: {outcome} ({pnl_percentage:+.2f}%)
+- Entry Reasoning: {entry_reasoning}
+- Exit Reasoning: {exit_reasoning}
+- Technical Context: {technical_context}"""
+
+    # Output tokens requested per episode in a batch, and the overall cap
+    BATCH_TOKENS_PER_EPISODE = 400
+    BATCH_MAX_TOKENS = 8192
+
     DAILY_REFLECTION_PROMPT = """Analyze today's trading performance.
 
 Date: {date}
@@ -283,22 +330,41 @@ Provide your analysis in a structured format."""
         self,
         episodic_memory: EpisodicMemory | None = None,
         semantic_memory: SemanticMemory | None = None,
+        batch_size: int | None = None,
+        max_pending: int | None = None,
+        cache_size: int | None = None,
     ):
         """Initialize the reflection engine.
 
         Args:
             episodic_memory: Episodic memory instance. Uses global if None.
             semantic_memory: Semantic memory instance. Uses global if None.
+            batch_size: Episodes per batched LLM request. Uses settings if None.
+            max_pending: Queued episodes analyzed by the LLM; the rest get a
+                basic post-mortem. Uses settings if None.
+            cache_size: Post-mortems cached by episode id. Uses settings if None.
         """
         self.settings = get_settings()
         self.episodic = episodic_memory or get_episodic_memory()
         self.semantic = semantic_memory or get_semantic_memory()
 
+        agent = self.settings.agent
+        self.batch_size = batch_size or agent.reflection_batch_size
+        self.max_pending = max_pending or agent.reflection_max_pending
+        self.cache_size = agent.reflection_cache_size if cache_size is None else cache_size
+
         self._initialized = False
         self._client: Any = None
         self._stats = ReflectionStats()
         self._reflection_history: list[dict[str, Any]] = []
 
+        # Post-mortem queue and cache
+        self._pending: list[int] = []
+        self._overflow: list[int] = []
+        self._queued: set[int] = set()
+        self._cache: OrderedDict[int, PostMortemResult] = OrderedDict()
+        self._flush_lock = asyncio.Lock()
+
     async def initialize(self) -> None:
         """Initialize the reflection engine."""
         if self._initialized:
@@ -334,6 +400,10 @@ Provide your analysis in a structured format."""
         if not self._initialized:
             await self.initialize()
 
+        cached = self._get_cached(episode_id)
+        if cached is not None:
+            return cached
+
         # Get the episode
         episode = await self.episodic.get_episode(episode_id)
         if episode is None:
@@ -345,60 +415,184 @@ Provide your analysis in a structured format."""
             return None
 
         # Build the prompt
-        technical_context = "Not available"
-        if episode.technical_context:
-            try:
-                technical_context = json.dumps(json.loads(episode.technical_context), indent=2)
-            except json.JSONDecodeError:
-                logger.debug("json_decode_fallback", context="technical_context")
-                technical_context = episode.technical_context
-
         prompt = self.POST_MORTEM_PROMPT.format(
-            symbol=episode.symbol,
-            entry_price=episode.entry_price,
-            entry_time=episode.entry_timestamp.isoformat(),
-            exit_price=episode.exit_price or 0,
-            exit_time=episode.exit_timestamp.isoformat() if episode.exit_timestamp else "N/A",
-            outcome=episode.outcome.value if episode.outcome else "unknown",
-            pnl_percentage=episode.pnl_percentage or 0,
-            entry_reasoning=episode.entry_reasoning,
-            exit_reasoning=episode.exit_reasoning or "Not specified",
-            technical_context=technical_context,
+            **self._episode_fields(episode),
+            technical_context=self._format_technical_context(episode, indent=2),
         )
 
         # Get analysis from Claude
         analysis = await self._get_analysis(prompt)
-        if analysis is None:
+        analyzed = analysis is not None
+        if not analyzed:
             # Generate a basic analysis without LLM
             analysis = self._generate_basic_post_mortem(episode)
 
         # Parse the analysis
         result = self._parse_post_mortem(episode, analysis)
+        await self._finish_post_mortem(result, cache=analyzed)
 
-        # Update the episode with lessons learned
-        if result:
-            await self.episodic.record_lessons(
-                episode_id=episode_id,
-                lessons=result.lessons_learned,
-                what_went_well=result.what_went_well,
-                what_went_wrong=result.what_went_wrong,
-                would_take_again=result.would_take_again,
-            )
+        logger.info(
+            "post_mortem_completed",
+            episode_id=episode_id,
+            outcome=result.outcome.value,
+            new_rules=len(result.new_rules),
+        )
 
-            # Create any new rules
-            for rule_data in result.new_rules:
-                await self._create_rule_from_reflection(rule_data)
+        return result
 
-            self._stats.total_post_mortems += 1
-            self._stats.last_reflection_time = datetime.now(UTC)
+    def enqueue_post_mortem(self, episode_id: int) -> bool:
+        """Queue a closed trade for the next batched post-mortem.
 
-            logger.info(
-                "post_mortem_completed",
-                episode_id=episode_id,
-                outcome=result.outcome.value,
-                new_rules=len(result.new_rules),
+        Args:
+            episode_id: ID of the trade episode to analyze
+
+        Returns:
+            False if the queue is full and the episode will get a basic
+            post-mortem without the LLM, True otherwise
+        """
+        if episode_id in self._queued or episode_id in self._cache:
+            return True
+
+        self._queued.add(episode_id)
+        if len(self._pending) >= self.max_pending:
+            self._overflow.append(episode_id)
+            return False
+
+        self._pending.append(episode_id)
+        return True
+
+    @property
+    def pending_post_mortems(self) -> int:
+        """Number of queued episodes not analyzed yet."""
+        return len(self._pending) + len(self._overflow)
+
+    async def flush_post_mortems(self) -> list[PostMortemResult]:
+        """Analyze every queued episode.
+
+        Queued episodes are sent in batches of batch_size, one LLM request
+        per batch; episodes queued beyond max_pending get the basic
+        post-mortem. Runs as the scheduler's post_mortem_batch task.
+
+        Returns:
+            Post-mortem results for the queued episodes that could be analyzed
+        """
+        async with self._flush_lock:
+            pending, self._pending = self._pending, []
+            overflow, self._overflow = self._overflow, []
+            self._queued.clear()
+
+            results = []
+            for i in range(0, len(pending), self.batch_size):
+                results.extend(await self.post_mortem_batch(pending[i : i + self.batch_size]))
+            if overflow:
+                logger.warning("post_mortem_queue_overflow", episodes=len(overflow))
+                results.extend(await self.post_mortem_batch(overflow, use_llm=False))
+            return results
+
+    async def post_mortem_batch(
+        self, episode_ids: list[int], use_llm: bool = True
+    ) -> list[PostMortemResult]:
+        """Analyze several closed trades with a single LLM request.
+
+        Args:
+            episode_ids: IDs of the trade episodes to analyze
+            use_llm: Generate basic post-mortems without calling the LLM
+
+        Returns:
+            Post-mortem results, cached ones included, for the episodes that
+            exist and are closed
+        """
+        if not self._initialized:
+            await self.initialize()
+
+        results: list[PostMortemResult] = []
+        episodes: list[TradeEpisode] = []
+        for episode_id in dict.fromkeys(episode_ids):
+            cached = self._get_cached(episode_id)
+            if cached is not None:
+                results.append(cached)
+                continue
+
+            episode = await self.episodic.get_episode(episode_id)
+            if episode is None or episode.exit_timestamp is None:
+                logger.warning("post_mortem_skipped", episode_id=episode_id)
+                continue
+            episodes.append(episode)
+
+        if not episodes:
+            return results
+
+        items: dict[int, dict[str, Any]] = {}
+        if use_llm and self._client is not None:
+            self._stats.batch_requests += 1
+            analysis = await self._get_analysis(
+                self._build_batch_prompt(episodes),
+                max_tokens=min(
+                    self.BATCH_TOKENS_PER_EPISODE * len(episodes), self.BATCH_MAX_TOKENS
+                ),
             )
+            if analysis is not None:
+                items = self._parse_batch_post_mortem(analysis)
+
+        fallbacks = 0
+        for episode in episodes:
+            item = items.get(episode.id or 0)
+            result = self._result_from_batch_item(episode, item) if item else None
+            analyzed = result is not None
+            if result is None:
+                result = self._parse_post_mortem(episode, self._generate_basic_post_mortem(episode))
+                fallbacks += 1
+            await self._finish_post_mortem(result, cache=analyzed)
+            results.append(result)
+
+        self._stats.batched_post_mortems += len(episodes) - fallbacks
+        self._stats.fallback_post_mortems += fallbacks
+
+        logger.info(
+            "post_mortem_batch_completed",
+            episodes=len(episodes),
+            analyzed=len(episodes) - fallbacks,
+            fallback=fallbacks,
+        )
+
+        return results
+
+    async def _finish_post_mortem(self, result: PostMortemResult, cache: bool = True) -> None:
+        """Record lessons and rules from a post-mortem.
+
+        Args:
+            result: The post-mortem
+            cache: Cache the result; basic post-mortems made without the
+                LLM are not cached, so the episode can be analyzed again
+        """
+        await self.episodic.record_lessons(
+            episode_id=result.episode_id,
+            lessons_learned=result.lessons_learned,
+            what_went_well=result.what_went_well,
+            what_went_wrong=result.what_went_wrong,
+            would_take_again=result.would_take_again,
+        )
 
+        # Create any new rules
+        for rule_data in result.new_rules:
+            if await self._create_rule_from_reflection(rule_data) is not None:
+                self._stats.rules_created += 1
+
+        self._stats.total_post_mortems += 1
+        self._stats.last_reflection_time = datetime.now(UTC)
+
+        if cache and self.cache_size > 0:
+            self._cache[result.episode_id] = result
+            self._cache.move_to_end(result.episode_id)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+
+    def _get_cached(self, episode_id: int) -> PostMortemResult | None:
+        """Get a cached post-mortem and mark it recently used."""
+        result = self._cache.get(episode_id)
+        if result is not None:
+            self._cache.move_to_end(episode_id)
+            self._stats.cache_hits += 1
         return result
 
     async def daily_reflection(self, date: datetime | None = None) -> DailyReflectionResult | None:
@@ -419,10 +613,8 @@ Provide your analysis in a structured format."""
         date_str = date.strftime("%Y-%m-%d")
 
         # Get episodes for the day
-        episodes = await self.episodic.get_episodes_by_date_range(
-            start_date=date.replace(hour=0, minute=0, second=0, microsecond=0),
-            end_date=date.replace(hour=23, minute=59, second=59, microsecond=999999),
-        )
+        day_start = date.replace(hour=0, minute=0, second=0, microsecond=0)
+        episodes = await self._get_episodes(day_start, day_start + timedelta(days=1))
 
         if not episodes:
             logger.info("no_trades_for_daily_reflection", date=date_str)
@@ -514,10 +706,7 @@ Provide your analysis in a structured format."""
         week_end_str = week_end.strftime("%Y-%m-%d")
 
         # Get episodes for the week
-        episodes = await self.episodic.get_episodes_by_date_range(
-            start_date=week_start,
-            end_date=week_end,
-        )
+        episodes = await self._get_episodes(week_start, week_end)
 
         if not episodes:
             logger.info("no_trades_for_weekly_reflection", week=week_start_str)
@@ -533,7 +722,7 @@ Provide your analysis in a structured format."""
         avg_pnl = total_pnl / total_trades if total_trades > 0 else 0
 
         # Build daily summaries
-        daily_summaries = await self._build_daily_summaries(week_start, week_end)
+        daily_summaries = self._build_daily_summaries(episodes)
 
         # Build symbol performance
         symbol_performance = self._build_symbol_performance(episodes)
@@ -611,11 +800,18 @@ Provide your analysis in a structured format."""
 
         return result
 
-    async def _get_analysis(self, prompt: str) -> str | None:
+    async def _get_episodes(self, start: datetime, end: datetime) -> list[TradeEpisode]:
+        """Get episodes entered in [start, end), oldest first."""
+        return [e async for e in self.episodic.iter_episode_history(start=start, end=end)]
+
+    async def _get_analysis(self, prompt: str, max_tokens: int = 2048) -> str | None:
         """Get analysis from Claude.
 
+        The client is synchronous, so the request runs in a worker thread.
+
         Args:
             prompt: The analysis prompt
+            max_tokens: Maximum tokens in the response
 
         Returns:
             Analysis text or None if failed
@@ -624,9 +820,10 @@ Provide your analysis in a structured format."""
             return None
 
         try:
-            response = self._client.messages.create(
+            response = await asyncio.to_thread(
+                self._client.messages.create,
                 model=self.settings.agent.model,
-                max_tokens=2048,
+                max_tokens=max_tokens,
                 temperature=0.3,
                 messages=[{"role": "user", "content": prompt}],
             )
@@ -707,6 +904,101 @@ Focus Areas: {"Maintain consistency" if total_pnl > 0 else "Improve entry criter
 Improvement Plan: {"Continue current approach" if total_pnl > 0 else "Review and refine entry signals"}
 """
 
+    def _episode_fields(self, episode: TradeEpisode) -> dict[str, Any]:
+        """Trade details shared by the post-mortem prompts."""
+        return {
+            "symbol": episode.symbol,
+            "entry_price": episode.entry_price,
+            "entry_time": episode.entry_timestamp.isoformat(),
+            "exit_price": episode.exit_price or 0,
+            "exit_time": episode.exit_timestamp.isoformat() if episode.exit_timestamp else "N/A",
+            "outcome": episode.outcome.value if episode.outcome else "unknown",
+            "pnl_percentage": episode.pnl_percentage or 0,
+            "entry_reasoning": episode.entry_reasoning,
+            "exit_reasoning": episode.exit_reasoning or "Not specified",
+        }
+
+    def _format_technical_context(self, episode: TradeEpisode, indent: int | None = None) -> str:
+        """Format an episode's technical context for a prompt."""
+        if not episode.technical_context:
+            return "Not available"
+        try:
+            return json.dumps(json.loads(episode.technical_context), indent=indent)
+        except json.JSONDecodeError:
+            logger.debug("json_decode_fallback", context="technical_context")
+            return episode.technical_context
+
+    def _build_batch_prompt(self, episodes: list[TradeEpisode]) -> str:
+        """Build one post-mortem prompt covering several episodes."""
+        trades = "\n\n".join(
+            self.BATCH_TRADE_TEMPLATE.format(
+                episode_id=episode.id,
+                **self._episode_fields(episode),
+                technical_context=self._format_technical_context(episode),
+            )
+            for episode in episodes
+        )
+        return self.BATCH_POST_MORTEM_PROMPT.format(count=len(episodes), trades=trades)
+
+    def _parse_batch_post_mortem(self, analysis: str) -> dict[int, dict[str, Any]]:
+        """Parse a batched post-mortem response into objects keyed by episode id."""
+        start, end = analysis.find("["), analysis.rfind("]")
+        if start == -1 or end < start:
+            logger.warning("batch_post_mortem_unparseable", reason="no_json_array")
+            return {}
+
+        try:
+            items = json.loads(analysis[start : end + 1])
+        except json.JSONDecodeError:
+            logger.warning("batch_post_mortem_unparseable", reason="invalid_json")
+            return {}
+
+        parsed: dict[int, dict[str, Any]] = {}
+        for item in items if isinstance(items, list) else []:
+            if not isinstance(item, dict):
+                continue
+            try:
+                parsed[int(item["episode_id"])] = item
+            except (KeyError, TypeError, ValueError):
+                continue
+        return parsed
+
+    def _result_from_batch_item(
+        self, episode: TradeEpisode, item: dict[str, Any]
+    ) -> PostMortemResult | None:
+        """Build a post-mortem from one object of a batched response.
+
+        Returns None if the object has no lessons, so the caller can fall
+        back to the basic post-mortem.
+        """
+        lessons = str(item.get("lessons_learned") or "").strip()
+        if not lessons:
+            return None
+
+        would_take = item.get("would_take_again")
+        if not isinstance(would_take, bool):
+            would_take = str(would_take).strip().lower() in ("yes", "true")
+
+        new_rules = item.get("new_rules")
+        observations = item.get("pattern_observations")
+
+        return PostMortemResult(
+            episode_id=episode.id or 0,
+            symbol=episode.symbol,
+            outcome=episode.outcome or TradeOutcome.LOSS,
+            pnl_percentage=episode.pnl_percentage or 0,
+            lessons_learned=lessons[:500],
+            what_went_well=str(item.get("what_went_well") or "Trade executed as planned")[:500],
+            what_went_wrong=str(item.get("what_went_wrong") or "No significant issues")[:500],
+            would_take_again=would_take,
+            new_rules=[r for r in new_rules if isinstance(r, dict)]
+            if isinstance(new_rules, list)
+            else [],
+            pattern_observations=[str(o)[:200] for o in observations]
+            if isinstance(observations, list)
+            else [],
+        )
+
     def _parse_post_mortem(self, episode: TradeEpisode, analysis: str) -> PostMortemResult:
         """Parse post-mortem analysis into structured result."""
         # Extract sections from analysis
@@ -855,24 +1147,18 @@ Improvement Plan: {"Continue current approach" if total_pnl > 0 else "Review and
             summaries.append(f"- {ep.symbol}: {outcome} ({pnl:+.2f}%) - {ep.entry_reasoning[:100]}")
         return "\n".join(summaries)
 
-    async def _build_daily_summaries(self, start: datetime, end: datetime) -> list[str]:
-        """Build daily summaries for weekly reflection."""
-        summaries = []
-        current = start
-
-        while current <= end:
-            date_str = current.strftime("%Y-%m-%d")
-            episodes = await self.episodic.get_episodes_by_date_range(
-                start_date=current.replace(hour=0, minute=0, second=0),
-                end_date=current.replace(hour=23, minute=59, second=59),
-            )
-
-            if episodes:
-                wins = sum(1 for e in episodes if e.outcome == TradeOutcome.WIN)
-                pnl = sum(e.pnl_percentage or 0 for e in episodes)
-                summaries.append(f"{date_str}: {len(episodes)} trades, {wins} wins, {pnl:+.2f}%")
+    def _build_daily_summaries(self, episodes: list[TradeEpisode]) -> list[str]:
+        """Build daily summaries for weekly reflection from the week's episodes."""
+        by_day: dict[str, list[TradeEpisode]] = {}
+        for ep in episodes:
+            by_day.setdefault(ep.entry_timestamp.strftime("%Y-%m-%d"), []).append(ep)
 
-            current += timedelta(days=1)
+        summaries = []
+        for date_str in sorted(by_day):
+            day = by_day[date_str]
+            wins = sum(1 for e in day if e.outcome == TradeOutcome.WIN)
+            pnl = sum(e.pnl_percentage or 0 for e in day)
+            summaries.append(f"{date_str}: {len(day)} trades, {wins} wins, {pnl:+.2f}%")
 
         return summaries
 
@@ -952,6 +1238,12 @@ Improvement Plan: {"Continue current approach" if total_pnl > 0 else "Review and
             "rules_updated": self._stats.rules_updated,
             "patterns_identified": self._stats.patterns_identified,
             "total_tokens_used": self._stats.total_tokens_used,
+            "batch_requests": self._stats.batch_requests,
+            "batched_post_mortems": self._stats.batched_post_mortems,
+            "fallback_post_mortems": self._stats.fallback_post_mortems,
+            "cache_hits": self._stats.cache_hits,
+            "pending_post_mortems": self.pending_post_mortems,
+            "cached_post_mortems": len(self._cache),
             "last_reflection_time": (
                 self._stats.last_reflection_time.isoformat()
                 if self._stats.last_reflection_time
@@ -79,13 +79,14 @@ Current UTC time: {current_time}
     async def assess(
         self,
         analysis: MarketAnalysis,
-        _context: dict[str, Any] | None = None,
+        context: dict[str, Any] | None = None,
     ) -> RiskAssessment:
         """Assess the risk of a proposed trade based on market analysis.
 
         Args:
             analysis: MarketAnalysis from the AnalystAgent
-            context: Optional additional context
+            context: Optional additional context; its ``cycle_trades`` lists
+                trades already executed in this cycle
 
         Returns:
             RiskAssessment with approval, position size, and risk parameters
@@ -99,9 +100,19 @@ Current UTC time: {current_time}
             f"Signal: {analysis.signal.upper()}",
             f"Confidence: {analysis.confidence:.2f}",
             f"Analyst reasoning: {analysis.reasoning}\n",
-            "Use the available tools to check portfolio state, calculate position size, "
-            "risk/reward ratio, and stop loss levels. Then approve or reject this trade.",
         ]
+
+        # Trades executed earlier in the same cycle may not show in positions yet
+        if context and context.get("cycle_trades"):
+            parts.append("Trades already executed this cycle:")
+            for trade in context["cycle_trades"]:
+                parts.append(f"- {trade['side']} {trade['quantity']} {trade['symbol']}")
+            parts.append("Account for this exposure when sizing.\n")
+
+        parts.append(
+            "Use the available tools to check portfolio state, calculate position size, "
+            "risk/reward ratio, and stop loss levels. Then approve or reject this trade."
+        )
         user_message = "\n".join(parts)
 
         try:
@@ -4,17 +4,26 @@ This module provides scheduling capabilities for:
 - Daily close tasks (end of trading day)
 - Weekly review tasks
 - Periodic reflections
+- Frequent maintenance tasks (fixed intervals, cron expressions)
 - Custom scheduled tasks
+
+Next run times are kept in a min-heap; the scheduler sleeps until the
+earliest one instead of polling, and due tasks run concurrently.
 """
 
 import asyncio
 import contextlib
+import heapq
+import itertools
+import time as time_module
 from collections.abc import Callable, Coroutine
 from dataclasses import dataclass, field
-from datetime import UTC, datetime, time, timedelta
+from datetime import datetime, time, timedelta
 from enum import Enum
 from typing import Any
 
+from keryxflow.agent.cron import CronExpression
+from keryxflow.core.clock import Clock
 from keryxflow.core.events import Event, EventType, get_event_bus
 from keryxflow.core.logging import get_logger
 
@@ -25,10 +34,12 @@ class TaskFrequency(str, Enum):
     """Frequency of scheduled tasks."""
 
     ONCE = "once"
+    INTERVAL = "interval"  # Every interval_seconds
     HOURLY = "hourly"
     DAILY = "daily"
     WEEKLY = "weekly"
     MONTHLY = "monthly"
+    CRON = "cron"  # Per the task's cron expression
 
 
 class TaskStatus(str, Enum):
@@ -53,6 +64,8 @@ class ScheduledTask:
     # Schedule configuration
     run_at_time: time | None = None  # Time of day to run (for DAILY/WEEKLY)
     run_on_day: int | None = None  # Day of week (0=Mon) or month (1-31)
+    interval_seconds: float | None = None  # Period for INTERVAL
+    cron: str | None = None  # Expression for CRON, e.g. "*/5 * * * *"
 
     # State
     status: TaskStatus = TaskStatus.PENDING
@@ -61,11 +74,23 @@ class ScheduledTask:
     run_count: int = 0
     error_count: int = 0
     last_error: str | None = None
+    active_runs: int = 0
+    skipped_count: int = 0  # Occurrences skipped at the concurrency limit
+    last_drift_ms: float | None = None  # Start delay behind schedule
 
     # Configuration
     enabled: bool = True
     max_retries: int = 3
     retry_delay_seconds: int = 60
+    timeout_seconds: float | None = None  # Cancel runs that take longer
+    max_concurrency: int = 1  # Overlapping runs allowed
+
+    _cron: CronExpression | None = field(default=None, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        """Parse the cron expression."""
+        if self.cron is not None:
+            self._cron = CronExpression.parse(self.cron)
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary."""
@@ -80,6 +105,13 @@ class ScheduledTask:
             "run_count": self.run_count,
             "error_count": self.error_count,
             "last_error": self.last_error,
+            "interval_seconds": self.interval_seconds,
+            "cron": self.cron,
+            "timeout_seconds": self.timeout_seconds,
+            "max_concurrency": self.max_concurrency,
+            "active_runs": self.active_runs,
+            "skipped_count": self.skipped_count,
+            "last_drift_ms": self.last_drift_ms,
         }
 
 
@@ -115,9 +147,23 @@ class SchedulerStats:
     tasks_executed: int = 0
     tasks_succeeded: int = 0
     tasks_failed: int = 0
+    tasks_timed_out: int = 0
+    tasks_skipped: int = 0
     total_execution_time_ms: float = 0
     last_execution_time: datetime | None = None
 
+    # Wakeups of the scheduler loop and how late dispatches were
+    wakeups: int = 0
+    drift_samples: int = 0
+    total_drift_ms: float = 0.0
+    max_drift_ms: float = 0.0
+
+    def record_drift(self, drift_ms: float) -> None:
+        """Record how far behind schedule a task was dispatched."""
+        self.drift_samples += 1
+        self.total_drift_ms += drift_ms
+        self.max_drift_ms = max(self.max_drift_ms, drift_ms)
+
 
 class TaskScheduler:
     """Scheduler for periodic agent tasks.
@@ -127,6 +173,13 @@ class TaskScheduler:
     - Weekly performance review
     - Periodic health checks
 
+    Pending runs sit in a min-heap keyed by next run time. The loop sleeps
+    until the earliest one (or until a task is added or changed), then
+    starts every due task as its own asyncio task, so a slow reflection
+    does not hold up anything else. Each task may set a timeout and how
+    many of its runs may overlap; an occurrence that would exceed that is
+    skipped. Drift, how late each run started, is reported in get_stats().
+
     Example:
         scheduler = TaskScheduler()
 
@@ -139,16 +192,30 @@ class TaskScheduler:
             run_at_time=time(23, 0),  # Run at 11 PM
         )
 
+        # Lightweight maintenance every 15 seconds
+        scheduler.add_task(
+            id="prune_cache",
+            name="Prune cache",
+            frequency=TaskFrequency.INTERVAL,
+            callback=prune_cache,
+            interval_seconds=15,
+            timeout_seconds=5,
+        )
+
         # Start the scheduler
         await scheduler.start()
     """
 
-    def __init__(self, check_interval_seconds: int = 60):
+    def __init__(self, check_interval_seconds: int = 60, clock: Clock | None = None):
         """Initialize the scheduler.
 
         Args:
-            check_interval_seconds: How often to check for due tasks.
+            check_interval_seconds: Longest the loop sleeps without checking
+                the clock, which bounds lateness after a wall-clock jump.
+            clock: Time source for schedules (default: wall clock). With a
+                SimulatedClock, call run_due() after advancing it.
         """
+        self.clock = clock or Clock()
         self._tasks: dict[str, ScheduledTask] = {}
         self._check_interval = check_interval_seconds
         self._running = False
@@ -157,6 +224,14 @@ class TaskScheduler:
         self._execution_history: list[TaskResult] = []
         self._scheduler_task: asyncio.Task | None = None
 
+        # (next_run, sequence, task_id); entries whose sequence no longer
+        # matches _heap_seq[task_id] are stale and skipped when popped
+        self._heap: list[tuple[datetime, int, str]] = []
+        self._heap_seq: dict[str, int] = {}
+        self._sequence = itertools.count()
+        self._wakeup = asyncio.Event()
+        self._in_flight: set[asyncio.Task] = set()
+
     def add_task(
         self,
         id: str,
@@ -166,6 +241,10 @@ class TaskScheduler:
         run_at_time: time | None = None,
         run_on_day: int | None = None,
         enabled: bool = True,
+        interval_seconds: float | None = None,
+        cron: str | None = None,
+        timeout_seconds: float | None = None,
+        max_concurrency: int = 1,
     ) -> ScheduledTask:
         """Add a scheduled task.
 
@@ -177,12 +256,25 @@ class TaskScheduler:
             run_at_time: Time of day to run (for daily/weekly)
             run_on_day: Day of week (0=Mon) or month (1-31)
             enabled: Whether task is enabled
+            interval_seconds: Period for INTERVAL tasks (may be under a minute)
+            cron: Five-field cron expression for CRON tasks
+            timeout_seconds: Cancel a run that takes longer than this
+            max_concurrency: How many runs of this task may overlap
 
         Returns:
             The created ScheduledTask
+
+        Raises:
+            ValueError: If the id exists or the schedule is invalid
         """
         if id in self._tasks:
             raise ValueError(f"Task '{id}' already exists")
+        if frequency == TaskFrequency.INTERVAL and not (interval_seconds and interval_seconds > 0):
+            raise ValueError("INTERVAL tasks need a positive interval_seconds")
+        if frequency == TaskFrequency.CRON and not cron:
+            raise ValueError("CRON tasks need a cron expression")
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
 
         task = ScheduledTask(
             id=id,
@@ -192,10 +284,14 @@ class TaskScheduler:
             run_at_time=run_at_time,
             run_on_day=run_on_day,
             enabled=enabled,
+            interval_seconds=interval_seconds,
+            cron=cron,
+            timeout_seconds=timeout_seconds,
+            max_concurrency=max_concurrency,
         )
 
         # Calculate initial next_run
-        task.next_run = self._calculate_next_run(task)
+        self._schedule(task)
 
         self._tasks[id] = task
 
@@ -219,6 +315,7 @@ class TaskScheduler:
         """
         if task_id in self._tasks:
             del self._tasks[task_id]
+            self._heap_seq.pop(task_id, None)
             logger.info("task_removed", task_id=task_id)
             return True
         return False
@@ -234,7 +331,7 @@ class TaskScheduler:
         """
         if task_id in self._tasks:
             self._tasks[task_id].enabled = True
-            self._tasks[task_id].next_run = self._calculate_next_run(self._tasks[task_id])
+            self._schedule(self._tasks[task_id])
             return True
         return False
 
@@ -249,6 +346,7 @@ class TaskScheduler:
         """
         if task_id in self._tasks:
             self._tasks[task_id].enabled = False
+            self._heap_seq.pop(task_id, None)
             return True
         return False
 
@@ -282,15 +380,22 @@ class TaskScheduler:
         logger.info("scheduler_started", task_count=len(self._tasks))
 
     async def stop(self) -> None:
-        """Stop the scheduler."""
+        """Stop the scheduler and cancel runs still in progress."""
         self._running = False
 
         if self._scheduler_task:
             self._scheduler_task.cancel()
             with contextlib.suppress(asyncio.CancelledError):
                 await self._scheduler_task
+            self._scheduler_task = None
 
-        logger.info("scheduler_stopped")
+        in_flight = list(self._in_flight)
+        for run in in_flight:
+            run.cancel()
+        if in_flight:
+            await asyncio.gather(*in_flight, return_exceptions=True)
+
+        logger.info("scheduler_stopped", cancelled_runs=len(in_flight))
 
     async def run_task_now(self, task_id: str) -> TaskResult | None:
         """Run a task immediately.
@@ -305,24 +410,99 @@ class TaskScheduler:
         if task is None:
             return None
 
-        return await self._execute_task(task)
+        task.active_runs += 1
+        result = await self._run_reserved(task)
+        self._schedule(task)
+        return result
+
+    async def run_due(self) -> list[TaskResult]:
+        """Run every enabled task whose next run time has passed on the clock.
+
+        Due tasks run concurrently; this returns once all of them finish.
+
+        Returns:
+            Results of the tasks that ran
+        """
+        runs = self._dispatch_due()
+        if not runs:
+            return []
+        return list(await asyncio.gather(*runs))
+
+    def _schedule(self, task: ScheduledTask, after: datetime | None = None) -> None:
+        """Set a task's next run and push it on the heap.
+
+        Args:
+            task: The task
+            after: Scheduled time of the occurrence just dispatched, if any
+        """
+        if task.frequency == TaskFrequency.ONCE and after is not None:
+            task.next_run = None
+        else:
+            task.next_run = self._calculate_next_run(task, after)
+
+        if task.next_run is None or not task.enabled:
+            self._heap_seq.pop(task.id, None)
+            return
+
+        sequence = next(self._sequence)
+        self._heap_seq[task.id] = sequence
+        heapq.heappush(self._heap, (task.next_run, sequence, task.id))
+        self._wakeup.set()
+
+    def _dispatch_due(self) -> list[asyncio.Task]:
+        """Start every task due on the clock; returns the started runs."""
+        now = self.clock.now()
+        runs = []
+        while self._heap and self._heap[0][0] <= now:
+            scheduled, sequence, task_id = heapq.heappop(self._heap)
+            task = self._tasks.get(task_id)
+            if task is None or self._heap_seq.get(task_id) != sequence:
+                continue  # Removed, disabled or rescheduled since pushed
+
+            drift_ms = (now - scheduled).total_seconds() * 1000
+            task.last_drift_ms = drift_ms
+            self._stats.record_drift(drift_ms)
+
+            # The next occurrence is fixed now, not after this run ends
+            self._schedule(task, after=scheduled)
+
+            if task.active_runs >= task.max_concurrency:
+                task.skipped_count += 1
+                self._stats.tasks_skipped += 1
+                logger.warning("task_skipped", task_id=task.id, active_runs=task.active_runs)
+                continue
+
+            task.active_runs += 1
+            run = asyncio.create_task(self._run_reserved(task))
+            self._in_flight.add(run)
+            run.add_done_callback(self._in_flight.discard)
+            runs.append(run)
+        return runs
+
+    def _seconds_until_next(self) -> float:
+        """Seconds until the earliest pending run, capped at the check interval."""
+        while self._heap:
+            _, sequence, task_id = self._heap[0]
+            if self._heap_seq.get(task_id) == sequence:
+                break
+            heapq.heappop(self._heap)  # Drop stale entries
+        if not self._heap:
+            return float(self._check_interval)
+        delay = (self._heap[0][0] - self.clock.now()).total_seconds()
+        return min(max(delay, 0.0), float(self._check_interval))
 
     async def _run_loop(self) -> None:
-        """Main scheduler loop."""
+        """Main scheduler loop: sleep until the earliest deadline, then dispatch."""
         while self._running:
             try:
-                now = datetime.now(UTC)
-
-                # Check each task
-                for task in self._tasks.values():
-                    if not task.enabled:
-                        continue
+                self._dispatch_due()
+                # Set again by add/enable/reschedule while we sleep
+                self._wakeup.clear()
 
-                    if task.next_run and now >= task.next_run:
-                        await self._execute_task(task)
-
-                # Wait before next check
-                await asyncio.sleep(self._check_interval)
+                delay = self._seconds_until_next()
+                with contextlib.suppress(TimeoutError):
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=delay)
+                self._stats.wakeups += 1
 
             except asyncio.CancelledError:
                 break
@@ -330,6 +510,13 @@ class TaskScheduler:
                 logger.exception("scheduler_loop_error")
                 await asyncio.sleep(self._check_interval)
 
+    async def _run_reserved(self, task: ScheduledTask) -> TaskResult:
+        """Execute a task whose active_runs slot is already taken."""
+        try:
+            return await self._execute_task(task)
+        finally:
+            task.active_runs -= 1
+
     async def _execute_task(self, task: ScheduledTask) -> TaskResult:
         """Execute a single task.
 
@@ -339,7 +526,8 @@ class TaskScheduler:
         Returns:
             TaskResult
         """
-        started_at = datetime.now(UTC)
+        started_at = self.clock.now()
+        start = time_module.perf_counter()
         task.status = TaskStatus.RUNNING
 
         # Publish event
@@ -356,16 +544,18 @@ class TaskScheduler:
 
         try:
             # Execute the callback
-            await task.callback()
+            if task.timeout_seconds:
+                await asyncio.wait_for(task.callback(), timeout=task.timeout_seconds)
+            else:
+                await task.callback()
 
             # Success
-            completed_at = datetime.now(UTC)
-            duration_ms = (completed_at - started_at).total_seconds() * 1000
+            completed_at = self.clock.now()
+            duration_ms = (time_module.perf_counter() - start) * 1000
 
             task.status = TaskStatus.COMPLETED
             task.last_run = completed_at
             task.run_count += 1
-            task.next_run = self._calculate_next_run(task)
 
             self._stats.tasks_executed += 1
             self._stats.tasks_succeeded += 1
@@ -388,17 +578,20 @@ class TaskScheduler:
 
         except Exception as e:
             # Failure
-            completed_at = datetime.now(UTC)
-            duration_ms = (completed_at - started_at).total_seconds() * 1000
+            completed_at = self.clock.now()
+            duration_ms = (time_module.perf_counter() - start) * 1000
+            timed_out = isinstance(e, TimeoutError)
+            error = f"Timed out after {task.timeout_seconds}s" if timed_out else str(e)
 
             task.status = TaskStatus.FAILED
             task.last_run = completed_at
             task.error_count += 1
-            task.last_error = str(e)
-            task.next_run = self._calculate_next_run(task)
+            task.last_error = error
 
             self._stats.tasks_executed += 1
             self._stats.tasks_failed += 1
+            if timed_out:
+                self._stats.tasks_timed_out += 1
 
             result = TaskResult(
                 task_id=task.id,
@@ -406,13 +599,16 @@ class TaskScheduler:
                 started_at=started_at,
                 completed_at=completed_at,
                 duration_ms=duration_ms,
-                error=str(e),
+                error=error,
             )
 
-            logger.exception(
-                "task_failed",
-                task_id=task.id,
-            )
+            if timed_out:
+                logger.warning("task_timed_out", task_id=task.id, timeout=task.timeout_seconds)
+            else:
+                logger.exception(
+                    "task_failed",
+                    task_id=task.id,
+                )
 
         # Store in history
         self._execution_history.append(result)
@@ -434,22 +630,39 @@ class TaskScheduler:
 
         return result
 
-    def _calculate_next_run(self, task: ScheduledTask) -> datetime | None:
+    def _calculate_next_run(
+        self, task: ScheduledTask, after: datetime | None = None
+    ) -> datetime | None:
         """Calculate the next run time for a task.
 
         Args:
             task: The task
+            after: Scheduled time of the previous occurrence; INTERVAL
+                tasks keep their phase from it instead of drifting
 
         Returns:
             Next run datetime or None for ONCE tasks that have run
         """
-        now = datetime.now(UTC)
+        now = self.clock.now()
 
         if task.frequency == TaskFrequency.ONCE:
             if task.run_count > 0:
                 return None
             return task.next_run or now
 
+        if task.frequency == TaskFrequency.INTERVAL:
+            interval = timedelta(seconds=task.interval_seconds or 60)
+            if after is None:
+                return now + interval
+            # Skip occurrences missed while the loop was held up
+            missed = max(0, int((now - after) / interval))
+            return after + interval * (missed + 1)
+
+        if task.frequency == TaskFrequency.CRON:
+            if task._cron is None:
+                task._cron = CronExpression.parse(task.cron or "")
+            return task._cron.next_after(now)
+
         if task.frequency == TaskFrequency.HOURLY:
             # Next hour
             next_run = now.replace(minute=0, second=0, microsecond=0) + timedelta(hours=1)
@@ -534,6 +747,10 @@ class TaskScheduler:
         Returns:
             Statistics dictionary
         """
+        next_run = min(
+            (t.next_run for t in self._tasks.values() if t.enabled and t.next_run),
+            default=None,
+        )
         return {
             "tasks_scheduled": len(self._tasks),
             "tasks_enabled": sum(1 for t in self._tasks.values() if t.enabled),
@@ -557,6 +774,17 @@ class TaskScheduler:
                 else None
             ),
             "running": self._running,
+            "tasks_timed_out": self._stats.tasks_timed_out,
+            "tasks_skipped": self._stats.tasks_skipped,
+            "active_runs": len(self._in_flight),
+            "wakeups": self._stats.wakeups,
+            "avg_drift_ms": (
+                self._stats.total_drift_ms / self._stats.drift_samples
+                if self._stats.drift_samples > 0
+                else 0
+            ),
+            "max_drift_ms": self._stats.max_drift_ms,
+            "next_run": next_run.isoformat() if next_run else None,
         }
 
     def get_execution_history(self, limit: int = 10) -> list[dict[str, Any]]:
@@ -615,4 +843,13 @@ async def setup_default_tasks(scheduler: TaskScheduler | None = None) -> None:
         run_on_day=6,  # Sunday
     )
 
+    # Batched post-mortems for queued episodes
+    scheduler.add_task(
+        id="post_mortem_batch",
+        name="Batched Trade Post-Mortems",
+        frequency=TaskFrequency.INTERVAL,
+        callback=reflection.flush_post_mortems,
+        interval_seconds=reflection.settings.agent.reflection_batch_interval,
+    )
+
     logger.info("default_tasks_configured", task_count=len(scheduler._tasks))
@@ -257,6 +257,7 @@ class StrategyGenerator:
         result = await self.generate(description)
 
         try:
+            from keryxflow.backtester.cache import BacktestCache
             from keryxflow.backtester.runner import run_backtest
 
             backtest_result = await run_backtest(
@@ -264,6 +265,7 @@ class StrategyGenerator:
                 start=datetime.strptime(start_date, "%Y-%m-%d").replace(tzinfo=UTC),
                 end=datetime.strptime(end_date, "%Y-%m-%d").replace(tzinfo=UTC),
                 initial_balance=initial_balance,
+                cache=BacktestCache(),
             )
             result.backtest_result = {
                 "total_return": backtest_result.total_return,
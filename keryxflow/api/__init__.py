@@ -4,7 +4,21 @@ Provides HTTP endpoints for monitoring engine state,
 positions, trades, portfolio balance, and WebSocket event streaming.
 """
 
-from keryxflow.api.server import create_app, start_api_server, stop_api_server
+from typing import TYPE_CHECKING
+
+from keryxflow.core.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from keryxflow.api.server import create_app, start_api_server, stop_api_server
+
+# Public name -> defining submodule, imported on first access
+_LAZY_EXPORTS = {
+    "create_app": "server",
+    "start_api_server": "server",
+    "stop_api_server": "server",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _LAZY_EXPORTS)
 
 __all__ = [
     "create_app",
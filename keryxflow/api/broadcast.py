@@ -0,0 +1,323 @@
+"""Shared WebSocket fan-out for EventBus events."""
+
+import asyncio
+import contextlib
+import json
+import time
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
+from typing import Any
+
+from keryxflow.core.events import Event, EventBus, EventType, get_event_bus
+from keryxflow.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Event types coalesced per symbol: only the latest update in each interval is sent
+COALESCED_EVENTS = frozenset({EventType.PRICE_UPDATE, EventType.OHLCV_UPDATE})
+
+
+def event_to_dict(event: Event) -> dict[str, Any]:
+    """Convert an Event to a JSON-serializable dictionary."""
+    return {
+        "type": event.type.value,
+        "timestamp": event.timestamp.isoformat(),
+        "data": event.data,
+    }
+
+
+def encode_event(event: Event) -> str:
+    """Encode an Event as a JSON text frame."""
+    return json.dumps(event_to_dict(event), default=str)
+
+
+@dataclass
+class ClientStats:
+    """Delivery statistics for one WebSocket client."""
+
+    sent: int = 0
+    dropped: int = 0
+    last_lag: float = 0.0  # seconds between broadcast and send
+    max_lag: float = 0.0
+
+    def record_send(self, lag: float) -> None:
+        """Record a delivered frame."""
+        self.sent += 1
+        self.last_lag = lag
+        self.max_lag = max(self.max_lag, lag)
+
+
+@dataclass
+class BroadcastClient:
+    """A WebSocket subscriber with its own bounded frame queue.
+
+    Attributes:
+        client_id: Identifier used in logs and stats
+        topics: Event types to receive (None = all)
+        symbols: Symbols to receive for events carrying one (None = all)
+        queue_size: Maximum frames buffered before the oldest is dropped
+    """
+
+    client_id: int
+    topics: frozenset[EventType] | None = None
+    symbols: frozenset[str] | None = None
+    queue_size: int = 256
+    stats: ClientStats = field(default_factory=ClientStats)
+    connected_at: float = field(default_factory=time.monotonic)
+
+    def __post_init__(self) -> None:
+        self.queue: asyncio.Queue[tuple[str, float]] = asyncio.Queue(maxsize=self.queue_size)
+        self.loop = asyncio.get_running_loop()
+
+    def wants(self, event: Event) -> bool:
+        """Check if the event passes this client's filters."""
+        if self.topics is not None and event.type not in self.topics:
+            return False
+        if self.symbols is not None:
+            symbol = event.data.get("symbol")
+            if symbol is not None and symbol not in self.symbols:
+                return False
+        return True
+
+    def offer(self, frame: str, sent_at: float) -> None:
+        """Enqueue a frame, dropping the oldest one if the client is behind."""
+        try:
+            self.queue.put_nowait((frame, sent_at))
+        except asyncio.QueueFull:
+            with contextlib.suppress(asyncio.QueueEmpty):
+                self.queue.get_nowait()
+                self.stats.dropped += 1
+            with contextlib.suppress(asyncio.QueueFull):
+                self.queue.put_nowait((frame, sent_at))
+
+    async def next_frame(self) -> str:
+        """Wait for the next frame and record its lag."""
+        frame, sent_at = await self.queue.get()
+        self.stats.record_send(time.monotonic() - sent_at)
+        return frame
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get delivery statistics."""
+        return {
+            "client_id": self.client_id,
+            "topics": sorted(t.value for t in self.topics) if self.topics else None,
+            "symbols": sorted(self.symbols) if self.symbols else None,
+            "queued": self.queue.qsize(),
+            "sent": self.stats.sent,
+            "dropped": self.stats.dropped,
+            "last_lag_ms": round(self.stats.last_lag * 1000, 2),
+            "max_lag_ms": round(self.stats.max_lag * 1000, 2),
+            "connected_seconds": round(time.monotonic() - self.connected_at, 1),
+        }
+
+
+class EventBroadcaster:
+    """Fans EventBus events out to WebSocket clients.
+
+    A single handler is subscribed to the EventBus regardless of how many
+    clients are connected. Each event is JSON-encoded once and the same
+    frame is queued for every matching client, so the EventBus dispatch
+    cost does not grow with the number of dashboards. High-frequency
+    events in COALESCED_EVENTS are limited to one frame per symbol per
+    ``coalesce_interval``; the latest update in each interval wins.
+
+    Example:
+        broadcaster = EventBroadcaster()
+        client = broadcaster.register(topics={EventType.ORDER_FILLED})
+        frame = await client.next_frame()
+        broadcaster.unregister(client)
+    """
+
+    def __init__(
+        self,
+        event_bus: EventBus | None = None,
+        coalesce_interval: float = 0.25,
+        queue_size: int = 256,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Initialize the broadcaster.
+
+        Args:
+            event_bus: Event bus to subscribe to (default: global bus)
+            coalesce_interval: Minimum seconds between coalesced frames per symbol
+            queue_size: Default per-client queue size
+            clock: Monotonic time source
+        """
+        self._event_bus = event_bus
+        self.coalesce_interval = coalesce_interval
+        self.queue_size = queue_size
+        self._clock = clock
+
+        self._clients: dict[int, BroadcastClient] = {}
+        self._next_id = 1
+        self._attached: EventBus | None = None
+
+        # Coalescing state keyed by (event type, symbol)
+        self._last_sent: dict[tuple[EventType, str], float] = {}
+        self._pending: dict[tuple[EventType, str], Event] = {}
+        self._timers: dict[tuple[EventType, str], asyncio.TimerHandle] = {}
+
+        self.events_received = 0
+        self.events_coalesced = 0
+        self.frames_encoded = 0
+
+    @property
+    def client_count(self) -> int:
+        """Number of connected clients."""
+        return len(self._clients)
+
+    def register(
+        self,
+        topics: Iterable[EventType] | None = None,
+        symbols: Iterable[str] | None = None,
+        queue_size: int | None = None,
+    ) -> BroadcastClient:
+        """Register a client and attach to the event bus if needed.
+
+        Args:
+            topics: Event types to receive (None = all)
+            symbols: Symbols to receive (None = all)
+            queue_size: Per-client queue size (default: broadcaster setting)
+
+        Returns:
+            The registered client
+        """
+        client = BroadcastClient(
+            client_id=self._next_id,
+            topics=frozenset(topics) if topics else None,
+            symbols=frozenset(symbols) if symbols else None,
+            queue_size=queue_size or self.queue_size,
+        )
+        self._next_id += 1
+        self._clients[client.client_id] = client
+
+        if self._attached is None:
+            self._attach()
+
+        logger.info("ws_client_registered", client_id=client.client_id, clients=self.client_count)
+        return client
+
+    def unregister(self, client: BroadcastClient) -> None:
+        """Remove a client and detach from the event bus when none remain."""
+        if self._clients.pop(client.client_id, None) is None:
+            return
+
+        logger.info(
+            "ws_client_unregistered",
+            client_id=client.client_id,
+            sent=client.stats.sent,
+            dropped=client.stats.dropped,
+        )
+        if not self._clients:
+            self._detach()
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get broadcaster and per-client statistics."""
+        return {
+            "clients": [c.get_stats() for c in self._clients.values()],
+            "events_received": self.events_received,
+            "events_coalesced": self.events_coalesced,
+            "frames_encoded": self.frames_encoded,
+            "coalesce_interval_ms": int(self.coalesce_interval * 1000),
+        }
+
+    async def on_event(self, event: Event) -> None:
+        """EventBus handler: coalesce, encode once and fan out."""
+        self.events_received += 1
+
+        if self.coalesce_interval > 0 and event.type in COALESCED_EVENTS:
+            symbol = event.data.get("symbol")
+            if symbol is not None:
+                self._coalesce((event.type, symbol), event)
+                return
+
+        self._broadcast(event)
+
+    def _coalesce(self, key: tuple[EventType, str], event: Event) -> None:
+        now = self._clock()
+        last = self._last_sent.get(key)
+
+        if last is None or now - last >= self.coalesce_interval:
+            self._last_sent[key] = now
+            self._broadcast(event)
+            return
+
+        # Within the interval: keep only the latest update and flush it later
+        if key in self._pending:
+            self.events_coalesced += 1
+        self._pending[key] = event
+        if key not in self._timers:
+            delay = self.coalesce_interval - (now - last)
+            loop = asyncio.get_running_loop()
+            self._timers[key] = loop.call_later(delay, self._flush, key)
+
+    def _flush(self, key: tuple[EventType, str]) -> None:
+        self._timers.pop(key, None)
+        event = self._pending.pop(key, None)
+        if event is not None:
+            self._last_sent[key] = self._clock()
+            self._broadcast(event)
+
+    def _broadcast(self, event: Event) -> None:
+        targets = [c for c in list(self._clients.values()) if c.wants(event)]
+        if not targets:
+            return
+
+        frame = encode_event(event)
+        self.frames_encoded += 1
+        sent_at = time.monotonic()
+
+        try:
+            current_loop = asyncio.get_running_loop()
+        except RuntimeError:
+            current_loop = None
+
+        for client in targets:
+            if client.loop is current_loop:
+                client.offer(frame, sent_at)
+            else:
+                # Client served from another event loop (e.g. a server thread)
+                with contextlib.suppress(RuntimeError):
+                    client.loop.call_soon_threadsafe(client.offer, frame, sent_at)
+
+    def _attach(self) -> None:
+        bus = self._event_bus or get_event_bus()
+        for event_type in EventType:
+            bus.subscribe(event_type, self.on_event)
+        self._attached = bus
+
+    def _detach(self) -> None:
+        if self._attached is not None:
+            for event_type in EventType:
+                self._attached.unsubscribe(event_type, self.on_event)
+            self._attached = None
+
+        for timer in self._timers.values():
+            timer.cancel()
+        self._timers.clear()
+        self._pending.clear()
+        self._last_sent.clear()
+
+
+def parse_topics(value: str | None) -> set[EventType] | None:
+    """Parse a comma-separated list of event type values.
+
+    Args:
+        value: e.g. "price_update,order_filled"
+
+    Returns:
+        Set of EventType, or None if value is empty
+
+    Raises:
+        ValueError: If a topic is not a known event type
+    """
+    if not value:
+        return None
+    return {EventType(topic.strip()) for topic in value.split(",") if topic.strip()}
+
+
+def parse_symbols(value: str | None) -> set[str] | None:
+    """Parse a comma-separated list of symbols."""
+    if not value:
+        return None
+    return {symbol.strip() for symbol in value.split(",") if symbol.strip()} or None
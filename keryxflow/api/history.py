@@ -0,0 +1,79 @@
+"""Serialization and streaming export for trade and episode history."""
+
+import csv
+import io
+import json
+from collections.abc import AsyncIterable, AsyncIterator, Sequence
+from datetime import datetime
+from enum import Enum
+from typing import Any
+
+from keryxflow.core.models import Trade, TradeEpisode
+
+EXPORT_FORMATS = ("ndjson", "csv")
+MEDIA_TYPES = {"ndjson": "application/x-ndjson", "csv": "text/csv"}
+
+# Exported columns, in model definition order
+TRADE_FIELDS: tuple[str, ...] = tuple(Trade.model_fields)
+EPISODE_FIELDS: tuple[str, ...] = tuple(TradeEpisode.model_fields)
+
+# Rows buffered into one chunk before it is handed to the response
+_CHUNK_ROWS = 500
+
+
+def _plain(value: Any) -> Any:
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+
+def row_to_dict(row: Any, fields: Sequence[str]) -> dict[str, Any]:
+    """Convert a model row to a JSON-safe dict of the given fields."""
+    return {name: _plain(getattr(row, name)) for name in fields}
+
+
+async def export_rows(
+    rows: AsyncIterable[Any],
+    fields: Sequence[str],
+    fmt: str,
+) -> AsyncIterator[str]:
+    """Encode rows as NDJSON or CSV, yielding text chunks as rows arrive.
+
+    Args:
+        rows: Async iterable of model rows
+        fields: Columns to export
+        fmt: ``"ndjson"`` or ``"csv"``
+
+    Yields:
+        Encoded chunks of up to ``_CHUNK_ROWS`` rows
+
+    Raises:
+        ValueError: If the format is unknown
+    """
+    if fmt not in EXPORT_FORMATS:
+        raise ValueError(f"Unknown export format: {fmt}")
+
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n") if fmt == "csv" else None
+    if writer is not None:
+        writer.writerow(fields)
+
+    pending = 0
+    async for row in rows:
+        if writer is not None:
+            writer.writerow([_plain(getattr(row, name)) for name in fields])
+        else:
+            buffer.write(json.dumps(row_to_dict(row, fields), separators=(",", ":")))
+            buffer.write("\n")
+        pending += 1
+        if pending >= _CHUNK_ROWS:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+            pending = 0
+
+    tail = buffer.getvalue()
+    if tail:
+        yield tail
@@ -0,0 +1,391 @@
+"""In-memory read model for REST status endpoints and the dashboard."""
+
+import asyncio
+import contextlib
+import hashlib
+import json
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from typing import Any
+
+from keryxflow.core.events import Event, EventBus, EventType, get_event_bus
+from keryxflow.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Sections served by the read model
+POSITIONS = "positions"
+TRADES = "trades"
+BALANCE = "balance"
+TODAY_TRADES = "today_trades"
+SECTIONS = (POSITIONS, TRADES, BALANCE, TODAY_TRADES)
+
+# Events that change persisted state, and the sections they invalidate
+_INVALIDATING_EVENTS: dict[EventType, tuple[str, ...]] = {
+    EventType.ORDER_FILLED: SECTIONS,
+    EventType.POSITION_OPENED: SECTIONS,
+    EventType.POSITION_UPDATED: (POSITIONS, BALANCE),
+    EventType.POSITION_CLOSED: SECTIONS,
+    EventType.PANIC_TRIGGERED: SECTIONS,
+}
+
+Loader = Callable[[], Awaitable[Any]]
+
+
+def _position_to_dict(p: Any) -> dict[str, Any]:
+    return {
+        "id": p.id,
+        "symbol": p.symbol,
+        "side": p.side.value,
+        "quantity": p.quantity,
+        "entry_price": p.entry_price,
+        "current_price": p.current_price,
+        "unrealized_pnl": p.unrealized_pnl,
+        "unrealized_pnl_percentage": p.unrealized_pnl_percentage,
+        "stop_loss": p.stop_loss,
+        "take_profit": p.take_profit,
+        "opened_at": p.opened_at.isoformat() if p.opened_at else None,
+    }
+
+
+def _trade_to_dict(t: Any) -> dict[str, Any]:
+    return {
+        "id": t.id,
+        "symbol": t.symbol,
+        "side": t.side.value,
+        "quantity": t.quantity,
+        "entry_price": t.entry_price,
+        "exit_price": t.exit_price,
+        "stop_loss": t.stop_loss,
+        "take_profit": t.take_profit,
+        "pnl": t.pnl,
+        "pnl_percentage": t.pnl_percentage,
+        "status": t.status.value,
+        "is_paper": t.is_paper,
+        "created_at": t.created_at.isoformat() if t.created_at else None,
+        "closed_at": t.closed_at.isoformat() if t.closed_at else None,
+    }
+
+
+async def load_positions() -> list[dict[str, Any]]:
+    """Load open positions from the paper engine."""
+    from keryxflow.exchange.paper import get_paper_engine
+
+    positions = await get_paper_engine().get_positions()
+    return [_position_to_dict(p) for p in positions]
+
+
+async def load_trades() -> list[dict[str, Any]]:
+    """Load the 50 most recent trades."""
+    from keryxflow.core.repository import get_trade_repository
+
+    trades = await get_trade_repository().get_recent_trades(limit=50)
+    return [_trade_to_dict(t) for t in trades]
+
+
+async def load_balance() -> dict[str, Any]:
+    """Load the paper portfolio balance."""
+    from keryxflow.exchange.paper import get_paper_engine
+
+    return await get_paper_engine().get_balance()
+
+
+async def load_today_trades() -> list[dict[str, Any]]:
+    """Load trades opened since midnight UTC."""
+    from keryxflow.core.repository import get_trade_repository
+
+    today_start = datetime.now(tz=UTC).replace(hour=0, minute=0, second=0, microsecond=0)
+    trades = await get_trade_repository().get_trades_by_date(start_date=today_start)
+    return [_trade_to_dict(t) for t in trades]
+
+
+DEFAULT_LOADERS: dict[str, Loader] = {
+    POSITIONS: load_positions,
+    TRADES: load_trades,
+    BALANCE: load_balance,
+    TODAY_TRADES: load_today_trades,
+}
+
+# Served when a loader fails before any data has been loaded
+_EMPTY: dict[str, Any] = {
+    POSITIONS: [],
+    TRADES: [],
+    BALANCE: {"total": {}, "free": {}, "used": {}},
+    TODAY_TRADES: [],
+}
+
+
+@dataclass
+class Snapshot:
+    """Encoded state of one read model section."""
+
+    section: str
+    data: Any
+    body: bytes
+    etag: str
+    version: int
+    loaded_at: float
+
+    @classmethod
+    def build(cls, section: str, data: Any, version: int, loaded_at: float) -> "Snapshot":
+        """Encode data and derive a content-based ETag."""
+        body = json.dumps(data, default=str, separators=(",", ":")).encode()
+        etag = f'"{hashlib.sha1(body, usedforsecurity=False).hexdigest()[:20]}"'
+        return cls(section, data, body, etag, version, loaded_at)
+
+
+class ReadModel:
+    """Event-maintained cache of positions, trades and balance.
+
+    Each section is loaded from the database once and then served from
+    memory. ORDER_FILLED and POSITION_* events mark sections dirty so the
+    next read reloads them; PRICE_UPDATE events reprice held positions in
+    memory without touching the database. Sections older than ``max_age``
+    are reloaded as a safety net for changes that publish no event.
+
+    Example:
+        model = ReadModel()
+        snapshot = await model.get(POSITIONS)
+        return Response(snapshot.body, headers={"ETag": snapshot.etag})
+    """
+
+    def __init__(
+        self,
+        event_bus: EventBus | None = None,
+        loaders: dict[str, Loader] | None = None,
+        max_age: float = 30.0,
+        refresh_delay: float = 0.05,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Initialize the read model.
+
+        Args:
+            event_bus: Event bus to follow (default: global bus)
+            loaders: Section loaders (default: database-backed loaders)
+            max_age: Seconds before a section is reloaded without an event
+            refresh_delay: Debounce before pushing reloaded sections to subscribers
+            clock: Monotonic time source
+        """
+        self._event_bus = event_bus
+        self._loaders = {**DEFAULT_LOADERS, **(loaders or {})}
+        self.max_age = max_age
+        self.refresh_delay = refresh_delay
+        self._clock = clock
+
+        self._snapshots: dict[str, Snapshot] = {}
+        self._dirty: set[str] = set()
+        self._locks: dict[str, asyncio.Lock] = {}
+        self._version = 0
+        self._attached: EventBus | None = None
+
+        self._subscribers: set[asyncio.Queue[str]] = set()
+        self._refresh_task: asyncio.Task | None = None
+
+        self.hits = 0
+        self.loads = 0
+
+    async def get(self, section: str) -> Snapshot:
+        """Get a section, loading it only if missing, dirty or stale.
+
+        Args:
+            section: One of SECTIONS
+
+        Returns:
+            Current snapshot of the section
+        """
+        self._attach()
+        snapshot = self._snapshots.get(section)
+        if snapshot is not None and not self._needs_load(section, snapshot):
+            self.hits += 1
+            return snapshot
+
+        lock = self._locks.setdefault(section, asyncio.Lock())
+        async with lock:
+            # Another request may have loaded it while we waited
+            snapshot = self._snapshots.get(section)
+            if snapshot is not None and not self._needs_load(section, snapshot):
+                self.hits += 1
+                return snapshot
+            return await self._load(section)
+
+    def invalidate(self, sections: Iterable[str] = SECTIONS) -> None:
+        """Mark sections for reload on next access.
+
+        Args:
+            sections: Sections to invalidate (default: all)
+        """
+        self._dirty.update(sections)
+        if self._subscribers:
+            self._schedule_refresh()
+
+    async def on_event(self, event: Event) -> None:
+        """EventBus handler keeping the model current."""
+        if event.type == EventType.PRICE_UPDATE:
+            self._apply_price(event.data.get("symbol"), event.data.get("price"))
+            return
+
+        sections = _INVALIDATING_EVENTS.get(event.type)
+        if sections:
+            self.invalidate(sections)
+
+    def subscribe(self) -> asyncio.Queue[str]:
+        """Subscribe to section change notifications.
+
+        Returns:
+            Queue receiving the name of each section that changes
+        """
+        self._attach()
+        queue: asyncio.Queue[str] = asyncio.Queue(maxsize=64)
+        self._subscribers.add(queue)
+        return queue
+
+    def unsubscribe(self, queue: asyncio.Queue[str]) -> None:
+        """Stop receiving change notifications."""
+        self._subscribers.discard(queue)
+
+    async def stream(
+        self,
+        sections: Iterable[str] = SECTIONS,
+        heartbeat: float = 15.0,
+    ) -> AsyncIterator[str]:
+        """Yield Server-Sent Events with the current and every changed snapshot.
+
+        Args:
+            sections: Sections to stream
+            heartbeat: Seconds between keep-alive comments when idle
+
+        Yields:
+            SSE-formatted chunks (``event: <section>`` + JSON data)
+        """
+        wanted = set(sections)
+        queue = self.subscribe()
+        sent: dict[str, str] = {}
+        try:
+            for section in SECTIONS:
+                if section in wanted:
+                    snapshot = await self.get(section)
+                    sent[section] = snapshot.etag
+                    yield _sse(snapshot)
+
+            while True:
+                try:
+                    section = await asyncio.wait_for(queue.get(), timeout=heartbeat)
+                except TimeoutError:
+                    yield ": keep-alive\n\n"
+                    continue
+                if section not in wanted:
+                    continue
+                snapshot = await self.get(section)
+                if sent.get(section) != snapshot.etag:
+                    sent[section] = snapshot.etag
+                    yield _sse(snapshot)
+        finally:
+            self.unsubscribe(queue)
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get cache statistics."""
+        return {
+            "hits": self.hits,
+            "loads": self.loads,
+            "dirty": sorted(self._dirty),
+            "subscribers": len(self._subscribers),
+            "versions": {s: snap.version for s, snap in self._snapshots.items()},
+        }
+
+    def close(self) -> None:
+        """Detach from the event bus and stop pending refreshes."""
+        if self._attached is not None:
+            for event_type in (*_INVALIDATING_EVENTS, EventType.PRICE_UPDATE):
+                self._attached.unsubscribe(event_type, self.on_event)
+            self._attached = None
+        if self._refresh_task is not None:
+            self._refresh_task.cancel()
+            self._refresh_task = None
+
+    def _needs_load(self, section: str, snapshot: Snapshot) -> bool:
+        return section in self._dirty or self._clock() - snapshot.loaded_at >= self.max_age
+
+    async def _load(self, section: str) -> Snapshot:
+        # Clear before loading so events arriving mid-load trigger another reload
+        self._dirty.discard(section)
+        previous = self._snapshots.get(section)
+        self.loads += 1
+
+        try:
+            data = await self._loaders[section]()
+        except Exception as e:
+            logger.warning("read_model_load_failed", section=section, error=str(e))
+            if previous is not None:
+                return previous
+            data = _EMPTY[section]
+
+        return self._store(section, data)
+
+    def _store(self, section: str, data: Any) -> Snapshot:
+        previous = self._snapshots.get(section)
+        self._version += 1
+        snapshot = Snapshot.build(section, data, self._version, self._clock())
+        self._snapshots[section] = snapshot
+
+        if previous is None or previous.etag != snapshot.etag:
+            self._notify(section)
+        return snapshot
+
+    def _apply_price(self, symbol: str | None, price: float | None) -> None:
+        snapshot = self._snapshots.get(POSITIONS)
+        if snapshot is None or symbol is None or not price:
+            return
+
+        changed = False
+        positions = []
+        for p in snapshot.data:
+            if p["symbol"] == symbol and p["current_price"] != price:
+                p = dict(p)
+                direction = 1 if p["side"] == "buy" else -1
+                pnl = (price - p["entry_price"]) * p["quantity"] * direction
+                cost = p["entry_price"] * p["quantity"]
+                p["current_price"] = price
+                p["unrealized_pnl"] = pnl
+                p["unrealized_pnl_percentage"] = pnl / cost * 100 if cost else 0.0
+                changed = True
+            positions.append(p)
+
+        if changed:
+            # Keep the original load time so max_age still forces a DB resync
+            self._version += 1
+            self._snapshots[POSITIONS] = Snapshot.build(
+                POSITIONS, positions, self._version, snapshot.loaded_at
+            )
+            self._notify(POSITIONS)
+
+    def _notify(self, section: str) -> None:
+        for queue in list(self._subscribers):
+            with contextlib.suppress(asyncio.QueueFull):
+                queue.put_nowait(section)
+
+    def _schedule_refresh(self) -> None:
+        if self._refresh_task is not None and not self._refresh_task.done():
+            return
+        # Without a running loop, sections simply reload lazily on next read
+        with contextlib.suppress(RuntimeError):
+            self._refresh_task = asyncio.get_running_loop().create_task(self._refresh_dirty())
+
+    async def _refresh_dirty(self) -> None:
+        """Reload dirty sections for push subscribers after a short debounce."""
+        await asyncio.sleep(self.refresh_delay)
+        for section in [s for s in SECTIONS if s in self._dirty]:
+            await self.get(section)
+
+    def _attach(self) -> None:
+        if self._attached is not None:
+            return
+        bus = self._event_bus or get_event_bus()
+        for event_type in (*_INVALIDATING_EVENTS, EventType.PRICE_UPDATE):
+            bus.subscribe(event_type, self.on_event)
+        self._attached = bus
+
+
+def _sse(snapshot: Snapshot) -> str:
+    return f"event: {snapshot.section}\ndata: {snapshot.body.decode()}\n\n"
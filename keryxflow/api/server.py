@@ -5,16 +5,36 @@ import contextlib
 from collections.abc import AsyncIterator
 from contextlib import asynccontextmanager
 from datetime import UTC, datetime
-from typing import Any
+from typing import Any, Literal
 
 import uvicorn
-from fastapi import APIRouter, Depends, FastAPI, HTTPException, WebSocket, WebSocketDisconnect
+from fastapi import (
+    APIRouter,
+    Depends,
+    FastAPI,
+    HTTPException,
+    Query,
+    Request,
+    WebSocket,
+    WebSocketDisconnect,
+)
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import Response, StreamingResponse
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 
 from keryxflow.agent.session import get_trading_session
+from keryxflow.api.broadcast import EventBroadcaster, parse_symbols, parse_topics
+from keryxflow.api.history import (
+    EPISODE_FIELDS,
+    MEDIA_TYPES,
+    TRADE_FIELDS,
+    export_rows,
+    row_to_dict,
+)
+from keryxflow.api.read_model import BALANCE, POSITIONS, SECTIONS, TRADES, ReadModel
 from keryxflow.config import get_settings
 from keryxflow.core.events import Event, EventType, get_event_bus
+from keryxflow.core.history import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
 from keryxflow.core.logging import get_logger
 
 logger = get_logger(__name__)
@@ -64,75 +84,174 @@ async def get_status() -> dict[str, Any]:
     return result
 
 
+def _etag_matches(header: str | None, etag: str) -> bool:
+    """Check an If-None-Match header against an ETag."""
+    if not header:
+        return False
+    candidates = {tag.strip().removeprefix("W/") for tag in header.split(",")}
+    return etag in candidates or "*" in candidates
+
+
+async def _cached_response(request: Request, section: str) -> Response:
+    """Serve a read model section with ETag / If-None-Match support."""
+    read_model: ReadModel = request.app.state.read_model
+    snapshot = await read_model.get(section)
+    headers = {"ETag": snapshot.etag, "Cache-Control": "no-cache"}
+
+    if _etag_matches(request.headers.get("if-none-match"), snapshot.etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=snapshot.body, media_type="application/json", headers=headers)
+
+
 @router.get("/positions")
-async def get_positions() -> list[dict[str, Any]]:
+async def get_positions(request: Request) -> Response:
     """Get open positions with unrealized PnL."""
-    try:
-        from keryxflow.exchange.paper import get_paper_engine
-
-        engine = get_paper_engine()
-        positions = await engine.get_positions()
-        return [
-            {
-                "id": p.id,
-                "symbol": p.symbol,
-                "side": p.side.value,
-                "quantity": p.quantity,
-                "entry_price": p.entry_price,
-                "current_price": p.current_price,
-                "unrealized_pnl": p.unrealized_pnl,
-                "unrealized_pnl_percentage": p.unrealized_pnl_percentage,
-                "stop_loss": p.stop_loss,
-                "take_profit": p.take_profit,
-                "opened_at": p.opened_at.isoformat() if p.opened_at else None,
-            }
-            for p in positions
-        ]
-    except Exception:
-        return []
+    return await _cached_response(request, POSITIONS)
 
 
 @router.get("/trades")
-async def get_trades() -> list[dict[str, Any]]:
+async def get_trades(request: Request) -> Response:
     """Get the 50 most recent trades."""
+    return await _cached_response(request, TRADES)
+
+
+def _export_response(rows: Any, fields: tuple[str, ...], fmt: str, name: str) -> StreamingResponse:
+    """Stream history rows as an NDJSON or CSV download."""
+    return StreamingResponse(
+        export_rows(rows, fields, fmt),
+        media_type=MEDIA_TYPES[fmt],
+        headers={"Content-Disposition": f'attachment; filename="{name}.{fmt}"'},
+    )
+
+
+@router.get("/trades/history")
+async def get_trade_history(
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: str | None = None,
+    symbol: str | None = None,
+    start: datetime | None = None,
+    end: datetime | None = None,
+    order: Literal["desc", "asc"] = "desc",
+) -> dict[str, Any]:
+    """Get a page of trade history, resumable via ``next_cursor``.
+
+    Args:
+        limit: Page size
+        cursor: ``next_cursor`` from the previous page
+        symbol: Optional symbol filter
+        start: Inclusive lower bound on created_at
+        end: Exclusive upper bound on created_at
+        order: ``desc`` (newest first) or ``asc``
+    """
+    from keryxflow.core.repository import get_trade_repository
+
     try:
-        from keryxflow.core.repository import get_trade_repository
-
-        repo = get_trade_repository()
-        trades = await repo.get_recent_trades(limit=50)
-        return [
-            {
-                "id": t.id,
-                "symbol": t.symbol,
-                "side": t.side.value,
-                "quantity": t.quantity,
-                "entry_price": t.entry_price,
-                "exit_price": t.exit_price,
-                "stop_loss": t.stop_loss,
-                "take_profit": t.take_profit,
-                "pnl": t.pnl,
-                "pnl_percentage": t.pnl_percentage,
-                "status": t.status.value,
-                "is_paper": t.is_paper,
-                "created_at": t.created_at.isoformat() if t.created_at else None,
-                "closed_at": t.closed_at.isoformat() if t.closed_at else None,
-            }
-            for t in trades
-        ]
-    except Exception:
-        return []
+        page = await get_trade_repository().get_trade_history(
+            limit=limit,
+            cursor=cursor,
+            symbol=symbol,
+            start=start,
+            end=end,
+            ascending=order == "asc",
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+
+    return {
+        "items": [row_to_dict(t, TRADE_FIELDS) for t in page.items],
+        "next_cursor": page.next_cursor,
+    }
+
+
+@router.get("/trades/export")
+async def export_trades(
+    fmt: Literal["ndjson", "csv"] = Query("ndjson", alias="format"),
+    symbol: str | None = None,
+    start: datetime | None = None,
+    end: datetime | None = None,
+) -> StreamingResponse:
+    """Stream the full trade history, oldest first, as NDJSON or CSV."""
+    from keryxflow.core.repository import get_trade_repository
+
+    rows = get_trade_repository().iter_trade_history(symbol=symbol, start=start, end=end)
+    return _export_response(rows, TRADE_FIELDS, fmt, "trades")
+
+
+@router.get("/episodes/history")
+async def get_episode_history(
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: str | None = None,
+    symbol: str | None = None,
+    start: datetime | None = None,
+    end: datetime | None = None,
+    order: Literal["desc", "asc"] = "desc",
+) -> dict[str, Any]:
+    """Get a page of trade episode history, resumable via ``next_cursor``."""
+    from keryxflow.memory.episodic import get_episodic_memory
+
+    try:
+        page = await get_episodic_memory().get_episode_history(
+            limit=limit,
+            cursor=cursor,
+            symbol=symbol,
+            start=start,
+            end=end,
+            ascending=order == "asc",
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+
+    return {
+        "items": [row_to_dict(e, EPISODE_FIELDS) for e in page.items],
+        "next_cursor": page.next_cursor,
+    }
+
+
+@router.get("/episodes/export")
+async def export_episodes(
+    fmt: Literal["ndjson", "csv"] = Query("ndjson", alias="format"),
+    symbol: str | None = None,
+    start: datetime | None = None,
+    end: datetime | None = None,
+) -> StreamingResponse:
+    """Stream the full trade episode history, oldest first, as NDJSON or CSV."""
+    from keryxflow.memory.episodic import get_episodic_memory
+
+    rows = get_episodic_memory().iter_episode_history(symbol=symbol, start=start, end=end)
+    return _export_response(rows, EPISODE_FIELDS, fmt, "episodes")
 
 
 @router.get("/balance")
-async def get_balance() -> dict[str, Any]:
+async def get_balance(request: Request) -> Response:
     """Get portfolio balance."""
-    try:
-        from keryxflow.exchange.paper import get_paper_engine
+    return await _cached_response(request, BALANCE)
 
-        engine = get_paper_engine()
-        return await engine.get_balance()
-    except Exception:
-        return {"total": {}, "free": {}, "used": {}}
+
+@router.get("/stream")
+async def stream_state(request: Request, sections: str | None = None) -> StreamingResponse:
+    """Push positions, trades and balance as Server-Sent Events whenever they change.
+
+    Args:
+        sections: Optional comma-separated subset of sections to stream
+    """
+    read_model: ReadModel = request.app.state.read_model
+    wanted = [s.strip() for s in sections.split(",")] if sections else list(SECTIONS)
+    unknown = set(wanted) - set(SECTIONS)
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Unknown sections: {sorted(unknown)}")
+
+    return StreamingResponse(
+        read_model.stream(wanted),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache"},
+    )
+
+
+@router.get("/ws/clients")
+async def get_ws_clients(request: Request) -> dict[str, Any]:
+    """Get WebSocket fan-out statistics, including per-client lag."""
+    broadcaster: EventBroadcaster = request.app.state.broadcaster
+    return broadcaster.get_stats()
 
 
 # Module-level state for pause tracking and server lifecycle
@@ -141,15 +260,6 @@ _server: uvicorn.Server | None = None
 _server_task: asyncio.Task | None = None
 
 
-def _event_to_dict(event: Event) -> dict[str, Any]:
-    """Convert an Event to a JSON-serializable dictionary."""
-    return {
-        "type": event.type.value,
-        "timestamp": event.timestamp.isoformat(),
-        "data": event.data,
-    }
-
-
 async def _on_paused(_event: Event) -> None:
     global _paused
     _paused = True
@@ -161,7 +271,7 @@ async def _on_resumed(_event: Event) -> None:
 
 
 @asynccontextmanager
-async def _lifespan(_app: FastAPI) -> AsyncIterator[None]:
+async def _lifespan(app: FastAPI) -> AsyncIterator[None]:
     """Lifespan handler: subscribe/unsubscribe pause sync events."""
     event_bus = get_event_bus()
     event_bus.subscribe(EventType.SYSTEM_PAUSED, _on_paused)
@@ -171,6 +281,7 @@ async def _lifespan(_app: FastAPI) -> AsyncIterator[None]:
     event_bus.unsubscribe(EventType.SYSTEM_PAUSED, _on_paused)
     event_bus.unsubscribe(EventType.SYSTEM_RESUMED, _on_resumed)
     event_bus.unsubscribe(EventType.PANIC_TRIGGERED, _on_paused)
+    app.state.read_model.close()
 
 
 def create_app() -> FastAPI:
@@ -182,6 +293,11 @@ def create_app() -> FastAPI:
         version="0.13.0",
         lifespan=_lifespan,
     )
+    app.state.read_model = ReadModel()
+    app.state.broadcaster = EventBroadcaster(
+        coalesce_interval=settings.api.ws_coalesce_ms / 1000,
+        queue_size=settings.api.ws_queue_size,
+    )
 
     app.add_middleware(
         CORSMiddleware,
@@ -254,36 +370,32 @@ def create_app() -> FastAPI:
 
     @app.websocket("/ws/events")
     async def websocket_events(websocket: WebSocket) -> None:
-        """Stream all EventBus events to connected WebSocket clients as JSON."""
+        """Stream EventBus events to a WebSocket client as JSON.
+
+        Optional query parameters narrow the stream:
+        ``topics`` (comma-separated event types) and ``symbols``.
+        """
+        try:
+            topics = parse_topics(websocket.query_params.get("topics"))
+        except ValueError:
+            await websocket.close(code=1008, reason="Unknown topic")
+            return
+        symbols = parse_symbols(websocket.query_params.get("symbols"))
+
         await websocket.accept()
-        event_bus = get_event_bus()
-        queue: asyncio.Queue[Event] = asyncio.Queue(maxsize=256)
-
-        async def _enqueue(event: Event) -> None:
-            try:
-                queue.put_nowait(event)
-            except asyncio.QueueFull:
-                # Drop oldest, then enqueue
-                with contextlib.suppress(asyncio.QueueEmpty):
-                    queue.get_nowait()
-                with contextlib.suppress(asyncio.QueueFull):
-                    queue.put_nowait(event)
-
-        # Subscribe to all event types
-        for event_type in EventType:
-            event_bus.subscribe(event_type, _enqueue)
+        broadcaster: EventBroadcaster = app.state.broadcaster
+        client = broadcaster.register(topics=topics, symbols=symbols)
 
         try:
             while True:
-                event = await queue.get()
-                await websocket.send_json(_event_to_dict(event))
+                frame = await client.next_frame()
+                await websocket.send_text(frame)
         except WebSocketDisconnect:
             pass
         except Exception:
             logger.warning("websocket_error", exc_info=True)
         finally:
-            for event_type in EventType:
-                event_bus.unsubscribe(event_type, _enqueue)
+            broadcaster.unregister(client)
 
     return app
 
@@ -1,17 +1,43 @@
 """Backtesting module for strategy validation."""
 
-from keryxflow.backtester.data import DataLoader
-from keryxflow.backtester.engine import BacktestEngine
-from keryxflow.backtester.html_report import HtmlReportGenerator
-from keryxflow.backtester.monte_carlo import MonteCarloEngine, MonteCarloResult
-from keryxflow.backtester.report import BacktestReporter, BacktestResult
-from keryxflow.backtester.walk_forward import (
-    WalkForwardConfig,
-    WalkForwardEngine,
-    WalkForwardResult,
-)
+from typing import TYPE_CHECKING
+
+from keryxflow.core.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from keryxflow.backtester.cache import BacktestCache
+    from keryxflow.backtester.data import DataLoader
+    from keryxflow.backtester.engine import BacktestEngine
+    from keryxflow.backtester.html_report import HtmlReportGenerator
+    from keryxflow.backtester.monte_carlo import MonteCarloEngine, MonteCarloResult
+    from keryxflow.backtester.pruning import PruningRules
+    from keryxflow.backtester.report import BacktestReporter, BacktestResult
+    from keryxflow.backtester.walk_forward import (
+        WalkForwardConfig,
+        WalkForwardEngine,
+        WalkForwardResult,
+    )
+
+# Public name -> defining submodule, imported on first access
+_LAZY_EXPORTS = {
+    "BacktestCache": "cache",
+    "DataLoader": "data",
+    "BacktestEngine": "engine",
+    "HtmlReportGenerator": "html_report",
+    "MonteCarloEngine": "monte_carlo",
+    "MonteCarloResult": "monte_carlo",
+    "PruningRules": "pruning",
+    "BacktestReporter": "report",
+    "BacktestResult": "report",
+    "WalkForwardConfig": "walk_forward",
+    "WalkForwardEngine": "walk_forward",
+    "WalkForwardResult": "walk_forward",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _LAZY_EXPORTS)
 
 __all__ = [
+    "BacktestCache",
     "BacktestEngine",
     "BacktestReporter",
     "BacktestResult",
@@ -19,6 +45,7 @@ __all__ = [
     "HtmlReportGenerator",
     "MonteCarloEngine",
     "MonteCarloResult",
+    "PruningRules",
     "WalkForwardConfig",
     "WalkForwardEngine",
     "WalkForwardResult",
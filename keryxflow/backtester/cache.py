@@ -0,0 +1,312 @@
+"""Persistent result cache for backtest runs."""
+
+import ast
+import hashlib
+import importlib.util
+import json
+import os
+import pickle
+import shutil
+from datetime import datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import pandas as pd
+
+from keryxflow import __version__
+from keryxflow.config import get_settings
+from keryxflow.core.logging import get_logger
+
+if TYPE_CHECKING:
+    from keryxflow.backtester.report import BacktestResult
+
+logger = get_logger(__name__)
+
+# Entry points of a backtest run. The code version hashes these and every
+# keryxflow module they import, directly or transitively, so an edit to any
+# of them orphans every previously cached result. The circuit breaker is
+# listed because the engine does not import it statically.
+_ENGINE_ROOTS = (
+    "keryxflow.backtester.engine",
+    "keryxflow.backtester.report",
+    "keryxflow.aegis.circuit",
+)
+
+_code_version: str | None = None
+
+
+def _imported_modules(tree: ast.AST) -> list[str]:
+    """Names a module imports from keryxflow, including ``from x import module``."""
+    names = []
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            names.extend(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.module and node.level == 0:
+            names.append(node.module)
+            names.extend(f"{node.module}.{alias.name}" for alias in node.names)
+    return [name for name in names if name.split(".")[0] == "keryxflow"]
+
+
+def engine_modules() -> dict[str, Path]:
+    """Find the source files a backtest can run through.
+
+    Follows keryxflow imports from the engine roots without importing
+    anything, including imports made inside functions.
+
+    Returns:
+        Mapping of module name to source path, sorted by name
+    """
+    found: dict[str, Path] = {}
+    pending = list(_ENGINE_ROOTS)
+    while pending:
+        name = pending.pop()
+        if name in found:
+            continue
+        try:
+            spec = importlib.util.find_spec(name)
+        except ModuleNotFoundError:
+            spec = None
+        # "from package import Name" also yields package.Name, which is not a module
+        if spec is None or not spec.origin or not spec.origin.endswith(".py"):
+            continue
+        path = Path(spec.origin)
+        found[name] = path
+        pending.extend(_imported_modules(ast.parse(path.read_bytes())))
+    return dict(sorted(found.items()))
+
+
+def get_code_version() -> str:
+    """Get a short fingerprint of the backtest engine code.
+
+    Combines the package version with the source of every module in the
+    engine's import closure (see engine_modules()).
+
+    Returns:
+        16-character hex digest
+    """
+    global _code_version
+    if _code_version is None:
+        digest = hashlib.sha256(__version__.encode())
+        for name, path in engine_modules().items():
+            digest.update(name.encode())
+            digest.update(path.read_bytes())
+        _code_version = digest.hexdigest()[:16]
+    return _code_version
+
+
+def fingerprint_data(data: dict[str, Any]) -> str:
+    """Hash the content of single-TF or MTF OHLCV data.
+
+    Args:
+        data: Either {symbol: DataFrame} or {symbol: {timeframe: DataFrame}}
+
+    Returns:
+        Hex digest of the data content
+    """
+    digest = hashlib.sha256()
+
+    def _update(prefix: str, value: Any) -> None:
+        if isinstance(value, dict):
+            for key in sorted(value):
+                _update(f"{prefix}/{key}", value[key])
+            return
+        digest.update(prefix.encode())
+        digest.update(",".join(map(str, value.columns)).encode())
+        digest.update(pd.util.hash_pandas_object(value, index=False).values.tobytes())
+
+    _update("", data)
+    return digest.hexdigest()
+
+
+class BacktestCache:
+    """On-disk LRU cache of BacktestResult objects.
+
+    Entries live under ``<cache_dir>/<code_version>/<key>.pkl``. Directories
+    belonging to other code versions are purged on first use, so results
+    computed by an older engine are never served. Recency is tracked via
+    file mtime, which is refreshed on every hit.
+
+    Example:
+        cache = BacktestCache()
+        engine = BacktestEngine(cache=cache)
+        result = await engine.run(data)  # computed and stored
+        result = await engine.run(data)  # served from disk
+    """
+
+    DEFAULT_DIR = Path("data/cache/backtests")
+
+    def __init__(
+        self,
+        cache_dir: str | Path | None = None,
+        max_bytes: int = 512 * 1024 * 1024,
+        max_entries: int = 10_000,
+    ):
+        """Initialize the cache.
+
+        Args:
+            cache_dir: Root directory for cache files (default: data/cache/backtests)
+            max_bytes: Maximum total size of cached entries
+            max_entries: Maximum number of cached entries
+        """
+        self.root = Path(cache_dir) if cache_dir else self.DEFAULT_DIR
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._prepared = False
+
+    @property
+    def directory(self) -> Path:
+        """Directory holding entries for the current code version."""
+        return self.root / get_code_version()
+
+    def make_key(
+        self,
+        data: dict[str, Any],
+        start: datetime | None,
+        end: datetime | None,
+        engine_params: dict[str, Any],
+    ) -> str:
+        """Build a cache key from data content and effective settings.
+
+        The oracle and risk sections of the global settings are included
+        because the optimizer mutates them between runs.
+
+        Args:
+            data: OHLCV data passed to BacktestEngine.run
+            start: Backtest start datetime
+            end: Backtest end datetime
+            engine_params: Engine constructor values (balance, slippage, ...)
+
+        Returns:
+            Hex digest identifying the run
+        """
+        settings = get_settings()
+        payload = {
+            "data": fingerprint_data(data),
+            "start": start.isoformat() if start else None,
+            "end": end.isoformat() if end else None,
+            "engine": engine_params,
+            "oracle": settings.oracle.model_dump(mode="json"),
+            "risk": settings.risk.model_dump(mode="json"),
+        }
+        encoded = json.dumps(payload, sort_keys=True, default=str).encode()
+        return hashlib.sha256(encoded).hexdigest()
+
+    def get(self, key: str) -> "BacktestResult | None":
+        """Get a cached result.
+
+        Args:
+            key: Cache key from make_key()
+
+        Returns:
+            Cached BacktestResult or None on miss
+        """
+        self._prepare()
+        path = self._path(key)
+
+        try:
+            with open(path, "rb") as f:
+                result = pickle.load(f)
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        except Exception as e:
+            logger.warning("backtest_cache_corrupt", key=key, error=str(e))
+            path.unlink(missing_ok=True)
+            self.misses += 1
+            return None
+
+        # Refresh recency for LRU eviction
+        os.utime(path)
+        self.hits += 1
+        return result
+
+    def put(self, key: str, result: "BacktestResult") -> None:
+        """Store a result and evict least recently used entries over the cap.
+
+        Args:
+            key: Cache key from make_key()
+            result: Result to store
+        """
+        self._prepare()
+        path = self._path(key)
+        tmp_path = path.with_suffix(".tmp")
+
+        try:
+            with open(tmp_path, "wb") as f:
+                pickle.dump(result, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, path)
+        except Exception as e:
+            logger.warning("backtest_cache_write_failed", key=key, error=str(e))
+            tmp_path.unlink(missing_ok=True)
+            return
+
+        self._evict()
+
+    def clear(self) -> None:
+        """Remove every cached entry for all code versions."""
+        if self.root.exists():
+            shutil.rmtree(self.root)
+        self._prepared = False
+
+    def size_bytes(self) -> int:
+        """Get the total size of cached entries."""
+        return sum(entry.stat().st_size for entry in self._entries())
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get cache statistics."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "entries": len(self),
+            "size_bytes": self.size_bytes(),
+            "version": get_code_version(),
+        }
+
+    def __len__(self) -> int:
+        return len(self._entries())
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}.pkl"
+
+    def _entries(self) -> list[Path]:
+        if not self.directory.exists():
+            return []
+        return list(self.directory.glob("*.pkl"))
+
+    def _prepare(self) -> None:
+        """Create the version directory and purge stale versions."""
+        if self._prepared:
+            return
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        for child in self.root.iterdir():
+            if child.is_dir() and child.name != self.directory.name:
+                logger.info("backtest_cache_invalidated", version=child.name)
+                shutil.rmtree(child, ignore_errors=True)
+
+        self._prepared = True
+
+    def _evict(self) -> None:
+        """Drop least recently used entries until within size and count caps."""
+        entries = []
+        for entry in self._entries():
+            try:
+                stat = entry.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, entry))
+
+        total = sum(size for _, size, _ in entries)
+        count = len(entries)
+        if total <= self.max_bytes and count <= self.max_entries:
+            return
+
+        entries.sort(key=lambda e: e[0])
+        for _, size, entry in entries:
+            if total <= self.max_bytes and count <= self.max_entries:
+                break
+            entry.unlink(missing_ok=True)
+            total -= size
+            count -= 1
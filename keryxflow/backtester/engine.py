@@ -4,10 +4,13 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from typing import TYPE_CHECKING
 
+import numpy as np
 import pandas as pd
 
+from keryxflow.aegis.metrics import simple_returns
 from keryxflow.aegis.quant import QuantEngine, get_quant_engine
 from keryxflow.aegis.risk import OrderRequest, RiskManager, get_risk_manager
+from keryxflow.backtester.trade_log import EquityCurve, TradeLog
 from keryxflow.config import get_settings
 from keryxflow.core.logging import get_logger
 from keryxflow.core.models import RiskProfile
@@ -15,6 +18,8 @@ from keryxflow.oracle.mtf_signals import MTFSignalGenerator
 from keryxflow.oracle.signals import SignalGenerator, SignalType, TradingSignal
 
 if TYPE_CHECKING:
+    from keryxflow.backtester.cache import BacktestCache
+    from keryxflow.backtester.pruning import PruningRules
     from keryxflow.backtester.report import BacktestResult
 
 logger = get_logger(__name__)
@@ -35,7 +40,7 @@ class BacktestTrade:
     take_profit: float | None = None
     pnl: float = 0.0
     pnl_percentage: float = 0.0
-    exit_reason: str | None = None  # "stop_loss", "take_profit", "signal", "end"
+    exit_reason: str | None = None  # "stop_loss", "take_profit", "signal", "end", "pruned"
 
     @property
     def is_closed(self) -> bool:
@@ -91,6 +96,8 @@ class BacktestEngine:
     min_candles: int = 50  # Minimum candles for analysis
     mtf_enabled: bool = False  # Multi-timeframe analysis
     primary_timeframe: str | None = None  # Primary TF for MTF mode
+    cache: "BacktestCache | None" = None  # Persistent result cache (optional)
+    pruning: "PruningRules | None" = None  # Early-abort rules (optional)
 
     # Components (initialized in __post_init__)
     signal_gen: SignalGenerator = field(init=False)
@@ -100,8 +107,9 @@ class BacktestEngine:
     # State
     balance: float = field(init=False)
     positions: dict[str, BacktestPosition] = field(default_factory=dict)
-    trades: list[BacktestTrade] = field(default_factory=list)
-    equity_curve: list[float] = field(default_factory=list)
+    trades: TradeLog = field(default_factory=TradeLog)
+    equity_curve: EquityCurve = field(default_factory=EquityCurve)
+    prune_reason: str | None = field(init=False, default=None)
     _current_time: datetime = field(init=False, default=None)
 
     def __post_init__(self):
@@ -147,6 +155,34 @@ class BacktestEngine:
         if not data:
             raise ValueError("No data in specified range")
 
+        cache_key = None
+        if self.cache is not None:
+            cache_key = self.cache.make_key(data, start, end, self._cache_params())
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                logger.info("backtest_cache_hit", key=cache_key[:12])
+                self.trades = cached.trades
+                self.equity_curve = cached.equity_curve
+                self.positions = {}
+                self.balance = cached.final_balance
+                self.prune_reason = cached.prune_reason
+                return cached
+
+        result = await self._run(data, start, end)
+
+        if self.cache is not None and cache_key is not None:
+            self.cache.put(cache_key, result)
+
+        return result
+
+    async def _run(
+        self,
+        data: dict[str, pd.DataFrame] | dict[str, dict[str, pd.DataFrame]],
+        start: datetime | None,
+        end: datetime | None,
+    ) -> "BacktestResult":
+        """Simulate the full backtest without consulting the cache."""
+
         # Determine if MTF data
         is_mtf_data = False
         first_value = next(iter(data.values()))
@@ -158,8 +194,8 @@ class BacktestEngine:
         # Reset state
         self.balance = self.initial_balance
         self.positions = {}
-        self.trades = []
-        self.equity_curve = [self.initial_balance]
+        self.trades = TradeLog()
+        self.equity_curve = EquityCurve([self.initial_balance])
 
         # Get primary data for timestamps
         primary_data = self._get_primary_timeframe_data(data) if is_mtf_data else data
@@ -189,8 +225,12 @@ class BacktestEngine:
             mtf_enabled=self.mtf_enabled,
         )
 
+        self.prune_reason = None
+        peak_equity = self.initial_balance
+        pruning = self.pruning if self.pruning is not None and self.pruning.enabled else None
+
         # Process each timestamp
-        for timestamp in timestamps:
+        for period, timestamp in enumerate(timestamps, 1):
             self._current_time = timestamp
 
             for symbol in data:
@@ -239,6 +279,32 @@ class BacktestEngine:
             # Update risk manager balance
             self.risk_manager.update_balance(total_equity)
 
+            # Abort early if the run has breached a pruning bound
+            if pruning is not None:
+                peak_equity = max(peak_equity, total_equity)
+                reason = pruning.check(
+                    period=period,
+                    total_periods=len(timestamps),
+                    equity=total_equity,
+                    peak_equity=peak_equity,
+                    initial_balance=self.initial_balance,
+                    trade_count=len(self.trades),
+                )
+                if reason:
+                    self.prune_reason = reason
+                    logger.info(
+                        "backtest_pruned",
+                        reason=reason,
+                        period=period,
+                        total_periods=len(timestamps),
+                        equity=total_equity,
+                    )
+                    for symbol in list(self.positions.keys()):
+                        pos = self.positions[symbol]
+                        self._close_position(symbol, pos.current_price, "pruned")
+                    self.equity_curve[-1] = self._calculate_equity()
+                    break
+
         # Close any remaining positions at end
         for symbol in list(self.positions.keys()):
             last_df = data[symbol].get(self.primary_timeframe) if is_mtf_data else data[symbol]
@@ -249,6 +315,19 @@ class BacktestEngine:
         # Calculate final metrics
         return self._calculate_result()
 
+    def _cache_params(self) -> dict:
+        """Engine settings that affect the result, for cache keying."""
+        return {
+            "initial_balance": self.initial_balance,
+            "risk_profile": self.risk_profile.value,
+            "slippage": self.slippage,
+            "commission": self.commission,
+            "min_candles": self.min_candles,
+            "mtf_enabled": self.mtf_enabled,
+            "primary_timeframe": self.primary_timeframe,
+            "pruning": self.pruning.to_dict() if self.pruning else None,
+        }
+
     def _get_primary_timeframe_data(
         self, mtf_data: dict[str, dict[str, pd.DataFrame]]
     ) -> dict[str, pd.DataFrame]:
@@ -553,36 +632,35 @@ class BacktestEngine:
         total_return = (final_balance - self.initial_balance) / self.initial_balance
 
         # Trade statistics
-        total_trades = len(self.trades)
-        winning_trades = sum(1 for t in self.trades if t.is_winner)
+        pnl = self.trades.pnl
+        is_winner = pnl > 0
+        total_trades = len(pnl)
+        winning_trades = int(is_winner.sum())
         losing_trades = total_trades - winning_trades
         win_rate = winning_trades / total_trades if total_trades > 0 else 0
 
         # Average win/loss
-        wins = [t.pnl for t in self.trades if t.is_winner]
-        losses = [abs(t.pnl) for t in self.trades if not t.is_winner]
-        avg_win = sum(wins) / len(wins) if wins else 0
-        avg_loss = sum(losses) / len(losses) if losses else 0
+        wins = pnl[is_winner]
+        losses = np.abs(pnl[~is_winner])
+        avg_win = float(wins.mean()) if len(wins) else 0
+        avg_loss = float(losses.mean()) if len(losses) else 0
 
         # Expectancy
         expectancy = self.quant.calculate_expectancy(win_rate, avg_win, avg_loss)
 
         # Profit factor
-        gross_profit = sum(wins)
-        gross_loss = sum(losses)
+        gross_profit = float(wins.sum())
+        gross_loss = float(losses.sum())
         profit_factor = gross_profit / gross_loss if gross_loss > 0 else float("inf")
 
         # Drawdown
         current_dd, max_dd, max_dd_duration = self.quant.calculate_drawdown(self.equity_curve)
 
         # Sharpe ratio (using daily returns approximation)
-        returns = []
-        for i in range(1, len(self.equity_curve)):
-            ret = (self.equity_curve[i] - self.equity_curve[i - 1]) / self.equity_curve[i - 1]
-            returns.append(ret)
+        returns = simple_returns(self.equity_curve)
 
-        sharpe = self.quant.calculate_sharpe_ratio(returns) if returns else 0
-        sortino = self.quant.calculate_sortino_ratio(returns) if returns else 0
+        sharpe = self.quant.calculate_sharpe_ratio(returns) if len(returns) else 0
+        sortino = self.quant.calculate_sortino_ratio(returns) if len(returns) else 0
         calmar = self.quant.calculate_calmar_ratio(self.equity_curve) if self.equity_curve else 0
 
         return BacktestResult(
@@ -604,4 +682,6 @@ class BacktestEngine:
             calmar_ratio=calmar,
             trades=self.trades,
             equity_curve=self.equity_curve,
+            pruned=self.prune_reason is not None,
+            prune_reason=self.prune_reason,
         )
@@ -62,6 +62,7 @@ class HtmlReportGenerator:
 
         matplotlib.use("Agg")
         import matplotlib.pyplot as plt
+        import numpy as np
 
         output_path = Path(output_path)
         output_path.parent.mkdir(parents=True, exist_ok=True)
@@ -71,7 +72,7 @@ class HtmlReportGenerator:
         # Equity curve chart
         if backtest_result.equity_curve:
             fig, ax = plt.subplots(figsize=(10, 4))
-            ax.plot(backtest_result.equity_curve, color="#2196F3", linewidth=1.5)
+            ax.plot(np.asarray(backtest_result.equity_curve), color="#2196F3", linewidth=1.5)
             ax.set_title("Equity Curve")
             ax.set_xlabel("Period")
             ax.set_ylabel("Equity ($)")
@@ -82,9 +83,7 @@ class HtmlReportGenerator:
 
         # Drawdown chart
         if backtest_result.equity_curve and len(backtest_result.equity_curve) > 1:
-            import numpy as np
-
-            equity = np.array(backtest_result.equity_curve)
+            equity = np.asarray(backtest_result.equity_curve)
             peak = np.maximum.accumulate(equity)
             with np.errstate(divide="ignore", invalid="ignore"):
                 dd = (peak - equity) / peak
@@ -103,9 +102,9 @@ class HtmlReportGenerator:
 
         # Trade PnL distribution
         if backtest_result.trades:
-            pnls = [t.pnl for t in backtest_result.trades]
+            pnls = backtest_result.trades.pnl
             fig, ax = plt.subplots(figsize=(8, 4))
-            colors = ["#4CAF50" if p > 0 else "#F44336" for p in pnls]
+            colors = np.where(pnls > 0, "#4CAF50", "#F44336")
             ax.bar(range(len(pnls)), pnls, color=colors, width=1.0)
             ax.set_title("Trade PnL Distribution")
             ax.set_xlabel("Trade #")
@@ -240,7 +239,7 @@ class HtmlReportGenerator:
                 )
                 if backtest_result.equity_curve:
                     ax.plot(
-                        backtest_result.equity_curve,
+                        np.asarray(backtest_result.equity_curve),
                         color="black",
                         label="Original",
                         linestyle="--",
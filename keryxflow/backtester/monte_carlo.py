@@ -138,7 +138,7 @@ class MonteCarloEngine:
                 original_max_drawdown=backtest_result.max_drawdown,
             )
 
-        pnls = np.array([t.pnl for t in trades])
+        pnls = trades.pnl
         num_trades = len(pnls)
 
         logger.info(
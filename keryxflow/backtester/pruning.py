@@ -0,0 +1,86 @@
+"""Early-abort pruning rules for backtest runs."""
+
+from dataclasses import dataclass
+
+
+@dataclass
+class PruningRules:
+    """Bounds that terminate a backtest early once clearly breached.
+
+    All bounds are optional; a rule set with every bound unset never prunes.
+
+    Attributes:
+        max_drawdown: Abort when drawdown from peak equity exceeds this (0.3 = 30%)
+        min_equity_pct: Abort when equity falls below this fraction of initial balance
+        min_trades: Minimum closed trades required by the checkpoint
+        checkpoint_pct: Fraction of the run (0.0-1.0) at which min_trades is enforced
+        min_periods: Candles to process before any rule is evaluated
+    """
+
+    max_drawdown: float | None = None
+    min_equity_pct: float | None = None
+    min_trades: int | None = None
+    checkpoint_pct: float = 0.5
+    min_periods: int = 0
+
+    @property
+    def enabled(self) -> bool:
+        """Check if any pruning bound is configured."""
+        return (
+            self.max_drawdown is not None
+            or self.min_equity_pct is not None
+            or self.min_trades is not None
+        )
+
+    def check(
+        self,
+        period: int,
+        total_periods: int,
+        equity: float,
+        peak_equity: float,
+        initial_balance: float,
+        trade_count: int,
+    ) -> str | None:
+        """Evaluate the rules against the current state of a run.
+
+        Args:
+            period: Number of candles processed so far
+            total_periods: Total candles in the run
+            equity: Current equity
+            peak_equity: Highest equity seen so far
+            initial_balance: Starting balance
+            trade_count: Closed trades so far
+
+        Returns:
+            Reason string if the run should be pruned, None otherwise
+        """
+        if period < self.min_periods:
+            return None
+
+        if self.max_drawdown is not None and peak_equity > 0:
+            drawdown = (peak_equity - equity) / peak_equity
+            if drawdown > self.max_drawdown:
+                return "max_drawdown"
+
+        if self.min_equity_pct is not None and equity < initial_balance * self.min_equity_pct:
+            return "min_equity"
+
+        if (
+            self.min_trades is not None
+            and total_periods > 0
+            and period / total_periods >= self.checkpoint_pct
+            and trade_count < self.min_trades
+        ):
+            return "min_trades"
+
+        return None
+
+    def to_dict(self) -> dict[str, float | int | None]:
+        """Convert to dictionary."""
+        return {
+            "max_drawdown": self.max_drawdown,
+            "min_equity_pct": self.min_equity_pct,
+            "min_trades": self.min_trades,
+            "checkpoint_pct": self.checkpoint_pct,
+            "min_periods": self.min_periods,
+        }
@@ -5,6 +5,11 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
+import numpy as np
+
+from keryxflow.aegis.metrics import rolling_sharpe, simple_returns, underwater_curve
+from keryxflow.backtester.trade_log import EquityCurve, TradeLog
+
 if TYPE_CHECKING:
     from keryxflow.backtester.engine import BacktestTrade
 
@@ -37,9 +42,37 @@ class BacktestResult:
     sortino_ratio: float = 0.0
     calmar_ratio: float = 0.0
 
-    # Raw data
-    trades: list["BacktestTrade"] = field(default_factory=list)
-    equity_curve: list[float] = field(default_factory=list)
+    # Raw data (lists are converted to array-backed storage on init)
+    trades: TradeLog | list["BacktestTrade"] = field(default_factory=TradeLog)
+    equity_curve: EquityCurve | list[float] = field(default_factory=EquityCurve)
+
+    # Early termination
+    pruned: bool = False  # True if the run was aborted by PruningRules
+    prune_reason: str | None = None
+
+    def __post_init__(self) -> None:
+        """Normalize raw data to array-backed storage."""
+        if not isinstance(self.trades, TradeLog):
+            self.trades = TradeLog(self.trades)
+        if not isinstance(self.equity_curve, EquityCurve):
+            self.equity_curve = EquityCurve(self.equity_curve)
+
+    def underwater_curve(self) -> np.ndarray:
+        """Get equity relative to its running peak (0 at highs, -0.2 = 20% below)."""
+        return underwater_curve(self.equity_curve)
+
+    def rolling_sharpe(self, window: int, periods_per_year: int = 252) -> np.ndarray:
+        """
+        Get the Sharpe ratio over trailing windows of period returns.
+
+        Args:
+            window: Number of returns per window
+            periods_per_year: Number of periods per year
+
+        Returns:
+            Array aligned with the returns series; NaN until the first full window
+        """
+        return rolling_sharpe(simple_returns(self.equity_curve), window, 0.0, periods_per_year)
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary."""
@@ -126,6 +159,10 @@ class BacktestReporter:
             "=" * 50,
         ]
 
+        if result.pruned:
+            lines.insert(-1, f"  PRUNED EARLY:       {result.prune_reason}")
+            lines.insert(-1, "")
+
         return "\n".join(lines)
 
     @staticmethod
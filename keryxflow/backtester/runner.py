@@ -1,4 +1,9 @@
-"""CLI runner for backtesting."""
+"""CLI runner for backtesting.
+
+Heavy dependencies (pandas, the engine, exchange clients) are imported
+inside the functions that use them so ``--help`` and argument errors
+return without loading them.
+"""
 
 from __future__ import annotations
 
@@ -8,16 +13,14 @@ from datetime import UTC, datetime
 from pathlib import Path
 from typing import TYPE_CHECKING
 
-from keryxflow.backtester.data import DataLoader
-from keryxflow.backtester.engine import BacktestEngine
-from keryxflow.backtester.report import BacktestReporter, BacktestResult
 from keryxflow.core.logging import get_logger
-from keryxflow.core.models import RiskProfile
-from keryxflow.exchange import get_exchange_adapter
 
 if TYPE_CHECKING:
+    from keryxflow.backtester.cache import BacktestCache
     from keryxflow.backtester.monte_carlo import MonteCarloResult
+    from keryxflow.backtester.report import BacktestResult
     from keryxflow.backtester.walk_forward import WalkForwardResult
+    from keryxflow.core.models import RiskProfile
 
 logger = get_logger(__name__)
 
@@ -27,7 +30,7 @@ async def run_backtest(
     start: datetime,
     end: datetime,
     initial_balance: float = 10000.0,
-    risk_profile: RiskProfile = RiskProfile.BALANCED,
+    risk_profile: RiskProfile | None = None,
     timeframe: str = "1h",
     data_source: str | None = None,
     slippage: float = 0.001,
@@ -35,6 +38,7 @@ async def run_backtest(
     mtf_enabled: bool = False,
     mtf_timeframes: list[str] | None = None,
     filter_timeframe: str | None = None,
+    cache: BacktestCache | None = None,
 ) -> BacktestResult:
     """
     Run a complete backtest.
@@ -44,7 +48,7 @@ async def run_backtest(
         start: Start datetime
         end: End datetime
         initial_balance: Starting balance
-        risk_profile: Risk profile to use
+        risk_profile: Risk profile to use (defaults to balanced)
         timeframe: Candle timeframe (or primary TF for MTF mode)
         data_source: Path to CSV file (if None, uses exchange)
         slippage: Slippage percentage
@@ -52,10 +56,18 @@ async def run_backtest(
         mtf_enabled: Enable multi-timeframe analysis
         mtf_timeframes: List of timeframes for MTF mode
         filter_timeframe: Filter timeframe for trend direction
+        cache: Persistent result cache (disabled if None)
 
     Returns:
         BacktestResult with metrics
     """
+    from keryxflow.backtester.data import DataLoader
+    from keryxflow.backtester.engine import BacktestEngine
+    from keryxflow.core.models import RiskProfile
+    from keryxflow.exchange import get_exchange_adapter
+    from keryxflow.exchange.market_data import close_market_data_clients
+
+    risk_profile = risk_profile or RiskProfile.BALANCED
     loader = None
     exchange = None
 
@@ -115,6 +127,7 @@ async def run_backtest(
                     data[symbol] = df
         finally:
             await exchange.disconnect()
+            await close_market_data_clients()
 
     if not data:
         raise ValueError("No data loaded for any symbol")
@@ -127,6 +140,7 @@ async def run_backtest(
         commission=commission,
         mtf_enabled=mtf_enabled,
         primary_timeframe=timeframe if mtf_enabled else None,
+        cache=cache,
     )
 
     result = await engine.run(data, start=start, end=end)
@@ -141,6 +155,8 @@ def parse_date(date_str: str) -> datetime:
 
 def parse_risk_profile(profile_str: str) -> RiskProfile:
     """Parse risk profile string."""
+    from keryxflow.core.models import RiskProfile
+
     profiles = {
         "conservative": RiskProfile.CONSERVATIVE,
         "balanced": RiskProfile.BALANCED,
@@ -318,8 +334,23 @@ Examples:
         help="Output path for HTML report",
     )
 
+    # Result cache
+    parser.add_argument(
+        "--cache",
+        action="store_true",
+        help="Reuse cached results for identical data and settings",
+    )
+
+    parser.add_argument(
+        "--cache-dir",
+        help="Directory for the result cache (default: data/cache/backtests)",
+    )
+
     args = parser.parse_args()
 
+    from keryxflow.backtester.cache import BacktestCache
+    from keryxflow.backtester.report import BacktestReporter
+
     # Parse arguments
     start = parse_date(args.start)
     end = parse_date(args.end)
@@ -338,6 +369,8 @@ Examples:
             print(f"Filter Timeframe: {args.filter_tf}")
     print("\nLoading data and running backtest...")
 
+    cache = BacktestCache(args.cache_dir) if args.cache or args.cache_dir else None
+
     # Run backtest
     try:
         result = asyncio.run(
@@ -354,6 +387,7 @@ Examples:
                 mtf_enabled=args.mtf,
                 mtf_timeframes=args.timeframes,
                 filter_timeframe=args.filter_tf,
+                cache=cache,
             )
         )
     except Exception as e:
@@ -390,6 +424,7 @@ Examples:
                     commission=args.commission,
                     num_windows=args.wf_windows,
                     oos_pct=args.wf_oos_pct,
+                    cache=cache,
                 )
             )
             _print_walk_forward_summary(wf_result)
@@ -456,9 +491,13 @@ async def _run_walk_forward(
     commission: float,
     num_windows: int,
     oos_pct: float,
+    cache: BacktestCache | None = None,
 ) -> WalkForwardResult:
     """Run walk-forward analysis with data loading."""
+    from keryxflow.backtester.data import DataLoader
     from keryxflow.backtester.walk_forward import WalkForwardConfig, WalkForwardEngine
+    from keryxflow.exchange import get_exchange_adapter
+    from keryxflow.exchange.market_data import close_market_data_clients
     from keryxflow.optimizer.grid import ParameterGrid
 
     # Load data (reuse the same logic as run_backtest)
@@ -486,6 +525,7 @@ async def _run_walk_forward(
                 data[symbol] = df
         finally:
             await exchange.disconnect()
+            await close_market_data_clients()
 
     if not data:
         raise ValueError("No data loaded for walk-forward analysis")
@@ -497,6 +537,7 @@ async def _run_walk_forward(
         risk_profile=risk_profile,
         slippage=slippage,
         commission=commission,
+        cache=cache,
     )
 
     wf_engine = WalkForwardEngine(config=config)
@@ -0,0 +1,308 @@
+"""Array-backed storage for backtest trades and equity curves."""
+
+from collections.abc import Iterable, Iterator
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+import pandas as pd
+
+if TYPE_CHECKING:
+    from keryxflow.backtester.engine import BacktestTrade
+
+# Known exit reasons are stored as small integer codes
+EXIT_REASONS: tuple[str | None, ...] = (
+    None,
+    "stop_loss",
+    "take_profit",
+    "signal",
+    "end",
+    "liquidation",
+    "pruned",
+)
+
+_NAT = np.iinfo(np.int64).min
+
+# One row per trade. Times are int64 nanoseconds since epoch (_NAT for None);
+# optional prices use NaN for None.
+TRADE_DTYPE = np.dtype(
+    [
+        ("symbol", np.int32),  # index into TradeLog.symbols
+        ("side", np.int8),  # 1 = buy, -1 = sell
+        ("quantity", np.float64),
+        ("entry_price", np.float64),
+        ("entry_time", np.int64),
+        ("exit_price", np.float64),
+        ("exit_time", np.int64),
+        ("stop_loss", np.float64),
+        ("take_profit", np.float64),
+        ("pnl", np.float64),
+        ("pnl_percentage", np.float64),
+        ("exit_reason", np.int16),  # index into TradeLog.reasons
+        ("naive_time", np.bool_),  # True if the original datetimes had no tzinfo
+    ]
+)
+
+_MIN_CAPACITY = 16
+
+
+def _to_ns(value: datetime | None) -> tuple[int, bool]:
+    """Convert a datetime to (epoch nanoseconds, is_naive)."""
+    if value is None:
+        return _NAT, False
+    ts = pd.Timestamp(value)
+    if ts.tzinfo is None:
+        return ts.value, True
+    return ts.tz_convert(UTC).value, False
+
+
+def _from_ns(value: int, naive: bool) -> datetime | None:
+    """Convert epoch nanoseconds back to a Timestamp."""
+    if value == _NAT:
+        return None
+    return pd.Timestamp(value) if naive else pd.Timestamp(value, tz=UTC)
+
+
+def _opt(value: float) -> float | None:
+    """Map NaN back to None."""
+    return None if np.isnan(value) else float(value)
+
+
+class TradeLog:
+    """Columnar, append-only log of closed backtest trades.
+
+    Trades are held in a NumPy structured array (see TRADE_DTYPE) so metric
+    code can read columns such as ``pnl`` without building Python objects.
+    Indexing and iteration return BacktestTrade objects built on demand;
+    these are read-only snapshots, so mutating them does not change the log.
+    """
+
+    def __init__(self, trades: Iterable["BacktestTrade"] | None = None):
+        """Initialize the log.
+
+        Args:
+            trades: Optional trades to append
+        """
+        self._data = np.empty(0, dtype=TRADE_DTYPE)
+        self._size = 0
+        self.symbols: list[str] = []
+        self.reasons: list[str | None] = list(EXIT_REASONS)
+        self._symbol_ids: dict[str, int] = {}
+        self._reason_ids = {r: i for i, r in enumerate(self.reasons)}
+
+        if trades is not None:
+            for trade in trades:
+                self.append(trade)
+
+    @property
+    def array(self) -> np.ndarray:
+        """Structured array view of the stored trades (no copy)."""
+        return self._data[: self._size]
+
+    @property
+    def pnl(self) -> np.ndarray:
+        """PnL column as a float64 view (no copy)."""
+        return self.array["pnl"]
+
+    def column(self, name: str) -> np.ndarray:
+        """Get a numeric column as a view.
+
+        Args:
+            name: Field name from TRADE_DTYPE
+
+        Returns:
+            Column array (no copy)
+        """
+        return self.array[name]
+
+    def append(self, trade: "BacktestTrade") -> None:
+        """Append a trade.
+
+        Args:
+            trade: Trade to store
+        """
+        if self._size == len(self._data):
+            self._grow()
+
+        entry_ns, naive = _to_ns(trade.entry_time)
+        exit_ns, exit_naive = _to_ns(trade.exit_time)
+
+        self._data[self._size] = (
+            self._symbol_id(trade.symbol),
+            1 if trade.side == "buy" else -1,
+            trade.quantity,
+            trade.entry_price,
+            entry_ns,
+            np.nan if trade.exit_price is None else trade.exit_price,
+            exit_ns,
+            np.nan if trade.stop_loss is None else trade.stop_loss,
+            np.nan if trade.take_profit is None else trade.take_profit,
+            trade.pnl,
+            trade.pnl_percentage,
+            self._reason_id(trade.exit_reason),
+            naive or exit_naive,
+        )
+        self._size += 1
+
+    def to_list(self) -> list["BacktestTrade"]:
+        """Materialize every trade as a BacktestTrade."""
+        return [self._trade(i) for i in range(self._size)]
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __bool__(self) -> bool:
+        return self._size > 0
+
+    def __iter__(self) -> Iterator["BacktestTrade"]:
+        for i in range(self._size):
+            yield self._trade(i)
+
+    def __getitem__(self, index: int | slice) -> "BacktestTrade | list[BacktestTrade]":
+        if isinstance(index, slice):
+            return [self._trade(i) for i in range(*index.indices(self._size))]
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError("trade index out of range")
+        return self._trade(index)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, TradeLog):
+            return self.to_list() == other.to_list()
+        if isinstance(other, list | tuple):
+            return self.to_list() == list(other)
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"TradeLog({self._size} trades)"
+
+    def __getstate__(self) -> dict[str, Any]:
+        state = self.__dict__.copy()
+        state["_data"] = self.array.copy()
+        return state
+
+    def _grow(self) -> None:
+        capacity = max(_MIN_CAPACITY, len(self._data) * 2)
+        data = np.empty(capacity, dtype=TRADE_DTYPE)
+        data[: self._size] = self._data[: self._size]
+        self._data = data
+
+    def _symbol_id(self, symbol: str) -> int:
+        sid = self._symbol_ids.get(symbol)
+        if sid is None:
+            sid = len(self.symbols)
+            self.symbols.append(symbol)
+            self._symbol_ids[symbol] = sid
+        return sid
+
+    def _reason_id(self, reason: str | None) -> int:
+        rid = self._reason_ids.get(reason)
+        if rid is None:
+            rid = len(self.reasons)
+            self.reasons.append(reason)
+            self._reason_ids[reason] = rid
+        return rid
+
+    def _trade(self, index: int) -> "BacktestTrade":
+        from keryxflow.backtester.engine import BacktestTrade
+
+        row = self._data[index]
+        naive = bool(row["naive_time"])
+        return BacktestTrade(
+            symbol=self.symbols[row["symbol"]],
+            side="buy" if row["side"] == 1 else "sell",
+            quantity=float(row["quantity"]),
+            entry_price=float(row["entry_price"]),
+            entry_time=_from_ns(int(row["entry_time"]), naive),
+            exit_price=_opt(row["exit_price"]),
+            exit_time=_from_ns(int(row["exit_time"]), naive),
+            stop_loss=_opt(row["stop_loss"]),
+            take_profit=_opt(row["take_profit"]),
+            pnl=float(row["pnl"]),
+            pnl_percentage=float(row["pnl_percentage"]),
+            exit_reason=self.reasons[row["exit_reason"]],
+        )
+
+
+class EquityCurve:
+    """Growable float64 equity series with list-like access.
+
+    ``np.asarray(curve)`` and ``curve.values`` return the underlying buffer
+    without copying; indexing, iteration and ``==`` behave like a list of
+    floats so existing callers keep working.
+    """
+
+    def __init__(self, values: Iterable[float] | np.ndarray | None = None):
+        """Initialize the curve.
+
+        Args:
+            values: Optional initial equity values
+        """
+        if values is None:
+            self._data = np.empty(_MIN_CAPACITY, dtype=np.float64)
+            self._size = 0
+        else:
+            arr = np.asarray(values if isinstance(values, np.ndarray) else list(values))
+            self._data = arr.astype(np.float64, copy=False)
+            self._size = len(self._data)
+
+    @property
+    def values(self) -> np.ndarray:
+        """Equity values as a float64 view (no copy)."""
+        return self._data[: self._size]
+
+    def append(self, value: float) -> None:
+        """Append an equity value.
+
+        Args:
+            value: Equity at the next period
+        """
+        if self._size == len(self._data):
+            data = np.empty(max(_MIN_CAPACITY, len(self._data) * 2), dtype=np.float64)
+            data[: self._size] = self._data[: self._size]
+            self._data = data
+        self._data[self._size] = value
+        self._size += 1
+
+    def tolist(self) -> list[float]:
+        """Get the values as a Python list."""
+        return self.values.tolist()
+
+    def __array__(self, dtype: Any = None, copy: bool | None = None) -> np.ndarray:
+        values = self.values
+        if dtype is not None and dtype != values.dtype:
+            return values.astype(dtype)
+        return values.copy() if copy else values
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __bool__(self) -> bool:
+        return self._size > 0
+
+    def __iter__(self) -> Iterator[float]:
+        return iter(self.values.tolist())
+
+    def __getitem__(self, index: int | slice) -> "float | EquityCurve":
+        if isinstance(index, slice):
+            return EquityCurve(self.values[index])
+        return float(self.values[index])
+
+    def __setitem__(self, index: int, value: float) -> None:
+        self.values[index] = value
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, EquityCurve | list | tuple | np.ndarray):
+            return bool(np.array_equal(self.values, np.asarray(other, dtype=np.float64)))
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"EquityCurve({self._size} points)"
+
+    def __getstate__(self) -> dict[str, Any]:
+        return {"_data": self.values.copy(), "_size": self._size}
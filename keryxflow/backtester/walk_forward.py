@@ -4,8 +4,10 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any
 
+import numpy as np
 import pandas as pd
 
+from keryxflow.backtester.cache import BacktestCache
 from keryxflow.backtester.engine import BacktestEngine
 from keryxflow.backtester.report import BacktestResult
 from keryxflow.core.logging import get_logger
@@ -106,6 +108,7 @@ class WalkForwardConfig:
         risk_profile: Risk profile for backtests
         slippage: Slippage percentage
         commission: Commission percentage
+        cache: Persistent backtest result cache (disabled if None)
     """
 
     num_windows: int = 5
@@ -115,6 +118,7 @@ class WalkForwardConfig:
     risk_profile: RiskProfile = RiskProfile.BALANCED
     slippage: float = 0.001
     commission: float = 0.001
+    cache: BacktestCache | None = None
 
 
 class WalkForwardEngine:
@@ -186,6 +190,7 @@ class WalkForwardEngine:
             risk_profile=self.config.risk_profile,
             slippage=self.config.slippage,
             commission=self.config.commission,
+            cache=self.config.cache,
         )
 
         window_results: list[WalkForwardWindow] = []
@@ -239,6 +244,7 @@ class WalkForwardEngine:
                     risk_profile=self.config.risk_profile,
                     slippage=self.config.slippage,
                     commission=self.config.commission,
+                    cache=self.config.cache,
                 )
                 oos_result = await engine.run(oos_data, start=oos_start, end=oos_end)
             except Exception as e:
@@ -342,11 +348,10 @@ class WalkForwardEngine:
         oos_equity = [self.config.initial_balance]
         current_balance = self.config.initial_balance
         for w in windows:
-            if w.oos_result.equity_curve and len(w.oos_result.equity_curve) > 1:
-                curve = w.oos_result.equity_curve
+            curve = np.asarray(w.oos_result.equity_curve)
+            if len(curve) > 1:
                 scale = current_balance / curve[0] if curve[0] != 0 else 1.0
-                for eq in curve[1:]:
-                    oos_equity.append(eq * scale)
+                oos_equity.extend((curve[1:] * scale).tolist())
                 current_balance = oos_equity[-1]
 
         return WalkForwardResult(
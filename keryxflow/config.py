@@ -69,6 +69,11 @@ class OracleSettings(BaseSettings):
     ]
     news_lookback_hours: int = Field(default=4, ge=1, le=24)
 
+    # Live analysis scheduling
+    analysis_workers: int = Field(default=2, ge=0, le=64)  # Indicator workers; 0 = on loop
+    analysis_executor: Literal["thread", "process"] = "thread"
+    analysis_deadline: float = Field(default=10.0, gt=0.0, le=600.0)  # Drop older requests
+
     # Multi-Timeframe Analysis
     mtf: MTFSettings = Field(default_factory=MTFSettings)
 
@@ -109,6 +114,13 @@ class AgentSettings(BaseSettings):
     analyst_model: str | None = None  # Override model for analyst (defaults to main model)
     risk_model: str | None = None  # Override model for risk agent
     executor_model: str | None = None  # Override model for executor agent
+    analyst_concurrency: int = Field(default=4, ge=1, le=32)  # Symbols analyzed at once
+
+    # Batched post-mortems
+    reflection_batch_size: int = Field(default=20, ge=1, le=100)  # Episodes per LLM request
+    reflection_batch_interval: int = Field(default=60, ge=1, le=3600)  # Seconds between flushes
+    reflection_max_pending: int = Field(default=200, ge=1)  # Beyond this, no LLM analysis
+    reflection_cache_size: int = Field(default=1000, ge=0)  # Post-mortems kept by episode id
 
 
 class ApiSettings(BaseSettings):
@@ -122,6 +134,8 @@ class ApiSettings(BaseSettings):
     token: str = ""
     webhook_secret: str = ""
     cors_origins: list[str] = ["*"]
+    ws_queue_size: int = Field(default=256, ge=1)  # Frames buffered per WebSocket client
+    ws_coalesce_ms: int = Field(default=250, ge=0)  # Min interval per symbol for price events
 
 
 class SystemSettings(BaseSettings):
@@ -136,6 +150,11 @@ class SystemSettings(BaseSettings):
     base_currency: str = "USDT"
     log_level: Literal["DEBUG", "INFO", "WARNING", "ERROR"] = "INFO"
     demo_mode: bool = False
+    market_data_concurrency: int = Field(default=4, ge=1, le=32)  # Shared public-data client
+    venues: list[str] = []  # Trade several exchanges in one engine (e.g. ["binance", "bybit"])
+    venue_routing: Literal["best_price", "primary"] = "best_price"
+    ohlcv_snapshot_path: str = "data/cache/ohlcv_snapshot.pkl"  # Warm-start file; "" disables
+    ohlcv_snapshot_interval: int = Field(default=300, ge=0)  # Seconds between saves; 0 = on stop
 
 
 class HermesSettings(BaseSettings):
@@ -150,6 +169,26 @@ class HermesSettings(BaseSettings):
     theme: Literal["cyberpunk", "minimal"] = "cyberpunk"
 
 
+class DaemonSettings(BaseSettings):
+    """Headless daemon (``keryxflow --headless``) configuration."""
+
+    model_config = SettingsConfigDict(env_prefix="KERYXFLOW_DAEMON_")
+
+    poll_interval: float = Field(default=1.0, ge=0.0, le=60.0)  # Seconds between price polls
+    uvloop: bool = True  # Use uvloop when installed
+
+
+class JournalSettings(BaseSettings):
+    """Event journal configuration."""
+
+    model_config = SettingsConfigDict(env_prefix="KERYXFLOW_JOURNAL_")
+
+    enabled: bool = False  # Record bus events for replay
+    directory: str = "data/journal"
+    max_file_mb: int = Field(default=64, ge=1)  # Rotate files past this size
+    fsync_interval: float = Field(default=1.0, ge=0.0)  # Min seconds between fsyncs
+
+
 class DatabaseSettings(BaseSettings):
     """Database configuration."""
 
@@ -190,6 +229,11 @@ class NotificationSettings(BaseSettings):
     notify_daily_summary: bool = True
     notify_on_error: bool = True
 
+    # Delivery pipeline
+    queue_size: int = Field(default=100, ge=1)  # Pending messages per provider
+    batch_window: float = Field(default=1.0, ge=0.0)  # Seconds to gather bursts
+    max_batch: int = Field(default=20, ge=1)  # Messages per digest
+
 
 class Settings(BaseSettings):
     """Main application settings."""
@@ -221,6 +265,8 @@ class Settings(BaseSettings):
     risk: RiskSettings = Field(default_factory=RiskSettings)
     oracle: OracleSettings = Field(default_factory=OracleSettings)
     hermes: HermesSettings = Field(default_factory=HermesSettings)
+    daemon: DaemonSettings = Field(default_factory=DaemonSettings)
+    journal: JournalSettings = Field(default_factory=JournalSettings)
     database: DatabaseSettings = Field(default_factory=DatabaseSettings)
     live: LiveSettings = Field(default_factory=LiveSettings)
     notifications: NotificationSettings = Field(default_factory=NotificationSettings)
@@ -310,6 +356,10 @@ def load_settings() -> Settings:
             overrides["oracle"] = OracleSettings(**toml_config["oracle"])
         if "hermes" in toml_config:
             overrides["hermes"] = HermesSettings(**toml_config["hermes"])
+        if "daemon" in toml_config:
+            overrides["daemon"] = DaemonSettings(**toml_config["daemon"])
+        if "journal" in toml_config:
+            overrides["journal"] = JournalSettings(**toml_config["journal"])
         if "database" in toml_config:
             db_config = toml_config["database"].copy()
             # Allow env var to override TOML for database URL
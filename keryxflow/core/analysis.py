@@ -0,0 +1,203 @@
+"""Coalescing scheduler for per-symbol market analysis.
+
+The engine's price handler submits ``(symbol, price)`` here instead of
+awaiting analysis inline, so price handling and trailing-stop checks never
+wait on indicator computation. Each symbol holds at most one pending
+request - a newer price replaces the queued one - requests older than the
+deadline are dropped rather than analyzed, and at most ``concurrency``
+analyses run at once, never two for the same symbol.
+"""
+
+import asyncio
+import contextlib
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any
+
+from keryxflow.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+AnalyzeFn = Callable[[str, float, float], Awaitable[bool | None]]
+
+
+def latency_summary(samples: deque | list) -> dict[str, float | None]:
+    """Average, p95 and max of second-valued samples, in milliseconds."""
+    ordered = sorted(samples)
+    if not ordered:
+        return {"avg_ms": None, "p95_ms": None, "max_ms": None}
+    return {
+        "avg_ms": round(sum(ordered) / len(ordered) * 1000, 2),
+        "p95_ms": round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))] * 1000, 2),
+        "max_ms": round(ordered[-1] * 1000, 2),
+    }
+
+
+def create_analysis_executor(workers: int, kind: str = "thread") -> Executor | None:
+    """Create the pool used for CPU-bound indicator computation.
+
+    Args:
+        workers: Pool size; 0 means compute on the event loop
+        kind: ``"thread"`` or ``"process"``
+
+    Returns:
+        The executor, or None when ``workers`` is 0
+    """
+    if workers <= 0:
+        return None
+    if kind == "process":
+        return ProcessPoolExecutor(max_workers=workers)
+    return ThreadPoolExecutor(max_workers=workers, thread_name_prefix="keryxflow-analysis")
+
+
+@dataclass
+class AnalysisStats:
+    """Counters and latency samples for the analysis scheduler."""
+
+    submitted: int = 0
+    coalesced: int = 0
+    dropped_stale: int = 0
+    expired: int = 0
+    completed: int = 0
+    failed: int = 0
+    queue_wait: deque = field(default_factory=lambda: deque(maxlen=1024))
+    compute: deque = field(default_factory=lambda: deque(maxlen=1024))
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            "submitted": self.submitted,
+            "coalesced": self.coalesced,
+            "dropped_stale": self.dropped_stale,
+            "expired": self.expired,
+            "completed": self.completed,
+            "failed": self.failed,
+            "queue_wait": latency_summary(self.queue_wait),
+            "compute": latency_summary(self.compute),
+        }
+
+
+class AnalysisScheduler:
+    """Runs the newest pending analysis per symbol on a bounded set of workers."""
+
+    def __init__(
+        self,
+        analyze: AnalyzeFn,
+        concurrency: int = 1,
+        deadline: float = 10.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Initialize the scheduler.
+
+        Args:
+            analyze: Coroutine ``(symbol, price, deadline_at)`` doing the work;
+                ``deadline_at`` is on ``clock``'s timescale. Returning False
+                means the result arrived too late and was discarded
+            concurrency: Analyses allowed to run at once
+            deadline: Seconds a request may wait before it is dropped
+            clock: Monotonic clock, injectable for tests
+        """
+        self._analyze = analyze
+        self._concurrency = max(1, concurrency)
+        self.deadline = deadline
+        self._clock = clock
+
+        # symbol -> (price, submitted_at); one slot per symbol
+        self._pending: dict[str, tuple[float, float]] = {}
+        self._order: deque[str] = deque()
+        self._in_flight: set[str] = set()
+        self._wakeup = asyncio.Event()
+        self._workers: list[asyncio.Task] = []
+        self.stats = AnalysisStats()
+
+    @property
+    def running(self) -> bool:
+        """Check if the workers are running."""
+        return any(not task.done() for task in self._workers)
+
+    def start(self) -> None:
+        """Start the worker tasks."""
+        if self.running:
+            return
+        self._workers = [
+            asyncio.create_task(self._worker(), name=f"analysis-{i}")
+            for i in range(self._concurrency)
+        ]
+
+    async def stop(self) -> None:
+        """Cancel the workers and discard pending requests."""
+        for task in self._workers:
+            task.cancel()
+        for task in self._workers:
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+        self._workers = []
+        self._pending.clear()
+        self._order.clear()
+        self._in_flight.clear()
+
+    def submit(self, symbol: str, price: float) -> None:
+        """Request analysis of ``symbol``, replacing any request still queued."""
+        self.stats.submitted += 1
+        if symbol in self._pending:
+            self.stats.coalesced += 1
+        else:
+            self._order.append(symbol)
+        self._pending[symbol] = (price, self._clock())
+        self._wakeup.set()
+
+    def _next(self) -> str | None:
+        """Pop the oldest queued symbol that is not already being analyzed."""
+        for _ in range(len(self._order)):
+            symbol = self._order.popleft()
+            if symbol not in self._in_flight:
+                return symbol
+            self._order.append(symbol)
+        return None
+
+    async def _worker(self) -> None:
+        while True:
+            symbol = self._next()
+            if symbol is None:
+                self._wakeup.clear()
+                await self._wakeup.wait()
+                continue
+
+            price, submitted_at = self._pending.pop(symbol)
+            waited = self._clock() - submitted_at
+            if waited > self.deadline:
+                self.stats.dropped_stale += 1
+                logger.debug("analysis_dropped_stale", symbol=symbol, waited=round(waited, 3))
+                continue
+
+            self.stats.queue_wait.append(waited)
+            self._in_flight.add(symbol)
+            started = self._clock()
+            try:
+                result = await self._analyze(symbol, price, submitted_at + self.deadline)
+                if result is False:
+                    self.stats.expired += 1
+                else:
+                    self.stats.completed += 1
+            except Exception as e:
+                self.stats.failed += 1
+                logger.error("analysis_failed", symbol=symbol, error=str(e))
+            finally:
+                self.stats.compute.append(self._clock() - started)
+                self._in_flight.discard(symbol)
+                # A request that arrived meanwhile was parked behind this one
+                if symbol in self._pending:
+                    self._wakeup.set()
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get scheduler statistics including current queue depth."""
+        return {
+            "pending": len(self._pending),
+            "in_flight": len(self._in_flight),
+            "concurrency": self._concurrency,
+            "deadline_s": self.deadline,
+            **self.stats.to_dict(),
+        }
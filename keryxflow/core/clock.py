@@ -0,0 +1,68 @@
+"""Clocks for components that run in wall-clock or simulated time."""
+
+from datetime import UTC, datetime, timedelta
+
+
+class Clock:
+    """Wall clock: the current UTC time."""
+
+    def now(self) -> datetime:
+        """Get the current time (timezone-aware UTC)."""
+        return datetime.now(UTC)
+
+
+class SimulatedClock(Clock):
+    """
+    Clock that only moves when told to.
+
+    Used to drive the live code path faster than real time, e.g. when
+    replaying a recorded event journal.
+
+    Example:
+        clock = SimulatedClock(datetime(2024, 1, 1, tzinfo=UTC))
+        clock.advance(60)
+        clock.set(event.timestamp)
+    """
+
+    def __init__(self, start: datetime | None = None):
+        """
+        Initialize the clock.
+
+        Args:
+            start: Initial time (default: the current wall-clock time,
+                until the first set() moves the clock to the time given)
+        """
+        self._now = start or datetime.now(UTC)
+        # Without a start time the first set() may move the clock backwards,
+        # so a default clock can replay a session recorded in the past
+        self._anchored = start is not None
+
+    def now(self) -> datetime:
+        """Get the simulated time."""
+        return self._now
+
+    def set(self, when: datetime) -> None:
+        """
+        Move the clock to a time; it never moves backwards once anchored.
+
+        A clock built without a start time is anchored by its first set(),
+        which moves it to ``when`` even if that is in the past.
+
+        Args:
+            when: New time (naive values are taken as UTC)
+        """
+        if when.tzinfo is None:
+            when = when.replace(tzinfo=UTC)
+        if when > self._now or not self._anchored:
+            self._now = when
+        self._anchored = True
+
+    def advance(self, seconds: float) -> None:
+        """
+        Move the clock forward.
+
+        Args:
+            seconds: Seconds to advance
+        """
+        self._now += timedelta(seconds=seconds)
+        self._anchored = True
@@ -0,0 +1,275 @@
+"""Headless runtime: the trading engine without the Textual TUI.
+
+``HeadlessRunner`` drives the same components as ``KeryxFlowApp`` - event
+bus, exchange connection, ``TradingEngine`` (which starts the API server
+when enabled), price polling and, in autonomous AI mode, a
+``TradingSession`` - on a single event loop with no widget updates.
+"""
+
+import asyncio
+import contextlib
+import signal
+import time
+from collections import deque
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any
+
+from keryxflow.config import get_settings
+from keryxflow.core.analysis import latency_summary
+from keryxflow.core.events import Event, EventType
+from keryxflow.core.logging import get_logger
+
+if TYPE_CHECKING:
+    from keryxflow.agent.session import TradingSession
+    from keryxflow.core.engine import TradingEngine
+    from keryxflow.core.events import EventBus
+    from keryxflow.exchange.adapter import ExchangeAdapter
+    from keryxflow.exchange.paper import PaperTradingEngine
+
+logger = get_logger(__name__)
+
+# Max concurrent ticker requests per poll
+_FETCH_CONCURRENCY = 5
+
+# Seconds between event-loop lag samples
+_LAG_SAMPLE_INTERVAL = 0.1
+
+
+def event_loop_factory(use_uvloop: bool = True) -> Callable[[], asyncio.AbstractEventLoop] | None:
+    """Pick the event loop implementation for ``asyncio.run(loop_factory=...)``.
+
+    Args:
+        use_uvloop: Prefer uvloop when it is installed
+
+    Returns:
+        uvloop's loop constructor, or None for the default asyncio loop
+    """
+    if not use_uvloop:
+        return None
+    try:
+        import uvloop
+    except ImportError:
+        logger.info("uvloop_unavailable")
+        return None
+    return uvloop.new_event_loop
+
+
+class HeadlessRunner:
+    """Runs the trading stack as a daemon with no user interface."""
+
+    def __init__(
+        self,
+        trading_engine: "TradingEngine",
+        exchange_client: "ExchangeAdapter",
+        event_bus: "EventBus",
+        paper_engine: "PaperTradingEngine | None" = None,
+        symbols: list[str] | None = None,
+        poll_interval: float | None = None,
+        start_session: bool | None = None,
+    ):
+        """Initialize the runner.
+
+        Args:
+            trading_engine: Engine to run
+            exchange_client: Source of ticker prices
+            event_bus: Bus that price updates are published on
+            paper_engine: Paper engine to keep marked to market (optional)
+            symbols: Symbols to poll (defaults to settings)
+            poll_interval: Seconds between polls (defaults to settings)
+            start_session: Start an agent TradingSession (defaults to
+                autonomous AI mode)
+        """
+        settings = get_settings()
+        self.engine = trading_engine
+        self.exchange = exchange_client
+        self.event_bus = event_bus
+        self.paper = paper_engine
+        self.symbols = symbols or settings.system.symbols
+        self.poll_interval = (
+            settings.daemon.poll_interval if poll_interval is None else poll_interval
+        )
+        self._start_session = trading_engine._agent_mode if start_session is None else start_session
+        self.session: TradingSession | None = None
+
+        self._semaphore = asyncio.Semaphore(_FETCH_CONCURRENCY)
+        self._stop_event = asyncio.Event()
+        self._tasks: list[asyncio.Task] = []
+
+        # Stats
+        self._started_at: float | None = None
+        self._polls = 0
+        self._ticks = 0
+        self._fetch_errors = 0
+        self._poll_latency: deque[float] = deque(maxlen=1024)
+        self._loop_lag: deque[float] = deque(maxlen=1024)
+
+    @property
+    def running(self) -> bool:
+        """Check if the price loop is running."""
+        return any(not task.done() for task in self._tasks)
+
+    async def start(self) -> None:
+        """Connect and start every component, then begin polling prices."""
+        if self.running:
+            return
+
+        if not self.event_bus.is_running:
+            await self.event_bus.start()
+
+        if not self.exchange.is_connected and not await self.exchange.connect():
+            logger.warning("headless_exchange_connect_failed")
+
+        if not self.engine._running:
+            await self.engine.start()
+
+        if self._start_session:
+            from keryxflow.agent.session import TradingSession
+
+            self.session = TradingSession(engine=self.engine, symbols=self.symbols)
+            self.session._event_bus = self.event_bus
+            if not await self.session.start():
+                logger.warning("headless_session_start_failed")
+
+        self._stop_event.clear()
+        self._started_at = time.perf_counter()
+        self._tasks = [
+            asyncio.create_task(self._price_loop(), name="headless-prices"),
+            asyncio.create_task(self._monitor_loop_lag(), name="headless-lag"),
+        ]
+        logger.info(
+            "headless_started",
+            symbols=len(self.symbols),
+            poll_interval=self.poll_interval,
+            agent_session=self.session is not None,
+        )
+
+    def request_stop(self) -> None:
+        """Ask :meth:`run` to shut down (safe to call from a signal handler)."""
+        self._stop_event.set()
+
+    async def stop(self) -> None:
+        """Stop polling and shut every component down."""
+        self._stop_event.set()
+        for task in self._tasks:
+            task.cancel()
+        for task in self._tasks:
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+        self._tasks = []
+
+        if self.session is not None and (self.session.is_running or self.session.is_paused):
+            await self.session.stop()
+
+        if self.engine._running:
+            await self.engine.stop()
+
+        if self.exchange.is_connected:
+            await self.exchange.disconnect()
+
+        from keryxflow.exchange.market_data import close_market_data_clients
+
+        await close_market_data_clients()
+
+        await self.event_bus.stop()
+
+        logger.info("headless_stopped", ticks=self._ticks, polls=self._polls)
+
+    async def run(self, duration: float | None = None) -> None:
+        """Run until SIGINT/SIGTERM, :meth:`request_stop` or ``duration`` seconds.
+
+        Args:
+            duration: Stop after this many seconds (runs indefinitely if None)
+        """
+        await self.start()
+
+        loop = asyncio.get_running_loop()
+        handled: list[signal.Signals] = []
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            # Unsupported on Windows and outside the main thread
+            with contextlib.suppress(NotImplementedError, RuntimeError, ValueError):
+                loop.add_signal_handler(sig, self.request_stop)
+                handled.append(sig)
+
+        try:
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(self._stop_event.wait(), duration)
+        finally:
+            for sig in handled:
+                loop.remove_signal_handler(sig)
+            await self.stop()
+
+    async def poll_once(self) -> int:
+        """Fetch every symbol's ticker and publish it as a price update.
+
+        Returns:
+            Number of price updates published
+        """
+        started = time.perf_counter()
+        results = await asyncio.gather(*(self._fetch_ticker(s) for s in self.symbols))
+
+        published = 0
+        for symbol, ticker in results:
+            price = ticker.get("last") if ticker else None
+            if not price:
+                continue
+            if self.paper is not None:
+                self.paper.update_price(symbol, price)
+            await self.event_bus.publish(
+                Event(
+                    type=EventType.PRICE_UPDATE,
+                    data={
+                        "symbol": symbol,
+                        "price": price,
+                        "bid": ticker.get("bid"),
+                        "ask": ticker.get("ask"),
+                        "volume": ticker.get("baseVolume", 0),
+                    },
+                )
+            )
+            published += 1
+
+        self._polls += 1
+        self._ticks += published
+        self._poll_latency.append(time.perf_counter() - started)
+        return published
+
+    async def _fetch_ticker(self, symbol: str) -> tuple[str, dict[str, Any] | None]:
+        async with self._semaphore:
+            try:
+                return symbol, await self.exchange.get_ticker(symbol)
+            except Exception as e:
+                self._fetch_errors += 1
+                logger.warning("price_fetch_error", symbol=symbol, error=str(e))
+                return symbol, None
+
+    async def _price_loop(self) -> None:
+        while not self._stop_event.is_set():
+            try:
+                await self.poll_once()
+            except Exception as e:
+                logger.error("headless_poll_failed", error=str(e))
+            await asyncio.sleep(self.poll_interval)
+
+    async def _monitor_loop_lag(self) -> None:
+        """Sample how late the loop wakes from a short sleep."""
+        loop = asyncio.get_running_loop()
+        while True:
+            started = loop.time()
+            await asyncio.sleep(_LAG_SAMPLE_INTERVAL)
+            self._loop_lag.append(max(0.0, loop.time() - started - _LAG_SAMPLE_INTERVAL))
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get throughput and latency statistics."""
+        uptime = time.perf_counter() - self._started_at if self._started_at else 0.0
+        return {
+            "running": self.running,
+            "uptime_s": round(uptime, 2),
+            "polls": self._polls,
+            "ticks": self._ticks,
+            "ticks_per_sec": round(self._ticks / uptime, 2) if uptime else 0.0,
+            "fetch_errors": self._fetch_errors,
+            "event_queue": self.event_bus.queue_size,
+            "analysis": self.engine._analysis.get_stats(),
+            "poll_latency": latency_summary(self._poll_latency),
+            "loop_lag": latency_summary(self._loop_lag),
+        }
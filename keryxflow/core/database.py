@@ -85,11 +85,23 @@ def get_session_factory():
     return _async_session_factory
 
 
+def _create_missing_indexes(connection) -> None:
+    """Create indexes added to models after their table already existed.
+
+    ``create_all`` skips existing tables entirely, so databases created by an
+    older version would otherwise never get new indexes.
+    """
+    for table in SQLModel.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(connection, checkfirst=True)
+
+
 async def init_db() -> None:
-    """Initialize the database, creating all tables."""
+    """Initialize the database, creating all tables and missing indexes."""
     engine = get_engine()
     async with engine.begin() as conn:
         await conn.run_sync(SQLModel.metadata.create_all)
+        await conn.run_sync(_create_missing_indexes)
 
 
 async def get_session() -> AsyncGenerator[AsyncSession, None]:
@@ -1,7 +1,9 @@
 """Trading engine that orchestrates the full trading loop."""
 
 import asyncio
+import time
 from collections import defaultdict
+from concurrent.futures import Executor
 from datetime import UTC, datetime
 from typing import TYPE_CHECKING, Any
 
@@ -13,13 +15,19 @@ from keryxflow.aegis.risk import (
     RiskManager,
     get_risk_manager,
 )
+from keryxflow.aegis.stops import StopBook, StopTrigger
 from keryxflow.aegis.trailing import get_trailing_stop_manager
 from keryxflow.config import get_settings
+from keryxflow.core.analysis import AnalysisScheduler, create_analysis_executor
+from keryxflow.core.clock import Clock
 from keryxflow.core.events import Event, EventBus, EventType, get_event_bus
+from keryxflow.core.journal import create_journal_from_settings
 from keryxflow.core.logging import get_logger
 from keryxflow.core.models import RiskProfile, TradeOutcome
+from keryxflow.core.mtf_buffer import candle_to_row, timeframe_to_seconds
 from keryxflow.core.repository import get_trade_repository
 from keryxflow.core.safeguards import LiveTradingSafeguards
+from keryxflow.core.snapshot import OHLCVSnapshotStore, merge_candles, missing_candles
 from keryxflow.exchange.adapter import ExchangeAdapter
 from keryxflow.exchange.paper import PaperTradingEngine
 from keryxflow.memory.manager import MemoryManager, get_memory_manager
@@ -38,13 +46,20 @@ if TYPE_CHECKING:
 
 logger = get_logger(__name__)
 
+_STOP_EXIT_REASONING = {
+    "stop_loss": "Stop loss hit",
+    "trailing_stop": "Trailing stop triggered",
+    "take_profit": "Take profit hit",
+}
+
 
 class OHLCVBuffer:
     """Buffer to accumulate price updates into OHLCV candles."""
 
-    def __init__(self, max_candles: int = 100):
+    def __init__(self, max_candles: int = 100, clock: Clock | None = None):
         """Initialize the buffer."""
         self.max_candles = max_candles
+        self.clock = clock or Clock()
         self._candles: dict[str, list[dict[str, Any]]] = defaultdict(list)
         self._current_candle: dict[str, dict[str, Any]] = {}
         self._last_candle_time: dict[str, datetime] = {}
@@ -56,7 +71,7 @@ class OHLCVBuffer:
 
         Returns True if a new candle was completed.
         """
-        now = datetime.now(UTC)
+        now = self.clock.now()
         candle_time = now.replace(second=0, microsecond=0)
 
         # Check if we need to start a new candle
@@ -118,6 +133,15 @@ class OHLCVBuffer:
         """Get number of completed candles for a symbol."""
         return len(self._candles.get(symbol, []))
 
+    @property
+    def symbols(self) -> list[str]:
+        """Symbols with completed candles."""
+        return [symbol for symbol, candles in self._candles.items() if candles]
+
+    def to_rows(self, symbol: str) -> list[list[float]]:
+        """Get completed candles as [timestamp_ms, open, high, low, close, volume] rows."""
+        return [candle_to_row(c) for c in self._candles.get(symbol, [])]
+
     def add_candle(
         self,
         symbol: str,
@@ -174,12 +198,22 @@ class TradingEngine:
         notification_manager: "NotificationManager | None" = None,
         memory_manager: MemoryManager | None = None,
         cognitive_agent: "CognitiveAgent | None" = None,
+        clock: Clock | None = None,
     ):
         """Initialize the trading engine."""
         self.settings = get_settings()
+        self.clock = clock or Clock()
         self.exchange = exchange_client
         self.paper = paper_engine
         self.event_bus = event_bus or get_event_bus()
+        if risk_manager is None and clock is not None:
+            # A clock of its own (e.g. simulated): keep daily resets on it
+            # rather than on the process-wide risk manager
+            risk_manager = RiskManager(
+                risk_profile=RiskProfile.CONSERVATIVE,
+                initial_balance=10000.0,
+                clock=self.clock,
+            )
         self.risk = risk_manager or get_risk_manager(
             risk_profile=RiskProfile.CONSERVATIVE,
             initial_balance=10000.0,
@@ -218,18 +252,23 @@ class TradingEngine:
         if self._mtf_enabled:
             from keryxflow.core.mtf_buffer import create_mtf_buffer_from_settings
 
-            self._mtf_buffer = create_mtf_buffer_from_settings()
+            self._mtf_buffer = create_mtf_buffer_from_settings(clock=self.clock)
             self.signals = signal_generator or get_mtf_signal_generator()
             self._ohlcv_buffer = None  # Not used in MTF mode
         else:
             self._mtf_buffer = None
             self.signals = signal_generator or get_signal_generator()
-            self._ohlcv_buffer = OHLCVBuffer(max_candles=100)
+            self._ohlcv_buffer = OHLCVBuffer(max_candles=100, clock=self.clock)
 
         # Trailing stop manager
         self._trailing_enabled = self.settings.risk.trailing_stop_enabled
         self._trailing_manager = get_trailing_stop_manager() if self._trailing_enabled else None
 
+        # Trailing and fixed stops share one array-backed book
+        self._stop_book = (
+            self._trailing_manager.book if self._trailing_manager is not None else StopBook()
+        )
+
         # API server (managed lifecycle)
         self._api_server: Any = None
         self._api_task: asyncio.Task | None = None
@@ -246,6 +285,27 @@ class TradingEngine:
         self._balance_sync_interval = self.settings.live.sync_interval
         self._last_agent_cycle: datetime | None = None
         self._preload_task: asyncio.Task | None = None
+        self._post_mortem_task: asyncio.Task | None = None
+
+        # Warm start: buffers are snapshotted to disk and restored on start
+        snapshot_path = self.settings.system.ohlcv_snapshot_path
+        self._snapshot = OHLCVSnapshotStore(snapshot_path) if snapshot_path else None
+        self._snapshot_task: asyncio.Task | None = None
+        self._buffers_ready = False
+
+        # Optional recording of bus events for replay
+        self._journal = create_journal_from_settings()
+
+        # Analysis runs off the price handler: newest request per symbol,
+        # indicators computed in a worker pool, orders placed one at a time
+        oracle = self.settings.oracle
+        self._analysis = AnalysisScheduler(
+            self._analyze_symbol,
+            concurrency=max(1, oracle.analysis_workers),
+            deadline=oracle.analysis_deadline,
+        )
+        self._analysis_executor: Executor | None = None
+        self._order_lock = asyncio.Lock()
 
     async def start(self) -> None:
         """Start the trading engine."""
@@ -266,20 +326,33 @@ class TradingEngine:
 
         self._running = True
 
+        # Indicator pool, unless the signal generator was given one
+        if self.signals.executor is None:
+            self._analysis_executor = create_analysis_executor(
+                self.settings.oracle.analysis_workers, self.settings.oracle.analysis_executor
+            )
+            self.signals.executor = self._analysis_executor
+        self._analysis.start()
+
         # Subscribe to events
         self.event_bus.subscribe(EventType.PRICE_UPDATE, self._on_price_update)
         self.event_bus.subscribe(EventType.SYSTEM_PAUSED, self._on_pause)
         self.event_bus.subscribe(EventType.SYSTEM_RESUMED, self._on_resume)
         self.event_bus.subscribe(EventType.PANIC_TRIGGERED, self._on_panic)
 
-        # Subscribe to position events for trailing stop
+        # Subscribe to position events for stop tracking
         if self._trailing_enabled:
             self.event_bus.subscribe(EventType.POSITION_OPENED, self._on_position_opened)
-            self.event_bus.subscribe(EventType.POSITION_CLOSED, self._on_position_closed)
+        self.event_bus.subscribe(EventType.POSITION_CLOSED, self._on_position_closed)
+
+        if self._journal is not None:
+            self._journal.attach(self.event_bus)
+            await self._journal.start()
 
-        # Setup notification manager
+        # Setup notification manager with background delivery
         if self.notifications:
             self.notifications.subscribe_to_events()
+            self.notifications.start()
 
         # Get balance from appropriate source
         if self._is_live_mode:
@@ -332,25 +405,84 @@ class TradingEngine:
         try:
             logger.info("background_preload_started")
             await self._preload_ohlcv()
+            self._buffers_ready = True
+            if self._snapshot is not None and self.settings.system.ohlcv_snapshot_interval > 0:
+                self._snapshot_task = asyncio.create_task(self._snapshot_loop())
             await self._initial_analysis()
             logger.info("background_preload_completed")
         except Exception as e:
             logger.error("background_preload_failed", error=str(e))
 
     async def _preload_ohlcv(self) -> None:
-        """Pre-load historical OHLCV data for all symbols."""
+        """Pre-load historical OHLCV data for all symbols.
+
+        Series found in the warm-start snapshot are restored from disk and
+        only the candles since the snapshot are fetched.
+        """
 
         symbols = self.settings.system.symbols
         candles_to_load = 60  # Need at least 50 for technical analysis
+        cached = await asyncio.to_thread(self._snapshot.load) if self._snapshot else {}
 
         if self._mtf_enabled:
-            await self._preload_mtf_ohlcv(symbols, candles_to_load)
+            await self._preload_mtf_ohlcv(symbols, candles_to_load, cached)
         else:
-            await self._preload_single_tf_ohlcv(symbols, candles_to_load)
+            await self._preload_single_tf_ohlcv(symbols, candles_to_load, cached)
+
+    async def _fetch_preload_candles(
+        self,
+        symbol: str,
+        timeframe: str,
+        candles_to_load: int,
+        cached: dict[tuple[str, str], Any],
+    ) -> tuple[list[list[float]], bool]:
+        """Get the candles to preload for one symbol/timeframe.
+
+        Returns:
+            Tuple of (candle rows, whether the snapshot was used)
+        """
+        rows = cached.get((symbol, timeframe))
+        now_ms = int(self.clock.now().timestamp() * 1000)
+        missing = missing_candles(rows, timeframe_to_seconds(timeframe), now_ms=now_ms)
+        if missing is None or missing >= candles_to_load:
+            # No snapshot, or too old to bridge: full fetch
+            ohlcv = await self.exchange.get_ohlcv(
+                symbol=symbol,
+                timeframe=timeframe,
+                limit=candles_to_load,
+            )
+            return merge_candles(None, ohlcv or []), False
 
-    async def _preload_single_tf_ohlcv(self, symbols: list[str], candles_to_load: int) -> None:
+        if missing == 0:
+            # Still inside the last snapshot candle; live prices continue it
+            return merge_candles(rows, []), True
+
+        # The last snapshot candle may have been saved while still forming,
+        # so the gap starts at it
+        try:
+            ohlcv = await self.exchange.get_ohlcv(
+                symbol=symbol,
+                timeframe=timeframe,
+                limit=missing + 1,
+                since=int(rows[-1, 0]),
+            )
+        except Exception as e:
+            # Keep the snapshot; live prices fill in from here
+            logger.warning(
+                "ohlcv_gap_fetch_failed", symbol=symbol, timeframe=timeframe, error=str(e)
+            )
+            ohlcv = []
+        return merge_candles(rows, ohlcv or []), True
+
+    async def _preload_single_tf_ohlcv(
+        self,
+        symbols: list[str],
+        candles_to_load: int,
+        cached: dict[tuple[str, str], Any] | None = None,
+    ) -> None:
         """Pre-load single timeframe OHLCV data (parallel with concurrency limit)."""
         semaphore = asyncio.Semaphore(5)  # Max 5 concurrent requests
+        cached = cached or {}
 
         async def load_symbol(symbol: str) -> None:
             async with semaphore:
@@ -358,10 +490,8 @@ class TradingEngine:
                     logger.info("preloading_ohlcv", symbol=symbol, candles=candles_to_load)
 
                     # Use the main exchange client instead of creating temporary ones
-                    ohlcv = await self.exchange.get_ohlcv(
-                        symbol=symbol,
-                        timeframe="1m",
-                        limit=candles_to_load,
+                    ohlcv, from_snapshot = await self._fetch_preload_candles(
+                        symbol, "1m", candles_to_load, cached
                     )
 
                     if ohlcv:
@@ -381,6 +511,7 @@ class TradingEngine:
                             "ohlcv_preloaded",
                             symbol=symbol,
                             candles=self._ohlcv_buffer.candle_count(symbol),
+                            from_snapshot=from_snapshot,
                         )
                 except Exception as e:
                     logger.warning("ohlcv_preload_failed", symbol=symbol, error=str(e))
@@ -388,10 +519,16 @@ class TradingEngine:
         # Load all symbols in parallel
         await asyncio.gather(*[load_symbol(s) for s in symbols])
 
-    async def _preload_mtf_ohlcv(self, symbols: list[str], candles_to_load: int) -> None:
+    async def _preload_mtf_ohlcv(
+        self,
+        symbols: list[str],
+        candles_to_load: int,
+        cached: dict[tuple[str, str], Any] | None = None,
+    ) -> None:
         """Pre-load multi-timeframe OHLCV data (parallel with concurrency limit)."""
         timeframes = self.settings.oracle.mtf.timeframes
         semaphore = asyncio.Semaphore(5)  # Max 5 concurrent requests
+        cached = cached or {}
 
         async def load_symbol_tf(symbol: str, tf: str) -> None:
             async with semaphore:
@@ -404,10 +541,8 @@ class TradingEngine:
                     )
 
                     # Use the main exchange client instead of creating temporary ones
-                    ohlcv = await self.exchange.get_ohlcv(
-                        symbol=symbol,
-                        timeframe=tf,
-                        limit=candles_to_load,
+                    ohlcv, from_snapshot = await self._fetch_preload_candles(
+                        symbol, tf, candles_to_load, cached
                     )
 
                     if ohlcv:
@@ -429,6 +564,7 @@ class TradingEngine:
                             symbol=symbol,
                             timeframe=tf,
                             candles=self._mtf_buffer.candle_count(symbol, tf),
+                            from_snapshot=from_snapshot,
                         )
                 except Exception as e:
                     logger.warning(
@@ -442,6 +578,44 @@ class TradingEngine:
         tasks = [load_symbol_tf(s, tf) for s in symbols for tf in timeframes]
         await asyncio.gather(*tasks)
 
+    def _snapshot_series(self) -> dict[tuple[str, str], list[list[float]]]:
+        """Completed candles per (symbol, timeframe) from the active buffer."""
+        if self._mtf_enabled:
+            return {
+                (symbol, tf): self._mtf_buffer.to_rows(symbol, tf)
+                for symbol in self._mtf_buffer.symbols
+                for tf in self._mtf_buffer.timeframes
+            }
+        return {
+            (symbol, "1m"): self._ohlcv_buffer.to_rows(symbol)
+            for symbol in self._ohlcv_buffer.symbols
+        }
+
+    async def save_ohlcv_snapshot(self) -> int:
+        """
+        Write the OHLCV buffers to the warm-start snapshot.
+
+        Skipped until the startup preload has filled the buffers, so an
+        interrupted start never replaces a good snapshot with a partial one.
+
+        Returns:
+            Number of series written
+        """
+        if self._snapshot is None or not self._buffers_ready:
+            return 0
+        series = self._snapshot_series()
+        return await asyncio.to_thread(self._snapshot.save, series)
+
+    async def _snapshot_loop(self) -> None:
+        """Save the OHLCV snapshot periodically so a crash loses little history."""
+        interval = self.settings.system.ohlcv_snapshot_interval
+        while self._running:
+            await asyncio.sleep(interval)
+            try:
+                await self.save_ohlcv_snapshot()
+            except Exception as e:
+                logger.warning("ohlcv_snapshot_failed", error=str(e))
+
     async def _initial_analysis(self) -> None:
         """Run initial analysis for all symbols after OHLCV preload."""
         symbols = self.settings.system.symbols
@@ -473,6 +647,15 @@ class TradingEngine:
         if self._preload_task and not self._preload_task.done():
             self._preload_task.cancel()
 
+        # Persist candles for the next start
+        if self._snapshot_task and not self._snapshot_task.done():
+            self._snapshot_task.cancel()
+        self._snapshot_task = None
+        try:
+            await self.save_ohlcv_snapshot()
+        except Exception as e:
+            logger.warning("ohlcv_snapshot_failed", error=str(e))
+
         # Stop API server if running
         if self._api_server is not None:
             try:
@@ -492,7 +675,32 @@ class TradingEngine:
 
         if self._trailing_enabled:
             self.event_bus.unsubscribe(EventType.POSITION_OPENED, self._on_position_opened)
-            self.event_bus.unsubscribe(EventType.POSITION_CLOSED, self._on_position_closed)
+        self.event_bus.unsubscribe(EventType.POSITION_CLOSED, self._on_position_closed)
+
+        if self._journal is not None:
+            await self._journal.stop()
+
+        if self._orchestrator is not None:
+            self._orchestrator.close()
+
+        # Let a running post-mortem batch record its lessons
+        if self._post_mortem_task is not None:
+            try:
+                await self._post_mortem_task
+            except Exception as e:
+                logger.warning("post_mortem_flush_failed", error=str(e))
+            self._post_mortem_task = None
+
+        # Flush queued notifications
+        if self.notifications:
+            await self.notifications.stop()
+
+        await self._analysis.stop()
+        if self._analysis_executor is not None:
+            if self.signals.executor is self._analysis_executor:
+                self.signals.executor = None
+            self._analysis_executor.shutdown(wait=False, cancel_futures=True)
+            self._analysis_executor = None
 
         logger.info("trading_engine_stopped")
 
@@ -508,12 +716,9 @@ class TradingEngine:
         if not symbol or not price:
             return
 
-        # Check trailing stop before anything else (fastest reaction)
-        if self._trailing_enabled and self._trailing_manager is not None:
-            self._trailing_manager.update_price(symbol, price)
-            if self._trailing_manager.should_trigger_stop(symbol, price):
-                await self._close_trailing_stop(symbol, price)
-                return
+        # Check stops before anything else (fastest reaction)
+        if symbol in await self.check_stops({symbol: price}):
+            return
 
         # Add to appropriate buffer
         if self._mtf_enabled:
@@ -525,7 +730,14 @@ class TradingEngine:
             new_candle = self._ohlcv_buffer.add_price(symbol, price, volume or 0.0)
 
         # Check if we should analyze
-        if self._should_analyze(symbol, new_candle):
+        if not self._should_analyze(symbol, new_candle):
+            return
+
+        if self._analysis.running:
+            # Hand off so the next price update is not held up by indicators
+            self._last_analysis[symbol] = self.clock.now()
+            self._analysis.submit(symbol, price)
+        else:
             await self._analyze_symbol(symbol, price)
 
     def _should_analyze(self, symbol: str, new_candle: bool) -> bool:
@@ -548,7 +760,7 @@ class TradingEngine:
             return False
 
         # Check time since last analysis
-        now = datetime.now(UTC)
+        now = self.clock.now()
         last = self._last_analysis.get(symbol)
 
         if last is None:
@@ -558,14 +770,26 @@ class TradingEngine:
         elapsed = (now - last).total_seconds()
         return elapsed >= self._analysis_interval or new_candle
 
-    async def _analyze_symbol(self, symbol: str, current_price: float) -> None:
-        """Run analysis and generate signal for a symbol."""
-        self._last_analysis[symbol] = datetime.now(UTC)
+    async def _analyze_symbol(
+        self, symbol: str, current_price: float, deadline: float | None = None
+    ) -> bool:
+        """Run analysis and generate signal for a symbol.
+
+        Args:
+            symbol: Symbol to analyze
+            current_price: Price that triggered the analysis
+            deadline: ``time.monotonic()`` value after which the signal is
+                stale and is neither published nor traded (None = no limit)
+
+        Returns:
+            False if the signal was discarded for missing its deadline
+        """
+        self._last_analysis[symbol] = self.clock.now()
 
         # If agent mode is enabled, run agent cycle instead
         if self._agent_mode and self._cognitive_agent is not None:
             await self._run_agent_cycle([symbol])
-            return
+            return True
 
         # Get OHLCV data (single TF or MTF dict)
         if self._mtf_enabled:
@@ -574,11 +798,11 @@ class TradingEngine:
             primary_tf = self.settings.oracle.mtf.primary_timeframe
             primary_df = ohlcv.get(primary_tf)
             if primary_df is None or len(primary_df) < self._min_candles:
-                return
+                return True
         else:
             ohlcv = self._ohlcv_buffer.get_ohlcv(symbol)
             if ohlcv is None or len(ohlcv) < self._min_candles:
-                return
+                return True
 
         try:
             # include_llm depends on ai_mode: disabled=False, enhanced=True
@@ -591,6 +815,10 @@ class TradingEngine:
                 include_llm=include_llm,
             )
 
+            if deadline is not None and time.monotonic() > deadline:
+                logger.warning("analysis_expired", symbol=symbol, price=current_price)
+                return False
+
             # Publish signal event
             await self.event_bus.publish(
                 Event(
@@ -608,11 +836,14 @@ class TradingEngine:
 
             # Process actionable signals
             if signal.is_actionable and self._auto_trade:
-                await self._process_signal(signal)
+                async with self._order_lock:
+                    await self._process_signal(signal)
 
         except Exception as e:
             logger.error("analysis_failed", symbol=symbol, error=str(e))
 
+        return True
+
     async def _run_agent_cycle(self, symbols: list[str]) -> None:
         """Run a cognitive agent cycle for the given symbols.
 
@@ -622,7 +853,7 @@ class TradingEngine:
             symbols: Symbols to analyze in this cycle
         """
         # Check cycle interval
-        now = datetime.now(UTC)
+        now = self.clock.now()
         if self._last_agent_cycle is not None:
             elapsed = (now - self._last_agent_cycle).total_seconds()
             if elapsed < self.settings.agent.cycle_interval:
@@ -722,6 +953,7 @@ class TradingEngine:
             entry_price=signal.entry_price,
             stop_loss=signal.stop_loss,
             take_profit=signal.take_profit,
+            confidence=signal.confidence,
         )
 
         # Get approval from Aegis
@@ -767,7 +999,7 @@ class TradingEngine:
 
             if result:
                 fill_price = result.get("price", order.entry_price)
-                order_id = result.get("id", f"{order.symbol}_{datetime.now(UTC).timestamp()}")
+                order_id = result.get("id", f"{order.symbol}_{self.clock.now().timestamp()}")
 
                 # Publish fill event
                 await self.event_bus.publish(
@@ -780,10 +1012,21 @@ class TradingEngine:
                             "price": fill_price,
                             "order_id": order_id,
                             "is_live": self._is_live_mode,
+                            "venue": result.get("venue"),
                         },
                     )
                 )
 
+                # Paper positions have no exchange-side stops; track them here
+                if not self._is_live_mode and (order.stop_loss or order.take_profit):
+                    self._stop_book.track(
+                        order.symbol,
+                        order.side,
+                        fill_price,
+                        stop_loss=order.stop_loss,
+                        take_profit=order.take_profit,
+                    )
+
                 # Record trade episode in memory
                 await self._record_trade_episode(order, signal, fill_price, order_id)
 
@@ -894,7 +1137,7 @@ class TradingEngine:
             else:
                 outcome = TradeOutcome.LOSS
 
-            await self.memory.record_trade_exit(
+            recorded = await self.memory.record_trade_exit(
                 episode_id=episode_id,
                 exit_price=exit_price,
                 exit_reasoning=exit_reasoning,
@@ -906,6 +1149,9 @@ class TradingEngine:
             # Clean up tracking
             del self._episode_by_order[order_id]
 
+            if recorded and self._agent_mode:
+                self._queue_post_mortem(episode_id)
+
             logger.debug(
                 "trade_exit_recorded",
                 episode_id=episode_id,
@@ -916,6 +1162,21 @@ class TradingEngine:
         except Exception as e:
             logger.warning("failed_to_record_exit", error=str(e))
 
+    def _queue_post_mortem(self, episode_id: int) -> None:
+        """Queue a closed episode for a batched post-mortem.
+
+        A full batch is analyzed right away; smaller batches wait for the
+        scheduler's post_mortem_batch task.
+        """
+        from keryxflow.agent.reflection import get_reflection_engine
+
+        reflection = get_reflection_engine()
+        reflection.enqueue_post_mortem(episode_id)
+        if reflection.pending_post_mortems < reflection.batch_size:
+            return
+        if self._post_mortem_task is None or self._post_mortem_task.done():
+            self._post_mortem_task = asyncio.create_task(reflection.flush_post_mortems())
+
     async def _execute_live_order(self, order: OrderRequest) -> dict[str, Any] | None:
         """Execute an order on the live exchange.
 
@@ -942,6 +1203,7 @@ class TradingEngine:
                     side=order.side,
                     amount=order.quantity,
                     price=result.get("average") or result.get("price"),
+                    venue=result.get("venue"),
                 )
 
             return result
@@ -1004,28 +1266,49 @@ class TradingEngine:
         )
 
     async def _on_position_closed(self, event: Event) -> None:
-        """Handle position closed event — stop trailing stop tracking."""
-        if not self._trailing_enabled or self._trailing_manager is None:
+        """Handle position closed event — stop tracking its stops."""
+        symbol = event.data.get("symbol")
+        if not symbol:
             return
 
-        symbol = event.data.get("symbol")
-        if symbol:
+        if self._trailing_manager is not None:
             self._trailing_manager.stop_tracking(symbol)
+        else:
+            self._stop_book.remove(symbol)
 
-    async def _close_trailing_stop(self, symbol: str, price: float) -> None:
-        """Close a position due to trailing stop trigger."""
+    async def check_stops(self, prices: dict[str, float]) -> set[str]:
+        """Evaluate a batch of prices against every tracked stop.
+
+        Trailing, stop-loss and take-profit levels for all open positions
+        are checked in one pass; each crossed position is closed.
+
+        Args:
+            prices: Latest price per symbol
+
+        Returns:
+            Symbols whose position was stopped out
+        """
+        if not len(self._stop_book):
+            return set()
+
+        triggers = self._stop_book.evaluate(prices)
+        for trigger in triggers:
+            await self._close_on_stop(trigger)
+        return {trigger.symbol for trigger in triggers}
+
+    async def _close_on_stop(self, trigger: StopTrigger) -> None:
+        """Close a position whose stop level was crossed."""
+        symbol, price, reason = trigger.symbol, trigger.price, trigger.reason
         logger.warning(
-            "trailing_stop_triggered",
+            "stop_triggered",
             symbol=symbol,
+            reason=reason,
             price=price,
-            stop_price=self._trailing_manager.get_stop_price(symbol)
-            if self._trailing_manager
-            else None,
+            stop_price=trigger.stop_price,
         )
 
         # Stop tracking immediately to prevent duplicate triggers
-        if self._trailing_manager is not None:
-            self._trailing_manager.stop_tracking(symbol)
+        self._stop_book.remove(symbol)
 
         try:
             result = await self.paper.close_position(symbol, price)
@@ -1042,7 +1325,7 @@ class TradingEngine:
                             "exit_price": price,
                             "pnl": pnl,
                             "pnl_percentage": pnl_pct,
-                            "reason": "trailing_stop",
+                            "reason": reason,
                         },
                     )
                 )
@@ -1058,20 +1341,21 @@ class TradingEngine:
                 await self.record_trade_exit(
                     order_id=order_id,
                     exit_price=price,
-                    exit_reasoning="Trailing stop triggered",
+                    exit_reasoning=_STOP_EXIT_REASONING[reason],
                     pnl=pnl,
                     pnl_percentage=pnl_pct,
                 )
 
                 logger.info(
-                    "trailing_stop_position_closed",
+                    "stop_position_closed",
                     symbol=symbol,
+                    reason=reason,
                     pnl=pnl,
                     pnl_pct=pnl_pct,
                 )
 
         except Exception as e:
-            logger.error("trailing_stop_close_failed", symbol=symbol, error=str(e))
+            logger.error("stop_close_failed", symbol=symbol, reason=reason, error=str(e))
 
     async def _on_pause(self, _event: Event) -> None:
         """Handle pause event."""
@@ -1089,9 +1373,11 @@ class TradingEngine:
         logger.warning("panic_triggered")
 
         try:
-            # Stop all trailing stops before closing
-            if self._trailing_enabled and self._trailing_manager is not None:
+            # Stop all trailing and fixed stops before closing
+            if self._trailing_manager is not None:
                 self._trailing_manager.stop_tracking_all()
+            else:
+                self._stop_book.clear()
 
             await self.paper.close_all_positions()
 
@@ -1163,11 +1449,18 @@ class TradingEngine:
         try:
             # Use the main exchange client
             balance = await self.exchange.get_balance()
-            self._last_balance_sync = datetime.now(UTC)
+            self._last_balance_sync = self.clock.now()
 
             # Extract free balances
             free_balance = balance.get("free", {})
 
+            # Multi-venue clients also report each venue's own balance
+            venues = balance.get("venues")
+            if venues:
+                self.risk.portfolio_state.set_venue_balances(
+                    {venue: held.get("free", {}) for venue, held in venues.items()}
+                )
+
             logger.debug(
                 "balance_synced",
                 usdt=free_balance.get("USDT", 0.0),
@@ -1184,7 +1477,7 @@ class TradingEngine:
         if not self._is_live_mode:
             return
 
-        now = datetime.now(UTC)
+        now = self.clock.now()
         if self._last_balance_sync is None:
             await self._sync_balance_from_exchange()
             return
@@ -1217,8 +1510,12 @@ class TradingEngine:
             "mtf_enabled": self._mtf_enabled,
             "ai_mode": self._ai_mode,
             "agent_mode": self._agent_mode,
+            "analysis": self._analysis.get_stats(),
         }
 
+        if self._journal is not None:
+            status["journal"] = self._journal.get_stats()
+
         if self._mtf_enabled:
             status["mtf_timeframes"] = self.settings.oracle.mtf.timeframes
             status["mtf_primary_timeframe"] = self.settings.oracle.mtf.primary_timeframe
@@ -226,6 +226,10 @@ class EventBus:
             except Exception as e:
                 logger.error("event_processor_error", error=str(e))
 
+    async def join(self) -> None:
+        """Wait until every queued event has been dispatched (needs start())."""
+        await self._queue.join()
+
     async def start(self) -> None:
         """Start the event processor."""
         if self._running:
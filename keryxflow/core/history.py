@@ -0,0 +1,163 @@
+"""Keyset pagination over time-ordered tables (trades, trade episodes).
+
+Pages are ordered by ``(timestamp, id)`` and resumed from an opaque cursor
+holding the last row's key, so fetching page N costs the same as page 1 and
+is served from the ``(symbol, timestamp)`` / ``timestamp`` indexes instead of
+an ``OFFSET`` scan.
+"""
+
+import base64
+from collections.abc import AsyncIterator, Callable
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING, Any, Generic, TypeVar
+
+from sqlalchemy import and_, or_
+from sqlmodel import col, select
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession
+    from sqlmodel.sql.expression import SelectOfScalar
+
+T = TypeVar("T")
+
+MAX_PAGE_SIZE = 1000
+DEFAULT_PAGE_SIZE = 100
+
+
+@dataclass
+class HistoryPage(Generic[T]):
+    """One page of a keyset-paginated history query."""
+
+    items: list[T] = field(default_factory=list)
+    next_cursor: str | None = None
+
+
+def encode_cursor(timestamp: datetime, row_id: int) -> str:
+    """Encode a ``(timestamp, id)`` key as an opaque URL-safe cursor."""
+    raw = f"{_to_utc(timestamp).isoformat()}|{row_id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, int]:
+    """Decode a cursor produced by :func:`encode_cursor`.
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        raw = base64.urlsafe_b64decode(padded.encode()).decode()
+        timestamp, row_id = raw.rsplit("|", 1)
+        return _to_utc(datetime.fromisoformat(timestamp)), int(row_id)
+    except Exception as e:
+        raise ValueError(f"Invalid cursor: {cursor!r}") from e
+
+
+def _to_utc(value: datetime) -> datetime:
+    """Normalize to aware UTC; naive values are taken to already be UTC."""
+    if value.tzinfo is None:
+        return value.replace(tzinfo=UTC)
+    return value.astimezone(UTC)
+
+
+def history_statement(
+    model: Any,
+    timestamp: Any,
+    symbol: str | None = None,
+    start: datetime | None = None,
+    end: datetime | None = None,
+    after: tuple[datetime, int] | None = None,
+    ascending: bool = False,
+) -> "SelectOfScalar":
+    """Build a keyset query ordered by ``(timestamp, id)``.
+
+    Args:
+        model: SQLModel table class with ``id`` and ``symbol`` columns
+        timestamp: Timestamp column to order and filter on
+        symbol: Optional symbol filter
+        start: Inclusive lower time bound
+        end: Exclusive upper time bound
+        after: Key of the last row already returned
+        ascending: Oldest first instead of newest first
+
+    Returns:
+        Select statement without a limit
+    """
+    ts = col(timestamp)
+    row_id = col(model.id)
+    statement = select(model)
+
+    if symbol:
+        statement = statement.where(model.symbol == symbol)
+    if start is not None:
+        statement = statement.where(ts >= _to_utc(start))
+    if end is not None:
+        statement = statement.where(ts < _to_utc(end))
+
+    if after is not None:
+        after_ts, after_id = _to_utc(after[0]), after[1]
+        if ascending:
+            statement = statement.where(or_(ts > after_ts, and_(ts == after_ts, row_id > after_id)))
+        else:
+            statement = statement.where(or_(ts < after_ts, and_(ts == after_ts, row_id < after_id)))
+
+    if ascending:
+        return statement.order_by(ts.asc(), row_id.asc())
+    return statement.order_by(ts.desc(), row_id.desc())
+
+
+async def fetch_page(
+    session: "AsyncSession",
+    statement: "SelectOfScalar",
+    limit: int,
+    key: Callable[[Any], tuple[datetime, int]],
+) -> HistoryPage:
+    """Execute a keyset statement and return one page.
+
+    Fetches ``limit + 1`` rows to know whether a further page exists
+    without a separate count query.
+
+    Args:
+        session: Database session
+        statement: Statement from :func:`history_statement`
+        limit: Page size
+        key: Extracts the ``(timestamp, id)`` key from a row
+
+    Returns:
+        HistoryPage with the rows and the cursor for the next page
+    """
+    result = await session.execute(statement.limit(limit + 1))
+    rows = list(result.scalars().all())
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_cursor(*key(rows[-1]))
+    return HistoryPage(items=rows, next_cursor=next_cursor)
+
+
+async def iter_batches(
+    fetch: Callable[[str | None], Any],
+    cursor: str | None = None,
+) -> AsyncIterator[list[Any]]:
+    """Walk every page of a history query, one batch at a time.
+
+    Each batch is fetched in its own short-lived query, so memory use is
+    bounded by the batch size and no long read transaction is held open
+    while the consumer (e.g. a slow HTTP client) drains rows.
+
+    Args:
+        fetch: Coroutine function returning the HistoryPage after a cursor
+        cursor: Cursor to resume from
+
+    Yields:
+        Lists of rows, in order
+    """
+    while True:
+        page: HistoryPage = await fetch(cursor)
+        if page.items:
+            yield page.items
+        if page.next_cursor is None:
+            return
+        cursor = page.next_cursor
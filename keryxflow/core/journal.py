@@ -0,0 +1,405 @@
+"""Append-only binary journal of event bus traffic.
+
+Every frame is a fixed header followed by a body::
+
+    crc32 (u32) | body length (u32) | timestamp µs (i64) | codec (u8) | type length (u8)
+    body: event type (utf-8) + payload
+
+Price updates use a packed ``(price, volume)`` payload followed by the
+symbol; every other event stores its data as compact JSON. The CRC covers
+everything after itself, so a frame torn by a crash ends the read instead
+of producing a bad event.
+"""
+
+import asyncio
+import contextlib
+import json
+import math
+import os
+import struct
+import time
+import zlib
+from collections.abc import Iterable, Iterator
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+from keryxflow.core.events import Event, EventBus, EventType
+from keryxflow.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+MAGIC = b"KXJ1"
+JOURNAL_SUFFIX = ".kxj"
+
+_CRC = struct.Struct("<I")
+_HEADER = struct.Struct("<IqBB")  # body length, timestamp µs, codec, type length
+_FRAME_SIZE = _CRC.size + _HEADER.size
+_PRICE = struct.Struct("<dd")
+
+CODEC_JSON = 0
+CODEC_PRICE = 1
+
+# What a session needs to be reproduced: market input, operator actions
+# and the engine's decisions
+DEFAULT_EVENT_TYPES = (
+    EventType.PRICE_UPDATE,
+    EventType.SIGNAL_GENERATED,
+    EventType.ORDER_REQUESTED,
+    EventType.ORDER_APPROVED,
+    EventType.ORDER_REJECTED,
+    EventType.ORDER_SUBMITTED,
+    EventType.ORDER_FILLED,
+    EventType.ORDER_CANCELLED,
+    EventType.POSITION_OPENED,
+    EventType.POSITION_UPDATED,
+    EventType.POSITION_CLOSED,
+    EventType.CIRCUIT_BREAKER_TRIGGERED,
+    EventType.SYSTEM_PAUSED,
+    EventType.SYSTEM_RESUMED,
+    EventType.PANIC_TRIGGERED,
+)
+
+
+def encode_event(event: Event) -> bytes:
+    """
+    Encode one event as a journal frame.
+
+    Args:
+        event: Event to encode
+
+    Returns:
+        Frame bytes
+    """
+    type_bytes = event.type.value.encode()
+    data = event.data
+    if (
+        event.type == EventType.PRICE_UPDATE
+        and data.keys() <= {"symbol", "price", "volume"}
+        and isinstance(data.get("symbol"), str)
+        and isinstance(data.get("price"), int | float)
+        and isinstance(data.get("volume"), int | float | None)
+    ):
+        volume = data.get("volume")
+        codec = CODEC_PRICE
+        payload = _PRICE.pack(data["price"], math.nan if volume is None else volume)
+        payload += data["symbol"].encode()
+    else:
+        codec = CODEC_JSON
+        payload = json.dumps(data, separators=(",", ":"), default=str).encode()
+
+    timestamp = event.timestamp
+    if timestamp.tzinfo is None:
+        timestamp = timestamp.replace(tzinfo=UTC)
+    timestamp_us = round(timestamp.timestamp() * 1_000_000)
+
+    body = type_bytes + payload
+    header = _HEADER.pack(len(body), timestamp_us, codec, len(type_bytes))
+    return _CRC.pack(zlib.crc32(header + body)) + header + body
+
+
+def _decode_frames(data: bytes, source: str) -> Iterator[Event]:
+    """Decode the frames of one journal file."""
+    offset = len(MAGIC)
+    size = len(data)
+
+    while offset < size:
+        if offset + _FRAME_SIZE > size:
+            logger.warning("journal_truncated", path=source, offset=offset)
+            return
+        (crc,) = _CRC.unpack_from(data, offset)
+        length, timestamp_us, codec, type_length = _HEADER.unpack_from(data, offset + _CRC.size)
+        start = offset + _FRAME_SIZE
+        end = start + length
+        if end > size or zlib.crc32(data[offset + _CRC.size : end]) != crc:
+            logger.warning("journal_truncated", path=source, offset=offset)
+            return
+
+        event_type = EventType(data[start : start + type_length].decode())
+        payload = data[start + type_length : end]
+        if codec == CODEC_PRICE:
+            price, volume = _PRICE.unpack_from(payload)
+            event_data: dict[str, Any] = {
+                "symbol": payload[_PRICE.size :].decode(),
+                "price": price,
+                "volume": None if math.isnan(volume) else volume,
+            }
+        else:
+            event_data = json.loads(payload)
+
+        yield Event(
+            type=event_type,
+            timestamp=datetime.fromtimestamp(timestamp_us / 1_000_000, tz=UTC),
+            data=event_data,
+        )
+        offset = end
+
+
+def journal_files(path: str | Path) -> list[Path]:
+    """
+    List the journal files at a path, oldest first.
+
+    Args:
+        path: A journal file or a directory of them
+
+    Returns:
+        Journal file paths
+    """
+    path = Path(path)
+    if path.is_dir():
+        return sorted(path.glob(f"*{JOURNAL_SUFFIX}"))
+    return [path]
+
+
+def read_journal(path: str | Path) -> Iterator[Event]:
+    """
+    Read recorded events in the order they were written.
+
+    Args:
+        path: A journal file or a directory of rotated files
+
+    Yields:
+        Events with their original timestamps
+    """
+    for file in journal_files(path):
+        data = file.read_bytes()
+        if not data.startswith(MAGIC):
+            logger.warning("journal_bad_header", path=str(file))
+            continue
+        yield from _decode_frames(data, str(file))
+
+
+class EventJournal:
+    """
+    Records event bus traffic to rotating binary files.
+
+    Subscribed handlers only append the event to a list; a writer task
+    encodes and writes the pending batch in a worker thread every
+    ``flush_interval`` seconds and fsyncs at most every ``fsync_interval``
+    seconds. Files roll over once they exceed ``max_file_bytes``.
+
+    Example:
+        journal = EventJournal("data/journal")
+        journal.attach(event_bus)
+        await journal.start()
+        ...
+        await journal.stop()
+        for event in read_journal("data/journal"):
+            ...
+    """
+
+    def __init__(
+        self,
+        directory: str | Path,
+        event_types: Iterable[EventType] | None = None,
+        max_file_bytes: int = 64 * 1024 * 1024,
+        fsync_interval: float = 1.0,
+        flush_interval: float = 0.1,
+        max_pending: int = 100_000,
+    ):
+        """
+        Initialize the journal.
+
+        Args:
+            directory: Directory for journal files
+            event_types: Event types to record (default: DEFAULT_EVENT_TYPES)
+            max_file_bytes: Size at which a new file is started
+            fsync_interval: Minimum seconds between fsyncs
+            flush_interval: Seconds between writes of pending events
+            max_pending: Events held before new ones are dropped
+        """
+        self.directory = Path(directory)
+        self.event_types = tuple(event_types or DEFAULT_EVENT_TYPES)
+        self.max_file_bytes = max_file_bytes
+        self.fsync_interval = fsync_interval
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+
+        self._pending: list[Event] = []
+        self._bus: EventBus | None = None
+        self._writer: asyncio.Task | None = None
+        self._write_lock = asyncio.Lock()
+        self._file: Any = None
+        self._file_path: Path | None = None
+        self._file_bytes = 0
+        self._file_seq = 0
+        self._last_fsync = 0.0
+
+        # Stats
+        self._recorded = 0
+        self._written = 0
+        self._dropped = 0
+        self._bytes = 0
+        self._files = 0
+
+    @property
+    def running(self) -> bool:
+        """Check if the writer task is running."""
+        return self._writer is not None and not self._writer.done()
+
+    @property
+    def current_file(self) -> Path | None:
+        """File currently being written."""
+        return self._file_path
+
+    def attach(self, bus: EventBus) -> None:
+        """
+        Record the configured event types published on a bus.
+
+        Args:
+            bus: Event bus to record
+        """
+        self._bus = bus
+        for event_type in self.event_types:
+            bus.subscribe(event_type, self._on_event)
+
+    def detach(self) -> None:
+        """Stop recording the attached bus."""
+        if self._bus is None:
+            return
+        for event_type in self.event_types:
+            self._bus.unsubscribe(event_type, self._on_event)
+        self._bus = None
+
+    def record(self, event: Event) -> None:
+        """
+        Queue an event for writing.
+
+        Args:
+            event: Event to record
+        """
+        if len(self._pending) >= self.max_pending:
+            self._dropped += 1
+            return
+        self._pending.append(event)
+        self._recorded += 1
+
+    async def _on_event(self, event: Event) -> None:
+        """Bus handler: queue the event."""
+        self.record(event)
+
+    async def start(self) -> None:
+        """Start the background writer."""
+        if self.running:
+            return
+        self._writer = asyncio.create_task(self._writer_loop())
+        logger.info("event_journal_started", directory=str(self.directory))
+
+    async def stop(self) -> None:
+        """Detach, write everything pending, fsync and close the file."""
+        self.detach()
+        if self._writer is not None:
+            self._writer.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._writer
+            self._writer = None
+
+        await self.flush()
+        async with self._write_lock:
+            await asyncio.to_thread(self._close_file)
+        logger.info("event_journal_stopped", **self.get_stats())
+
+    async def flush(self) -> int:
+        """
+        Write pending events now.
+
+        Returns:
+            Number of events written
+        """
+        async with self._write_lock:
+            if not self._pending:
+                return 0
+            batch, self._pending = self._pending, []
+            try:
+                await asyncio.to_thread(self._write_batch, batch)
+            except Exception as e:
+                self._dropped += len(batch)
+                logger.error("event_journal_write_failed", events=len(batch), error=str(e))
+                return 0
+            return len(batch)
+
+    async def _writer_loop(self) -> None:
+        """Write pending events every flush interval."""
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            await self.flush()
+
+    def _write_batch(self, batch: list[Event]) -> None:
+        """Encode and append a batch (runs in a worker thread)."""
+        frames = b"".join(encode_event(event) for event in batch)
+        if self._file is None or self._file_bytes + len(frames) > self.max_file_bytes:
+            self._open_file()
+
+        self._file.write(frames)
+        self._file.flush()
+        self._file_bytes += len(frames)
+        self._bytes += len(frames)
+        self._written += len(batch)
+
+        now = time.monotonic()
+        if now - self._last_fsync >= self.fsync_interval:
+            os.fsync(self._file.fileno())
+            self._last_fsync = now
+
+    def _open_file(self) -> None:
+        """Start a new journal file, closing the current one."""
+        self._close_file()
+        self.directory.mkdir(parents=True, exist_ok=True)
+        stamp = datetime.now(UTC).strftime("%Y%m%d-%H%M%S")
+        # Never append to an existing file: another journal (or an earlier
+        # run within the same second) may have taken the name already
+        while True:
+            self._file_seq += 1
+            self._file_path = (
+                self.directory / f"events-{stamp}-{self._file_seq:04d}{JOURNAL_SUFFIX}"
+            )
+            try:
+                self._file = open(self._file_path, "xb")  # noqa: SIM115 - held open across batches
+                break
+            except FileExistsError:
+                continue
+        self._file.write(MAGIC)
+        self._file_bytes = len(MAGIC)
+        self._files += 1
+        logger.info("event_journal_file_opened", path=str(self._file_path))
+
+    def _close_file(self) -> None:
+        """Fsync and close the current file."""
+        if self._file is None:
+            return
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._file.close()
+        self._file = None
+        self._last_fsync = time.monotonic()
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get journal statistics."""
+        return {
+            "recorded": self._recorded,
+            "written": self._written,
+            "pending": len(self._pending),
+            "dropped": self._dropped,
+            "bytes": self._bytes,
+            "files": self._files,
+        }
+
+
+def create_journal_from_settings() -> EventJournal | None:
+    """
+    Create an EventJournal from application settings.
+
+    Returns:
+        Configured journal, or None when journaling is disabled
+    """
+    from keryxflow.config import get_settings
+
+    settings = get_settings().journal
+    if not settings.enabled:
+        return None
+
+    return EventJournal(
+        directory=settings.directory,
+        max_file_bytes=settings.max_file_mb * 1024 * 1024,
+        fsync_interval=settings.fsync_interval,
+    )
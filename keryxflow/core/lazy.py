@@ -0,0 +1,43 @@
+"""Lazy attribute loading for package ``__init__`` modules.
+
+Packages that re-export classes from heavy submodules (pandas, langchain,
+textual, fastapi, matplotlib) use :func:`lazy_exports` so that importing
+the package - or any light sibling module inside it - does not pay for
+those dependencies until a re-exported name is actually used.
+"""
+
+import importlib
+import sys
+from collections.abc import Callable
+from typing import Any
+
+
+def lazy_exports(
+    package: str, exports: dict[str, str]
+) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    """Build module-level ``__getattr__`` and ``__dir__`` (PEP 562) for a package.
+
+    Args:
+        package: The package's ``__name__``
+        exports: Maps each public name to the submodule (relative to the
+            package) that defines it
+
+    Returns:
+        ``(__getattr__, __dir__)`` to assign in the package ``__init__``
+    """
+    namespace = sys.modules[package].__dict__
+
+    def __getattr__(name: str) -> Any:
+        try:
+            submodule = exports[name]
+        except KeyError:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}") from None
+        value = getattr(importlib.import_module(f"{package}.{submodule}"), name)
+        # Cache so later lookups skip __getattr__ entirely
+        namespace[name] = value
+        return value
+
+    def __dir__() -> list[str]:
+        return sorted(set(namespace) | set(exports))
+
+    return __getattr__, __dir__
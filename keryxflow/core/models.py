@@ -3,6 +3,7 @@
 from datetime import UTC, datetime
 from enum import Enum
 
+from sqlalchemy import Index
 from sqlmodel import Field, SQLModel
 
 
@@ -78,6 +79,7 @@ class Trade(SQLModel, table=True):
     """A trade record."""
 
     __tablename__ = "trades"
+    __table_args__ = (Index("ix_trades_symbol_created_at", "symbol", "created_at"),)
 
     id: int | None = Field(default=None, primary_key=True)
     symbol: str = Field(index=True)
@@ -93,7 +95,7 @@ class Trade(SQLModel, table=True):
     signal_id: int | None = Field(default=None, foreign_key="signals.id")
 
     # Timestamps
-    created_at: datetime = Field(default_factory=utc_now)
+    created_at: datetime = Field(default_factory=utc_now, index=True)
     opened_at: datetime | None = None
     closed_at: datetime | None = None
 
@@ -274,13 +276,16 @@ class TradeEpisode(SQLModel, table=True):
     """
 
     __tablename__ = "trade_episodes"
+    __table_args__ = (
+        Index("ix_trade_episodes_symbol_entry_timestamp", "symbol", "entry_timestamp"),
+    )
 
     id: int | None = Field(default=None, primary_key=True)
     trade_id: int = Field(foreign_key="trades.id", index=True)
     symbol: str = Field(index=True)
 
     # Entry context
-    entry_timestamp: datetime = Field(default_factory=utc_now)
+    entry_timestamp: datetime = Field(default_factory=utc_now, index=True)
     entry_price: float
     entry_reasoning: str  # Why the trade was taken
     entry_confidence: float = Field(ge=0.0, le=1.0)
@@ -7,6 +7,8 @@ from typing import Any
 
 import pandas as pd
 
+from keryxflow.core.clock import Clock
+
 
 @dataclass
 class TimeframeConfig:
@@ -52,6 +54,21 @@ def timeframe_to_seconds(timeframe: str) -> int:
     raise ValueError(f"Unknown timeframe format: {timeframe}")
 
 
+def candle_to_row(candle: dict[str, Any]) -> list[float]:
+    """Convert a buffered candle to a [timestamp_ms, open, high, low, close, volume] row."""
+    timestamp = candle["timestamp"]
+    if isinstance(timestamp, datetime):
+        timestamp = timestamp.timestamp() * 1000
+    return [
+        float(timestamp),
+        candle["open"],
+        candle["high"],
+        candle["low"],
+        candle["close"],
+        candle["volume"],
+    ]
+
+
 def get_candle_time(dt: datetime, interval_seconds: int) -> datetime:
     """Get the candle start time for a given datetime and interval."""
     timestamp = dt.timestamp()
@@ -67,6 +84,7 @@ class TimeframeBuffer:
     candles: list[dict[str, Any]] = field(default_factory=list)
     current_candle: dict[str, Any] | None = None
     last_candle_time: datetime | None = None
+    clock: Clock = field(default_factory=Clock)
 
     def add_price(self, price: float, volume: float = 0.0) -> bool:
         """
@@ -74,7 +92,7 @@ class TimeframeBuffer:
 
         Returns True if a new candle was completed.
         """
-        now = datetime.now(UTC)
+        now = self.clock.now()
         candle_time = get_candle_time(now, self.config.interval_seconds)
         completed = False
 
@@ -158,6 +176,10 @@ class TimeframeBuffer:
         """Get number of completed candles."""
         return len(self.candles)
 
+    def to_rows(self) -> list[list[float]]:
+        """Get completed candles as [timestamp_ms, open, high, low, close, volume] rows."""
+        return [candle_to_row(c) for c in self.candles]
+
 
 class MultiTimeframeBuffer:
     """
@@ -170,14 +192,16 @@ class MultiTimeframeBuffer:
     - Retrieving data for analysis
     """
 
-    def __init__(self, configs: list[TimeframeConfig]):
+    def __init__(self, configs: list[TimeframeConfig], clock: Clock | None = None):
         """
         Initialize the multi-timeframe buffer.
 
         Args:
             configs: List of timeframe configurations
+            clock: Time source for live candles (default: wall clock)
         """
         self._configs = {c.timeframe: c for c in configs}
+        self.clock = clock or Clock()
         self._buffers: dict[str, dict[str, TimeframeBuffer]] = defaultdict(dict)
 
         # Validate configs
@@ -219,7 +243,9 @@ class MultiTimeframeBuffer:
             raise ValueError(f"Timeframe {timeframe} not configured")
 
         if timeframe not in self._buffers[symbol]:
-            self._buffers[symbol][timeframe] = TimeframeBuffer(config=self._configs[timeframe])
+            self._buffers[symbol][timeframe] = TimeframeBuffer(
+                config=self._configs[timeframe], clock=self.clock
+            )
 
         return self._buffers[symbol][timeframe]
 
@@ -313,6 +339,18 @@ class MultiTimeframeBuffer:
 
         return self._buffers[symbol][timeframe].candle_count()
 
+    @property
+    def symbols(self) -> list[str]:
+        """Symbols with at least one buffer."""
+        return list(self._buffers.keys())
+
+    def to_rows(self, symbol: str, timeframe: str) -> list[list[float]]:
+        """Get completed candles for a symbol/timeframe as ccxt-style rows."""
+        if symbol not in self._buffers or timeframe not in self._buffers[symbol]:
+            return []
+
+        return self._buffers[symbol][timeframe].to_rows()
+
     def has_minimum_candles(self, symbol: str, min_candles: int = 50) -> dict[str, bool]:
         """
         Check if each timeframe has minimum required candles.
@@ -431,10 +469,13 @@ class MultiTimeframeBuffer:
             self._buffers.clear()
 
 
-def create_mtf_buffer_from_settings() -> MultiTimeframeBuffer:
+def create_mtf_buffer_from_settings(clock: Clock | None = None) -> MultiTimeframeBuffer:
     """
     Create a MultiTimeframeBuffer from application settings.
 
+    Args:
+        clock: Time source for live candles (default: wall clock)
+
     Returns:
         Configured MultiTimeframeBuffer instance
     """
@@ -455,4 +496,4 @@ def create_mtf_buffer_from_settings() -> MultiTimeframeBuffer:
         )
         configs.append(config)
 
-    return MultiTimeframeBuffer(configs)
+    return MultiTimeframeBuffer(configs, clock=clock)
@@ -0,0 +1,244 @@
+"""Deterministic replay of a recorded event journal through the trading engine."""
+
+import time
+from collections import Counter
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from keryxflow.core.clock import SimulatedClock
+from keryxflow.core.events import Event, EventType
+from keryxflow.core.journal import read_journal
+from keryxflow.core.logging import get_logger
+
+if TYPE_CHECKING:
+    from keryxflow.agent.scheduler import TaskScheduler
+    from keryxflow.core.engine import TradingEngine
+
+logger = get_logger(__name__)
+
+# Recorded events that drive the engine; everything else in a journal is
+# the engine's own output and is compared rather than replayed
+INPUT_EVENT_TYPES = frozenset(
+    {
+        EventType.PRICE_UPDATE,
+        EventType.SYSTEM_PAUSED,
+        EventType.SYSTEM_RESUMED,
+        EventType.PANIC_TRIGGERED,
+    }
+)
+
+# Engine output counted during a replay
+OUTPUT_EVENT_TYPES = (
+    EventType.SIGNAL_GENERATED,
+    EventType.ORDER_APPROVED,
+    EventType.ORDER_REJECTED,
+    EventType.ORDER_FILLED,
+    EventType.POSITION_OPENED,
+    EventType.POSITION_CLOSED,
+)
+
+
+@dataclass
+class ReplayResult:
+    """Outcome of one journal replay."""
+
+    events: int = 0  # Input events fed to the engine
+    tasks_run: int = 0  # Scheduled tasks that came due during the session
+    recorded: dict[str, int] = field(default_factory=dict)  # Output events in the journal
+    produced: dict[str, int] = field(default_factory=dict)  # Output events from the replay
+    session_start: datetime | None = None
+    session_end: datetime | None = None
+    wall_seconds: float = 0.0
+
+    @property
+    def session_seconds(self) -> float:
+        """Recorded session length."""
+        if self.session_start is None or self.session_end is None:
+            return 0.0
+        return (self.session_end - self.session_start).total_seconds()
+
+    @property
+    def events_per_second(self) -> float:
+        """Input events processed per wall-clock second."""
+        return self.events / self.wall_seconds if self.wall_seconds > 0 else 0.0
+
+    @property
+    def speedup(self) -> float:
+        """Session time replayed per wall-clock second."""
+        return self.session_seconds / self.wall_seconds if self.wall_seconds > 0 else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            "events": self.events,
+            "tasks_run": self.tasks_run,
+            "recorded": self.recorded,
+            "produced": self.produced,
+            "session_start": self.session_start.isoformat() if self.session_start else None,
+            "session_end": self.session_end.isoformat() if self.session_end else None,
+            "session_seconds": self.session_seconds,
+            "wall_seconds": self.wall_seconds,
+            "events_per_second": self.events_per_second,
+            "speedup": self.speedup,
+        }
+
+
+class JournalReplayer:
+    """
+    Feeds a recorded session through a TradingEngine as fast as it can run.
+
+    Before each event the engine's SimulatedClock is moved to the event's
+    recorded time (a clock built without a start time is first moved back
+    to the start of the session), so candles, analysis intervals, risk and circuit
+    breaker daily resets and any scheduled tasks follow session time.
+    Events are handed to the engine one at a time and its
+    analysis runs inline (the engine is not started), so the same journal
+    always produces the same signals and orders.
+
+    Example:
+        clock = SimulatedClock()  # Moved to the journal's first event by run()
+        engine = TradingEngine(exchange, paper, event_bus=bus, clock=clock)
+        result = await JournalReplayer(engine).run("data/journal")
+        print(result.events_per_second, result.produced)
+    """
+
+    def __init__(self, engine: "TradingEngine", scheduler: "TaskScheduler | None" = None):
+        """
+        Initialize the replayer.
+
+        Args:
+            engine: Engine to drive; must have been built with a SimulatedClock
+            scheduler: Task scheduler to run as session time passes; must
+                share the engine's clock and not be started
+        """
+        if not isinstance(engine.clock, SimulatedClock):
+            raise ValueError("Replay needs an engine built with a SimulatedClock")
+        if engine._running:
+            raise ValueError("Replay drives a stopped engine; call it before start()")
+        if scheduler is not None and scheduler.clock is not engine.clock:
+            raise ValueError("Replay needs the scheduler on the engine's clock")
+        self.engine = engine
+        self.scheduler = scheduler
+        self.clock: SimulatedClock = engine.clock
+
+    async def run(
+        self,
+        source: str | Path | Iterable[Event],
+        limit: int | None = None,
+    ) -> ReplayResult:
+        """
+        Replay a journal.
+
+        Args:
+            source: Journal file or directory, or an iterable of events
+            limit: Stop after this many input events
+
+        Returns:
+            Replay result with throughput and output counts
+        """
+        events = read_journal(source) if isinstance(source, str | Path) else source
+        engine = self.engine
+        bus = engine.event_bus
+        result = ReplayResult()
+        recorded: Counter[str] = Counter()
+        produced: Counter[str] = Counter()
+
+        async def count(event: Event) -> None:
+            produced[event.type.value] += 1
+
+        # The engine's own position tracking, normally wired up by start()
+        handlers = [(event_type, count) for event_type in OUTPUT_EVENT_TYPES]
+        handlers.append((EventType.POSITION_CLOSED, engine._on_position_closed))
+        if engine._trailing_enabled:
+            handlers.append((EventType.POSITION_OPENED, engine._on_position_opened))
+
+        for event_type, handler in handlers:
+            bus.subscribe(event_type, handler)
+        started_bus = not bus.is_running
+        if started_bus:
+            await bus.start()
+
+        await self._prepare()
+        start = time.perf_counter()
+
+        try:
+            for event in events:
+                if event.type not in INPUT_EVENT_TYPES:
+                    recorded[event.type.value] += 1
+                    continue
+                if limit is not None and result.events >= limit:
+                    break
+
+                if result.session_start is None:
+                    self._start_session(event.timestamp)
+                    result.session_start = event.timestamp
+                self.clock.set(event.timestamp)
+                result.session_end = event.timestamp
+                if self.scheduler is not None:
+                    result.tasks_run += len(await self.scheduler.run_due())
+                await self._feed(event)
+                result.events += 1
+
+            # Let the engine's published events reach the counter
+            await bus.join()
+        finally:
+            result.wall_seconds = time.perf_counter() - start
+            for event_type, handler in handlers:
+                bus.unsubscribe(event_type, handler)
+            if started_bus:
+                await bus.stop()
+
+        result.recorded = dict(recorded)
+        result.produced = dict(produced)
+        logger.info(
+            "journal_replayed",
+            events=result.events,
+            wall_seconds=round(result.wall_seconds, 3),
+            events_per_second=round(result.events_per_second),
+            produced=result.produced,
+        )
+        return result
+
+    async def _prepare(self) -> None:
+        """Seed risk state from the paper account, as start() does."""
+        engine = self.engine
+        balance = await engine.paper.get_balance()
+        engine.risk.update_balance(balance["total"].get("USDT", 10000.0))
+        positions = await engine.paper.get_positions()
+        engine.risk.set_open_positions(len(positions))
+
+    def _start_session(self, start: datetime) -> None:
+        """Move the clock to the first recorded event.
+
+        A clock that moved backwards (a default SimulatedClock replaying an
+        older journal) would leave the hourly trade window and the task
+        schedule at wall-clock time, so both are restarted from ``start``.
+        """
+        before = self.clock.now()
+        self.clock.set(start)
+        if self.clock.now() >= before:
+            return
+        self.engine.risk.portfolio_state.reset_hourly()
+        if self.scheduler is not None:
+            for task in self.scheduler._tasks.values():
+                self.scheduler._schedule(task)
+
+    async def _feed(self, event: Event) -> None:
+        """Hand one input event to the engine."""
+        engine = self.engine
+        if event.type == EventType.PRICE_UPDATE:
+            symbol = event.data.get("symbol")
+            price = event.data.get("price")
+            if symbol and price:
+                # Mark the paper account like the price loop does
+                engine.paper.update_price(symbol, price)
+            await engine._on_price_update(event)
+        elif event.type == EventType.SYSTEM_PAUSED:
+            await engine._on_pause(event)
+        elif event.type == EventType.SYSTEM_RESUMED:
+            await engine._on_resume(event)
+        elif event.type == EventType.PANIC_TRIGGERED:
+            await engine._on_panic(event)
@@ -1,6 +1,6 @@
 """Repository for trade persistence."""
 
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, AsyncIterator
 from contextlib import asynccontextmanager
 from datetime import UTC, datetime
 from typing import TYPE_CHECKING
@@ -8,6 +8,15 @@ from typing import TYPE_CHECKING
 from sqlmodel import col, select
 
 from keryxflow.core.database import get_session_factory
+from keryxflow.core.history import (
+    DEFAULT_PAGE_SIZE,
+    MAX_PAGE_SIZE,
+    HistoryPage,
+    decode_cursor,
+    fetch_page,
+    history_statement,
+    iter_batches,
+)
 from keryxflow.core.logging import get_logger
 from keryxflow.core.models import DailyStats, Trade, TradeStatus
 
@@ -215,6 +224,84 @@ class TradeRepository:
             result = await session.execute(statement)
             return list(result.scalars().all())
 
+    async def get_trade_history(
+        self,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: str | None = None,
+        symbol: str | None = None,
+        start: datetime | None = None,
+        end: datetime | None = None,
+        ascending: bool = False,
+    ) -> HistoryPage[Trade]:
+        """Get one page of trade history using keyset pagination.
+
+        Args:
+            limit: Page size (capped at MAX_PAGE_SIZE)
+            cursor: Cursor from the previous page's ``next_cursor``
+            symbol: Optional symbol filter
+            start: Inclusive lower bound on created_at
+            end: Exclusive upper bound on created_at
+            ascending: Oldest first instead of newest first
+
+        Returns:
+            HistoryPage of trades ordered by (created_at, id)
+
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        after = decode_cursor(cursor) if cursor else None
+        statement = history_statement(
+            Trade,
+            Trade.created_at,
+            symbol=symbol,
+            start=start,
+            end=end,
+            after=after,
+            ascending=ascending,
+        )
+        async with self._get_session() as session:
+            return await fetch_page(
+                session,
+                statement,
+                max(1, min(limit, MAX_PAGE_SIZE)),
+                key=lambda t: (t.created_at, t.id),
+            )
+
+    async def iter_trade_history(
+        self,
+        symbol: str | None = None,
+        start: datetime | None = None,
+        end: datetime | None = None,
+        ascending: bool = True,
+        batch_size: int = MAX_PAGE_SIZE,
+    ) -> AsyncIterator[Trade]:
+        """Iterate over the full trade history without loading it all.
+
+        Args:
+            symbol: Optional symbol filter
+            start: Inclusive lower bound on created_at
+            end: Exclusive upper bound on created_at
+            ascending: Oldest first (default) instead of newest first
+            batch_size: Rows fetched per query
+
+        Yields:
+            Trades ordered by (created_at, id)
+        """
+
+        async def fetch(cursor: str | None) -> HistoryPage[Trade]:
+            return await self.get_trade_history(
+                limit=batch_size,
+                cursor=cursor,
+                symbol=symbol,
+                start=start,
+                end=end,
+                ascending=ascending,
+            )
+
+        async for batch in iter_batches(fetch):
+            for trade in batch:
+                yield trade
+
     async def count_paper_trades(self) -> int:
         """Count total paper trades.
 
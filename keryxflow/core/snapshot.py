@@ -0,0 +1,149 @@
+"""On-disk snapshots of OHLCV buffers for warm engine restarts."""
+
+import os
+import pickle
+import time
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from keryxflow.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+SNAPSHOT_VERSION = 1
+
+# (symbol, timeframe) -> rows of [timestamp_ms, open, high, low, close, volume]
+SeriesKey = tuple[str, str]
+
+
+class OHLCVSnapshotStore:
+    """Single-file store of completed candles per symbol and timeframe.
+
+    Each series is kept as a float64 ``(n, 6)`` array in the ccxt row
+    layout, so a restored series can be fed back through ``add_candle``
+    and extended with the exchange's own candles. Writes go to a temporary
+    file that replaces the snapshot, so a crash mid-write leaves the
+    previous snapshot intact.
+
+    Example:
+        store = OHLCVSnapshotStore("data/cache/ohlcv_snapshot.pkl")
+        store.save({("BTC/USDT", "1m"): rows})
+        series = store.load()
+    """
+
+    def __init__(self, path: str | Path):
+        """Initialize the store.
+
+        Args:
+            path: Snapshot file location
+        """
+        self.path = Path(path)
+
+    def save(self, series: dict[SeriesKey, list[list[float]]]) -> int:
+        """Write a snapshot, replacing the previous one.
+
+        Args:
+            series: Candle rows per (symbol, timeframe)
+
+        Returns:
+            Number of series written (0 when the write failed)
+        """
+        tmp_path = self.path.with_suffix(".tmp")
+
+        try:
+            payload = {
+                "version": SNAPSHOT_VERSION,
+                "saved_at": int(time.time() * 1000),
+                "series": {
+                    key: np.asarray(rows, dtype=np.float64).reshape(-1, 6)
+                    for key, rows in series.items()
+                    if rows
+                },
+            }
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, "wb") as f:
+                pickle.dump(payload, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, self.path)
+        except Exception as e:
+            logger.warning("ohlcv_snapshot_write_failed", path=str(self.path), error=str(e))
+            tmp_path.unlink(missing_ok=True)
+            return 0
+
+        logger.debug("ohlcv_snapshot_saved", path=str(self.path), series=len(payload["series"]))
+        return len(payload["series"])
+
+    def load(self) -> dict[SeriesKey, np.ndarray]:
+        """Read the snapshot.
+
+        Returns:
+            Candle arrays per (symbol, timeframe); empty when there is no
+            usable snapshot
+        """
+        if not self.path.exists():
+            return {}
+
+        try:
+            with open(self.path, "rb") as f:
+                payload: dict[str, Any] = pickle.load(f)
+        except Exception as e:
+            logger.warning("ohlcv_snapshot_read_failed", path=str(self.path), error=str(e))
+            return {}
+
+        if not isinstance(payload, dict) or payload.get("version") != SNAPSHOT_VERSION:
+            logger.warning("ohlcv_snapshot_version_mismatch", path=str(self.path))
+            return {}
+
+        series = payload.get("series", {})
+        logger.info("ohlcv_snapshot_loaded", path=str(self.path), series=len(series))
+        return series
+
+
+def missing_candles(
+    rows: np.ndarray | None,
+    interval_seconds: int,
+    now_ms: int | None = None,
+) -> int | None:
+    """Count the candles opened since the last snapshot candle.
+
+    Args:
+        rows: Snapshot candles for one series
+        interval_seconds: Candle interval
+        now_ms: Current time in milliseconds (default: wall clock)
+
+    Returns:
+        0 while the last snapshot candle is still the current one, the
+        number of newer candles otherwise, or None without a snapshot
+    """
+    if rows is None or len(rows) == 0:
+        return None
+
+    now_ms = int(time.time() * 1000) if now_ms is None else now_ms
+    last_ts = int(rows[-1, 0])
+    return max(0, (now_ms - last_ts) // (interval_seconds * 1000))
+
+
+def merge_candles(
+    rows: np.ndarray | None,
+    fetched: list[list[float]],
+    max_candles: int | None = None,
+) -> list[list[float]]:
+    """Extend snapshot candles with freshly fetched ones.
+
+    Snapshot candles at or after the first fetched timestamp are replaced.
+
+    Args:
+        rows: Snapshot candles for one series
+        fetched: Candles from the exchange, oldest first
+        max_candles: Most candles to keep (default: all)
+
+    Returns:
+        Merged rows, oldest first
+    """
+    kept: list[list[float]] = [] if rows is None else rows.tolist()
+    if fetched:
+        first_ts = fetched[0][0]
+        kept = [row for row in kept if row[0] < first_ts]
+        kept.extend(list(row) for row in fetched)
+    return kept[-max_candles:] if max_candles else kept
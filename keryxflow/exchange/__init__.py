@@ -1,24 +1,35 @@
 """Exchange - Connectivity layer for exchanges and paper trading."""
 
+# Patches aiohttp/ccxt destructors; imported for its side effect
+from keryxflow.exchange import silence  # noqa: F401
 from keryxflow.exchange.adapter import ExchangeAdapter
+from keryxflow.exchange.base import CCXTExchangeClient
 from keryxflow.exchange.bybit import BybitClient, get_bybit_client
 from keryxflow.exchange.client import ExchangeClient, get_exchange_client
 from keryxflow.exchange.demo import DemoExchangeClient, get_demo_client
 from keryxflow.exchange.kraken import KrakenClient, get_kraken_client
 from keryxflow.exchange.okx import OKXClient, get_okx_client
+from keryxflow.exchange.ratelimit import RequestPriority, RequestScheduler
+from keryxflow.exchange.venues import ConsolidatedQuote, MultiVenueClient, get_multi_venue_client
 
 __all__ = [
     "ExchangeAdapter",
+    "CCXTExchangeClient",
     "ExchangeClient",
     "BybitClient",
     "DemoExchangeClient",
     "KrakenClient",
+    "MultiVenueClient",
+    "ConsolidatedQuote",
     "OKXClient",
+    "RequestPriority",
+    "RequestScheduler",
     "get_exchange_client",
     "get_bybit_client",
     "get_demo_client",
     "get_kraken_client",
     "get_okx_client",
+    "get_multi_venue_client",
     "get_exchange_adapter",
 ]
 
@@ -28,7 +39,9 @@ def get_exchange_adapter(sandbox: bool = True) -> ExchangeAdapter:
 
     Reads ``settings.system.exchange`` and ``settings.system.mode`` and returns
     the matching adapter singleton. When mode is "demo", returns the demo client
-    regardless of the exchange setting.
+    regardless of the exchange setting. When ``settings.system.venues`` lists
+    more than one exchange, returns the MultiVenueClient over all of them; a
+    single listed venue takes precedence over ``settings.system.exchange``.
 
     Args:
         sandbox: Whether to use sandbox/testnet mode
@@ -46,7 +59,11 @@ def get_exchange_adapter(sandbox: bool = True) -> ExchangeAdapter:
     if settings.system.mode == "demo":
         return get_demo_client()
 
-    exchange_name = settings.system.exchange.lower()
+    venues = settings.system.venues
+    if len(venues) > 1:
+        return get_multi_venue_client(sandbox=sandbox)
+
+    exchange_name = (venues[0] if venues else settings.system.exchange).lower()
 
     if exchange_name == "binance":
         return get_exchange_client(sandbox=sandbox)
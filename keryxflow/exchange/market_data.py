@@ -0,0 +1,176 @@
+"""Shared long-lived clients for public market data.
+
+Sandbox/testnet endpoints have no usable history, so adapters fetch
+OHLCV from the real public API. Instead of building, loading and closing a
+ccxt client per call, every caller (engine preload, agent tools,
+backtest loader) goes through one :class:`MarketDataClient` per exchange.
+It keeps the HTTP session open, loads markets once, bounds concurrent
+requests and, because there is a single ccxt instance, ccxt's own
+rate-limit throttle paces all callers together.
+"""
+
+import asyncio
+import time
+from collections.abc import Callable
+from typing import Any
+
+import ccxt.async_support as ccxt
+
+from keryxflow.config import get_settings
+from keryxflow.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+class MarketDataClient:
+    """
+    Unauthenticated, non-sandbox ccxt client shared by all market data callers.
+
+    The ccxt instance is created and its markets loaded on first use;
+    later requests reuse both. At most ``max_concurrency`` requests are in
+    flight at once.
+    """
+
+    def __init__(
+        self,
+        exchange_id: str,
+        max_concurrency: int = 4,
+        factory: Callable[[dict[str, Any]], Any] | None = None,
+    ):
+        """
+        Initialize the client (no connection is made yet).
+
+        Args:
+            exchange_id: ccxt exchange id (e.g. "binance")
+            max_concurrency: Maximum concurrent requests
+            factory: Builds the ccxt instance from its config (defaults to ccxt's class)
+        """
+        self.exchange_id = exchange_id
+        self.max_concurrency = max_concurrency
+        self._factory = factory or getattr(ccxt, exchange_id)
+        self._exchange: Any = None
+        self._open_lock = asyncio.Lock()
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._in_flight = 0
+        self._stats = {"requests": 0, "errors": 0, "opens": 0, "peak_in_flight": 0}
+        self._wait_s = 0.0
+
+    @property
+    def is_open(self) -> bool:
+        """Whether a ccxt instance is currently held."""
+        return self._exchange is not None
+
+    @property
+    def markets(self) -> dict[str, Any]:
+        """Cached market metadata (empty until the first request)."""
+        if self._exchange is None:
+            return {}
+        return self._exchange.markets or {}
+
+    async def _ensure_open(self) -> Any:
+        """Create the ccxt instance and load markets once."""
+        if self._exchange is not None:
+            return self._exchange
+        async with self._open_lock:
+            if self._exchange is None:
+                exchange = self._factory({"enableRateLimit": True})
+                try:
+                    await exchange.load_markets()
+                except Exception:
+                    await exchange.close()
+                    raise
+                self._exchange = exchange
+                self._stats["opens"] += 1
+                logger.info(
+                    "market_data_client_opened",
+                    exchange=self.exchange_id,
+                    markets=len(exchange.markets or {}),
+                )
+        return self._exchange
+
+    async def request(self, method: str, *args: Any, **kwargs: Any) -> Any:
+        """
+        Call a ccxt method through the shared instance.
+
+        Args:
+            method: ccxt method name (e.g. "fetch_ohlcv")
+            *args: Positional arguments for the method
+            **kwargs: Keyword arguments for the method
+
+        Returns:
+            The ccxt result
+        """
+        exchange = await self._ensure_open()
+        queued_at = time.monotonic()
+        async with self._semaphore:
+            self._wait_s += time.monotonic() - queued_at
+            self._in_flight += 1
+            self._stats["requests"] += 1
+            self._stats["peak_in_flight"] = max(self._stats["peak_in_flight"], self._in_flight)
+            try:
+                return await getattr(exchange, method)(*args, **kwargs)
+            except Exception:
+                self._stats["errors"] += 1
+                raise
+            finally:
+                self._in_flight -= 1
+
+    async def fetch_ohlcv(
+        self,
+        symbol: str,
+        timeframe: str = "1h",
+        since: int | None = None,
+        limit: int | None = None,
+    ) -> list[list[float]]:
+        """Fetch candles as ``[timestamp, open, high, low, close, volume]`` rows."""
+        return await self.request("fetch_ohlcv", symbol, timeframe, since=since, limit=limit)
+
+    async def fetch_ticker(self, symbol: str) -> dict[str, Any]:
+        """Fetch the raw ccxt ticker for a symbol."""
+        return await self.request("fetch_ticker", symbol)
+
+    async def close(self) -> None:
+        """Close the HTTP session; the next request reopens it."""
+        async with self._open_lock:
+            if self._exchange is not None:
+                exchange, self._exchange = self._exchange, None
+                await exchange.close()
+                logger.info("market_data_client_closed", exchange=self.exchange_id)
+
+    def get_stats(self) -> dict[str, Any]:
+        """Request counters for monitoring."""
+        requests = self._stats["requests"]
+        return {
+            "exchange": self.exchange_id,
+            "open": self.is_open,
+            "in_flight": self._in_flight,
+            "max_concurrency": self.max_concurrency,
+            "avg_wait_ms": round(self._wait_s / requests * 1000, 3) if requests else None,
+            **self._stats,
+        }
+
+
+# One shared client per exchange id
+_clients: dict[str, MarketDataClient] = {}
+
+
+def get_market_data_client(exchange_id: str = "binance") -> MarketDataClient:
+    """Get the shared market data client for an exchange."""
+    client = _clients.get(exchange_id)
+    if client is None:
+        concurrency = get_settings().system.market_data_concurrency
+        client = MarketDataClient(exchange_id, max_concurrency=concurrency)
+        _clients[exchange_id] = client
+    return client
+
+
+async def close_market_data_clients() -> None:
+    """Close every shared market data client (call once at shutdown)."""
+    for client in list(_clients.values()):
+        try:
+            await client.close()
+        except Exception as e:
+            logger.warning(
+                "market_data_client_close_failed", exchange=client.exchange_id, error=str(e)
+            )
+    _clients.clear()
@@ -0,0 +1,167 @@
+"""Price-indexed book of resting paper limit orders."""
+
+from __future__ import annotations
+
+import heapq
+from dataclasses import dataclass
+from itertools import count
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from keryxflow.exchange.orders import Order
+
+
+@dataclass
+class LimitFill:
+    """Quantity of one resting order matched against a price."""
+
+    order: Order
+    amount: float
+    sequence: int
+
+    @property
+    def is_partial(self) -> bool:
+        """Whether the order keeps a remainder after this fill."""
+        return self.amount < self.order.remaining
+
+
+class LimitOrderBook:
+    """
+    Resting limit orders for one symbol, in price-time priority.
+
+    Buys sit in a max-heap and sells in a min-heap keyed by limit price,
+    so a price update only visits orders whose limit it crosses:
+    O(k log n) for k fills out of n resting orders. Cancellations are
+    lazy; stale heap entries are skipped and the heaps are rebuilt once
+    they outnumber the live ones.
+    """
+
+    def __init__(self, symbol: str):
+        """
+        Initialize an empty book.
+
+        Args:
+            symbol: Trading pair the book holds orders for
+        """
+        self.symbol = symbol
+        self._orders: dict[str, Order] = {}
+        self._sequence: dict[str, int] = {}
+        # Entries are (key, sequence, order_id); buy keys are negated prices
+        self._bids: list[tuple[float, int, str]] = []
+        self._asks: list[tuple[float, int, str]] = []
+        self._counter = count()
+
+    def __len__(self) -> int:
+        return len(self._orders)
+
+    def __contains__(self, order_id: object) -> bool:
+        return order_id in self._orders
+
+    def orders(self) -> list[Order]:
+        """Resting orders in insertion order."""
+        return list(self._orders.values())
+
+    def add(self, order: Order, sequence: int | None = None) -> None:
+        """
+        Rest an order in the book.
+
+        Args:
+            order: Open limit order with a price and a remaining amount
+            sequence: Time priority to keep (new orders go to the back)
+        """
+        if order.price is None:
+            raise ValueError(f"Limit order {order.id} has no price")
+        if order.id in self._orders:
+            raise ValueError(f"Order {order.id} is already resting")
+        seq = next(self._counter) if sequence is None else sequence
+        self._sequence[order.id] = seq
+        self._orders[order.id] = order
+        if order.side == "buy":
+            heapq.heappush(self._bids, (-order.price, seq, order.id))
+        else:
+            heapq.heappush(self._asks, (order.price, seq, order.id))
+
+    def cancel(self, order_id: str) -> Order | None:
+        """
+        Remove a resting order.
+
+        Returns:
+            The removed order, or None if it was not resting
+        """
+        order = self._orders.pop(order_id, None)
+        if order is not None:
+            self._sequence.pop(order_id, None)
+            self._compact()
+        return order
+
+    def restore(self, fill: LimitFill) -> None:
+        """Put back an order whose full fill was rejected, keeping its priority."""
+        if fill.order.id not in self._orders:
+            self.add(fill.order, sequence=fill.sequence)
+
+    def best_bid(self) -> float | None:
+        """Highest resting buy limit."""
+        entry = self._peek(self._bids)
+        return -entry[0] if entry else None
+
+    def best_ask(self) -> float | None:
+        """Lowest resting sell limit."""
+        entry = self._peek(self._asks)
+        return entry[0] if entry else None
+
+    def match(self, price: float, liquidity: float | None = None) -> list[LimitFill]:
+        """
+        Take every order whose limit ``price`` crosses.
+
+        Buys fill when the price is at or below their limit, sells when it
+        is at or above. Fully matched orders leave the book; with a
+        ``liquidity`` cap the last order matched may fill partially and
+        stays at the head of its ladder. Order fields are not modified;
+        the caller books the fill and ``restore()``s any it rejects.
+
+        Args:
+            price: Current market price
+            liquidity: Maximum base amount to fill across both sides
+
+        Returns:
+            Fills in price-time priority (buys first)
+        """
+        fills: list[LimitFill] = []
+        left = liquidity
+        for heap, sign in ((self._bids, -1.0), (self._asks, 1.0)):
+            while left is None or left > 0:
+                entry = self._peek(heap)
+                # Signed keys: buy -limit > -price and sell limit > price both mean "not crossed"
+                if entry is None or entry[0] > sign * price:
+                    break
+                order = self._orders[entry[2]]
+                amount = order.remaining if left is None else min(order.remaining, left)
+                fill = LimitFill(order=order, amount=amount, sequence=entry[1])
+                fills.append(fill)
+                if left is not None:
+                    left -= amount
+                if fill.is_partial:
+                    break
+                heapq.heappop(heap)
+                del self._orders[order.id]
+                del self._sequence[order.id]
+        return fills
+
+    def _peek(self, heap: list[tuple[float, int, str]]) -> tuple[float, int, str] | None:
+        """Top live entry of a ladder, dropping cancelled ones."""
+        while heap:
+            entry = heap[0]
+            if entry[2] in self._orders and self._sequence.get(entry[2]) == entry[1]:
+                return entry
+            heapq.heappop(heap)
+        return None
+
+    def _compact(self) -> None:
+        """Rebuild the ladders once most entries are stale."""
+        if len(self._bids) + len(self._asks) <= 2 * len(self._orders) + 16:
+            return
+        live = self._sequence
+        self._bids = [e for e in self._bids if live.get(e[2]) == e[1]]
+        self._asks = [e for e in self._asks if live.get(e[2]) == e[1]]
+        heapq.heapify(self._bids)
+        heapq.heapify(self._asks)
@@ -1,5 +1,7 @@
 """Order management abstraction over paper and live trading."""
 
+import uuid
+from collections.abc import Iterable, Mapping
 from dataclasses import dataclass
 from datetime import UTC, datetime
 from enum import Enum
@@ -9,6 +11,7 @@ from keryxflow.config import get_settings
 from keryxflow.core.events import EventType, get_event_bus, order_event
 from keryxflow.core.logging import LogMessages, get_logger
 from keryxflow.exchange.adapter import ExchangeAdapter
+from keryxflow.exchange.orderbook import LimitFill, LimitOrderBook
 from keryxflow.exchange.paper import PaperTradingEngine, get_paper_engine
 
 logger = get_logger(__name__)
@@ -105,6 +108,7 @@ class OrderManager:
         self._paper_engine: PaperTradingEngine | None = None
         self._exchange_client: ExchangeAdapter | None = None
         self._pending_orders: dict[str, Order] = {}
+        self._books: dict[str, LimitOrderBook] = {}
 
     @property
     def is_paper_mode(self) -> bool:
@@ -248,7 +252,7 @@ class OrderManager:
             else:
                 # Create pending order
                 order = Order(
-                    id=f"limit_{symbol}_{datetime.now(UTC).timestamp()}",
+                    id=f"limit_{symbol}_{datetime.now(UTC).timestamp()}_{uuid.uuid4().hex[:6]}",
                     symbol=symbol,
                     order_type=OrderType.LIMIT,
                     side=side,
@@ -260,6 +264,7 @@ class OrderManager:
                     is_paper=True,
                 )
                 self._pending_orders[order.id] = order
+                self._books.setdefault(symbol, LimitOrderBook(symbol)).add(order)
                 logger.info(
                     "limit_order_placed",
                     order_id=order.id,
@@ -298,7 +303,10 @@ class OrderManager:
             True if cancelled successfully
         """
         if order_id in self._pending_orders:
-            del self._pending_orders[order_id]
+            order = self._pending_orders.pop(order_id)
+            book = self._books.get(order.symbol)
+            if book is not None:
+                book.cancel(order_id)
             logger.info("order_cancelled", order_id=order_id)
             return True
 
@@ -312,56 +320,111 @@ class OrderManager:
 
         return False
 
-    async def check_pending_orders(self) -> list[Order]:
+    async def check_pending_orders(
+        self,
+        symbols: Iterable[str] | None = None,
+        liquidity: Mapping[str, float] | None = None,
+    ) -> list[Order]:
         """
         Check and fill any pending limit orders.
 
+        Each symbol's book only yields the orders its current price
+        crosses, and all fills are booked in one ledger transaction.
+
+        Args:
+            symbols: Symbols whose price changed (all books if None)
+            liquidity: Optional per-symbol cap on the base amount filled
+                this check; orders beyond it fill partially or wait
+
         Returns:
-            List of filled orders
+            List of orders that received a fill (fully or partially)
         """
-        filled = []
-
-        for order_id, order in list(self._pending_orders.items()):
-            current_price = self.executor.get_price(order.symbol)
+        matched: list[tuple[LimitOrderBook, LimitFill]] = []
+        for symbol in list(self._books) if symbols is None else symbols:
+            book = self._books.get(symbol)
+            if not book:
+                continue
+            current_price = self.executor.get_price(symbol)
             if current_price is None:
                 continue
+            cap = liquidity.get(symbol) if liquidity else None
+            matched.extend((book, fill) for fill in book.match(current_price, cap))
 
-            should_fill = (order.side == "buy" and current_price <= (order.price or 0)) or (
-                order.side == "sell" and current_price >= (order.price or 0)
-            )
+        if not matched:
+            return []
 
-            if should_fill:
-                # Execute the order
-                try:
-                    result = await self.executor.execute_market_order(
-                        order.symbol,
-                        order.side,
-                        order.amount,
-                        order.price,
-                    )
-                    order.status = OrderStatus.FILLED
-                    order.filled = order.amount
-                    order.remaining = 0.0
-                    order.average_price = result.get("price", order.price or 0)
-                    order.updated_at = datetime.now(UTC)
-                    filled.append(order)
-                    del self._pending_orders[order_id]
-
-                    logger.info(
-                        "limit_order_filled",
-                        order_id=order_id,
-                        symbol=order.symbol,
-                        price=order.average_price,
-                    )
-                except Exception as e:
-                    logger.error(
-                        "limit_order_fill_failed",
-                        order_id=order_id,
-                        error=str(e),
-                    )
+        try:
+            results = await self._execute_fills([fill for _, fill in matched])
+        except Exception as e:
+            logger.error("limit_order_fill_failed", count=len(matched), error=str(e))
+            results = [None] * len(matched)
+
+        filled = []
+        for (book, fill), result in zip(matched, results, strict=True):
+            order = fill.order
+            if result is None:
+                # Leave it resting; a partial fill never left the book
+                book.restore(fill)
+                logger.error("limit_order_fill_failed", order_id=order.id)
+                continue
+
+            partial = fill.is_partial
+            price = result.get("price", order.price or 0)
+            order.average_price = (order.average_price * order.filled + price * fill.amount) / (
+                order.filled + fill.amount
+            )
+            order.filled += fill.amount
+            order.remaining = max(order.amount - order.filled, 0.0)
+            order.cost += result.get("cost", price * fill.amount)
+            order.updated_at = datetime.now(UTC)
+            filled.append(order)
+
+            if partial:
+                order.status = OrderStatus.PARTIALLY_FILLED
+                logger.info(
+                    "limit_order_partially_filled",
+                    order_id=order.id,
+                    symbol=order.symbol,
+                    filled=order.filled,
+                    remaining=order.remaining,
+                )
+            else:
+                order.status = OrderStatus.FILLED
+                order.remaining = 0.0
+                self._pending_orders.pop(order.id, None)
+                logger.info(
+                    "limit_order_filled",
+                    order_id=order.id,
+                    symbol=order.symbol,
+                    price=order.average_price,
+                )
 
         return filled
 
+    async def _execute_fills(self, fills: list[LimitFill]) -> list[dict[str, Any] | None]:
+        """Book matched fills, batched into one transaction when paper trading."""
+        requests = [
+            {
+                "symbol": fill.order.symbol,
+                "side": fill.order.side,
+                "amount": fill.amount,
+                "price": fill.order.price,
+            }
+            for fill in fills
+        ]
+        executor = self.executor
+        if isinstance(executor, PaperTradingEngine):
+            return await executor.execute_fills(requests)
+
+        results: list[dict[str, Any] | None] = []
+        for request in requests:
+            try:
+                results.append(await executor.execute_market_order(**request))
+            except Exception as e:
+                logger.error("limit_order_fill_failed", symbol=request["symbol"], error=str(e))
+                results.append(None)
+        return results
+
     def get_pending_orders(self) -> list[Order]:
         """Get all pending orders."""
         return list(self._pending_orders.values())
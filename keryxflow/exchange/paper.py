@@ -172,6 +172,83 @@ class PaperTradingEngine:
 
         return balance
 
+    async def _book_fill(
+        self,
+        session: Any,
+        symbol: str,
+        side: str,
+        amount: float,
+        exec_price: float,
+        balances: dict[str, PaperBalance] | None = None,
+    ) -> None:
+        """
+        Move balances and record the trade for one fill inside a transaction.
+
+        Args:
+            balances: Balance rows already loaded in this session, by currency;
+                filled in as rows are loaded so a batch selects each only once
+
+        Raises:
+            ValueError: If the paying balance is insufficient (nothing is changed)
+        """
+        base, quote = self._get_base_quote(symbol)
+        cost = amount * exec_price
+        balances = {} if balances is None else balances
+
+        async def load(currency: str) -> PaperBalance:
+            if currency not in balances:
+                balances[currency] = await self._get_or_create_balance(session, currency)
+            return balances[currency]
+
+        if side == "buy":
+            # Check quote balance
+            quote_balance = await load(quote)
+            if quote_balance.free < cost:
+                raise ValueError(
+                    f"Insufficient {quote} balance: {quote_balance.free:.2f} < {cost:.2f}"
+                )
+
+            # Deduct quote, add base
+            quote_balance.free -= cost
+            quote_balance.total -= cost
+
+            base_balance = await load(base)
+            base_balance.free += amount
+            base_balance.total += amount
+
+        else:  # sell
+            # Check base balance
+            base_balance = await load(base)
+            if base_balance.free < amount:
+                raise ValueError(
+                    f"Insufficient {base} balance: {base_balance.free:.6f} < {amount:.6f}"
+                )
+
+            # Deduct base, add quote
+            base_balance.free -= amount
+            base_balance.total -= amount
+
+            quote_balance = await load(quote)
+            quote_balance.free += cost
+            quote_balance.total += cost
+
+        # Update timestamps
+        base_balance.updated_at = datetime.now(UTC)
+        quote_balance.updated_at = datetime.now(UTC)
+
+        # Create trade record
+        trade = Trade(
+            symbol=symbol,
+            side=TradeSide(side),
+            quantity=amount,
+            entry_price=exec_price,
+            status=TradeStatus.CLOSED,
+            is_paper=True,
+            opened_at=datetime.now(UTC),
+            closed_at=datetime.now(UTC),
+        )
+        session.add(trade)
+
     async def execute_market_order(
         self,
         symbol: str,
@@ -201,61 +278,13 @@ class PaperTradingEngine:
 
         # Apply slippage
         exec_price = self._apply_slippage(price, side)
-        base, quote = self._get_base_quote(symbol)
         cost = amount * exec_price
 
         order_id = str(uuid.uuid4())[:8]
 
         async_session = get_session_factory()
         async with async_session() as session, session.begin():
-            if side == "buy":
-                # Check quote balance
-                quote_balance = await self._get_or_create_balance(session, quote)
-                if quote_balance.free < cost:
-                    raise ValueError(
-                        f"Insufficient {quote} balance: {quote_balance.free:.2f} < {cost:.2f}"
-                    )
-
-                # Deduct quote, add base
-                quote_balance.free -= cost
-                quote_balance.total -= cost
-
-                base_balance = await self._get_or_create_balance(session, base)
-                base_balance.free += amount
-                base_balance.total += amount
-
-            else:  # sell
-                # Check base balance
-                base_balance = await self._get_or_create_balance(session, base)
-                if base_balance.free < amount:
-                    raise ValueError(
-                        f"Insufficient {base} balance: {base_balance.free:.6f} < {amount:.6f}"
-                    )
-
-                # Deduct base, add quote
-                base_balance.free -= amount
-                base_balance.total -= amount
-
-                quote_balance = await self._get_or_create_balance(session, quote)
-                quote_balance.free += cost
-                quote_balance.total += cost
-
-            # Update timestamps
-            base_balance.updated_at = datetime.now(UTC)
-            quote_balance.updated_at = datetime.now(UTC)
-
-            # Create trade record
-            trade = Trade(
-                symbol=symbol,
-                side=TradeSide(side),
-                quantity=amount,
-                entry_price=exec_price,
-                status=TradeStatus.CLOSED,
-                is_paper=True,
-                opened_at=datetime.now(UTC),
-                closed_at=datetime.now(UTC),
-            )
-            session.add(trade)
+            await self._book_fill(session, symbol, side, amount, exec_price)
 
         # Create order result
         order_result = {
@@ -289,6 +318,74 @@ class PaperTradingEngine:
 
         return order_result
 
+    async def execute_fills(self, fills: list[dict[str, Any]]) -> list[dict[str, Any] | None]:
+        """
+        Book many fills in a single ledger transaction.
+
+        Each fill is checked against the balances left by the fills before
+        it; one that cannot be paid for is skipped (``None`` in the result)
+        without affecting the others. Slippage is applied as in
+        ``execute_market_order``.
+
+        Args:
+            fills: Dicts with ``symbol``, ``side``, ``amount`` and ``price``
+
+        Returns:
+            An order result dict per fill, or None where it was rejected
+        """
+        await self.initialize()
+        if not fills:
+            return []
+
+        results: list[dict[str, Any] | None] = []
+        balances: dict[str, PaperBalance] = {}
+        async_session = get_session_factory()
+        async with async_session() as session, session.begin():
+            for fill in fills:
+                symbol, side, amount = fill["symbol"], fill["side"], fill["amount"]
+                exec_price = self._apply_slippage(fill["price"], side)
+                try:
+                    await self._book_fill(session, symbol, side, amount, exec_price, balances)
+                except ValueError as e:
+                    logger.warning("paper_fill_rejected", symbol=symbol, side=side, error=str(e))
+                    results.append(None)
+                    continue
+                results.append(
+                    {
+                        "id": str(uuid.uuid4())[:8],
+                        "symbol": symbol,
+                        "type": "limit",
+                        "side": side,
+                        "amount": amount,
+                        "price": exec_price,
+                        "cost": amount * exec_price,
+                        "filled": amount,
+                        "remaining": 0.0,
+                        "status": "closed",
+                        "timestamp": datetime.now(UTC).isoformat(),
+                    }
+                )
+
+        for result in results:
+            if result is not None:
+                await self.event_bus.publish(
+                    order_event(
+                        EventType.ORDER_FILLED,
+                        symbol=result["symbol"],
+                        side=result["side"],
+                        quantity=result["amount"],
+                        price=result["price"],
+                        order_id=result["id"],
+                    )
+                )
+
+        logger.info(
+            "paper_fills_executed",
+            count=len(fills),
+            rejected=sum(result is None for result in results),
+        )
+        return results
+
     async def open_position(
         self,
         symbol: str,
@@ -0,0 +1,260 @@
+"""Per-exchange request scheduler: weighted token bucket, priorities, coalescing."""
+
+import asyncio
+import heapq
+import itertools
+import time
+from collections.abc import Awaitable, Callable, Hashable
+from enum import IntEnum
+from typing import Any, TypeVar
+
+import ccxt.async_support as ccxt
+
+from keryxflow.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+
+class RequestPriority(IntEnum):
+    """Dispatch order when requests queue for budget (lower goes first)."""
+
+    ORDER = 0
+    BALANCE = 1
+    TICKER = 2
+    HISTORY = 3
+
+
+# Relative weight of each ccxt call against the bucket (one unit = one cheap call)
+ENDPOINT_COSTS: dict[str, float] = {
+    "fetch_time": 1.0,
+    "fetch_ticker": 1.0,
+    "fetch_order_book": 2.0,
+    "fetch_ohlcv": 2.0,
+    "fetch_balance": 5.0,
+    "fetch_order": 2.0,
+    "fetch_open_orders": 3.0,
+    "create_market_order": 1.0,
+    "create_limit_order": 1.0,
+    "cancel_order": 1.0,
+}
+
+ENDPOINT_PRIORITIES: dict[str, RequestPriority] = {
+    "create_market_order": RequestPriority.ORDER,
+    "create_limit_order": RequestPriority.ORDER,
+    "cancel_order": RequestPriority.ORDER,
+    "fetch_order": RequestPriority.ORDER,
+    "fetch_open_orders": RequestPriority.ORDER,
+    "fetch_balance": RequestPriority.BALANCE,
+    "fetch_time": RequestPriority.TICKER,
+    "fetch_ticker": RequestPriority.TICKER,
+    "fetch_order_book": RequestPriority.TICKER,
+    "fetch_ohlcv": RequestPriority.HISTORY,
+}
+
+
+class RequestScheduler:
+    """
+    Paces every request to one exchange through a single token bucket.
+
+    The bucket refills at ``rate`` cost units per second up to ``capacity``.
+    A request that finds budget and an empty queue runs immediately;
+    otherwise it waits in a priority queue (orders before balances before
+    tickers before historical candles, FIFO within a level) and a single
+    dispatcher releases waiters as the bucket refills. The last
+    ``order_reserve`` share of the bucket is kept for orders, so they are
+    not stuck behind a bucket drained by polling. Identical concurrent
+    reads passed with a ``key`` share one in-flight call. A rate-limit
+    response pauses all dispatch for ``cooldown`` seconds.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        rate: float = 10.0,
+        capacity: float | None = None,
+        cooldown: float = 1.0,
+        order_reserve: float = 0.2,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize the scheduler with a full bucket.
+
+        Args:
+            name: Exchange label used in logs and stats
+            rate: Cost units refilled per second
+            capacity: Maximum burst in cost units (defaults to one second of rate)
+            cooldown: Seconds to pause dispatch after a rate-limit response
+            order_reserve: Share of capacity only order requests may spend
+            clock: Monotonic time source in seconds
+        """
+        self.name = name
+        self._clock = clock
+        self.cooldown = cooldown
+        self.order_reserve = order_reserve
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self._tokens = self.capacity
+        self._updated = clock()
+        self._paused_until = 0.0
+        self._queue: list[tuple[int, int, float, asyncio.Future[None]]] = []
+        self._sequence = itertools.count()
+        self._dispatcher: asyncio.Task | None = None
+        self._in_flight: dict[Hashable, asyncio.Future[Any]] = {}
+        self._stats = {
+            "requests": 0,
+            "executed": 0,
+            "coalesced": 0,
+            "queued": 0,
+            "rate_limited": 0,
+        }
+        self._wait_s = 0.0
+
+    def configure(self, rate: float, capacity: float | None = None) -> None:
+        """
+        Change the refill rate (e.g. once the exchange's limits are known).
+
+        Args:
+            rate: Cost units refilled per second
+            capacity: Maximum burst in cost units (defaults to one second of rate)
+        """
+        self._refill()
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self._tokens = min(self._tokens, self.capacity)
+
+    @property
+    def queued(self) -> int:
+        """Requests currently waiting for budget."""
+        return sum(1 for entry in self._queue if not entry[3].done())
+
+    async def submit(
+        self,
+        call: Callable[[], Awaitable[T]],
+        cost: float = 1.0,
+        priority: int = RequestPriority.TICKER,
+        key: Hashable | None = None,
+    ) -> T:
+        """
+        Run ``call`` once the bucket can pay for it.
+
+        Args:
+            call: Zero-argument coroutine factory performing the request
+            cost: Bucket units the request consumes
+            priority: Queue priority (see RequestPriority)
+            key: Coalescing key; concurrent submissions with the same key
+                share one request. Leave None for anything with side effects.
+
+        Returns:
+            The result of ``call``
+        """
+        self._stats["requests"] += 1
+        if key is None:
+            return await self._run(call, cost, priority)
+
+        shared = self._in_flight.get(key)
+        if shared is None:
+            shared = asyncio.ensure_future(self._run(call, cost, priority))
+            self._in_flight[key] = shared
+            shared.add_done_callback(lambda _f, key=key: self._in_flight.pop(key, None))
+        else:
+            self._stats["coalesced"] += 1
+        # Shield so one cancelled caller does not cancel the others' request
+        return await asyncio.shield(shared)
+
+    async def _run(self, call: Callable[[], Awaitable[T]], cost: float, priority: int) -> T:
+        """Acquire budget, perform the call and record rate-limit responses."""
+        await self._acquire(cost, priority)
+        self._stats["executed"] += 1
+        try:
+            return await call()
+        except Exception as e:
+            # ccxt maps HTTP 429 to RateLimitExceeded and 418/IP bans to DDoSProtection
+            if isinstance(e, ccxt.RateLimitExceeded | ccxt.DDoSProtection):
+                self.penalize()
+            raise
+
+    async def _acquire(self, cost: float, priority: int) -> None:
+        """Take ``cost`` tokens, queueing behind waiters of equal or higher priority."""
+        cost = min(cost, self.capacity)
+        self._refill()
+        ahead = self._queue and self._queue[0][0] <= priority
+        if not ahead and self._clock() >= self._paused_until and self._can_spend(cost, priority):
+            self._tokens -= cost
+            return
+
+        loop = asyncio.get_running_loop()
+        granted: asyncio.Future[None] = loop.create_future()
+        heapq.heappush(self._queue, (priority, next(self._sequence), cost, granted))
+        self._stats["queued"] += 1
+        if self._dispatcher is None or self._dispatcher.done():
+            self._dispatcher = asyncio.create_task(self._dispatch())
+        queued_at = self._clock()
+        await granted
+        self._wait_s += self._clock() - queued_at
+
+    async def _dispatch(self) -> None:
+        """Release queued requests in priority order as budget allows."""
+        while self._queue:
+            priority, _, cost, granted = self._queue[0]
+            if granted.done():
+                # Caller was cancelled while waiting
+                heapq.heappop(self._queue)
+                continue
+            self._refill()
+            now = self._clock()
+            if now < self._paused_until:
+                await asyncio.sleep(self._paused_until - now)
+                continue
+            if not self._can_spend(cost, priority):
+                needed = cost if priority <= RequestPriority.ORDER else self._with_reserve(cost)
+                await asyncio.sleep((needed - self._tokens) / self.rate)
+                continue
+            heapq.heappop(self._queue)
+            self._tokens -= cost
+            granted.set_result(None)
+
+    def _with_reserve(self, cost: float) -> float:
+        """Tokens a non-order request needs on hand, leaving the order reserve."""
+        return min(cost + self.order_reserve * self.capacity, self.capacity)
+
+    def _can_spend(self, cost: float, priority: int) -> bool:
+        """Whether the bucket can pay ``cost`` at ``priority`` now."""
+        if priority <= RequestPriority.ORDER:
+            return self._tokens >= cost
+        return self._tokens >= self._with_reserve(cost)
+
+    def _refill(self) -> None:
+        """Add the tokens earned since the last update."""
+        now = self._clock()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def penalize(self, seconds: float | None = None) -> None:
+        """
+        Empty the bucket and pause dispatch after the exchange pushed back.
+
+        Args:
+            seconds: Pause length (defaults to ``cooldown``)
+        """
+        pause = seconds if seconds is not None else self.cooldown
+        self._stats["rate_limited"] += 1
+        self._refill()
+        self._tokens = 0.0
+        self._paused_until = max(self._paused_until, self._clock() + pause)
+        logger.warning("exchange_rate_limited", exchange=self.name, pause_s=pause)
+
+    def get_stats(self) -> dict[str, Any]:
+        """Scheduler counters for monitoring."""
+        queued = self._stats["queued"]
+        return {
+            "exchange": self.name,
+            "rate": self.rate,
+            "capacity": self.capacity,
+            "tokens": round(self._tokens, 3),
+            "waiting": self.queued,
+            "in_flight_shared": len(self._in_flight),
+            "avg_queue_wait_ms": round(self._wait_s / queued * 1000, 3) if queued else None,
+            **self._stats,
+        }
@@ -0,0 +1,45 @@
+"""Silence aiohttp/ccxt destructor warnings.
+
+These warnings are cosmetic and don't affect functionality. They occur
+because ccxt uses aiohttp internally and the cleanup messages are printed
+during garbage collection. Imported by ``keryxflow.exchange`` rather than
+the top-level package so that entry points which never touch an exchange
+(e.g. backtests from CSV) don't pay for importing ccxt and aiohttp.
+"""
+
+# Monkeypatch aiohttp to silence the __del__ warnings
+try:
+    import aiohttp
+
+    # Silence ClientSession.__del__ warning
+    _original_session_del = getattr(aiohttp.ClientSession, "__del__", None)
+
+    def _silent_session_del(self):  # noqa: ARG001
+        pass  # Do nothing - GC will clean up
+
+    aiohttp.ClientSession.__del__ = _silent_session_del
+
+    # Silence TCPConnector.__del__ warning
+    _original_connector_del = getattr(aiohttp.TCPConnector, "__del__", None)
+
+    def _silent_connector_del(self):  # noqa: ARG001
+        pass  # Do nothing - GC will clean up
+
+    aiohttp.TCPConnector.__del__ = _silent_connector_del
+
+except ImportError:
+    pass  # aiohttp not installed
+
+# Monkeypatch ccxt to silence the destructor warning
+try:
+    import ccxt.async_support as ccxt_async
+
+    _original_exchange_del = getattr(ccxt_async.Exchange, "__del__", None)
+
+    def _silent_exchange_del(self):  # noqa: ARG001
+        pass  # Do nothing - GC will clean up
+
+    ccxt_async.Exchange.__del__ = _silent_exchange_del
+
+except (ImportError, AttributeError):
+    pass  # ccxt not installed or no __del__
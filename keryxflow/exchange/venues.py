@@ -0,0 +1,614 @@
+"""Several exchange adapters traded concurrently behind one adapter."""
+
+import asyncio
+import contextlib
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from typing import Any
+
+from keryxflow.config import get_settings
+from keryxflow.core.events import get_event_bus, price_update_event
+from keryxflow.core.logging import LogMessages, get_logger
+from keryxflow.exchange.adapter import ExchangeAdapter
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class VenueQuote:
+    """Top of book for one symbol on one venue."""
+
+    venue: str
+    bid: float | None
+    ask: float | None
+    last: float | None
+    volume: float = 0.0
+    timestamp: int | None = None
+
+
+@dataclass
+class ConsolidatedQuote:
+    """Best bid and ask for one symbol across every venue that quotes it."""
+
+    symbol: str
+    quotes: dict[str, VenueQuote] = field(default_factory=dict)
+
+    @property
+    def best_bid(self) -> VenueQuote | None:
+        """Venue quote with the highest bid."""
+        bids = [q for q in self.quotes.values() if q.bid]
+        return max(bids, key=lambda q: q.bid) if bids else None
+
+    @property
+    def best_ask(self) -> VenueQuote | None:
+        """Venue quote with the lowest ask."""
+        asks = [q for q in self.quotes.values() if q.ask]
+        return min(asks, key=lambda q: q.ask) if asks else None
+
+    @property
+    def price(self) -> float | None:
+        """Mid of the best bid and ask, else the first last price."""
+        bid, ask = self.best_bid, self.best_ask
+        if bid is not None and ask is not None:
+            return (bid.bid + ask.ask) / 2
+        lasts = [q.last for q in self.quotes.values() if q.last]
+        return lasts[0] if lasts else None
+
+    @property
+    def volume(self) -> float:
+        """Base volume summed over venues."""
+        return sum(q.volume or 0.0 for q in self.quotes.values())
+
+    def to_dict(self) -> dict[str, Any]:
+        """Ticker-shaped view with the venue of each side."""
+        bid, ask = self.best_bid, self.best_ask
+        return {
+            "symbol": self.symbol,
+            "last": self.price,
+            "bid": bid.bid if bid else None,
+            "ask": ask.ask if ask else None,
+            "bid_venue": bid.venue if bid else None,
+            "ask_venue": ask.venue if ask else None,
+            "volume": self.volume,
+            "venues": {
+                name: {"bid": q.bid, "ask": q.ask, "last": q.last}
+                for name, q in self.quotes.items()
+            },
+        }
+
+
+class MultiVenueClient(ExchangeAdapter):
+    """
+    One ExchangeAdapter over several venues traded at once.
+
+    Tickers are fetched from every connected venue concurrently and merged
+    into a ConsolidatedQuote per symbol; the price feed publishes one price
+    update per symbol from it, so the engine buffers and analyzes each
+    symbol once however many venues list it. Balances are summed (with the
+    per-venue split under ``"venues"``) so risk limits apply across venues.
+    Orders go to the venue named by the caller or chosen by ``route()``:
+    the best price for the side among venues that can afford the order
+    (``routing="best_price"``), or the primary venue (``"primary"``).
+    Historical OHLCV comes from the primary venue.
+    """
+
+    def __init__(
+        self,
+        venues: dict[str, ExchangeAdapter],
+        primary: str | None = None,
+        routing: str = "best_price",
+    ):
+        """
+        Initialize the client (no connection is made yet).
+
+        Args:
+            venues: Adapters keyed by venue name, in preference order
+            primary: Venue for history and fallback routing (defaults to the first)
+            routing: "best_price" or "primary"
+        """
+        if not venues:
+            raise ValueError("MultiVenueClient needs at least one venue")
+        self.venues = dict(venues)
+        self.primary = primary or next(iter(self.venues))
+        if self.primary not in self.venues:
+            raise ValueError(f"Primary venue '{self.primary}' is not configured")
+        self.routing = routing
+        self.settings = get_settings()
+        self.event_bus = get_event_bus()
+        self._quotes: dict[str, ConsolidatedQuote] = {}
+        self._venue_balances: dict[str, dict[str, dict[str, float]]] = {}
+        self._order_venues: dict[str, str] = {}
+        self._running = False
+        self._price_task: asyncio.Task | None = None
+
+    @property
+    def connected_venues(self) -> list[str]:
+        """Names of venues currently connected, in preference order."""
+        return [name for name, adapter in self.venues.items() if adapter.is_connected]
+
+    async def connect(self) -> bool:
+        """
+        Connect every venue concurrently.
+
+        Returns:
+            True if at least one venue connected
+        """
+        names = list(self.venues)
+        results = await asyncio.gather(
+            *(self.venues[name].connect() for name in names), return_exceptions=True
+        )
+        for name, result in zip(names, results, strict=True):
+            if isinstance(result, BaseException):
+                logger.warning("venue_connect_failed", venue=name, error=str(result))
+            elif result is not True:
+                logger.warning("venue_connect_failed", venue=name, error="connect() returned False")
+        connected = self.connected_venues
+        if connected:
+            msg = LogMessages.connection_status(", ".join(connected), "connected")
+            logger.info(msg.technical)
+        return bool(connected)
+
+    async def disconnect(self) -> None:
+        """Stop the price feed and disconnect every venue."""
+        await self.stop_price_feed()
+        await asyncio.gather(
+            *(adapter.disconnect() for adapter in self.venues.values()),
+            return_exceptions=True,
+        )
+
+    @property
+    def is_connected(self) -> bool:
+        """Check if any venue is connected."""
+        return any(adapter.is_connected for adapter in self.venues.values())
+
+    def _ensure_connected(self) -> None:
+        """Raise error if no venue is connected."""
+        if not self.is_connected:
+            raise RuntimeError("Not connected to exchange. Call connect() first.")
+
+    def _adapter(self, venue: str) -> ExchangeAdapter:
+        """Adapter for a venue name."""
+        try:
+            return self.venues[venue]
+        except KeyError:
+            raise ValueError(f"Unknown venue: '{venue}'") from None
+
+    # ------------------------------------------------------------------
+    # Consolidated market data
+    # ------------------------------------------------------------------
+
+    async def refresh_quotes(self, symbols: list[str]) -> dict[str, ConsolidatedQuote]:
+        """
+        Fetch every symbol from every connected venue concurrently.
+
+        A venue that fails for a symbol is left out of that symbol's view
+        until it answers again.
+
+        Args:
+            symbols: Symbols to refresh
+
+        Returns:
+            Consolidated quotes for the symbols that any venue quoted
+        """
+        self._ensure_connected()
+        pairs = [(venue, symbol) for symbol in symbols for venue in self.connected_venues]
+        results = await asyncio.gather(
+            *(self.venues[venue].get_ticker(symbol) for venue, symbol in pairs),
+            return_exceptions=True,
+        )
+
+        fresh: dict[str, ConsolidatedQuote] = {}
+        for (venue, symbol), ticker in zip(pairs, results, strict=True):
+            quote = fresh.setdefault(symbol, ConsolidatedQuote(symbol))
+            if isinstance(ticker, BaseException):
+                logger.debug("venue_ticker_failed", venue=venue, symbol=symbol, error=str(ticker))
+                continue
+            quote.quotes[venue] = VenueQuote(
+                venue=venue,
+                bid=ticker.get("bid"),
+                ask=ticker.get("ask"),
+                last=ticker.get("last"),
+                volume=ticker.get("volume") or 0.0,
+                timestamp=ticker.get("timestamp"),
+            )
+        for symbol, quote in fresh.items():
+            if quote.quotes:
+                self._quotes[symbol] = quote
+        return {s: self._quotes[s] for s in symbols if s in self._quotes}
+
+    def get_quote(self, symbol: str) -> ConsolidatedQuote | None:
+        """Last consolidated quote for a symbol (None before the first refresh)."""
+        return self._quotes.get(symbol)
+
+    async def get_ticker(self, symbol: str) -> dict[str, Any]:
+        """
+        Get the consolidated ticker for a symbol.
+
+        Args:
+            symbol: Trading pair (e.g., "BTC/USDT")
+
+        Returns:
+            Best bid and ask across venues with their venue names; ``last``
+            is the mid
+        """
+        quotes = await self.refresh_quotes([symbol])
+        if symbol not in quotes:
+            raise RuntimeError(f"No venue returned a ticker for {symbol}")
+        return quotes[symbol].to_dict()
+
+    async def get_ohlcv(
+        self,
+        symbol: str,
+        timeframe: str = "1h",
+        limit: int = 100,
+        since: int | None = None,
+    ) -> list[list[float]]:
+        """
+        Get OHLCV data from the primary venue, falling back to the others.
+
+        Args:
+            symbol: Trading pair
+            timeframe: Candle timeframe (1m, 5m, 15m, 1h, 4h, 1d)
+            limit: Number of candles to fetch
+            since: Timestamp in milliseconds for start time (optional)
+
+        Returns:
+            List of [timestamp, open, high, low, close, volume]
+        """
+        self._ensure_connected()
+        order = [self.primary] + [v for v in self.connected_venues if v != self.primary]
+        error: Exception | None = None
+        for venue in order:
+            adapter = self.venues[venue]
+            if not adapter.is_connected:
+                continue
+            try:
+                return await adapter.get_ohlcv(symbol, timeframe, limit=limit, since=since)
+            except Exception as e:
+                error = e
+                logger.warning("venue_ohlcv_failed", venue=venue, symbol=symbol, error=str(e))
+        raise RuntimeError(f"No venue returned OHLCV for {symbol}: {error}")
+
+    async def get_order_book(self, symbol: str, limit: int = 10) -> dict[str, Any]:
+        """
+        Get the merged order book across venues.
+
+        Args:
+            symbol: Trading pair
+            limit: Depth of the merged book
+
+        Returns:
+            Bids and asks as ``[price, amount, venue]`` levels, best first
+        """
+        self._ensure_connected()
+        venues = self.connected_venues
+        books = await asyncio.gather(
+            *(self.venues[v].get_order_book(symbol, limit) for v in venues),
+            return_exceptions=True,
+        )
+        bids: list[list[Any]] = []
+        asks: list[list[Any]] = []
+        for venue, book in zip(venues, books, strict=True):
+            if isinstance(book, BaseException):
+                logger.debug("venue_order_book_failed", venue=venue, error=str(book))
+                continue
+            bids.extend([level[0], level[1], venue] for level in book["bids"])
+            asks.extend([level[0], level[1], venue] for level in book["asks"])
+        bids.sort(key=lambda level: level[0], reverse=True)
+        asks.sort(key=lambda level: level[0])
+        return {
+            "symbol": symbol,
+            "bids": bids[:limit],
+            "asks": asks[:limit],
+            "timestamp": int(datetime.now(UTC).timestamp() * 1000),
+        }
+
+    # ------------------------------------------------------------------
+    # Balances
+    # ------------------------------------------------------------------
+
+    async def get_balance(self) -> dict[str, Any]:
+        """
+        Get balances from every venue, summed per currency.
+
+        Returns:
+            Balance dict with total, free and used amounts per currency, plus
+            ``"venues"`` holding each venue's own balance dict
+        """
+        self._ensure_connected()
+        venues = self.connected_venues
+        results = await asyncio.gather(
+            *(self.venues[v].get_balance() for v in venues), return_exceptions=True
+        )
+        combined: dict[str, dict[str, float]] = {"total": {}, "free": {}, "used": {}}
+        for venue, balance in zip(venues, results, strict=True):
+            if isinstance(balance, BaseException):
+                logger.warning("venue_balance_failed", venue=venue, error=str(balance))
+                continue
+            self._venue_balances[venue] = balance
+            for kind, totals in combined.items():
+                for currency, amount in (balance.get(kind) or {}).items():
+                    totals[currency] = totals.get(currency, 0.0) + (amount or 0.0)
+        return {**combined, "venues": dict(self._venue_balances)}
+
+    def get_venue_balances(self) -> dict[str, dict[str, dict[str, float]]]:
+        """Per-venue balances from the last ``get_balance()``."""
+        return dict(self._venue_balances)
+
+    # ------------------------------------------------------------------
+    # Routing and orders
+    # ------------------------------------------------------------------
+
+    def route(self, symbol: str, side: str, amount: float | None = None) -> str:
+        """
+        Choose the venue for an order.
+
+        With "best_price" routing a buy goes to the lowest ask and a sell to
+        the highest bid among venues quoting the symbol; when balances are
+        known, venues without the free quote (buy) or base (sell) currency
+        for ``amount`` are skipped. Falls back to the primary venue.
+
+        Args:
+            symbol: Trading pair
+            side: "buy" or "sell"
+            amount: Base amount, used for the balance check
+
+        Returns:
+            Venue name
+        """
+        quote = self._quotes.get(symbol)
+        if self.routing != "best_price" or quote is None:
+            return self.primary
+
+        base, _, quote_ccy = symbol.partition("/")
+        candidates = []
+        for q in quote.quotes.values():
+            if not self.venues[q.venue].is_connected:
+                continue
+            price = q.ask if side == "buy" else q.bid
+            if not price:
+                continue
+            if amount is not None and not self._can_afford(
+                q.venue, side, amount, price, base, quote_ccy
+            ):
+                continue
+            candidates.append((price, q.venue))
+        if not candidates:
+            return self.primary
+        best = min(candidates) if side == "buy" else max(candidates)
+        return best[1]
+
+    def _can_afford(
+        self, venue: str, side: str, amount: float, price: float, base: str, quote_ccy: str
+    ) -> bool:
+        """Whether a venue's last known free balance covers an order."""
+        balance = self._venue_balances.get(venue)
+        if balance is None:
+            return True
+        free = balance.get("free") or {}
+        if side == "buy":
+            return free.get(quote_ccy, 0.0) >= amount * price
+        return free.get(base, 0.0) >= amount
+
+    async def create_market_order(
+        self,
+        symbol: str,
+        side: str,
+        amount: float,
+        venue: str | None = None,
+    ) -> dict[str, Any]:
+        """
+        Create a market order on a venue.
+
+        Args:
+            symbol: Trading pair
+            side: "buy" or "sell"
+            amount: Amount to trade
+            venue: Venue to use (default: ``route()``)
+
+        Returns:
+            Order result with its ``"venue"``
+        """
+        venue = venue or self.route(symbol, side, amount)
+        order = await self._adapter(venue).create_market_order(symbol, side, amount)
+        return self._record_order(order, venue)
+
+    async def create_limit_order(
+        self,
+        symbol: str,
+        side: str,
+        amount: float,
+        price: float,
+        venue: str | None = None,
+    ) -> dict[str, Any]:
+        """
+        Create a limit order on a venue.
+
+        Args:
+            symbol: Trading pair
+            side: "buy" or "sell"
+            amount: Amount to trade
+            price: Limit price
+            venue: Venue to use (default: ``route()``)
+
+        Returns:
+            Order result with its ``"venue"``
+        """
+        venue = venue or self.route(symbol, side, amount)
+        order = await self._adapter(venue).create_limit_order(symbol, side, amount, price)
+        return self._record_order(order, venue)
+
+    def _record_order(self, order: dict[str, Any], venue: str) -> dict[str, Any]:
+        """Remember which venue holds an order and tag the result."""
+        if order.get("id") is not None:
+            self._order_venues[str(order["id"])] = venue
+        logger.info("venue_order_routed", venue=venue, order_id=order.get("id"))
+        return {**order, "venue": venue}
+
+    def _order_venue(self, order_id: str, venue: str | None) -> str:
+        """Venue for an existing order id."""
+        return venue or self._order_venues.get(str(order_id), self.primary)
+
+    async def cancel_order(
+        self, order_id: str, symbol: str, venue: str | None = None
+    ) -> dict[str, Any]:
+        """
+        Cancel an order on the venue that holds it.
+
+        Args:
+            order_id: Order ID to cancel
+            symbol: Trading pair
+            venue: Venue (default: where the order was placed, else primary)
+
+        Returns:
+            Cancellation result
+        """
+        venue = self._order_venue(order_id, venue)
+        result = await self._adapter(venue).cancel_order(order_id, symbol)
+        self._order_venues.pop(str(order_id), None)
+        return result
+
+    async def get_order(
+        self, order_id: str, symbol: str, venue: str | None = None
+    ) -> dict[str, Any]:
+        """
+        Get order status from the venue that holds it.
+
+        Args:
+            order_id: Order ID
+            symbol: Trading pair
+            venue: Venue (default: where the order was placed, else primary)
+
+        Returns:
+            Order details
+        """
+        venue = self._order_venue(order_id, venue)
+        return await self._adapter(venue).get_order(order_id, symbol)
+
+    async def get_open_orders(self, symbol: str) -> list[dict[str, Any]]:
+        """
+        Get open orders for a symbol from every connected venue.
+
+        Args:
+            symbol: Trading pair
+
+        Returns:
+            Open orders, each tagged with its ``"venue"``
+        """
+        self._ensure_connected()
+        venues = self.connected_venues
+        results = await asyncio.gather(
+            *(self.venues[v].get_open_orders(symbol) for v in venues), return_exceptions=True
+        )
+        orders: list[dict[str, Any]] = []
+        for venue, venue_orders in zip(venues, results, strict=True):
+            if isinstance(venue_orders, BaseException):
+                logger.warning("venue_open_orders_failed", venue=venue, error=str(venue_orders))
+                continue
+            orders.extend({**order, "venue": venue} for order in venue_orders)
+        return orders
+
+    # ------------------------------------------------------------------
+    # Price feed
+    # ------------------------------------------------------------------
+
+    async def start_price_feed(
+        self,
+        symbols: list[str] | None = None,
+        interval: float = 1.0,
+    ) -> None:
+        """
+        Start publishing one consolidated price update per symbol.
+
+        Args:
+            symbols: List of symbols to watch (default from settings)
+            interval: Update interval in seconds
+        """
+        if self._running:
+            return
+
+        if symbols is None:
+            symbols = self.settings.system.symbols
+
+        self._running = True
+        self._price_task = asyncio.create_task(self._price_feed_loop(symbols, interval))
+        logger.info(
+            "price_feed_started", symbols=symbols, interval=interval, venues=list(self.venues)
+        )
+
+    async def stop_price_feed(self) -> None:
+        """Stop the price feed."""
+        if not self._running:
+            return
+
+        self._running = False
+
+        if self._price_task:
+            self._price_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._price_task
+            self._price_task = None
+
+        logger.info("price_feed_stopped")
+
+    async def _price_feed_loop(self, symbols: list[str], interval: float) -> None:
+        """
+        Internal price feed loop.
+
+        Args:
+            symbols: Symbols to watch
+            interval: Update interval
+        """
+        while self._running:
+            try:
+                quotes = await self.refresh_quotes(symbols)
+                for symbol, quote in quotes.items():
+                    price = quote.price
+                    if price is None:
+                        continue
+                    await self.event_bus.publish(price_update_event(symbol, price, quote.volume))
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                logger.error("price_feed_error", error=str(e))
+            await asyncio.sleep(interval)
+
+
+def _build_adapter(name: str, sandbox: bool) -> ExchangeAdapter:
+    """Build a fresh adapter for a venue name."""
+    if name == "binance":
+        from keryxflow.exchange.client import ExchangeClient
+
+        return ExchangeClient(sandbox=sandbox)
+    if name == "bybit":
+        from keryxflow.exchange.bybit import BybitClient
+
+        return BybitClient(sandbox=sandbox)
+    if name == "kraken":
+        from keryxflow.exchange.kraken import KrakenClient
+
+        return KrakenClient(sandbox=sandbox)
+    if name == "okx":
+        from keryxflow.exchange.okx import OKXClient
+
+        return OKXClient(sandbox=sandbox)
+    raise ValueError(
+        f"Unsupported exchange: '{name}'. Supported exchanges: binance, bybit, kraken, okx"
+    )
+
+
+# Global client instance
+_multi_venue_client: MultiVenueClient | None = None
+
+
+def get_multi_venue_client(sandbox: bool = True) -> MultiVenueClient:
+    """Get the global multi-venue client built from ``settings.system.venues``."""
+    global _multi_venue_client
+    if _multi_venue_client is None:
+        system = get_settings().system
+        names = [v.lower() for v in system.venues] or [system.exchange.lower()]
+        _multi_venue_client = MultiVenueClient(
+            {name: _build_adapter(name, sandbox) for name in names},
+            routing=system.venue_routing,
+        )
+    return _multi_venue_client
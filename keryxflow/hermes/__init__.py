@@ -1,7 +1,22 @@
 """Hermes - Terminal User Interface layer."""
 
-from keryxflow.hermes.app import KeryxFlowApp
-from keryxflow.hermes.onboarding import OnboardingWizard, QuickSetupWizard, UserProfile
+from typing import TYPE_CHECKING
+
+from keryxflow.core.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from keryxflow.hermes.app import KeryxFlowApp
+    from keryxflow.hermes.onboarding import OnboardingWizard, QuickSetupWizard, UserProfile
+
+# Public name -> defining submodule, imported on first access
+_LAZY_EXPORTS = {
+    "KeryxFlowApp": "app",
+    "OnboardingWizard": "onboarding",
+    "QuickSetupWizard": "onboarding",
+    "UserProfile": "onboarding",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _LAZY_EXPORTS)
 
 __all__ = [
     "KeryxFlowApp",
@@ -329,8 +329,6 @@ class KeryxFlowApp(App):
 
     async def _update_oracle(self) -> None:
         """Update Oracle widget with latest signal from trading engine."""
-        import asyncio
-
         if not self.trading_engine:
             return
 
@@ -349,25 +347,14 @@ class KeryxFlowApp(App):
 
             current_price = ohlcv["close"].iloc[-1]
 
-            # Generate signal using engine's signal generator (in thread to avoid blocking)
-            def generate_signal_sync():
-                import asyncio
-
-                loop = asyncio.new_event_loop()
-                try:
-                    return loop.run_until_complete(
-                        self.trading_engine.signals.generate_signal(
-                            symbol=symbol,
-                            ohlcv=ohlcv,
-                            current_price=current_price,
-                            include_news=False,
-                            include_llm=False,
-                        )
-                    )
-                finally:
-                    loop.close()
-
-            signal = await asyncio.to_thread(generate_signal_sync)
+            # Indicators run in the generator's analysis pool, off the UI loop
+            signal = await self.trading_engine.signals.generate_signal(
+                symbol=symbol,
+                ohlcv=ohlcv,
+                current_price=current_price,
+                include_news=False,
+                include_llm=False,
+            )
 
             # Update Oracle widget
             oracle = self.query_one("#oracle", OracleWidget)
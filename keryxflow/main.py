@@ -1,18 +1,18 @@
-"""KeryxFlow main entrypoint."""
+"""KeryxFlow main entrypoint.
 
+Runs the Textual TUI, or with ``--headless`` a daemon with no UI (see
+``keryxflow.core.daemon``). The trading engine, exchange clients and the
+Textual TUI are imported inside the functions that start them, so
+``keryxflow --help`` and ``--version`` return without loading them.
+"""
+
+import argparse
 import asyncio
 from pathlib import Path
 from typing import Any
 
 from keryxflow import __version__
-from keryxflow.config import get_settings
-from keryxflow.core.database import get_or_create_user_profile, get_session, init_db
-from keryxflow.core.engine import TradingEngine
-from keryxflow.core.events import get_event_bus
-from keryxflow.core.logging import get_logger, setup_logging
-from keryxflow.exchange import get_exchange_adapter
-from keryxflow.exchange.paper import PaperTradingEngine
-from keryxflow.hermes.app import KeryxFlowApp
+from keryxflow.core.logging import get_logger
 
 logger = get_logger(__name__)
 
@@ -36,11 +36,22 @@ BANNER = """
 _cleanup_state: dict[str, Any] = {}
 
 
-def initialize_sync() -> dict[str, Any]:
+def initialize_sync(headless: bool = False) -> dict[str, Any]:
     """Initialize components synchronously (creates objects but doesn't connect).
 
-    The actual connection happens inside Textual's event loop.
+    The actual connection happens inside the event loop that runs them:
+    Textual's, or the headless daemon's.
+
+    Args:
+        headless: Initializing for the headless daemon rather than the TUI
     """
+    runtime = "daemon" if headless else "TUI"
+    from keryxflow.config import get_settings
+    from keryxflow.core.engine import TradingEngine
+    from keryxflow.core.events import get_event_bus
+    from keryxflow.exchange import get_exchange_adapter
+    from keryxflow.exchange.paper import PaperTradingEngine
+
     settings = get_settings()
     event_bus = get_event_bus()
 
@@ -77,10 +88,11 @@ def initialize_sync() -> dict[str, Any]:
         print("        ✓ Demo client ready (synthetic data)")
     else:
         print(
-            f"        ✓ {settings.system.exchange.capitalize()} client ready (will connect in TUI)"
+            f"        ✓ {settings.system.exchange.capitalize()} client ready "
+            f"(will connect in {runtime})"
         )
 
-    # Create trading engine (but DON'T start yet - that happens in TUI)
+    # Create trading engine (but DON'T start yet - that happens in the TUI/daemon)
     trading_engine = TradingEngine(
         exchange_client=client,
         paper_engine=paper,
@@ -89,7 +101,7 @@ def initialize_sync() -> dict[str, Any]:
 
     print()
     print("─" * 65)
-    print("\n  Starting TUI...")
+    print(f"\n  Starting {runtime}...")
     print()
 
     return {
@@ -102,6 +114,8 @@ def initialize_sync() -> dict[str, Any]:
 
 async def _init_db_and_profile() -> None:
     """Initialize database and load user profile."""
+    from keryxflow.core.database import get_or_create_user_profile, get_session, init_db
+
     await init_db()
     logger.info("database_initialized")
 
@@ -130,6 +144,10 @@ async def cleanup(state: dict[str, Any]) -> None:
     if client and client.is_connected:
         await client.disconnect()
 
+    from keryxflow.exchange.market_data import close_market_data_clients
+
+    await close_market_data_clients()
+
     if event_bus:
         await event_bus.stop()
 
@@ -137,10 +155,68 @@ async def cleanup(state: dict[str, Any]) -> None:
     print("\n  Stack sats. ₿\n")
 
 
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    """Parse command line arguments.
+
+    Args:
+        argv: Arguments to parse (defaults to sys.argv)
+
+    Returns:
+        Parsed arguments
+    """
+    parser = argparse.ArgumentParser(
+        prog="keryxflow",
+        description="KeryxFlow trading engine with terminal UI (or headless with --headless). "
+        "Configuration is read from settings.toml and KERYXFLOW_* environment variables.",
+    )
+    parser.add_argument("--version", action="version", version=f"%(prog)s {__version__}")
+    parser.add_argument(
+        "--headless",
+        action="store_true",
+        help="Run the engine, price feed, API server and agent session without the TUI",
+    )
+    parser.add_argument(
+        "--duration",
+        type=float,
+        default=None,
+        metavar="SECONDS",
+        help="Stop the headless daemon after this many seconds (default: run until signalled)",
+    )
+    return parser.parse_args(argv)
+
+
+def run_headless(state: dict[str, Any], duration: float | None = None) -> None:
+    """Run the initialized components as a headless daemon.
+
+    Args:
+        state: Components from :func:`initialize_sync`
+        duration: Stop after this many seconds (runs until SIGINT/SIGTERM if None)
+    """
+    from keryxflow.config import get_settings
+    from keryxflow.core.daemon import HeadlessRunner, event_loop_factory
+
+    runner = HeadlessRunner(
+        trading_engine=state["trading_engine"],
+        exchange_client=state["client"],
+        event_bus=state["event_bus"],
+        paper_engine=state["paper"],
+    )
+    asyncio.run(
+        runner.run(duration),
+        loop_factory=event_loop_factory(get_settings().daemon.uvloop),
+    )
+    logger.info("headless_summary", **runner.get_stats())
+
+
 def run() -> None:
     """Main entry point."""
     global _cleanup_state
 
+    args = parse_args()
+
+    from keryxflow.config import get_settings
+    from keryxflow.core.logging import setup_logging
+
     # Ensure data directories exist
     Path("data/logs").mkdir(parents=True, exist_ok=True)
 
@@ -154,7 +230,14 @@ def run() -> None:
 
     try:
         # Phase 1: Initialize (sync - creates objects but doesn't connect)
-        _cleanup_state = initialize_sync()
+        _cleanup_state = initialize_sync(headless=args.headless)
+
+        if args.headless:
+            # Phase 2: Run headless (one event loop, no widgets)
+            run_headless(_cleanup_state, duration=args.duration)
+            return
+
+        from keryxflow.hermes.app import KeryxFlowApp
 
         # Phase 2: Run TUI (sync - Textual manages its own event loop)
         # Connection/startup happens inside Textual's event loop in on_mount()
@@ -1,11 +1,21 @@
 """Episodic memory for trade episodes - record and recall similar situations."""
 
 import json
+from collections.abc import AsyncIterator
 from dataclasses import dataclass, field
 from datetime import UTC, datetime, timedelta
 
 from sqlmodel import select
 
+from keryxflow.core.history import (
+    DEFAULT_PAGE_SIZE,
+    MAX_PAGE_SIZE,
+    HistoryPage,
+    decode_cursor,
+    fetch_page,
+    history_statement,
+    iter_batches,
+)
 from keryxflow.core.logging import get_logger
 from keryxflow.core.models import (
     TradeEpisode,
@@ -415,6 +425,86 @@ class EpisodicMemory:
             result = await session.execute(query)
             return list(result.scalars().all())
 
+    async def get_episode_history(
+        self,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: str | None = None,
+        symbol: str | None = None,
+        start: datetime | None = None,
+        end: datetime | None = None,
+        ascending: bool = False,
+    ) -> HistoryPage[TradeEpisode]:
+        """
+        Get one page of episode history using keyset pagination.
+
+        Args:
+            limit: Page size (capped at MAX_PAGE_SIZE)
+            cursor: Cursor from the previous page's ``next_cursor``
+            symbol: Filter by symbol (optional)
+            start: Inclusive lower bound on entry_timestamp
+            end: Exclusive upper bound on entry_timestamp
+            ascending: Oldest first instead of newest first
+
+        Returns:
+            HistoryPage of episodes ordered by (entry_timestamp, id)
+
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        after = decode_cursor(cursor) if cursor else None
+        statement = history_statement(
+            TradeEpisode,
+            TradeEpisode.entry_timestamp,
+            symbol=symbol,
+            start=start,
+            end=end,
+            after=after,
+            ascending=ascending,
+        )
+        async with self._session_factory() as session:
+            return await fetch_page(
+                session,
+                statement,
+                max(1, min(limit, MAX_PAGE_SIZE)),
+                key=lambda e: (e.entry_timestamp, e.id),
+            )
+
+    async def iter_episode_history(
+        self,
+        symbol: str | None = None,
+        start: datetime | None = None,
+        end: datetime | None = None,
+        ascending: bool = True,
+        batch_size: int = MAX_PAGE_SIZE,
+    ) -> AsyncIterator[TradeEpisode]:
+        """
+        Iterate over the full episode history without loading it all.
+
+        Args:
+            symbol: Filter by symbol (optional)
+            start: Inclusive lower bound on entry_timestamp
+            end: Exclusive upper bound on entry_timestamp
+            ascending: Oldest first (default) instead of newest first
+            batch_size: Rows fetched per query
+
+        Yields:
+            Episodes ordered by (entry_timestamp, id)
+        """
+
+        async def fetch(cursor: str | None) -> HistoryPage[TradeEpisode]:
+            return await self.get_episode_history(
+                limit=batch_size,
+                cursor=cursor,
+                symbol=symbol,
+                start=start,
+                end=end,
+                ascending=ascending,
+            )
+
+        async for batch in iter_batches(fetch):
+            for episode in batch:
+                yield episode
+
     async def get_episode_stats(self, symbol: str | None = None, days_back: int = 30) -> dict:
         """
         Get statistics for trade episodes.
@@ -3,6 +3,7 @@
 from keryxflow.notifications.base import BaseNotifier, NotificationMessage
 from keryxflow.notifications.discord import DiscordNotifier
 from keryxflow.notifications.manager import NotificationManager, get_notification_manager
+from keryxflow.notifications.pipeline import NotificationChannel, RateLimiter
 from keryxflow.notifications.telegram import TelegramNotifier
 
 __all__ = [
@@ -11,5 +12,7 @@ __all__ = [
     "TelegramNotifier",
     "DiscordNotifier",
     "NotificationManager",
+    "NotificationChannel",
+    "RateLimiter",
     "get_notification_manager",
 ]
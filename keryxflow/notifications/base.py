@@ -86,6 +86,9 @@ class NotificationMessage:
 class BaseNotifier(ABC):
     """Abstract base class for notification providers."""
 
+    # Provider send limit as (messages, per_seconds), used to pace delivery
+    RATE_LIMIT: tuple[int, float] = (10, 1.0)
+
     def __init__(self, enabled: bool = True):
         """Initialize notifier.
 
@@ -93,6 +96,8 @@ class BaseNotifier(ABC):
             enabled: Whether this notifier is enabled
         """
         self._enabled = enabled
+        # Seconds the provider asked us to wait after the last rejected send
+        self.retry_after: float | None = None
 
     @property
     def enabled(self) -> bool:
@@ -18,11 +18,15 @@ class DiscordNotifier(BaseNotifier):
     Create a webhook in Discord: Server Settings > Integrations > Webhooks
     """
 
+    # Discord webhooks allow 5 requests per 2 seconds
+    RATE_LIMIT = (5, 2.0)
+
     def __init__(
         self,
         webhook_url: str,
         username: str = "KeryxFlow",
         enabled: bool = True,
+        client: httpx.AsyncClient | None = None,
     ):
         """Initialize Discord notifier.
 
@@ -30,11 +34,12 @@ class DiscordNotifier(BaseNotifier):
             webhook_url: Discord webhook URL
             username: Bot username to display
             enabled: Whether notifications are enabled
+            client: HTTP client to use instead of creating one
         """
         super().__init__(enabled=enabled)
         self._webhook_url = webhook_url
         self._username = username
-        self._client = httpx.AsyncClient(timeout=10.0)
+        self._client = client or httpx.AsyncClient(timeout=10.0)
 
     def _get_embed_color(self, level: NotificationLevel) -> int:
         """Get Discord embed color for notification level.
@@ -98,6 +103,11 @@ class DiscordNotifier(BaseNotifier):
                 logger.debug("discord_sent", title=message.title)
                 return True
 
+            if response.status_code == 429:
+                self.retry_after = _retry_after(response)
+                logger.warning("discord_rate_limited", retry_after=self.retry_after)
+                return False
+
             logger.warning(
                 "discord_api_error",
                 status=response.status_code,
@@ -142,3 +152,11 @@ class DiscordNotifier(BaseNotifier):
     async def close(self) -> None:
         """Close HTTP client."""
         await self._client.aclose()
+
+
+def _retry_after(response: httpx.Response) -> float:
+    """Read retry_after (seconds) from a Discord 429 response."""
+    try:
+        return float(response.json().get("retry_after", 1))
+    except Exception:
+        return float(response.headers.get("retry-after", 1))
@@ -1,6 +1,7 @@
 """Notification manager - coordinates multiple notification providers."""
 
-from typing import TYPE_CHECKING
+import asyncio
+from typing import TYPE_CHECKING, Any
 
 from keryxflow.core.events import Event, EventBus, EventType
 from keryxflow.core.logging import get_logger
@@ -10,6 +11,7 @@ from keryxflow.notifications.base import (
     NotificationMessage,
     NotificationType,
 )
+from keryxflow.notifications.pipeline import NotificationChannel
 
 if TYPE_CHECKING:
     from keryxflow.notifications.discord import DiscordNotifier
@@ -22,7 +24,9 @@ class NotificationManager:
     """Manages multiple notification providers and event subscriptions.
 
     Subscribes to trading events and dispatches notifications
-    to all configured providers.
+    to all configured providers. Once started, notifications are queued
+    per provider and delivered by background workers, so event handlers
+    never wait on provider HTTP calls.
     """
 
     def __init__(
@@ -30,6 +34,9 @@ class NotificationManager:
         event_bus: EventBus | None = None,
         telegram: "TelegramNotifier | None" = None,
         discord: "DiscordNotifier | None" = None,
+        queue_size: int = 100,
+        batch_window: float = 1.0,
+        max_batch: int = 20,
     ):
         """Initialize notification manager.
 
@@ -37,6 +44,9 @@ class NotificationManager:
             event_bus: Event bus for subscribing to events
             telegram: Telegram notifier instance
             discord: Discord notifier instance
+            queue_size: Pending notifications kept per provider
+            batch_window: Seconds to gather a burst into one digest
+            max_batch: Most notifications folded into one digest
         """
         self._event_bus = event_bus
         self._notifiers: list[BaseNotifier] = []
@@ -46,6 +56,10 @@ class NotificationManager:
         if discord and discord.enabled:
             self._notifiers.append(discord)
 
+        self._queue_size = queue_size
+        self._batch_window = batch_window
+        self._max_batch = max_batch
+        self._channels: dict[str, NotificationChannel] = {}
         self._subscribed = False
 
     @property
@@ -61,8 +75,46 @@ class NotificationManager:
         """
         self._notifiers.append(notifier)
 
+    @property
+    def running(self) -> bool:
+        """Check if the background delivery pipeline is running."""
+        return any(c.running for c in self._channels.values())
+
+    def start(self) -> None:
+        """Start a background delivery worker for each active notifier."""
+        for notifier in self.notifiers:
+            name = notifier.get_name()
+            if name not in self._channels:
+                self._channels[name] = NotificationChannel(
+                    notifier,
+                    queue_size=self._queue_size,
+                    batch_window=self._batch_window,
+                    max_batch=self._max_batch,
+                )
+            self._channels[name].start()
+
+        if self._channels:
+            logger.info("notification_pipeline_started", notifiers=list(self._channels))
+
+    async def stop(self, timeout: float = 5.0) -> None:
+        """Flush queued notifications and stop the delivery workers.
+
+        Args:
+            timeout: Seconds to wait for each queue to drain
+        """
+        await asyncio.gather(*(c.stop(timeout) for c in self._channels.values()))
+
+    def enqueue(self, message: NotificationMessage) -> None:
+        """Queue a notification on every provider's channel without waiting.
+
+        Args:
+            message: Notification message to send
+        """
+        for channel in self._channels.values():
+            channel.put(message)
+
     async def notify(self, message: NotificationMessage) -> dict[str, bool]:
-        """Send notification to all providers.
+        """Send notification to all providers concurrently and wait for the results.
 
         Args:
             message: Notification message to send
@@ -70,22 +122,36 @@ class NotificationManager:
         Returns:
             Dict mapping notifier name to success status
         """
-        results = {}
+        notifiers = self.notifiers
+        outcomes = await asyncio.gather(
+            *(n.send(message) for n in notifiers), return_exceptions=True
+        )
 
-        for notifier in self.notifiers:
-            try:
-                success = await notifier.send(message)
-                results[notifier.get_name()] = success
-            except Exception as e:
+        results = {}
+        for notifier, outcome in zip(notifiers, outcomes, strict=True):
+            if isinstance(outcome, BaseException):
                 logger.error(
                     "notification_failed",
                     notifier=notifier.get_name(),
-                    error=str(e),
+                    error=str(outcome),
                 )
                 results[notifier.get_name()] = False
+            else:
+                results[notifier.get_name()] = outcome
 
         return results
 
+    async def _dispatch(self, message: NotificationMessage) -> None:
+        """Queue the message if the pipeline is running, otherwise send it now."""
+        if self.running:
+            self.enqueue(message)
+        else:
+            await self.notify(message)
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get per-provider queue depth, delivery counts and latency."""
+        return {name: channel.get_stats() for name, channel in self._channels.items()}
+
     async def notify_order_filled(
         self,
         symbol: str,
@@ -130,7 +196,7 @@ class NotificationManager:
             metadata=metadata,
         )
 
-        await self.notify(message)
+        await self._dispatch(message)
 
     async def notify_circuit_breaker(self, reason: str, cooldown_minutes: int) -> None:
         """Send circuit breaker triggered notification.
@@ -151,7 +217,7 @@ class NotificationManager:
             },
         )
 
-        await self.notify(message)
+        await self._dispatch(message)
 
     async def notify_daily_summary(
         self,
@@ -193,7 +259,7 @@ class NotificationManager:
             },
         )
 
-        await self.notify(message)
+        await self._dispatch(message)
 
     async def notify_system_start(self, mode: str, symbols: list[str]) -> None:
         """Send system start notification.
@@ -215,7 +281,7 @@ class NotificationManager:
             },
         )
 
-        await self.notify(message)
+        await self._dispatch(message)
 
     async def notify_system_error(self, error: str, component: str) -> None:
         """Send system error notification.
@@ -234,7 +300,7 @@ class NotificationManager:
             },
         )
 
-        await self.notify(message)
+        await self._dispatch(message)
 
     def subscribe_to_events(self) -> None:
         """Subscribe to relevant trading events."""
@@ -271,7 +337,7 @@ class NotificationManager:
 
     async def _handle_panic(self, _event: Event) -> None:
         """Handle panic triggered event."""
-        await self.notify(
+        await self._dispatch(
             NotificationMessage(
                 title="🆘 PANIC MODE ACTIVATED",
                 body="Emergency shutdown triggered. All positions closed.",
@@ -358,7 +424,7 @@ class NotificationManager:
             },
         )
 
-        await self.notify(message)
+        await self._dispatch(message)
 
     async def notify_position_closed(
         self,
@@ -407,10 +473,11 @@ class NotificationManager:
             },
         )
 
-        await self.notify(message)
+        await self._dispatch(message)
 
     async def close(self) -> None:
-        """Close all notifiers."""
+        """Stop the pipeline and close all notifiers."""
+        await self.stop()
         for notifier in self._notifiers:
             if hasattr(notifier, "close"):
                 await notifier.close()
@@ -448,5 +515,8 @@ def get_notification_manager() -> NotificationManager:
             event_bus=get_event_bus(),
             telegram=telegram,
             discord=discord,
+            queue_size=settings.queue_size,
+            batch_window=settings.batch_window,
+            max_batch=settings.max_batch,
         )
     return _notification_manager
@@ -0,0 +1,293 @@
+"""Background delivery pipeline for notifications.
+
+Each notifier gets a ``NotificationChannel``: a bounded queue drained by its
+own worker task, paced by a token-bucket ``RateLimiter`` sized to the
+provider's documented limits. Bursts that pile up while a channel waits
+for a token are folded into a single digest message, so 20 fills in a
+second reach Telegram as one message instead of 20 rate-limited ones.
+"""
+
+import asyncio
+import contextlib
+import time
+from collections import deque
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+from keryxflow.core.logging import get_logger
+from keryxflow.notifications.base import BaseNotifier, NotificationLevel, NotificationMessage
+
+logger = get_logger(__name__)
+
+# Levels that are never held back by the batch window or folded into a digest
+URGENT_LEVELS = frozenset({NotificationLevel.ERROR, NotificationLevel.CRITICAL})
+
+_LEVEL_ORDER = list(NotificationLevel)
+
+# Both Telegram and Discord cap message text at 4096 characters
+_DIGEST_MAX_CHARS = 3500
+
+
+class RateLimiter:
+    """Token bucket allowing ``rate`` messages per ``per`` seconds."""
+
+    def __init__(
+        self,
+        rate: int,
+        per: float,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Initialize the limiter.
+
+        Args:
+            rate: Messages allowed per window (also the burst size)
+            per: Window length in seconds
+            clock: Monotonic clock, injectable for tests
+        """
+        self._capacity = float(rate)
+        self._refill = rate / per
+        self._clock = clock
+        self._tokens = self._capacity
+        self._updated = clock()
+        self._blocked_until = 0.0
+
+    def _replenish(self) -> None:
+        now = self._clock()
+        self._tokens = min(self._capacity, self._tokens + (now - self._updated) * self._refill)
+        self._updated = now
+
+    def available(self) -> bool:
+        """Check whether a message could be sent right now."""
+        self._replenish()
+        return self._tokens >= 1.0 and self._clock() >= self._blocked_until
+
+    async def acquire(self) -> None:
+        """Wait for and consume one token."""
+        while True:
+            self._replenish()
+            wait = self._blocked_until - self._clock()
+            if wait <= 0 and self._tokens >= 1.0:
+                self._tokens -= 1.0
+                return
+            if wait <= 0:
+                wait = (1.0 - self._tokens) / self._refill
+            await asyncio.sleep(wait)
+
+    def block(self, seconds: float) -> None:
+        """Hold all sends for ``seconds`` (e.g. a provider's retry_after)."""
+        self._blocked_until = max(self._blocked_until, self._clock() + seconds)
+
+
+def build_digest(messages: list[NotificationMessage]) -> NotificationMessage:
+    """Fold several notifications into one digest message.
+
+    Args:
+        messages: Notifications in arrival order
+
+    Returns:
+        A single message listing each notification's title
+    """
+    level = max((m.level for m in messages), key=_LEVEL_ORDER.index)
+
+    counts: dict[str, int] = {}
+    for m in messages:
+        key = m.notification_type.value if m.notification_type else "other"
+        counts[key] = counts.get(key, 0) + 1
+
+    lines: list[str] = []
+    used = 0
+    for i, m in enumerate(messages):
+        line = f"• {m.timestamp.strftime('%H:%M:%S')} {m.title}"
+        if used + len(line) > _DIGEST_MAX_CHARS:
+            lines.append(f"… and {len(messages) - i} more")
+            break
+        lines.append(line)
+        used += len(line) + 1
+
+    return NotificationMessage(
+        title=f"📬 {len(messages)} notifications",
+        body="\n".join(lines),
+        level=level,
+        timestamp=messages[-1].timestamp,
+        metadata={k.replace("_", " ").title(): v for k, v in counts.items()},
+    )
+
+
+@dataclass
+class ChannelStats:
+    """Delivery statistics for one notifier."""
+
+    enqueued: int = 0
+    delivered: int = 0
+    failed: int = 0
+    dropped: int = 0
+    sends: int = 0
+    digests: int = 0
+    retries: int = 0
+    latencies: deque = field(default_factory=lambda: deque(maxlen=512))
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary, summarizing latency in milliseconds."""
+        samples = sorted(self.latencies)
+        if samples:
+            latency = {
+                "avg_ms": round(sum(samples) / len(samples) * 1000, 1),
+                "p95_ms": round(samples[min(len(samples) - 1, int(len(samples) * 0.95))] * 1000, 1),
+                "max_ms": round(samples[-1] * 1000, 1),
+            }
+        else:
+            latency = {"avg_ms": None, "p95_ms": None, "max_ms": None}
+        return {
+            "enqueued": self.enqueued,
+            "delivered": self.delivered,
+            "failed": self.failed,
+            "dropped": self.dropped,
+            "sends": self.sends,
+            "digests": self.digests,
+            "retries": self.retries,
+            "latency": latency,
+        }
+
+
+class NotificationChannel:
+    """Bounded queue and worker delivering to a single notifier."""
+
+    def __init__(
+        self,
+        notifier: BaseNotifier,
+        queue_size: int = 100,
+        batch_window: float = 1.0,
+        max_batch: int = 20,
+        max_retries: int = 1,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Initialize the channel.
+
+        Args:
+            notifier: Provider to deliver to
+            queue_size: Pending messages kept before the oldest is dropped
+            batch_window: Seconds to wait for a burst to gather before sending
+            max_batch: Most messages folded into one digest
+            max_retries: Retries for a send the provider rate-limited
+            clock: Monotonic clock, injectable for tests
+        """
+        self.notifier = notifier
+        self._queue: deque[tuple[float, NotificationMessage]] = deque()
+        self._queue_size = queue_size
+        self._batch_window = batch_window
+        self._max_batch = max_batch
+        self._max_retries = max_retries
+        self._clock = clock
+        self._wakeup = asyncio.Event()
+        self._idle = asyncio.Event()
+        self._idle.set()
+        self._task: asyncio.Task | None = None
+
+        rate, per = notifier.RATE_LIMIT
+        self.limiter = RateLimiter(rate, per, clock=clock)
+        self.stats = ChannelStats()
+
+    @property
+    def name(self) -> str:
+        """Name of the notifier served."""
+        return self.notifier.get_name()
+
+    @property
+    def running(self) -> bool:
+        """Check if the worker is running."""
+        return self._task is not None and not self._task.done()
+
+    def put(self, message: NotificationMessage) -> None:
+        """Queue a message without waiting; drops the oldest when full."""
+        if len(self._queue) >= self._queue_size:
+            self._queue.popleft()
+            self.stats.dropped += 1
+            logger.warning("notification_dropped", notifier=self.name)
+        self._queue.append((self._clock(), message))
+        self.stats.enqueued += 1
+        self._idle.clear()
+        self._wakeup.set()
+
+    def start(self) -> None:
+        """Start the worker task."""
+        if not self.running:
+            self._task = asyncio.create_task(self._run(), name=f"notify-{self.name}")
+
+    async def stop(self, timeout: float = 5.0) -> None:
+        """Deliver what is queued (up to ``timeout``), then stop the worker."""
+        if self._task is None:
+            return
+        with contextlib.suppress(TimeoutError):
+            await asyncio.wait_for(self._idle.wait(), timeout)
+        self._task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._task
+        self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            if not self._queue:
+                self._idle.set()
+                self._wakeup.clear()
+                await self._wakeup.wait()
+                continue
+
+            _, first = self._queue[0]
+            if first.level not in URGENT_LEVELS and self._batch_window > 0:
+                await asyncio.sleep(self._batch_window)
+
+            await self.limiter.acquire()
+            batch = self._take_batch()
+            try:
+                await self._deliver(batch)
+            except Exception as e:
+                logger.error("notification_worker_error", notifier=self.name, error=str(e))
+                self.stats.failed += len(batch)
+
+    def _take_batch(self) -> list[tuple[float, NotificationMessage]]:
+        """Pop the next send: one urgent message, or a run of routine ones."""
+        if self._queue[0][1].level in URGENT_LEVELS:
+            return [self._queue.popleft()]
+
+        batch = []
+        while self._queue and len(batch) < self._max_batch:
+            if self._queue[0][1].level in URGENT_LEVELS:
+                break
+            batch.append(self._queue.popleft())
+        return batch
+
+    async def _deliver(self, batch: list[tuple[float, NotificationMessage]]) -> None:
+        messages = [m for _, m in batch]
+        message = messages[0] if len(messages) == 1 else build_digest(messages)
+
+        ok = await self._send(message)
+        now = self._clock()
+        self.stats.sends += 1
+        if ok:
+            self.stats.delivered += len(batch)
+            self.stats.latencies.extend(now - queued for queued, _ in batch)
+            if len(batch) > 1:
+                self.stats.digests += 1
+        else:
+            self.stats.failed += len(batch)
+            logger.warning("notification_failed", notifier=self.name, messages=len(batch))
+
+    async def _send(self, message: NotificationMessage) -> bool:
+        """Send once, retrying after the provider's retry_after if rate-limited."""
+        for attempt in range(self._max_retries + 1):
+            self.notifier.retry_after = None
+            if await self.notifier.send(message):
+                return True
+            retry_after = self.notifier.retry_after
+            if retry_after is None or attempt == self._max_retries:
+                return False
+            self.stats.retries += 1
+            logger.info("notification_rate_limited", notifier=self.name, retry_after=retry_after)
+            self.limiter.block(retry_after)
+            await self.limiter.acquire()
+        return False
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get delivery statistics including current queue depth."""
+        return {"queued": len(self._queue), **self.stats.to_dict()}
@@ -17,11 +17,16 @@ class TelegramNotifier(BaseNotifier):
 
     API_BASE = "https://api.telegram.org"
 
+    # Telegram allows about one message per second to a single chat
+    RATE_LIMIT = (1, 1.0)
+
     def __init__(
         self,
         bot_token: str,
         chat_id: str,
         enabled: bool = True,
+        api_base: str | None = None,
+        client: httpx.AsyncClient | None = None,
     ):
         """Initialize Telegram notifier.
 
@@ -29,11 +34,14 @@ class TelegramNotifier(BaseNotifier):
             bot_token: Telegram bot token from @BotFather
             chat_id: Target chat ID for messages
             enabled: Whether notifications are enabled
+            api_base: Bot API base URL (defaults to API_BASE)
+            client: HTTP client to use instead of creating one
         """
         super().__init__(enabled=enabled)
         self._bot_token = bot_token
         self._chat_id = chat_id
-        self._client = httpx.AsyncClient(timeout=10.0)
+        self._api_base = api_base or self.API_BASE
+        self._client = client or httpx.AsyncClient(timeout=10.0)
 
     async def send(self, message: NotificationMessage) -> bool:
         """Send a notification via Telegram.
@@ -51,7 +59,7 @@ class TelegramNotifier(BaseNotifier):
             logger.warning("telegram_not_configured")
             return False
 
-        url = f"{self.API_BASE}/bot{self._bot_token}/sendMessage"
+        url = f"{self._api_base}/bot{self._bot_token}/sendMessage"
 
         payload = {
             "chat_id": self._chat_id,
@@ -82,6 +90,10 @@ class TelegramNotifier(BaseNotifier):
             logger.error("telegram_timeout")
             return False
         except httpx.HTTPStatusError as e:
+            if e.response.status_code == 429:
+                self.retry_after = _retry_after(e.response)
+                logger.warning("telegram_rate_limited", retry_after=self.retry_after)
+                return False
             logger.error("telegram_http_error", status=e.response.status_code)
             return False
         except Exception as e:
@@ -97,7 +109,7 @@ class TelegramNotifier(BaseNotifier):
         if not self._bot_token:
             return False
 
-        url = f"{self.API_BASE}/bot{self._bot_token}/getMe"
+        url = f"{self._api_base}/bot{self._bot_token}/getMe"
 
         try:
             response = await self._client.get(url)
@@ -122,3 +134,11 @@ class TelegramNotifier(BaseNotifier):
     async def close(self) -> None:
         """Close HTTP client."""
         await self._client.aclose()
+
+
+def _retry_after(response: httpx.Response) -> float:
+    """Read retry_after from a Telegram 429 response."""
+    try:
+        return float(response.json().get("parameters", {}).get("retry_after", 1))
+    except Exception:
+        return float(response.headers.get("retry-after", 1))
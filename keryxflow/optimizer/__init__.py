@@ -1,9 +1,28 @@
 """Parameter optimization module for backtesting."""
 
-from keryxflow.optimizer.comparator import ResultComparator
-from keryxflow.optimizer.engine import OptimizationEngine, OptimizationResult
-from keryxflow.optimizer.grid import ParameterGrid, ParameterRange
-from keryxflow.optimizer.report import OptimizationReport
+from typing import TYPE_CHECKING
+
+from keryxflow.core.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from keryxflow.optimizer.comparator import ResultComparator
+    from keryxflow.optimizer.engine import OptimizationEngine, OptimizationResult
+    from keryxflow.optimizer.grid import ParameterGrid, ParameterRange
+    from keryxflow.optimizer.report import OptimizationReport
+    from keryxflow.optimizer.store import ResultStore
+
+# Public name -> defining submodule, imported on first access
+_LAZY_EXPORTS = {
+    "ResultComparator": "comparator",
+    "OptimizationEngine": "engine",
+    "OptimizationResult": "engine",
+    "ParameterGrid": "grid",
+    "ParameterRange": "grid",
+    "OptimizationReport": "report",
+    "ResultStore": "store",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _LAZY_EXPORTS)
 
 __all__ = [
     "ParameterRange",
@@ -12,4 +31,5 @@ __all__ = [
     "OptimizationEngine",
     "ResultComparator",
     "OptimizationReport",
+    "ResultStore",
 ]
@@ -2,6 +2,7 @@
 
 from collections import defaultdict
 from dataclasses import dataclass
+from pathlib import Path
 from typing import Any
 
 from keryxflow.optimizer.engine import OptimizationResult
@@ -30,7 +31,7 @@ class ResultComparator:
     """Compare and analyze optimization results.
 
     Provides methods for:
-    - Ranking results by any metric
+    - Ranking results by any metric (pruned runs rank last)
     - Extracting top N performers
     - Parameter sensitivity analysis
     - Metric correlation analysis
@@ -44,6 +45,20 @@ class ResultComparator:
         """
         self.results = results
 
+    @classmethod
+    def from_file(cls, path: str | Path) -> "ResultComparator":
+        """Create a comparator from a ResultStore results file.
+
+        Args:
+            path: Path to a JSON Lines results file
+
+        Returns:
+            ResultComparator over the stored results
+        """
+        from keryxflow.optimizer.store import ResultStore
+
+        return cls(ResultStore.load(path))
+
     def rank_by_metric(
         self,
         metric: str,
@@ -56,7 +71,7 @@ class ResultComparator:
             ascending: If True, sort ascending (lower is better)
 
         Returns:
-            Sorted list of results
+            Sorted list of results, completed runs before pruned runs
         """
         # Metrics where lower is better
         lower_is_better = {"max_drawdown", "max_drawdown_duration", "avg_loss"}
@@ -67,10 +82,18 @@ class ResultComparator:
 
         return sorted(
             self.results,
-            key=lambda r: r.get_metric(metric),
+            key=lambda r: (r.pruned != should_reverse, r.get_metric(metric)),
             reverse=should_reverse,
         )
 
+    def completed(self) -> list[OptimizationResult]:
+        """Get results that ran over the full period."""
+        return [r for r in self.results if not r.pruned]
+
+    def pruned(self) -> list[OptimizationResult]:
+        """Get results that were aborted early by pruning rules."""
+        return [r for r in self.results if r.pruned]
+
     def top_n(
         self,
         n: int = 10,
@@ -111,6 +134,7 @@ class ResultComparator:
         min_win_rate: float | None = None,
         max_drawdown: float | None = None,
         min_sharpe: float | None = None,
+        include_pruned: bool = True,
     ) -> list[OptimizationResult]:
         """Filter results by criteria.
 
@@ -119,12 +143,16 @@ class ResultComparator:
             min_win_rate: Minimum win rate (as decimal)
             max_drawdown: Maximum drawdown (as decimal)
             min_sharpe: Minimum Sharpe ratio
+            include_pruned: Keep runs aborted by pruning rules
 
         Returns:
             Filtered list of results
         """
         filtered = self.results
 
+        if not include_pruned:
+            filtered = [r for r in filtered if not r.pruned]
+
         if min_trades is not None:
             filtered = [r for r in filtered if r.metrics.total_trades >= min_trades]
 
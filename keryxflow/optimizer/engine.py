@@ -2,17 +2,22 @@
 
 import time
 from dataclasses import dataclass
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import pandas as pd
 
+from keryxflow.backtester.cache import BacktestCache
 from keryxflow.backtester.engine import BacktestEngine
+from keryxflow.backtester.pruning import PruningRules
 from keryxflow.backtester.report import BacktestResult
 from keryxflow.config import get_settings
 from keryxflow.core.logging import get_logger
 from keryxflow.core.models import RiskProfile
 from keryxflow.optimizer.grid import ParameterGrid
 
+if TYPE_CHECKING:
+    from keryxflow.optimizer.store import ResultStore
+
 logger = get_logger(__name__)
 
 
@@ -43,6 +48,11 @@ class OptimizationResult:
         """
         return getattr(self.metrics, name, 0.0)
 
+    @property
+    def pruned(self) -> bool:
+        """Check if this run was aborted early by pruning rules."""
+        return self.metrics.pruned
+
     def flat_parameters(self) -> dict[str, Any]:
         """Get flattened parameters dict."""
         result = {}
@@ -60,12 +70,16 @@ class OptimizationConfig:
         risk_profile: Base risk profile to use
         slippage: Slippage percentage (0.001 = 0.1%)
         commission: Commission percentage (0.001 = 0.1%)
+        cache: Persistent backtest result cache (disabled if None)
+        pruning: Early-abort rules for clearly bad combinations (disabled if None)
     """
 
     initial_balance: float = 10000.0
     risk_profile: RiskProfile = RiskProfile.BALANCED
     slippage: float = 0.001
     commission: float = 0.001
+    cache: BacktestCache | None = None
+    pruning: PruningRules | None = None
 
 
 class OptimizationEngine:
@@ -100,6 +114,7 @@ class OptimizationEngine:
         start: Any | None = None,
         end: Any | None = None,
         progress_callback: Any | None = None,
+        store: "ResultStore | None" = None,
     ) -> list[OptimizationResult]:
         """Run optimization across all parameter combinations.
 
@@ -110,9 +125,12 @@ class OptimizationEngine:
             start: Start datetime for backtest (optional)
             end: End datetime for backtest (optional)
             progress_callback: Optional callback(current, total, params) for progress updates
+            store: Optional ResultStore; results are streamed to it instead of
+                being accumulated in memory
 
         Returns:
-            List of OptimizationResult sorted by metric (best first)
+            List of OptimizationResult sorted by metric (best first). When a
+            store is given, only its top-K leaderboard is returned.
         """
         results: list[OptimizationResult] = []
         total_combinations = len(grid)
@@ -157,7 +175,10 @@ class OptimizationEngine:
                         run_time=run_time,
                         run_index=idx,
                     )
-                    results.append(opt_result)
+                    if store is not None:
+                        store.add(opt_result)
+                    else:
+                        results.append(opt_result)
 
                     logger.debug(
                         "optimization_run_complete",
@@ -165,6 +186,7 @@ class OptimizationEngine:
                         sharpe=result.sharpe_ratio,
                         return_pct=result.total_return * 100,
                         trades=result.total_trades,
+                        pruned=result.prune_reason,
                     )
 
                 except Exception as e:
@@ -179,12 +201,20 @@ class OptimizationEngine:
             # Restore original settings
             self._restore_original_settings()
 
-        # Sort by metric (descending - higher is better)
-        results = self._sort_results(results, metric)
+        if store is not None:
+            results = store.leaderboard()
+            total_runs = len(store)
+            pruned_runs = store.pruned_count
+        else:
+            # Sort by metric (descending - higher is better)
+            results = self._sort_results(results, metric)
+            total_runs = len(results)
+            pruned_runs = sum(1 for r in results if r.pruned)
 
         logger.info(
             "optimization_complete",
-            total_runs=len(results),
+            total_runs=total_runs,
+            pruned_runs=pruned_runs,
             best_metric=results[0].get_metric(metric) if results else 0,
         )
 
@@ -202,6 +232,8 @@ class OptimizationEngine:
             risk_profile=self.config.risk_profile,
             slippage=self.config.slippage,
             commission=self.config.commission,
+            cache=self.config.cache,
+            pruning=self.config.pruning,
         )
 
         return await engine.run(data, start=start, end=end)
@@ -266,6 +298,9 @@ class OptimizationEngine:
     ) -> list[OptimizationResult]:
         """Sort results by a metric.
 
+        Pruned runs always rank after completed runs, since their metrics
+        cover only part of the period.
+
         Args:
             results: List of optimization results
             metric: Metric name to sort by
@@ -283,7 +318,7 @@ class OptimizationEngine:
 
         return sorted(
             results,
-            key=lambda r: r.get_metric(metric),
+            key=lambda r: (r.pruned != should_reverse, r.get_metric(metric)),
             reverse=should_reverse,
         )
 
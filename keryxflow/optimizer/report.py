@@ -26,6 +26,23 @@ class OptimizationReport:
         self.results = results
         self.comparator = ResultComparator(results)
 
+    @classmethod
+    def from_file(cls, path: str | Path) -> "OptimizationReport":
+        """Create a report from a ResultStore results file.
+
+        Runs outside the stored top-K carry scalar metrics only, which is
+        all the summary, sensitivity and CSV sections need.
+
+        Args:
+            path: Path to a JSON Lines results file
+
+        Returns:
+            OptimizationReport over the stored results
+        """
+        from keryxflow.optimizer.store import ResultStore
+
+        return cls(ResultStore.load(path))
+
     def print_summary(
         self,
         metric: str = "sharpe_ratio",
@@ -59,6 +76,10 @@ class OptimizationReport:
             "",
         ]
 
+        pruned = self.comparator.pruned()
+        if pruned:
+            lines.insert(-1, f"  Pruned Early:   {len(pruned)}")
+
         # Top results
         top_results = self.comparator.top_n(top_n, metric)
         lines.append(f"TOP {len(top_results)} RESULTS (by {metric.replace('_', ' ').title()})")
@@ -127,6 +148,8 @@ class OptimizationReport:
         for i, result in enumerate(top_results, 1):
             m = result.metrics
             params = self._format_params_short(result.flat_parameters())
+            if result.pruned:
+                params = f"[pruned: {m.prune_reason}] {params}"
 
             lines.append(
                 f"{i:<3} {m.sharpe_ratio:>8.2f} "
@@ -181,7 +204,7 @@ class OptimizationReport:
             writer = csv.writer(f)
 
             # Header
-            header = ["run_index"] + param_names + metric_names + ["run_time"]
+            header = ["run_index"] + param_names + metric_names + ["run_time", "pruned"]
             writer.writerow(header)
 
             # Data rows
@@ -196,6 +219,7 @@ class OptimizationReport:
                     row.append(result.get_metric(mname))
 
                 row.append(result.run_time)
+                row.append(result.metrics.prune_reason or "")
                 writer.writerow(row)
 
     def save_best_params(
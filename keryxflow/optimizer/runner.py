@@ -1,18 +1,27 @@
-"""CLI runner for parameter optimization."""
+"""CLI runner for parameter optimization.
+
+Heavy dependencies (pandas, the backtest engine, exchange clients) are
+imported inside the functions that use them so ``--help`` and argument
+errors return without loading them.
+"""
+
+from __future__ import annotations
 
 import argparse
 import asyncio
 import sys
 from datetime import UTC, datetime
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-from keryxflow.backtester.data import DataLoader
+from keryxflow.backtester.pruning import PruningRules
 from keryxflow.core.logging import get_logger
-from keryxflow.core.models import RiskProfile
-from keryxflow.exchange import get_exchange_adapter
-from keryxflow.optimizer.engine import OptimizationConfig, OptimizationEngine
 from keryxflow.optimizer.grid import ParameterGrid, ParameterRange
-from keryxflow.optimizer.report import OptimizationReport
+
+if TYPE_CHECKING:
+    from keryxflow.backtester.cache import BacktestCache
+    from keryxflow.core.models import RiskProfile
+    from keryxflow.optimizer.report import OptimizationReport
 
 logger = get_logger(__name__)
 
@@ -24,6 +33,8 @@ def parse_date(date_str: str) -> datetime:
 
 def parse_risk_profile(profile_str: str) -> RiskProfile:
     """Parse risk profile string."""
+    from keryxflow.core.models import RiskProfile
+
     profiles = {
         "conservative": RiskProfile.CONSERVATIVE,
         "balanced": RiskProfile.BALANCED,
@@ -115,11 +126,15 @@ async def run_optimization(
     grid: ParameterGrid,
     metric: str = "sharpe_ratio",
     initial_balance: float = 10000.0,
-    risk_profile: RiskProfile = RiskProfile.BALANCED,
+    risk_profile: RiskProfile | None = None,
     timeframe: str = "1h",
     data_source: str | None = None,
     slippage: float = 0.001,
     commission: float = 0.001,
+    cache: BacktestCache | None = None,
+    pruning: PruningRules | None = None,
+    results_path: str | Path | None = None,
+    top_k: int = 10,
 ) -> OptimizationReport:
     """Run parameter optimization.
 
@@ -130,15 +145,29 @@ async def run_optimization(
         grid: Parameter grid to test
         metric: Metric to optimize for
         initial_balance: Starting balance
-        risk_profile: Base risk profile
+        risk_profile: Base risk profile (defaults to balanced)
         timeframe: Candle timeframe
         data_source: Path to CSV directory (optional)
         slippage: Slippage percentage
         commission: Commission percentage
+        cache: Persistent backtest result cache (disabled if None)
+        pruning: Early-abort rules for bad combinations (disabled if None)
+        results_path: Stream results to this JSON Lines file instead of memory
+        top_k: Number of full results (trades/equity) kept when streaming
 
     Returns:
         OptimizationReport with results
     """
+    from keryxflow.backtester.data import DataLoader
+    from keryxflow.core.models import RiskProfile
+    from keryxflow.exchange import get_exchange_adapter
+    from keryxflow.exchange.market_data import close_market_data_clients
+    from keryxflow.optimizer.engine import OptimizationConfig, OptimizationEngine
+    from keryxflow.optimizer.report import OptimizationReport
+    from keryxflow.optimizer.store import ResultStore
+
+    risk_profile = risk_profile or RiskProfile.BALANCED
+
     # Load data
     if data_source and Path(data_source).exists():
         loader = DataLoader()
@@ -168,6 +197,7 @@ async def run_optimization(
                 data[symbol] = df
         finally:
             await exchange.disconnect()
+            await close_market_data_clients()
 
     if not data:
         raise ValueError("No data loaded for any symbol")
@@ -178,6 +208,8 @@ async def run_optimization(
         risk_profile=risk_profile,
         slippage=slippage,
         commission=commission,
+        cache=cache,
+        pruning=pruning,
     )
 
     # Progress callback
@@ -191,6 +223,22 @@ async def run_optimization(
 
     print(f"\nRunning {len(grid)} backtests...")
 
+    if results_path:
+        with ResultStore(results_path, metric=metric, top_k=top_k) as store:
+            await engine.optimize(
+                data=data,
+                grid=grid,
+                metric=metric,
+                start=start,
+                end=end,
+                progress_callback=progress,
+                store=store,
+            )
+
+        print()  # Newline after progress
+
+        return OptimizationReport.from_file(results_path)
+
     results = await engine.optimize(
         data=data,
         grid=grid,
@@ -341,13 +389,72 @@ Grid types:
         help="Use compact output format",
     )
 
+    parser.add_argument(
+        "--cache",
+        action="store_true",
+        help="Reuse cached backtest results across optimization sessions",
+    )
+
+    parser.add_argument(
+        "--cache-dir",
+        help="Directory for the result cache (default: data/cache/backtests)",
+    )
+
+    # Streaming results
+    parser.add_argument(
+        "--results-file",
+        help="Stream results to a JSON Lines file instead of holding them in memory",
+    )
+
+    parser.add_argument(
+        "--keep-top",
+        type=int,
+        default=10,
+        help="Full results (trades/equity) kept when streaming (default: 10)",
+    )
+
+    # Early-abort pruning
+    parser.add_argument(
+        "--prune-max-dd",
+        type=float,
+        help="Abort a run once drawdown exceeds this fraction (e.g., 0.3)",
+    )
+
+    parser.add_argument(
+        "--prune-min-equity",
+        type=float,
+        help="Abort a run once equity falls below this fraction of initial balance",
+    )
+
+    parser.add_argument(
+        "--prune-min-trades",
+        type=int,
+        help="Abort a run with fewer trades than this by the checkpoint",
+    )
+
+    parser.add_argument(
+        "--prune-checkpoint",
+        type=float,
+        default=0.5,
+        help="Fraction of the period at which --prune-min-trades applies (default: 0.5)",
+    )
+
     args = parser.parse_args()
 
+    from keryxflow.backtester.cache import BacktestCache
+
     # Parse arguments
     start = parse_date(args.start)
     end = parse_date(args.end)
     risk_profile = parse_risk_profile(args.profile)
 
+    pruning = PruningRules(
+        max_drawdown=args.prune_max_dd,
+        min_equity_pct=args.prune_min_equity,
+        min_trades=args.prune_min_trades,
+        checkpoint_pct=args.prune_checkpoint,
+    )
+
     # Build grid
     grid = build_custom_grid(args.param) if args.param else build_grid(args.grid)
 
@@ -378,6 +485,10 @@ Grid types:
                 data_source=args.data,
                 slippage=args.slippage,
                 commission=args.commission,
+                cache=BacktestCache(args.cache_dir) if args.cache or args.cache_dir else None,
+                pruning=pruning if pruning.enabled else None,
+                results_path=args.results_file,
+                top_k=args.keep_top,
             )
         )
     except Exception as e:
@@ -0,0 +1,195 @@
+"""Streaming, bounded-memory storage for optimization results."""
+
+import heapq
+import json
+import pickle
+from collections.abc import Iterator
+from dataclasses import fields
+from pathlib import Path
+from typing import Any
+
+from keryxflow.backtester.report import BacktestResult
+from keryxflow.core.logging import get_logger
+from keryxflow.optimizer.engine import OptimizationResult
+
+logger = get_logger(__name__)
+
+# Metrics where lower is better
+LOWER_IS_BETTER = {"max_drawdown", "max_drawdown_duration", "avg_loss"}
+
+# BacktestResult fields kept per run; trades and equity only for the top-K
+_RAW_FIELDS = {"trades", "equity_curve"}
+_SCALAR_FIELDS = [f.name for f in fields(BacktestResult) if f.name not in _RAW_FIELDS]
+
+
+def rank_key(result: OptimizationResult, metric: str) -> tuple[bool, float]:
+    """Build a sort key where larger means better.
+
+    Completed runs always outrank pruned runs.
+
+    Args:
+        result: Optimization result
+        metric: Metric to rank by
+
+    Returns:
+        Tuple usable for max-ordering
+    """
+    value = result.get_metric(metric)
+    if metric in LOWER_IS_BETTER:
+        value = -value
+    return (not result.pruned, value)
+
+
+class ResultStore:
+    """Append-only results file with a bounded in-memory leaderboard.
+
+    Each completed run is written immediately as one JSON line holding its
+    parameters and scalar metrics. Only the best ``top_k`` runs keep their
+    full BacktestResult (trades and equity curve) in memory; on close they
+    are written to a ``.top.pkl`` sidecar next to the results file.
+
+    Example:
+        store = ResultStore("results/opt.jsonl", metric="sharpe_ratio", top_k=10)
+        await engine.optimize(data, grid, store=store)
+        report = OptimizationReport.from_file("results/opt.jsonl")
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        metric: str = "sharpe_ratio",
+        top_k: int = 10,
+    ):
+        """Initialize the store and truncate any existing results file.
+
+        Args:
+            path: Output path for the JSON Lines results file
+            metric: Metric used to rank the leaderboard
+            top_k: Number of full results kept in memory
+        """
+        self.path = Path(path)
+        self.metric = metric
+        self.top_k = top_k
+        self.count = 0
+        self.pruned_count = 0
+
+        # Min-heap of (rank_key, -run_index, result): the root is the worst kept run
+        self._heap: list[tuple[tuple[bool, float], int, OptimizationResult]] = []
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # Kept open for the whole run so each result is a single append
+        self._file = open(self.path, "w")  # noqa: SIM115
+
+    @property
+    def top_path(self) -> Path:
+        """Path of the sidecar holding full top-K results."""
+        return self.path.with_suffix(".top.pkl")
+
+    def add(self, result: OptimizationResult) -> None:
+        """Record a result.
+
+        Args:
+            result: Result of one optimization run
+        """
+        self._file.write(json.dumps(self._to_record(result)) + "\n")
+        self._file.flush()
+        self.count += 1
+        if result.pruned:
+            self.pruned_count += 1
+
+        if self.top_k <= 0:
+            return
+
+        item = (rank_key(result, self.metric), -result.run_index, result)
+        if len(self._heap) < self.top_k:
+            heapq.heappush(self._heap, item)
+        elif item[:2] > self._heap[0][:2]:
+            heapq.heapreplace(self._heap, item)
+
+    def leaderboard(self) -> list[OptimizationResult]:
+        """Get the current top-K results, best first."""
+        return [item[2] for item in sorted(self._heap, key=lambda i: i[:2], reverse=True)]
+
+    def close(self) -> None:
+        """Flush the results file and write the top-K sidecar."""
+        if self._file.closed:
+            return
+
+        self._file.close()
+        with open(self.top_path, "wb") as f:
+            pickle.dump(self.leaderboard(), f, protocol=pickle.HIGHEST_PROTOCOL)
+
+        logger.info(
+            "optimization_results_saved",
+            path=str(self.path),
+            runs=self.count,
+            pruned=self.pruned_count,
+            top_k=len(self._heap),
+        )
+
+    def __enter__(self) -> "ResultStore":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self.count
+
+    @staticmethod
+    def iter_file(path: str | Path) -> Iterator[OptimizationResult]:
+        """Stream results from a results file.
+
+        Runs stored in the top-K sidecar are yielded with their full trades
+        and equity curve; all others carry scalar metrics only.
+
+        Args:
+            path: Path to a JSON Lines results file
+
+        Yields:
+            OptimizationResult per recorded run, in run order
+        """
+        path = Path(path)
+        full: dict[int, OptimizationResult] = {}
+        top_path = path.with_suffix(".top.pkl")
+        if top_path.exists():
+            with open(top_path, "rb") as f:
+                full = {r.run_index: r for r in pickle.load(f)}
+
+        with open(path) as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                record = json.loads(line)
+                run_index = record["run_index"]
+                yield full.get(run_index) or ResultStore._from_record(record)
+
+    @staticmethod
+    def load(path: str | Path) -> list[OptimizationResult]:
+        """Load all results from a results file.
+
+        Args:
+            path: Path to a JSON Lines results file
+
+        Returns:
+            List of OptimizationResult in run order
+        """
+        return list(ResultStore.iter_file(path))
+
+    @staticmethod
+    def _to_record(result: OptimizationResult) -> dict[str, Any]:
+        return {
+            "run_index": result.run_index,
+            "run_time": result.run_time,
+            "parameters": result.parameters,
+            "metrics": {name: getattr(result.metrics, name) for name in _SCALAR_FIELDS},
+        }
+
+    @staticmethod
+    def _from_record(record: dict[str, Any]) -> OptimizationResult:
+        return OptimizationResult(
+            parameters=record["parameters"],
+            metrics=BacktestResult(**record["metrics"]),
+            run_time=record["run_time"],
+            run_index=record["run_index"],
+        )
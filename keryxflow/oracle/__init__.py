@@ -1,34 +1,66 @@
 """Oracle - Intelligence layer with technical analysis and LLM integration."""
 
-from keryxflow.oracle.brain import (
-    ActionRecommendation,
-    MarketBias,
-    MarketContext,
-    OracleBrain,
-    get_oracle_brain,
-)
-from keryxflow.oracle.feeds import (
-    NewsAggregator,
-    NewsDigest,
-    NewsItem,
-    NewsSentiment,
-    get_news_aggregator,
-)
-from keryxflow.oracle.signals import (
-    SignalGenerator,
-    SignalSource,
-    SignalType,
-    TradingSignal,
-    get_signal_generator,
-)
-from keryxflow.oracle.technical import (
-    IndicatorResult,
-    SignalStrength,
-    TechnicalAnalysis,
-    TechnicalAnalyzer,
-    TrendDirection,
-    get_technical_analyzer,
-)
+from typing import TYPE_CHECKING
+
+from keryxflow.core.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from keryxflow.oracle.brain import (
+        ActionRecommendation,
+        MarketBias,
+        MarketContext,
+        OracleBrain,
+        get_oracle_brain,
+    )
+    from keryxflow.oracle.feeds import (
+        NewsAggregator,
+        NewsDigest,
+        NewsItem,
+        NewsSentiment,
+        get_news_aggregator,
+    )
+    from keryxflow.oracle.signals import (
+        SignalGenerator,
+        SignalSource,
+        SignalType,
+        TradingSignal,
+        get_signal_generator,
+    )
+    from keryxflow.oracle.technical import (
+        IndicatorResult,
+        SignalStrength,
+        TechnicalAnalysis,
+        TechnicalAnalyzer,
+        TrendDirection,
+        get_technical_analyzer,
+    )
+
+# Public name -> defining submodule, imported on first access
+_LAZY_EXPORTS = {
+    "ActionRecommendation": "brain",
+    "MarketBias": "brain",
+    "MarketContext": "brain",
+    "OracleBrain": "brain",
+    "get_oracle_brain": "brain",
+    "NewsAggregator": "feeds",
+    "NewsDigest": "feeds",
+    "NewsItem": "feeds",
+    "NewsSentiment": "feeds",
+    "get_news_aggregator": "feeds",
+    "SignalGenerator": "signals",
+    "SignalSource": "signals",
+    "SignalType": "signals",
+    "TradingSignal": "signals",
+    "get_signal_generator": "signals",
+    "IndicatorResult": "technical",
+    "SignalStrength": "technical",
+    "TechnicalAnalysis": "technical",
+    "TechnicalAnalyzer": "technical",
+    "TrendDirection": "technical",
+    "get_technical_analyzer": "technical",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _LAZY_EXPORTS)
 
 __all__ = [
     # Technical
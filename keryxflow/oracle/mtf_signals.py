@@ -153,7 +153,7 @@ class MTFSignalGenerator(SignalGenerator):
 
         # Perform MTF analysis
         try:
-            mtf_analysis = self._mtf_analyzer.analyze(ohlcv_data, symbol)
+            mtf_analysis = await self._compute(self._mtf_analyzer.analyze, ohlcv_data, symbol)
         except Exception as e:
             logger.warning("mtf_analysis_failed", symbol=symbol, error=str(e))
             # Fallback to single-TF
@@ -1,5 +1,8 @@
 """Signal generator combining technical analysis and LLM insights."""
 
+import asyncio
+from collections.abc import Callable
+from concurrent.futures import Executor
 from dataclasses import dataclass
 from datetime import UTC, datetime
 from enum import Enum
@@ -137,6 +140,7 @@ class SignalGenerator:
         brain: OracleBrain | None = None,
         event_bus: EventBus | None = None,
         publish_events: bool = True,
+        executor: Executor | None = None,
     ):
         """Initialize the signal generator.
 
@@ -146,6 +150,8 @@ class SignalGenerator:
             brain: Custom LLM brain (optional)
             event_bus: Custom event bus (optional)
             publish_events: Whether to publish events (disable for backtesting)
+            executor: Pool for CPU-bound indicator work; runs on the event
+                loop when None (may also be assigned after construction)
         """
         self.settings = get_settings()
         self.technical = technical_analyzer or get_technical_analyzer()
@@ -153,6 +159,7 @@ class SignalGenerator:
         self.brain = brain or get_oracle_brain()
         self.event_bus = event_bus or get_event_bus()
         self._publish_events = publish_events
+        self.executor = executor
 
         # Signal history for deduplication
         self._last_signals: dict[str, TradingSignal] = {}
@@ -183,7 +190,7 @@ class SignalGenerator:
 
         # Step 1: Technical Analysis
         try:
-            technical = self.technical.analyze(ohlcv, symbol)
+            technical = await self._compute(self.technical.analyze, ohlcv, symbol)
         except ValueError as e:
             logger.warning("technical_analysis_failed", symbol=symbol, error=str(e))
             return self._no_action_signal(symbol, f"Technical analysis failed: {e}")
@@ -231,6 +238,12 @@ class SignalGenerator:
 
         return signal
 
+    async def _compute(self, func: Callable[..., Any], *args: Any) -> Any:
+        """Run CPU-bound analysis in ``executor``, or inline when there is none."""
+        if self.executor is None:
+            return func(*args)
+        return await asyncio.get_running_loop().run_in_executor(self.executor, func, *args)
+
     def _combine_signals(
         self,
         symbol: str,
@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 import asyncio
-from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
 
@@ -13,64 +12,50 @@ from fastapi.templating import Jinja2Templates
 
 from keryxflow.aegis.risk import get_risk_manager
 from keryxflow.agent.session import get_trading_session
-from keryxflow.core.repository import get_trade_repository
-from keryxflow.exchange.paper import get_paper_engine
+from keryxflow.api.read_model import BALANCE, POSITIONS, TODAY_TRADES, ReadModel
 
 router = APIRouter()
 
 templates = Jinja2Templates(directory=str(Path(__file__).parent / "templates"))
 
 
-async def _get_balance() -> dict[str, Any]:
-    try:
-        engine = get_paper_engine()
-        balance = await engine.get_balance()
-        total = balance.get("total", {})
-        return {"total": total.get("USDT", 0.0), "free": balance.get("free", {}).get("USDT", 0.0)}
-    except Exception:
-        return {"total": 0.0, "free": 0.0}
+async def _get_balance(read_model: ReadModel) -> dict[str, Any]:
+    balance = (await read_model.get(BALANCE)).data
+    return {
+        "total": balance.get("total", {}).get("USDT", 0.0),
+        "free": balance.get("free", {}).get("USDT", 0.0),
+    }
 
 
-async def _get_positions() -> list[dict[str, Any]]:
-    try:
-        engine = get_paper_engine()
-        positions = await engine.get_positions()
-        return [
-            {
-                "symbol": p.symbol,
-                "side": p.side,
-                "quantity": p.quantity,
-                "entry_price": p.entry_price,
-                "current_price": p.current_price,
-                "unrealized_pnl": p.unrealized_pnl,
-                "unrealized_pnl_pct": p.unrealized_pnl_percentage,
-            }
-            for p in positions
-        ]
-    except Exception:
-        return []
+async def _get_positions(read_model: ReadModel) -> list[dict[str, Any]]:
+    return [
+        {
+            "symbol": p["symbol"],
+            "side": p["side"],
+            "quantity": p["quantity"],
+            "entry_price": p["entry_price"],
+            "current_price": p["current_price"],
+            "unrealized_pnl": p["unrealized_pnl"],
+            "unrealized_pnl_pct": p["unrealized_pnl_percentage"],
+        }
+        for p in (await read_model.get(POSITIONS)).data
+    ]
 
 
-async def _get_recent_trades() -> list[dict[str, Any]]:
-    try:
-        repo = get_trade_repository()
-        today_start = datetime.now(tz=UTC).replace(hour=0, minute=0, second=0, microsecond=0)
-        trades = await repo.get_trades_by_date(start_date=today_start)
-        return [
-            {
-                "symbol": t.symbol,
-                "side": t.side,
-                "quantity": t.quantity,
-                "entry_price": t.entry_price,
-                "exit_price": t.exit_price,
-                "pnl": t.pnl,
-                "pnl_pct": t.pnl_percentage,
-                "status": t.status,
-            }
-            for t in trades
-        ]
-    except Exception:
-        return []
+async def _get_recent_trades(read_model: ReadModel) -> list[dict[str, Any]]:
+    return [
+        {
+            "symbol": t["symbol"],
+            "side": t["side"],
+            "quantity": t["quantity"],
+            "entry_price": t["entry_price"],
+            "exit_price": t["exit_price"],
+            "pnl": t["pnl"],
+            "pnl_pct": t["pnl_percentage"],
+            "status": t["status"],
+        }
+        for t in (await read_model.get(TODAY_TRADES)).data
+    ]
 
 
 def _get_risk_status() -> dict[str, Any]:
@@ -107,9 +92,10 @@ def _get_session_status() -> dict[str, Any]:
 
 @router.get("/dashboard", response_class=HTMLResponse)
 async def dashboard(request: Request) -> HTMLResponse:
-    """Render the main dashboard page."""
+    """Render the main dashboard page from the cached read model."""
+    read_model: ReadModel = request.app.state.read_model
     balance, positions, recent_trades = await asyncio.gather(
-        _get_balance(), _get_positions(), _get_recent_trades()
+        _get_balance(read_model), _get_positions(read_model), _get_recent_trades(read_model)
     )
     risk_status = _get_risk_status()
     session_status = _get_session_status()
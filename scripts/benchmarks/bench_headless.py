@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+"""Soak benchmark: headless daemon vs the Textual TUI.
+
+Runs the same engine stack (demo exchange, paper engine, technical-only
+signals analyzed on every price update) for a fixed time, once under
+``HeadlessRunner`` and once through ``KeryxFlowApp``'s price loop (with
+its every-third-poll Oracle refresh), and reports price ticks per second,
+signal generation latency and event-loop lag for each.
+
+Usage:
+    python scripts/benchmarks/bench_headless.py --symbols 20 --seconds 30
+"""
+
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+from pathlib import Path
+
+_tmp = tempfile.mkdtemp(prefix="keryxflow-bench-")
+os.environ["KERYXFLOW_DB_URL"] = f"sqlite+aiosqlite:///{Path(_tmp) / 'bench.db'}"
+os.environ["KERYXFLOW_MODE"] = "paper"
+
+from keryxflow.config import get_settings  # noqa: E402
+from keryxflow.core.daemon import HeadlessRunner, event_loop_factory  # noqa: E402
+from keryxflow.core.database import init_db  # noqa: E402
+from keryxflow.core.engine import TradingEngine  # noqa: E402
+from keryxflow.core.events import EventBus, EventType  # noqa: E402
+from keryxflow.exchange.demo import DemoExchangeClient  # noqa: E402
+from keryxflow.exchange.paper import PaperTradingEngine  # noqa: E402
+
+LAG_INTERVAL = 0.05
+
+
+class Probe:
+    """Counts price ticks, times signal generation and samples loop lag."""
+
+    def __init__(self, engine: TradingEngine, bus: EventBus):
+        self.ticks = 0
+        self.analysis: list[float] = []
+        self.lag: list[float] = []
+        bus.subscribe(EventType.PRICE_UPDATE, self._on_price)
+
+        generate = engine.signals.generate_signal
+
+        async def timed_generate(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return await generate(*args, **kwargs)
+            finally:
+                self.analysis.append(time.perf_counter() - start)
+
+        engine.signals.generate_signal = timed_generate
+
+    async def _on_price(self, _event) -> None:
+        self.ticks += 1
+
+    async def sample_lag(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            start = loop.time()
+            await asyncio.sleep(LAG_INTERVAL)
+            self.lag.append(max(0.0, loop.time() - start - LAG_INTERVAL))
+
+
+def pct(samples: list[float], q: float) -> float:
+    """Percentile of second-valued samples, in milliseconds."""
+    if not samples:
+        return float("nan")
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * q))] * 1000
+
+
+async def build_stack() -> tuple[TradingEngine, DemoExchangeClient, PaperTradingEngine, EventBus]:
+    """Create a fresh engine stack; analysis runs on every price update."""
+    await init_db()
+    bus = EventBus(max_queue_size=100_000)
+    exchange = DemoExchangeClient()
+    paper = PaperTradingEngine(initial_balance=10000.0)
+    await paper.initialize()
+    engine = TradingEngine(exchange_client=exchange, paper_engine=paper, event_bus=bus)
+    engine._analysis_interval = 0
+    engine._auto_trade = False
+    return engine, exchange, paper, bus
+
+
+async def soak_headless(seconds: float, interval: float) -> Probe:
+    """Run the stack under HeadlessRunner."""
+    engine, exchange, paper, bus = await build_stack()
+    probe = Probe(engine, bus)
+    runner = HeadlessRunner(
+        trading_engine=engine,
+        exchange_client=exchange,
+        event_bus=bus,
+        paper_engine=paper,
+        poll_interval=interval,
+        start_session=False,
+    )
+    lag_task = asyncio.create_task(probe.sample_lag())
+    await runner.run(duration=seconds)
+    lag_task.cancel()
+    return probe
+
+
+async def soak_tui(seconds: float) -> Probe:
+    """Run the stack through KeryxFlowApp's price loop.
+
+    The app is not mounted on a terminal: widget lookups return no-op stubs,
+    so rendering cost is excluded and the numbers are a lower bound for the TUI.
+    """
+    from unittest.mock import AsyncMock, MagicMock
+
+    from keryxflow.hermes.app import KeryxFlowApp
+
+    engine, exchange, paper, bus = await build_stack()
+    probe = Probe(engine, bus)
+    app = KeryxFlowApp(
+        event_bus=bus, exchange_client=exchange, paper_engine=paper, trading_engine=engine
+    )
+    app.query_one = lambda *_args, **_kwargs: MagicMock(refresh_data=AsyncMock())
+    # The same startup as KeryxFlowApp._initialize_after_splash, minus widgets
+    await bus.start()
+    await exchange.connect()
+    await engine.start()
+
+    lag_task = asyncio.create_task(probe.sample_lag())
+    loop_task = asyncio.create_task(app._price_loop())
+    await asyncio.sleep(seconds)
+    for task in (loop_task, lag_task):
+        task.cancel()
+    await asyncio.gather(loop_task, lag_task, return_exceptions=True)
+    await engine.stop()
+    await bus.stop()
+    return probe
+
+
+def report(label: str, probe: Probe, seconds: float) -> None:
+    """Print one result row."""
+    print(
+        f"  {label:<10} {probe.ticks / seconds:>10.1f} {len(probe.analysis):>9} "
+        f"{pct(probe.analysis, 0.5):>10.1f} {pct(probe.analysis, 0.95):>10.1f} "
+        f"{pct(probe.lag, 0.95):>10.1f} {pct(probe.lag, 1.0):>10.1f}"
+    )
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description="Soak test headless vs TUI engine modes")
+    parser.add_argument("--symbols", type=int, default=20, help="Symbols to poll")
+    parser.add_argument("--seconds", type=float, default=20.0, help="Duration of each run")
+    parser.add_argument(
+        "--interval",
+        type=float,
+        default=0.1,
+        help="Seconds between price polls (the TUI cannot go below 0.1)",
+    )
+    parser.add_argument("--workers", type=int, default=2, help="Engine analysis workers")
+    parser.add_argument("--no-uvloop", action="store_true", help="Use the default asyncio loop")
+    parser.add_argument("--skip-tui", action="store_true", help="Only run headless")
+    args = parser.parse_args()
+
+    settings = get_settings()
+    settings.system.symbols = [f"SYM{i}/USDT" for i in range(args.symbols)]
+    settings.system.ai_mode = "disabled"
+    settings.oracle.llm_enabled = False
+    settings.oracle.news_enabled = False
+    settings.api.enabled = False
+    settings.hermes.refresh_rate = max(0.1, args.interval)
+    settings.oracle.analysis_workers = args.workers
+
+    factory = event_loop_factory(not args.no_uvloop)
+    print(
+        f"{args.symbols} symbols, {args.seconds:.0f}s per run, poll every {args.interval}s, "
+        f"loop: {'uvloop' if factory else 'asyncio'}\n"
+    )
+    print(
+        f"  {'mode':<10} {'ticks/s':>10} {'analyses':>9} {'p50 ms':>10} {'p95 ms':>10} "
+        f"{'lag p95':>10} {'lag max':>10}"
+    )
+
+    headless = asyncio.run(soak_headless(args.seconds, args.interval), loop_factory=factory)
+    report("headless", headless, args.seconds)
+
+    if not args.skip_tui:
+        tui = asyncio.run(soak_tui(args.seconds))
+        report("tui", tui, args.seconds)
+
+    print("\n  p50/p95: signal generation latency; lag: event-loop wake-up delay")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""Benchmark AgentOrchestrator cycles with concurrent analyst stages.
+
+Runs one cycle over --symbols symbols with a stub Anthropic client that
+sleeps --latency seconds per request (in the worker thread the agents
+call it from). Every --every-nth symbol gets a long signal and goes
+through the risk and executor stages. The same cycle is run with
+analyst_concurrency=1, which analyzes symbols one after another like the
+previous sequential pipeline, and with --concurrency. Reports wall time
+and per-stage latency from get_stats().
+
+Usage:
+    python scripts/benchmarks/bench_orchestrator.py --symbols 20 --latency 0.5
+"""
+
+import argparse
+import asyncio
+import logging
+import re
+import time
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import structlog
+
+from keryxflow.agent.orchestrator import AgentOrchestrator
+from keryxflow.config import AgentSettings
+
+
+class StubClient:
+    """Synchronous client answering each agent role with a fixed reply."""
+
+    def __init__(self, latency: float, every_nth: int):
+        self.latency = latency
+        self.every_nth = every_nth
+        self.messages = SimpleNamespace(create=self.create)
+
+    def create(self, **kwargs):
+        prompt = kwargs["messages"][0]["content"]
+        match = re.search(r"for SYM(\d+)/USDT", prompt)
+        if prompt.startswith("Analyze"):
+            long = match and int(match.group(1)) % self.every_nth == 0
+            text = "Signal: LONG. Confidence: 0.8" if long else "Signal: HOLD"
+        elif prompt.startswith("Evaluate"):
+            text = "Decision: APPROVED. Risk score: 0.2"
+        else:
+            text = "Order placed."
+        time.sleep(self.latency)
+        return SimpleNamespace(
+            content=[SimpleNamespace(type="text", text=text)],
+            usage=SimpleNamespace(input_tokens=500, output_tokens=100),
+            stop_reason="end_turn",
+        )
+
+
+def make_orchestrator(concurrency: int, client: StubClient, symbols: list[str]):
+    """Orchestrator whose agents share the stub client."""
+    orchestrator = AgentOrchestrator(
+        toolkit=MagicMock(),
+        executor=MagicMock(),
+        memory=MagicMock(),
+        settings=AgentSettings(analyst_concurrency=concurrency, daily_token_budget=0),
+    )
+    orchestrator._build_context = AsyncMock(
+        return_value={"symbols": symbols, "market_data": {}, "memory_context": {}}
+    )
+    for agent in (orchestrator.analyst, orchestrator.risk_agent, orchestrator.executor_agent):
+        agent._client = client
+        agent._initialized = True
+    orchestrator._initialized = True
+    return orchestrator
+
+
+async def run(concurrency: int, args) -> tuple[float, dict]:
+    """Run one cycle and return wall time and stage stats."""
+    symbols = [f"SYM{i}/USDT" for i in range(args.symbols)]
+    client = StubClient(args.latency, args.every_nth)
+    orchestrator = make_orchestrator(concurrency, client, symbols)
+
+    start = time.perf_counter()
+    await orchestrator.run_cycle(symbols)
+    elapsed = time.perf_counter() - start
+    orchestrator.close()
+    return elapsed, orchestrator.get_stats()["stages"]
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description="Benchmark orchestrator cycles")
+    parser.add_argument("--symbols", type=int, default=20)
+    parser.add_argument("--latency", type=float, default=0.5, help="Seconds per request")
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--every-nth", type=int, default=5, help="Symbols with a long signal")
+    args = parser.parse_args()
+
+    structlog.configure(wrapper_class=structlog.make_filtering_bound_logger(logging.ERROR))
+    trades = len(range(0, args.symbols, args.every_nth))
+    print(
+        f"{args.symbols} symbols, {trades} proposing trades, "
+        f"{args.latency * 1000:.0f} ms per request\n"
+    )
+
+    for concurrency in (1, args.concurrency):
+        elapsed, stages = asyncio.run(run(concurrency, args))
+        print(
+            f"  concurrency {concurrency:>2}  cycle {elapsed:6.2f} s  "
+            f"analyst avg {stages['analyst']['avg_ms']:6.0f} ms  "
+            f"queue wait avg {stages['queue_wait']['avg_ms']:6.0f} ms  "
+            f"risk {stages['risk']['runs']:>2}  executor {stages['executor']['runs']:>2}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""Benchmark paper limit-order fill checks against resting order count.
+
+Part one rests N grid orders around the price and times the per-tick
+search for crossed orders: the old scan over every pending order against
+``LimitOrderBook.match()``. Filled orders are re-rested so N stays fixed.
+
+Part two books K crossed orders end to end through SQLite: one
+``execute_market_order`` transaction per order (the old path) against a
+single ``check_pending_orders()`` call that batches them into one
+``execute_fills`` transaction.
+
+Usage:
+    python scripts/benchmarks/bench_orderbook.py --orders 100 1000 10000 --fills 100
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import random
+import tempfile
+import time
+from pathlib import Path
+
+_tmp = tempfile.mkdtemp(prefix="keryxflow-bench-")
+os.environ["KERYXFLOW_DB_URL"] = f"sqlite+aiosqlite:///{Path(_tmp) / 'bench.db'}"
+os.environ["KERYXFLOW_MODE"] = "paper"
+
+import structlog  # noqa: E402
+
+from keryxflow.core.database import init_db  # noqa: E402
+from keryxflow.exchange.orderbook import LimitOrderBook  # noqa: E402
+from keryxflow.exchange.orders import Order, OrderManager, OrderStatus, OrderType  # noqa: E402
+from keryxflow.exchange.paper import get_paper_engine  # noqa: E402
+
+
+def grid(count: int, mid: float = 50000.0, step: float = 1.0) -> list[Order]:
+    """Buy levels below and sell levels above ``mid``."""
+    orders = []
+    for i in range(count):
+        side = "buy" if i % 2 else "sell"
+        offset = (i // 2 + 1) * step
+        orders.append(
+            Order(
+                id=f"o{i}",
+                symbol="BTC/USDT",
+                order_type=OrderType.LIMIT,
+                side=side,
+                amount=0.001,
+                price=mid - offset if side == "buy" else mid + offset,
+                status=OrderStatus.OPEN,
+                remaining=0.001,
+            )
+        )
+    return orders
+
+
+def linear_scan(pending: dict[str, Order], price: float) -> list[Order]:
+    """The previous check: visit every pending order."""
+    return [
+        order
+        for order in pending.values()
+        if (order.side == "buy" and price <= (order.price or 0))
+        or (order.side == "sell" and price >= (order.price or 0))
+    ]
+
+
+def bench_search(count: int, ticks: int) -> tuple[float, float]:
+    """Per-tick microseconds for the scan and the book."""
+    rng = random.Random(5)
+    prices = [50000.0 + rng.gauss(0, 3) for _ in range(ticks)]
+    orders = grid(count)
+    pending = {o.id: o for o in orders}
+
+    start = time.perf_counter()
+    for price in prices:
+        linear_scan(pending, price)
+    scan_us = (time.perf_counter() - start) / ticks * 1e6
+
+    book = LimitOrderBook("BTC/USDT")
+    for order in orders:
+        book.add(order)
+    start = time.perf_counter()
+    for price in prices:
+        for fill in book.match(price):
+            book.add(fill.order)
+    book_us = (time.perf_counter() - start) / ticks * 1e6
+    return scan_us, book_us
+
+
+async def bench_booking(fills: int) -> tuple[float, float]:
+    """Milliseconds to book ``fills`` crossed orders, per-order vs batched."""
+    await init_db()
+    engine = get_paper_engine()
+    await engine.initialize()
+    engine.update_price("BTC/USDT", 50000.0)
+
+    start = time.perf_counter()
+    for _ in range(fills):
+        await engine.execute_market_order("BTC/USDT", "buy", 0.0001, 49000.0)
+    per_order_ms = (time.perf_counter() - start) * 1e3
+
+    manager = OrderManager()
+    await manager.initialize()
+    for _ in range(fills):
+        await manager.place_limit_order("BTC/USDT", "buy", 0.0001, 49000.0)
+    engine.update_price("BTC/USDT", 48900.0)
+    start = time.perf_counter()
+    filled = await manager.check_pending_orders(symbols=["BTC/USDT"])
+    batched_ms = (time.perf_counter() - start) * 1e3
+    assert len(filled) == fills
+    return per_order_ms, batched_ms
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description="Benchmark paper limit-order fill checks")
+    parser.add_argument("--orders", type=int, nargs="+", default=[100, 1000, 10000])
+    parser.add_argument("--ticks", type=int, default=2000, help="Price ticks per measurement")
+    parser.add_argument("--fills", type=int, default=100, help="Crossed orders to book")
+    args = parser.parse_args()
+
+    structlog.configure(wrapper_class=structlog.make_filtering_bound_logger(logging.WARNING))
+
+    print("Fill check per tick (crossed-order search)")
+    print(f"{'resting':>10} {'linear scan':>14} {'order book':>14}")
+    for count in args.orders:
+        scan_us, book_us = bench_search(count, args.ticks)
+        print(f"{count:>10} {scan_us:>11.1f} us {book_us:>11.1f} us")
+
+    per_order_ms, batched_ms = asyncio.run(bench_booking(args.fills))
+    print(f"\nBooking {args.fills} fills")
+    print(f"  one transaction per order   {per_order_ms:>8.1f} ms")
+    print(f"  one batched transaction     {batched_ms:>8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""Benchmark per-tick PortfolioState updates.
+
+Opens N positions (one per symbol) and times the work the engine does on
+every price tick: marking one symbol, marking every symbol, reading the
+exposure and risk ratios reported by ``RiskManager.get_status()``, and
+taking the guardrail snapshot used for an order decision. ``get_status()``
+reads the float64 ``metrics()``; the Decimal properties are the exact
+path.
+
+Usage:
+    python scripts/benchmarks/bench_portfolio.py --positions 200
+"""
+
+import argparse
+import logging
+import random
+import time
+from decimal import Decimal
+
+import structlog
+
+from keryxflow.aegis.guardrails import GuardrailEnforcer
+from keryxflow.aegis.portfolio import PortfolioState, PositionState, create_portfolio_state
+
+
+def build_portfolio(positions: int) -> PortfolioState:
+    """A portfolio with one long position per symbol, half of them stopped."""
+    portfolio = create_portfolio_state(10_000_000.0)
+    rng = random.Random(7)
+    for i in range(positions):
+        price = Decimal(str(round(rng.uniform(1, 1000), 2)))
+        portfolio.add_position(
+            PositionState(
+                symbol=f"SYM{i}/USDT",
+                side="long" if i % 3 else "short",
+                quantity=Decimal("1.5"),
+                entry_price=price,
+                current_price=price,
+                stop_loss=price * Decimal("0.95") if i % 2 else None,
+            )
+        )
+    return portfolio
+
+
+def per_call_us(func, iterations: int) -> float:
+    """Average wall time of func() in microseconds."""
+    start = time.perf_counter()
+    for _ in range(iterations):
+        func()
+    return (time.perf_counter() - start) / iterations * 1e6
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description="Benchmark per-tick portfolio updates")
+    parser.add_argument("--positions", type=int, default=200, help="Open positions")
+    parser.add_argument("--iterations", type=int, default=2000, help="Calls per measurement")
+    args = parser.parse_args()
+
+    structlog.configure(wrapper_class=structlog.make_filtering_bound_logger(logging.WARNING))
+    portfolio = build_portfolio(args.positions)
+    enforcer = GuardrailEnforcer()
+    rng = random.Random(11)
+    symbols = [p.symbol for p in portfolio.positions]
+    ticks = [(rng.choice(symbols), rng.uniform(1, 1000)) for _ in range(args.iterations)]
+    all_prices = {s: rng.uniform(1, 1000) for s in symbols}
+    tick_iter = iter(ticks * 2)
+
+    def one_symbol() -> None:
+        symbol, price = next(tick_iter)
+        portfolio.update_prices({symbol: price})
+
+    def status_ratios() -> None:
+        float(portfolio.exposure_pct)
+        float(portfolio.risk_at_stop_pct)
+        float(portfolio.cash_reserve_pct)
+
+    rows = [
+        ("tick: update one symbol", per_call_us(one_symbol, args.iterations)),
+        (
+            f"tick: update all {args.positions} symbols",
+            per_call_us(lambda: portfolio.update_prices(all_prices), args.iterations // 10),
+        ),
+        ("status: metrics() (float64)", per_call_us(portfolio.metrics, args.iterations)),
+        ("status: Decimal ratio properties", per_call_us(status_ratios, args.iterations)),
+        ("decision: guardrail snapshot", per_call_us(lambda: enforcer.snapshot(portfolio), 200)),
+    ]
+
+    print(f"{args.positions} open positions\n")
+    for label, us in rows:
+        print(f"  {label:<38} {us:>10.1f} us")
+
+
+if __name__ == "__main__":
+    main()
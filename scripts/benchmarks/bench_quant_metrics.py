@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""Benchmark vectorized equity-curve metrics.
+
+Compares the vectorized drawdown summary against the previous
+per-period Python loop, and times the rolling metrics.
+
+Usage:
+    python scripts/benchmarks/bench_quant_metrics.py --points 10000000
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from keryxflow.aegis.metrics import (
+    rolling_calmar,
+    rolling_sharpe,
+    rolling_sortino,
+    simple_returns,
+    summarize_drawdown,
+    underwater_curve,
+)
+
+
+def loop_drawdown_duration(equity: np.ndarray) -> int:
+    """Reference implementation: the former per-period duration loop."""
+    peak = np.maximum.accumulate(equity)
+    duration = 0
+    max_duration = 0
+    for is_dd in equity < peak:
+        if is_dd:
+            duration += 1
+            max_duration = max(max_duration, duration)
+        else:
+            duration = 0
+    return max_duration
+
+
+def timed(label: str, func, *args):
+    """Run func once and print its wall time."""
+    start = time.perf_counter()
+    result = func(*args)
+    elapsed = time.perf_counter() - start
+    print(f"  {label:<32} {elapsed * 1000:>10.1f} ms")
+    return result
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description="Benchmark equity-curve metrics")
+    parser.add_argument("--points", type=int, default=10_000_000, help="Equity curve length")
+    parser.add_argument("--window", type=int, default=252, help="Rolling window")
+    parser.add_argument(
+        "--calmar-points", type=int, default=1_000_000, help="Rolling Calmar length"
+    )
+    parser.add_argument("--skip-loop", action="store_true", help="Skip the Python loop baseline")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(42)
+    equity = 10_000 * np.cumprod(1 + rng.normal(0.0001, 0.01, args.points))
+
+    print(f"Equity curve: {args.points:,} points, window {args.window}")
+    returns = timed("simple_returns", simple_returns, equity)
+    stats = timed("summarize_drawdown (vectorized)", summarize_drawdown, equity)
+    if not args.skip_loop:
+        duration = timed("drawdown duration (Python loop)", loop_drawdown_duration, equity)
+        assert duration == stats.max_duration, "duration mismatch"
+    timed("underwater_curve", underwater_curve, equity)
+    timed("rolling_sharpe", rolling_sharpe, returns, args.window)
+    timed("rolling_sortino", rolling_sortino, returns, args.window)
+    calmar_equity = equity[: args.calmar_points]
+    timed(f"rolling_calmar ({len(calmar_equity):,} points)", rolling_calmar, calmar_equity, 60)
+
+    print(
+        f"\nmax drawdown {stats.max_drawdown:.2%}, "
+        f"longest drawdown {stats.max_duration:,} periods"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+"""Benchmark exchange request pacing against a local mock exchange.
+
+The mock enforces a weight budget per sliding one-second window and
+answers ``RateLimitExceeded`` (HTTP 429) past it. Four callers hit it at
+once, the way the price feed, agent tools, OHLCV backfill and order flow
+share one exchange:
+
+- price feed and agent tools: the same tickers, concurrently
+- backfill: historical OHLCV pages
+- order flow: orders and a balance check
+
+"uncoordinated" gives each caller its own unit-cost pacer (what separate
+ccxt instances did); "shared scheduler" sends everything through one
+``RequestScheduler`` with endpoint weights, priorities and coalescing.
+Rate-limited calls retry with exponential backoff, like the adapters.
+
+Usage:
+    python scripts/benchmarks/bench_ratelimit.py --limit 40 --rounds 10
+"""
+
+import argparse
+import asyncio
+import collections
+import logging
+import time
+
+import ccxt.async_support as ccxt
+import structlog
+
+from keryxflow.exchange.ratelimit import (
+    ENDPOINT_COSTS,
+    ENDPOINT_PRIORITIES,
+    RequestPriority,
+    RequestScheduler,
+)
+
+SYMBOLS = ["BTC/USDT", "ETH/USDT", "SOL/USDT", "XRP/USDT", "BNB/USDT"]
+
+
+class MockExchange:
+    """Weight-limited exchange with a fixed response latency."""
+
+    def __init__(self, limit: float, latency: float = 0.005):
+        self.limit = limit
+        self.latency = latency
+        self.window: collections.deque[tuple[float, float]] = collections.deque()
+        self.used = 0.0
+        self.rejected = 0
+        self.served = 0
+
+    async def call(self, method: str) -> str:
+        """Serve one request or reject it when the window is full."""
+        now = time.monotonic()
+        while self.window and now - self.window[0][0] >= 1.0:
+            self.used -= self.window.popleft()[1]
+        cost = ENDPOINT_COSTS.get(method, 1.0)
+        if self.used + cost > self.limit:
+            self.rejected += 1
+            raise ccxt.RateLimitExceeded("429 Too Many Requests")
+        self.window.append((now, cost))
+        self.used += cost
+        self.served += 1
+        await asyncio.sleep(self.latency)
+        return method
+
+
+async def with_retry(func, attempts: int = 6):
+    """Retry 429s with exponential backoff."""
+    for attempt in range(attempts):
+        try:
+            return await func()
+        except ccxt.RateLimitExceeded:
+            if attempt == attempts - 1:
+                raise
+            await asyncio.sleep(0.05 * 2**attempt)
+
+
+async def run(mode: str, limit: float, rounds: int) -> dict:
+    """Drive the workload and collect latencies per request class."""
+    exchange = MockExchange(limit)
+    shared = RequestScheduler("mock", rate=limit * 0.75, capacity=limit * 0.25)
+    latencies: dict[str, list[float]] = collections.defaultdict(list)
+    failures = 0
+
+    def caller_scheduler() -> RequestScheduler:
+        if mode == "shared":
+            return shared
+        return RequestScheduler("mock", rate=limit * 0.75, capacity=limit * 0.25)
+
+    async def request(scheduler: RequestScheduler, method: str, key=None) -> None:
+        nonlocal failures
+        start = time.monotonic()
+        if mode == "shared":
+            cost = ENDPOINT_COSTS.get(method, 1.0)
+            priority = ENDPOINT_PRIORITIES.get(method, RequestPriority.TICKER)
+        else:
+            cost, priority, key = 1.0, RequestPriority.TICKER, None
+        try:
+            await with_retry(
+                lambda: scheduler.submit(
+                    lambda: exchange.call(method), cost=cost, priority=priority, key=key
+                )
+            )
+        except ccxt.RateLimitExceeded:
+            failures += 1
+        kind = ENDPOINT_PRIORITIES.get(method, RequestPriority.TICKER).name.lower()
+        latencies[kind].append(time.monotonic() - start)
+
+    async def ticker_caller() -> None:
+        scheduler = caller_scheduler()
+        for _ in range(rounds):
+            await asyncio.gather(
+                *(request(scheduler, "fetch_ticker", ("fetch_ticker", s)) for s in SYMBOLS)
+            )
+            await asyncio.sleep(0.1)
+
+    async def backfill() -> None:
+        scheduler = caller_scheduler()
+        for page in range(rounds * 2):
+            await request(scheduler, "fetch_ohlcv", ("fetch_ohlcv", page))
+
+    async def order_flow() -> None:
+        scheduler = caller_scheduler()
+        for _ in range(rounds):
+            await request(scheduler, "fetch_balance", ("fetch_balance",))
+            await request(scheduler, "create_market_order")
+            await asyncio.sleep(0.1)
+
+    start = time.monotonic()
+    await asyncio.gather(ticker_caller(), ticker_caller(), backfill(), order_flow())
+    return {
+        "wall_s": time.monotonic() - start,
+        "served": exchange.served,
+        "rejected": exchange.rejected,
+        "failed": failures,
+        "latencies": latencies,
+    }
+
+
+def percentile(values: list[float], pct: float) -> float:
+    """Nearest-rank percentile in milliseconds."""
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index] * 1000
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description="Benchmark exchange request pacing")
+    parser.add_argument("--limit", type=float, default=40.0, help="Weight allowed per second")
+    parser.add_argument("--rounds", type=int, default=10, help="Workload rounds per caller")
+    args = parser.parse_args()
+
+    structlog.configure(wrapper_class=structlog.make_filtering_bound_logger(logging.ERROR))
+
+    for mode, label in (("uncoordinated", "uncoordinated"), ("shared", "shared scheduler")):
+        result = asyncio.run(run(mode, args.limit, args.rounds))
+        print(f"\n{label}")
+        print(
+            f"  wall {result['wall_s']:.2f} s, sent {result['served']}, "
+            f"429s {result['rejected']}, gave up {result['failed']}"
+        )
+        for kind in ("order", "balance", "ticker", "history"):
+            values = result["latencies"].get(kind)
+            if values:
+                print(
+                    f"  {kind:>8}  p50 {percentile(values, 50):>8.1f} ms"
+                    f"  p99 {percentile(values, 99):>8.1f} ms"
+                )
+
+
+if __name__ == "__main__":
+    main()
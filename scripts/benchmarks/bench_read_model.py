@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""Load test for the cached REST read model.
+
+Simulates monitoring clients polling /api/positions, /api/trades and
+/api/balance concurrently, first with the event-maintained read model and
+then with caching disabled (every request hits SQLite), and reports
+requests per second for each.
+
+Usage:
+    python scripts/benchmarks/bench_read_model.py --clients 20 --seconds 5
+"""
+
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+from pathlib import Path
+
+_tmp = tempfile.mkdtemp(prefix="keryxflow-bench-")
+os.environ["KERYXFLOW_DB_URL"] = f"sqlite+aiosqlite:///{Path(_tmp) / 'bench.db'}"
+
+from httpx import ASGITransport, AsyncClient  # noqa: E402
+
+from keryxflow.api.read_model import ReadModel  # noqa: E402
+from keryxflow.api.server import create_app  # noqa: E402
+from keryxflow.core.database import init_db  # noqa: E402
+from keryxflow.exchange.paper import get_paper_engine  # noqa: E402
+
+ENDPOINTS = ("/api/positions", "/api/trades", "/api/balance")
+
+
+async def seed(positions: int) -> None:
+    """Create open paper positions to serve."""
+    await init_db()
+    engine = get_paper_engine()
+    await engine.initialize()
+    for i in range(positions):
+        await engine.open_position(f"SYM{i}/USDT", "buy", 0.01, 100.0 + i)
+
+
+async def poll(client: AsyncClient, deadline: float, use_etag: bool) -> tuple[int, int]:
+    """Poll every endpoint until the deadline.
+
+    Returns:
+        Tuple of (requests, not_modified)
+    """
+    etags: dict[str, str] = {}
+    requests = not_modified = 0
+    while time.perf_counter() < deadline:
+        for path in ENDPOINTS:
+            headers = {"If-None-Match": etags[path]} if use_etag and path in etags else {}
+            resp = await client.get(path, headers=headers)
+            requests += 1
+            if resp.status_code == 304:
+                not_modified += 1
+            elif "etag" in resp.headers:
+                etags[path] = resp.headers["etag"]
+    return requests, not_modified
+
+
+async def run(label: str, read_model: ReadModel, clients: int, seconds: float, etag: bool) -> None:
+    """Run one load scenario and print its throughput."""
+    app = create_app()
+    app.state.read_model = read_model
+    transport = ASGITransport(app=app)
+
+    async with AsyncClient(transport=transport, base_url="http://bench") as client:
+        deadline = time.perf_counter() + seconds
+        start = time.perf_counter()
+        results = await asyncio.gather(*(poll(client, deadline, etag) for _ in range(clients)))
+        elapsed = time.perf_counter() - start
+
+    total = sum(r for r, _ in results)
+    cached_304 = sum(n for _, n in results)
+    print(
+        f"  {label:<28} {total / elapsed:>10,.0f} req/s  "
+        f"({total:,} requests, {cached_304:,} x 304, {read_model.loads:,} DB loads)"
+    )
+
+
+async def main() -> None:
+    """Run the load test."""
+    parser = argparse.ArgumentParser(description="Load test the cached read model")
+    parser.add_argument("--clients", type=int, default=20, help="Concurrent pollers")
+    parser.add_argument("--seconds", type=float, default=5.0, help="Duration per scenario")
+    parser.add_argument("--positions", type=int, default=10, help="Open positions to serve")
+    args = parser.parse_args()
+
+    await seed(args.positions)
+    print(f"{args.clients} clients polling {len(ENDPOINTS)} endpoints for {args.seconds:.0f}s each")
+
+    await run("uncached (DB per request)", ReadModel(max_age=0), args.clients, args.seconds, False)
+    await run("read model", ReadModel(), args.clients, args.seconds, False)
+    await run("read model + If-None-Match", ReadModel(), args.clients, args.seconds, True)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""Benchmark batched post-mortems against one LLM request per episode.
+
+Runs ReflectionEngine over --episodes closed trades with a stub client
+that sleeps --latency seconds plus --per-token seconds per output token
+and counts prompt tokens as characters / 4. The baseline calls
+post_mortem() once per episode; the batched variant queues every episode
+and calls flush_post_mortems(). Reports LLM requests, estimated tokens
+and wall time.
+
+Usage:
+    python scripts/benchmarks/bench_reflection.py --episodes 200 --batch-size 20
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import re
+import time
+from datetime import UTC, datetime, timedelta
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import structlog
+
+from keryxflow.agent.reflection import ReflectionEngine
+from keryxflow.core.models import TradeEpisode, TradeOutcome
+
+T0 = datetime(2024, 1, 1, tzinfo=UTC)
+
+
+def make_episodes(count: int) -> dict[int, TradeEpisode]:
+    """Closed episodes alternating wins and losses."""
+    episodes = {}
+    for i in range(1, count + 1):
+        pnl = 1.5 if i % 2 else -0.8
+        entry = T0 + timedelta(minutes=i)
+        episodes[i] = TradeEpisode(
+            id=i,
+            trade_id=i,
+            symbol="BTC/USDT",
+            entry_timestamp=entry,
+            entry_price=100.0,
+            entry_reasoning="RSI oversold bounce with rising volume",
+            entry_confidence=0.7,
+            technical_context=json.dumps({"rsi": 28.5, "macd": -0.4, "trend": "down"}),
+            exit_timestamp=entry + timedelta(hours=2),
+            exit_price=100.0 + pnl,
+            exit_reasoning="Target reached" if pnl > 0 else "Stop loss",
+            outcome=TradeOutcome.WIN if pnl > 0 else TradeOutcome.LOSS,
+            pnl=pnl * 10,
+            pnl_percentage=pnl,
+        )
+    return episodes
+
+
+class StubClient:
+    """Synchronous client with request latency and a token estimate."""
+
+    def __init__(self, latency: float, per_token: float):
+        self.latency = latency
+        self.per_token = per_token
+        self.requests = 0
+        self.messages = SimpleNamespace(create=self.create)
+
+    def create(self, **kwargs):
+        prompt = kwargs["messages"][0]["content"]
+        self.requests += 1
+        ids = [int(i) for i in re.findall(r"^Trade (\d+):", prompt, re.MULTILINE)]
+        if ids:
+            text = json.dumps(
+                [
+                    {
+                        "episode_id": i,
+                        "lessons_learned": "Wait for confirmation before entering.",
+                        "what_went_well": "Risk was sized correctly.",
+                        "what_went_wrong": "Entry came before the reversal.",
+                        "would_take_again": i % 2 == 1,
+                    }
+                    for i in ids
+                ]
+            )
+        else:
+            text = (
+                "Lessons Learned: Wait for confirmation before entering.\n"
+                "What Went Well: Risk was sized correctly.\n"
+                "What Went Wrong: Entry came before the reversal.\n"
+                "Would Take Again: No"
+            )
+        output_tokens = len(text) // 4
+        time.sleep(self.latency + output_tokens * self.per_token)
+        return SimpleNamespace(
+            content=[SimpleNamespace(type="text", text=text)],
+            usage=SimpleNamespace(input_tokens=len(prompt) // 4, output_tokens=output_tokens),
+        )
+
+
+def make_engine(episodes: dict[int, TradeEpisode], client: StubClient, batch_size: int):
+    """Reflection engine over in-memory episodes."""
+    episodic = MagicMock()
+    episodic.get_episode = AsyncMock(side_effect=lambda i: episodes.get(i))
+    episodic.record_lessons = AsyncMock()
+    engine = ReflectionEngine(
+        episodic_memory=episodic,
+        semantic_memory=MagicMock(),
+        batch_size=batch_size,
+        max_pending=len(episodes),
+    )
+    engine._initialized = True
+    engine._client = client
+    return engine
+
+
+async def run_single(episodes, client, batch_size) -> ReflectionEngine:
+    """Baseline: one post_mortem() call per episode."""
+    engine = make_engine(episodes, client, batch_size)
+    for episode_id in episodes:
+        await engine.post_mortem(episode_id)
+    return engine
+
+
+async def run_batched(episodes, client, batch_size) -> ReflectionEngine:
+    """Queue every episode and flush once."""
+    engine = make_engine(episodes, client, batch_size)
+    for episode_id in episodes:
+        engine.enqueue_post_mortem(episode_id)
+    await engine.flush_post_mortems()
+    return engine
+
+
+def measure(label: str, runner, episodes, args) -> None:
+    """Run one variant and print its numbers."""
+    client = StubClient(args.latency, args.per_token)
+    start = time.perf_counter()
+    engine = asyncio.run(runner(episodes, client, args.batch_size))
+    elapsed = time.perf_counter() - start
+    stats = engine.get_stats()
+    print(
+        f"  {label:<8} requests {client.requests:>5}  tokens {stats['total_tokens_used']:>8}  "
+        f"post-mortems {stats['total_post_mortems']:>5}  "
+        f"fallback {stats['fallback_post_mortems']:>4}  time {elapsed:6.2f} s"
+    )
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description="Benchmark batched post-mortems")
+    parser.add_argument("--episodes", type=int, default=200)
+    parser.add_argument("--batch-size", type=int, default=20)
+    parser.add_argument("--latency", type=float, default=0.05, help="Seconds per request")
+    parser.add_argument("--per-token", type=float, default=0.0001, help="Seconds per output token")
+    args = parser.parse_args()
+
+    structlog.configure(wrapper_class=structlog.make_filtering_bound_logger(logging.ERROR))
+    episodes = make_episodes(args.episodes)
+
+    print(
+        f"{args.episodes} closed episodes, batch size {args.batch_size}, "
+        f"{args.latency * 1000:.0f} ms per request\n"
+    )
+    measure("single", run_single, episodes, args)
+    measure("batched", run_batched, episodes, args)
+
+
+if __name__ == "__main__":
+    main()
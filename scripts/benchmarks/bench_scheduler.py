@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""Benchmark TaskScheduler timing against fixed-interval polling.
+
+Schedules N interval tasks with periods spread between --min-period and
+--max-period seconds, plus one slow task that runs for --slow seconds on
+the same period, and lets the scheduler run for --duration seconds.
+The baseline is the previous design: wake every --poll seconds, scan
+all tasks and await each due callback inline. Reports runs, drift
+(start delay behind schedule), loop wakeups and process CPU time.
+
+Usage:
+    python scripts/benchmarks/bench_scheduler.py --tasks 50 --duration 10 --poll 1
+"""
+
+import argparse
+import asyncio
+import logging
+import random
+import time
+from datetime import UTC, datetime, timedelta
+
+import structlog
+
+from keryxflow.agent.scheduler import TaskFrequency, TaskScheduler
+
+
+def make_callback(delay: float):
+    """Callback that takes ``delay`` seconds."""
+
+    async def callback():
+        if delay:
+            await asyncio.sleep(delay)
+
+    return callback
+
+
+async def run_polling(periods: list[float], slow: float, duration: float, poll: float) -> dict:
+    """Baseline: scan every poll interval and await due callbacks inline."""
+    now = datetime.now(UTC)
+    next_runs = [now + timedelta(seconds=p) for p in periods]
+    callbacks = [make_callback(slow if i == 0 else 0.0) for i in range(len(periods))]
+    drifts: list[float] = []
+    wakeups = runs = 0
+
+    end = time.monotonic() + duration
+    while time.monotonic() < end:
+        for i, period in enumerate(periods):
+            now = datetime.now(UTC)
+            if now >= next_runs[i]:
+                drifts.append((now - next_runs[i]).total_seconds() * 1000)
+                await callbacks[i]()
+                runs += 1
+                next_runs[i] = datetime.now(UTC) + timedelta(seconds=period)
+        await asyncio.sleep(poll)
+        wakeups += 1
+
+    return {
+        "runs": runs,
+        "wakeups": wakeups,
+        "avg_drift_ms": sum(drifts) / len(drifts) if drifts else 0.0,
+        "max_drift_ms": max(drifts, default=0.0),
+    }
+
+
+async def run_heap(periods: list[float], slow: float, duration: float) -> dict:
+    """TaskScheduler: sleep until the earliest deadline, run due tasks concurrently."""
+    scheduler = TaskScheduler(check_interval_seconds=60)
+    for i, period in enumerate(periods):
+        scheduler.add_task(
+            id=f"task{i}",
+            name=f"Task {i}",
+            frequency=TaskFrequency.INTERVAL,
+            callback=make_callback(slow if i == 0 else 0.0),
+            interval_seconds=period,
+        )
+    await scheduler.start()
+    await asyncio.sleep(duration)
+    await scheduler.stop()
+
+    stats = scheduler.get_stats()
+    return {
+        "runs": stats["tasks_executed"],
+        "wakeups": stats["wakeups"],
+        "avg_drift_ms": stats["avg_drift_ms"],
+        "max_drift_ms": stats["max_drift_ms"],
+        "skipped": stats["tasks_skipped"],
+    }
+
+
+def measure(label: str, coro) -> None:
+    """Run one variant and print its numbers."""
+    cpu = time.process_time()
+    result = asyncio.run(coro)
+    cpu = time.process_time() - cpu
+    skipped = f"  skipped {result['skipped']}" if "skipped" in result else ""
+    print(
+        f"  {label:<8} runs {result['runs']:>6}  wakeups {result['wakeups']:>6}  "
+        f"drift avg {result['avg_drift_ms']:>7.1f} ms  max {result['max_drift_ms']:>7.1f} ms  "
+        f"cpu {cpu:.2f} s{skipped}"
+    )
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description="Benchmark TaskScheduler")
+    parser.add_argument("--tasks", type=int, default=50)
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--min-period", type=float, default=0.5)
+    parser.add_argument("--max-period", type=float, default=5.0)
+    parser.add_argument("--slow", type=float, default=2.0, help="Runtime of the slow task")
+    parser.add_argument("--poll", type=float, default=1.0, help="Baseline check interval")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    structlog.configure(wrapper_class=structlog.make_filtering_bound_logger(logging.ERROR))
+    rng = random.Random(args.seed)
+    periods = [rng.uniform(args.min_period, args.max_period) for _ in range(args.tasks)]
+
+    print(
+        f"{args.tasks} interval tasks ({args.min_period}-{args.max_period} s), "
+        f"one taking {args.slow} s, {args.duration} s run\n"
+    )
+    measure("polling", run_polling(periods, args.slow, args.duration, args.poll))
+    measure("heap", run_heap(periods, args.slow, args.duration))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""Benchmark stop evaluation across many open positions.
+
+Tracks N positions with trailing stops and fixed stop-loss/take-profit
+levels, then times one tick that moves every symbol: the per-symbol
+``update_price``/``should_trigger_stop`` loop against a single
+``StopBook.evaluate()`` over the whole batch (scalar below 32 symbols,
+one numpy pass above). Prices stay inside the stops so nothing is removed
+between iterations.
+
+Usage:
+    python scripts/benchmarks/bench_stops.py --positions 10 100 1000
+"""
+
+import argparse
+import logging
+import random
+import time
+
+import structlog
+
+from keryxflow.aegis.stops import StopBook
+from keryxflow.aegis.trailing import TrailingStopManager
+
+
+def per_call_us(func, iterations: int) -> float:
+    """Average wall time of func() in microseconds."""
+    start = time.perf_counter()
+    for _ in range(iterations):
+        func()
+    return (time.perf_counter() - start) / iterations * 1e6
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description="Benchmark batch stop evaluation")
+    parser.add_argument("--positions", type=int, nargs="+", default=[10, 100, 1000])
+    parser.add_argument("--iterations", type=int, default=500, help="Ticks per measurement")
+    args = parser.parse_args()
+
+    structlog.configure(wrapper_class=structlog.make_filtering_bound_logger(logging.WARNING))
+    rng = random.Random(7)
+
+    print(f"{'positions':>10} {'per-symbol loop':>18} {'batch evaluate':>16}")
+    for count in args.positions:
+        manager = TrailingStopManager()
+        book = StopBook()
+        prices = {}
+        for i in range(count):
+            symbol = f"SYM{i}/USDT"
+            side = "buy" if i % 2 else "sell"
+            entry = rng.uniform(10, 1000)
+            sign = 1 if side == "buy" else -1
+            manager.start_tracking(symbol, side, entry, trail_pct=0.5, activation_pct=0.01)
+            book.track(
+                symbol,
+                side,
+                entry,
+                trail_pct=0.5,
+                activation_pct=0.01,
+                stop_loss=entry * (1 - sign * 0.5),
+                take_profit=entry * (1 + sign * 0.5),
+            )
+            prices[symbol] = entry * (1 + sign * 0.02)
+
+        def per_symbol(manager=manager, prices=prices) -> None:
+            for symbol, price in prices.items():
+                manager.update_price(symbol, price)
+                manager.should_trigger_stop(symbol, price)
+
+        loop_us = per_call_us(per_symbol, max(1, args.iterations // 10))
+        batch_us = per_call_us(
+            lambda book=book, prices=prices: book.evaluate(prices), args.iterations
+        )
+        print(f"{count:>10} {loop_us:>15.1f} us {batch_us:>13.1f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""Benchmark engine startup preload: cold fetch against snapshot warm start.
+
+Preloads S symbols x 4 timeframes through ``TradingEngine._preload_ohlcv``
+against a mock exchange that answers each OHLCV request after a fixed
+latency. The cold start has no snapshot and fetches 60 candles per series;
+the warm start restores the snapshot written by the cold engine and only
+fetches the candles since it. ``--downtime`` ages the snapshot to model a
+restart after an outage.
+
+Usage:
+    python scripts/benchmarks/bench_warm_start.py --symbols 100 --latency 0.2 --downtime 30
+"""
+
+import argparse
+import asyncio
+import logging
+import tempfile
+import time
+from pathlib import Path
+
+import structlog
+
+from keryxflow.config import get_settings
+from keryxflow.core.engine import TradingEngine
+from keryxflow.core.events import EventBus
+from keryxflow.core.mtf_buffer import timeframe_to_seconds
+from keryxflow.core.snapshot import OHLCVSnapshotStore
+
+TIMEFRAMES = ["15m", "1h", "4h", "1d"]
+
+
+class MockExchange:
+    """Serves synthetic candles ending at the current interval."""
+
+    def __init__(self, latency: float):
+        self.latency = latency
+        self.requests = 0
+        self.candles = 0
+
+    async def get_ohlcv(self, symbol, timeframe="1h", limit=100, since=None):  # noqa: ARG002
+        """Return up to ``limit`` candles, from ``since`` when given."""
+        self.requests += 1
+        await asyncio.sleep(self.latency)
+        step = timeframe_to_seconds(timeframe) * 1000
+        last = int(time.time() * 1000) // step * step
+        first = (
+            last - (limit - 1) * step if since is None else max(since, last - (limit - 1) * step)
+        )
+        rows = [[float(ts), 100.0, 101.0, 99.0, 100.0, 1.0] for ts in range(first, last + 1, step)]
+        self.candles += len(rows)
+        return rows
+
+
+async def preload(latency: float) -> tuple[float, MockExchange, TradingEngine]:
+    """Run one engine preload and time it."""
+    exchange = MockExchange(latency)
+    engine = TradingEngine(exchange_client=exchange, paper_engine=None, event_bus=EventBus())
+    start = time.perf_counter()
+    await engine._preload_ohlcv()
+    elapsed = time.perf_counter() - start
+    engine._buffers_ready = True
+    return elapsed, exchange, engine
+
+
+def age_snapshot(path: str, minutes: float) -> None:
+    """Shift every snapshot candle back in time."""
+    store = OHLCVSnapshotStore(path)
+    series = store.load()
+    for rows in series.values():
+        rows[:, 0] -= minutes * 60_000
+    store.save({key: rows.tolist() for key, rows in series.items()})
+
+
+async def run(symbols: int, latency: float, downtime: float) -> None:
+    """Compare cold and warm preloads."""
+    with tempfile.TemporaryDirectory() as tmp:
+        settings = get_settings()
+        settings.system.symbols = [f"SYM{i}/USDT" for i in range(symbols)]
+        settings.system.ohlcv_snapshot_path = str(Path(tmp) / "ohlcv_snapshot.pkl")
+        settings.oracle.mtf.enabled = True
+        settings.oracle.mtf.timeframes = TIMEFRAMES
+        settings.oracle.mtf.primary_timeframe = "1h"
+        settings.oracle.mtf.filter_timeframe = "4h"
+
+        cold, cold_exchange, engine = await preload(latency)
+        save_start = time.perf_counter()
+        await engine.save_ohlcv_snapshot()
+        save = time.perf_counter() - save_start
+        size_kb = Path(settings.system.ohlcv_snapshot_path).stat().st_size / 1024
+
+        age_snapshot(settings.system.ohlcv_snapshot_path, downtime)
+        warm, warm_exchange, _ = await preload(latency)
+
+    print(
+        f"{symbols} symbols x {len(TIMEFRAMES)} timeframes, {latency * 1000:.0f} ms/request, "
+        f"restart after {downtime:g} min"
+    )
+    print(
+        f"  cold  {cold:7.2f} s  {cold_exchange.requests} requests"
+        f"  {cold_exchange.candles} candles fetched"
+    )
+    print(
+        f"  warm  {warm:7.2f} s  {warm_exchange.requests} requests"
+        f"  {warm_exchange.candles} candles fetched"
+    )
+    print(f"  snapshot {size_kb:.0f} KiB, saved in {save * 1000:.1f} ms")
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description="Benchmark OHLCV warm start")
+    parser.add_argument("--symbols", type=int, default=100)
+    parser.add_argument("--latency", type=float, default=0.2, help="Seconds per OHLCV request")
+    parser.add_argument("--downtime", type=float, default=30.0, help="Minutes between runs")
+    args = parser.parse_args()
+
+    structlog.configure(wrapper_class=structlog.make_filtering_bound_logger(logging.ERROR))
+    asyncio.run(run(args.symbols, args.latency, args.downtime))
+
+
+if __name__ == "__main__":
+    main()
@@ -15,9 +15,12 @@ def setup_test_database(tmp_path):
     os.environ["KERYXFLOW_DB_URL"] = f"sqlite+aiosqlite:///{db_path}"
     # Force paper mode for tests
     os.environ["KERYXFLOW_MODE"] = "paper"
+    # Keep OHLCV warm-start snapshots out of the working tree
+    os.environ["KERYXFLOW_OHLCV_SNAPSHOT_PATH"] = str(tmp_path / "ohlcv_snapshot.pkl")
 
     # Reset global instances before each test
     import keryxflow.aegis.risk as risk_module
+    import keryxflow.aegis.trailing as trailing_module
     import keryxflow.agent.cognitive as cognitive_module
     import keryxflow.agent.executor as executor_module
     import keryxflow.agent.reflection as reflection_module
@@ -31,8 +34,10 @@ def setup_test_database(tmp_path):
     import keryxflow.core.events as events_module
     import keryxflow.exchange.demo as demo_module
     import keryxflow.exchange.kraken as kraken_module
+    import keryxflow.exchange.market_data as market_data_module
     import keryxflow.exchange.okx as okx_module
     import keryxflow.exchange.paper as paper_module
+    import keryxflow.exchange.venues as venues_module
     import keryxflow.memory.episodic as episodic_module
     import keryxflow.memory.manager as manager_module
     import keryxflow.memory.semantic as semantic_module
@@ -43,8 +48,10 @@ def setup_test_database(tmp_path):
     events_module._event_bus = None
     demo_module._demo_client = None
     kraken_module._kraken_client = None
+    market_data_module._clients.clear()
     okx_module._okx_client = None
     paper_module._paper_engine = None
+    venues_module._multi_venue_client = None
     episodic_module._episodic_memory = None
     semantic_module._semantic_memory = None
     manager_module._memory_manager = None
@@ -57,6 +64,7 @@ def setup_test_database(tmp_path):
     strategy_module._strategy_manager = None
     strategy_gen_module._strategy_generator = None
     risk_module._risk_manager = None
+    trailing_module._trailing_stop_manager = None
 
     yield
 
@@ -1,5 +1,7 @@
 """Tests for circuit breaker."""
 
+from datetime import UTC, datetime
+
 import pytest
 
 from keryxflow.aegis.circuit import (
@@ -8,6 +10,7 @@ from keryxflow.aegis.circuit import (
     CircuitState,
     TripReason,
 )
+from keryxflow.core.clock import SimulatedClock
 
 
 @pytest.fixture
@@ -168,3 +171,31 @@ class TestDailyReset:
         circuit_breaker.current_balance = 9800.0
 
         assert circuit_breaker.daily_drawdown == pytest.approx(0.02, rel=0.01)
+
+    def test_reset_follows_clock(self, circuit_breaker):
+        """Daily tracking restarts when the clock crosses midnight."""
+        clock = SimulatedClock(datetime(2024, 1, 1, 23, 0, tzinfo=UTC))
+        circuit_breaker.clock = clock
+
+        circuit_breaker.update_balance(9800.0)
+        assert circuit_breaker.last_reset_date == "2024-01-01"
+        assert circuit_breaker.daily_starting_balance == 10000.0
+
+        clock.advance(2 * 3600)
+        circuit_breaker.update_balance(9700.0)
+
+        assert circuit_breaker.last_reset_date == "2024-01-02"
+        assert circuit_breaker.daily_starting_balance == 9800.0
+
+    def test_cooldown_follows_clock(self, circuit_breaker):
+        """The cooldown is measured on the breaker's clock."""
+        clock = SimulatedClock(datetime(2024, 1, 1, tzinfo=UTC))
+        circuit_breaker.clock = clock
+        circuit_breaker.trip_manual("Test")
+
+        assert circuit_breaker.trip_time == clock.now()
+        assert circuit_breaker.reset() is False
+
+        clock.advance(61)
+
+        assert circuit_breaker.reset() is True
@@ -1,5 +1,6 @@
 """Tests for immutable trading guardrails and portfolio state."""
 
+from datetime import UTC, datetime
 from decimal import Decimal
 
 import pytest
@@ -15,6 +16,7 @@ from keryxflow.aegis.portfolio import (
     PositionState,
     create_portfolio_state,
 )
+from keryxflow.core.clock import SimulatedClock
 
 # =============================================================================
 # TradingGuardrails Tests
@@ -193,6 +195,15 @@ class TestPortfolioState:
         assert portfolio.total_exposure == Decimal("5000")
         assert portfolio.trades_today == 1
 
+    def test_venue_balances(self):
+        """Venue balances are recorded and included in the snapshot."""
+        portfolio = create_portfolio_state(10000.0)
+        portfolio.set_venue_balances({"binance": {"USDT": 6000.0}, "bybit": {"USDT": 4000.0}})
+
+        snapshot = portfolio.to_dict()
+        assert snapshot["venue_balances"]["bybit"] == {"USDT": 4000.0}
+        assert snapshot["venue_balances"]["binance"] == {"USDT": 6000.0}
+
     def test_total_risk_at_stop(self):
         """Total risk at stop should sum all position risks."""
         portfolio = create_portfolio_state(10000.0)
@@ -271,6 +282,100 @@ class TestPortfolioState:
 
         assert portfolio.drawdown_pct == Decimal("0.1")  # 10% drawdown
 
+    def test_running_aggregates_match_exact(self):
+        """Float64 running totals track the exact Decimal sums across ticks."""
+        portfolio = create_portfolio_state(100000.0)
+        for symbol, side, stop in (
+            ("BTC/USDT", "long", Decimal("48000")),
+            ("ETH/USDT", "short", None),
+        ):
+            portfolio.add_position(
+                PositionState(
+                    symbol=symbol,
+                    side=side,
+                    quantity=Decimal("0.3"),
+                    entry_price=Decimal("50000"),
+                    current_price=Decimal("50000"),
+                    stop_loss=stop,
+                )
+            )
+
+        for price in (50100.5, 49875.25, 50333.0):
+            portfolio.update_prices({"BTC/USDT": price, "ETH/USDT": price - 100})
+
+        metrics = portfolio.metrics()
+        assert metrics["total_exposure"] == pytest.approx(float(portfolio.total_exposure))
+        assert metrics["total_risk_at_stop"] == pytest.approx(float(portfolio.total_risk_at_stop))
+        assert metrics["unrealized_pnl"] == pytest.approx(float(portfolio.unrealized_pnl))
+        assert metrics["exposure_pct"] == pytest.approx(float(portfolio.exposure_pct))
+        assert portfolio.total_value == portfolio.cash_available + portfolio.total_exposure
+        assert portfolio.peak_value >= portfolio.total_value
+
+    def test_float_price_has_decimal_view(self):
+        """A float tick reads back as Decimal(str(price)); Decimals stay exact."""
+        portfolio = create_portfolio_state(10000.0)
+        position = PositionState(
+            symbol="BTC/USDT",
+            side="long",
+            quantity=Decimal("0.01"),
+            entry_price=Decimal("50000"),
+            current_price=Decimal("50000"),
+        )
+        portfolio.add_position(position)
+
+        portfolio.update_prices({"BTC/USDT": 50123.45})
+        assert position.current_price == Decimal("50123.45")
+
+        exact = Decimal("50123.456789012345678")
+        portfolio.update_prices({"BTC/USDT": exact})
+        assert position.current_price is exact
+
+    def test_recalculate_after_direct_mutation(self):
+        """recalculate() resyncs running totals with the positions list."""
+        portfolio = create_portfolio_state(10000.0)
+        portfolio.positions.append(
+            PositionState(
+                symbol="BTC/USDT",
+                side="long",
+                quantity=Decimal("0.01"),
+                entry_price=Decimal("50000"),
+                current_price=Decimal("50000"),
+            )
+        )
+        assert portfolio.metrics()["total_exposure"] == 0.0
+
+        portfolio.recalculate()
+
+        assert portfolio.metrics()["total_exposure"] == pytest.approx(500.0)
+        assert portfolio.get_position("BTC/USDT") is portfolio.positions[0]
+
+    def test_hourly_count_follows_clock(self):
+        """The hourly trade count starts over once an hour has passed on the clock."""
+        clock = SimulatedClock(datetime(2024, 1, 1, 10, 0, tzinfo=UTC))
+        portfolio = create_portfolio_state(10000.0, clock=clock)
+
+        def add(symbol: str) -> None:
+            portfolio.add_position(
+                PositionState(
+                    symbol=symbol,
+                    side="long",
+                    quantity=Decimal("0.001"),
+                    entry_price=Decimal("100"),
+                    current_price=Decimal("100"),
+                )
+            )
+
+        add("A/USDT")
+        clock.advance(30 * 60)
+        add("B/USDT")
+        assert portfolio.trades_this_hour == 2
+
+        clock.advance(45 * 60)
+        add("C/USDT")
+        assert portfolio.trades_this_hour == 1
+        assert portfolio.hour_start == clock.now()
+        assert portfolio.trades_today == 3
+
 
 # =============================================================================
 # GuardrailEnforcer Tests
@@ -674,6 +779,75 @@ class TestIssue9AggregateRisk:
         assert portfolio.risk_at_stop_pct == expected_risk_pct
 
 
+# =============================================================================
+# PortfolioSnapshot Tests
+# =============================================================================
+
+
+class TestPortfolioSnapshot:
+    """Tests for validating against a portfolio snapshot."""
+
+    @pytest.fixture
+    def enforcer(self):
+        """Create enforcer with default guardrails."""
+        return GuardrailEnforcer()
+
+    @pytest.fixture
+    def portfolio(self):
+        """Portfolio with one open BTC position."""
+        portfolio = create_portfolio_state(10000.0)
+        portfolio.add_position(
+            PositionState(
+                symbol="BTC/USDT",
+                side="long",
+                quantity=Decimal("0.01"),
+                entry_price=Decimal("50000"),
+                current_price=Decimal("50000"),
+                stop_loss=Decimal("49000"),
+            )
+        )
+        return portfolio
+
+    def test_snapshot_copies_aggregates(self, enforcer, portfolio):
+        """The snapshot holds the portfolio's aggregates at capture time."""
+        snapshot = enforcer.snapshot(portfolio)
+
+        assert snapshot.total_exposure == portfolio.total_exposure
+        assert snapshot.total_risk_at_stop == portfolio.total_risk_at_stop
+        assert snapshot.cash_available == portfolio.cash_available
+        assert snapshot.trades_today == 1
+        assert "BTC/USDT" in snapshot.allowed_symbols
+
+    def test_reserve_accumulates(self, enforcer, portfolio):
+        """Reserved orders count toward aggregate risk for later orders."""
+        snapshot = enforcer.snapshot(portfolio)
+        order = {
+            "symbol": "BTC/USDT",
+            "side": "buy",
+            "quantity": 0.02,
+            "entry_price": 50000,
+            "stop_loss": 40000,  # 200 risk = 2%
+        }
+
+        assert enforcer.validate_order(**order, snapshot=snapshot).allowed
+        snapshot.reserve(0.02, 50000, 40000)
+        assert enforcer.validate_order(**order, snapshot=snapshot).allowed
+        snapshot.reserve(0.02, 50000, 40000)
+
+        # 10 + 200 + 200 + 200 risk > 5% daily limit
+        result = enforcer.validate_order(**order, snapshot=snapshot)
+        assert not result.allowed
+        assert result.violation == GuardrailViolation.DAILY_LOSS_EXCEEDED
+        assert snapshot.trades_today == 3
+        # The portfolio itself is untouched
+        assert portfolio.position_count == 1
+
+    def test_requires_portfolio_or_snapshot(self, enforcer):
+        """validate_order needs something to validate against."""
+        with pytest.raises(ValueError):
+            enforcer.validate_order("BTC/USDT", "buy", 0.01, 50000, 49000)
+
+
 # =============================================================================
 # Singleton Tests
 # =============================================================================
@@ -0,0 +1,178 @@
+"""Tests for vectorized equity-curve metrics."""
+
+import numpy as np
+import pytest
+
+from keryxflow.aegis.metrics import (
+    EquityWindow,
+    drawdown_runs,
+    drawdown_series,
+    rolling_calmar,
+    rolling_max_drawdown,
+    rolling_sharpe,
+    rolling_sortino,
+    simple_returns,
+    summarize_drawdown,
+    underwater_curve,
+)
+from keryxflow.aegis.quant import QuantEngine
+from keryxflow.aegis.risk import RiskManager
+from keryxflow.core.models import RiskProfile
+
+
+@pytest.fixture
+def equity() -> np.ndarray:
+    """Random-walk equity curve."""
+    rng = np.random.default_rng(7)
+    return 10000 * np.cumprod(1 + rng.normal(0.0005, 0.01, 400))
+
+
+class TestDrawdown:
+    """Tests for drawdown series and run-length durations."""
+
+    def test_drawdown_series(self):
+        """Drawdown is measured from the running peak."""
+        dd = drawdown_series([100, 110, 99, 110, 120])
+
+        assert dd == pytest.approx([0.0, 0.0, 0.1, 0.0, 0.0])
+
+    def test_underwater_is_negated_drawdown(self):
+        """Underwater curve is zero at highs and negative below."""
+        uw = underwater_curve([100, 50, 100])
+
+        assert uw == pytest.approx([0.0, -0.5, 0.0])
+
+    def test_runs(self):
+        """Each drawdown period is reported with its start and length."""
+        starts, lengths = drawdown_runs([100, 90, 95, 101, 100, 99, 98])
+
+        assert starts.tolist() == [1, 4]
+        assert lengths.tolist() == [2, 3]
+
+    def test_summary(self):
+        """Summary reports max and current durations."""
+        stats = summarize_drawdown([100, 90, 95, 101, 100, 99, 98])
+
+        assert stats.max_duration == 3
+        assert stats.current_duration == 3
+        assert stats.max_drawdown == pytest.approx(0.1)
+
+    def test_summary_at_peak(self):
+        """A curve ending at a new high has no current drawdown."""
+        stats = summarize_drawdown([100, 90, 120])
+
+        assert stats.current_duration == 0
+        assert stats.current_drawdown == 0.0
+
+    def test_empty(self):
+        """Empty curves have no drawdown."""
+        stats = summarize_drawdown([])
+
+        assert stats.max_drawdown == 0.0
+        assert stats.max_duration == 0
+
+    def test_matches_reference_loop(self, equity):
+        """Duration agrees with a per-period loop."""
+        peak = np.maximum.accumulate(equity)
+        duration = max_duration = 0
+        for is_dd in equity < peak:
+            duration = duration + 1 if is_dd else 0
+            max_duration = max(max_duration, duration)
+
+        assert summarize_drawdown(equity).max_duration == max_duration
+
+    def test_simple_returns(self):
+        """Returns are period-over-period changes."""
+        assert simple_returns([100, 110, 99]) == pytest.approx([0.1, -0.1])
+        assert len(simple_returns([100])) == 0
+
+
+class TestRollingMetrics:
+    """Rolling metrics match QuantEngine on each window."""
+
+    def test_rolling_sharpe(self, equity):
+        """Rolling Sharpe equals the scalar Sharpe over each window."""
+        quant = QuantEngine()
+        returns = simple_returns(equity)
+        window = 20
+        rolled = rolling_sharpe(returns, window)
+
+        assert np.isnan(rolled[: window - 1]).all()
+        for i in (window - 1, 150, len(returns) - 1):
+            expected = quant.calculate_sharpe_ratio(returns[i - window + 1 : i + 1])
+            assert rolled[i] == pytest.approx(expected, rel=1e-6)
+
+    def test_rolling_sortino(self, equity):
+        """Rolling Sortino equals the scalar Sortino over each window."""
+        quant = QuantEngine()
+        returns = simple_returns(equity)
+        window = 20
+        rolled = rolling_sortino(returns, window)
+
+        for i in (window - 1, 150, len(returns) - 1):
+            expected = quant.calculate_sortino_ratio(returns[i - window + 1 : i + 1])
+            assert rolled[i] == pytest.approx(expected, rel=1e-6)
+
+    def test_rolling_calmar(self, equity):
+        """Rolling Calmar equals the scalar Calmar over each window."""
+        quant = QuantEngine()
+        window = 30
+        rolled = rolling_calmar(equity, window)
+
+        for i in (window - 1, 200, len(equity) - 1):
+            expected = quant.calculate_calmar_ratio(equity[i - window + 1 : i + 1])
+            assert rolled[i] == pytest.approx(expected, rel=1e-6)
+
+    def test_rolling_max_drawdown_chunked(self, equity, monkeypatch):
+        """Chunked evaluation gives the same result as a single pass."""
+        full = rolling_max_drawdown(equity, 25)
+        monkeypatch.setattr("keryxflow.aegis.metrics._CHUNK_ELEMENTS", 100)
+        chunked = rolling_max_drawdown(equity, 25)
+
+        np.testing.assert_array_equal(full, chunked)
+
+    def test_flat_returns_are_zero(self):
+        """Flat windows report 0.0 like QuantEngine."""
+        rolled = rolling_sharpe(np.zeros(10), 3)
+
+        assert rolled[2:].tolist() == [0.0] * 8
+
+    def test_invalid_window(self):
+        """Windows shorter than two periods are rejected."""
+        with pytest.raises(ValueError):
+            rolling_sharpe([0.1, 0.2], 1)
+
+
+class TestEquityWindow:
+    """Tests for the live equity ring buffer."""
+
+    def test_wraps_oldest_first(self):
+        """Values are returned oldest first after wrapping."""
+        window = EquityWindow(capacity=3)
+        for value in (1.0, 2.0, 3.0, 4.0, 5.0):
+            window.append(value)
+
+        assert window.values().tolist() == [3.0, 4.0, 5.0]
+        assert len(window) == 3
+
+    def test_risk_manager_equity_metrics(self):
+        """RiskManager reports drawdown and rolling ratios from balance updates."""
+        rm = RiskManager(risk_profile=RiskProfile.BALANCED, initial_balance=10000.0)
+        for balance in (10100.0, 9900.0, 9800.0, 10050.0, 9950.0):
+            rm.update_balance(balance)
+
+        metrics = rm.get_equity_metrics(window=3)
+
+        assert metrics["samples"] == 6
+        assert metrics["max_drawdown"] == pytest.approx(300 / 10100)
+        assert metrics["current_duration"] == 4
+        assert metrics["rolling_sharpe"] is not None
+
+    def test_risk_manager_metrics_need_samples(self):
+        """Rolling ratios are None until enough balances are recorded."""
+        rm = RiskManager(initial_balance=10000.0)
+
+        metrics = rm.get_equity_metrics(window=30)
+
+        assert metrics["rolling_sharpe"] is None
+        assert metrics["max_drawdown"] == 0.0
@@ -148,6 +148,79 @@ class TestOrderApproval:
         )
 
 
+class TestBatchApproval:
+    """Tests for approve_batch."""
+
+    @staticmethod
+    def order(symbol: str = "BTC/USDT", confidence: float = 0.6) -> OrderRequest:
+        """A valid long order with a 1:2 risk/reward."""
+        price = 50000.0 if symbol == "BTC/USDT" else 3000.0
+        return OrderRequest(
+            symbol=symbol,
+            side="buy",
+            quantity=500.0 / price,
+            entry_price=price,
+            stop_loss=price * 0.98,
+            take_profit=price * 1.04,
+            confidence=confidence,
+        )
+
+    def test_results_follow_input_order(self, risk_manager):
+        """Results line up with the submitted orders."""
+        orders = [self.order("BTC/USDT"), self.order("ETH/USDT"), self.order("SHIB/USDT")]
+
+        results = risk_manager.approve_batch(orders)
+
+        assert [r.approved for r in results] == [True, True, False]
+        assert results[2].reason == RejectionReason.SYMBOL_NOT_ALLOWED
+
+    def test_single_order_matches_approve_order(self, risk_manager):
+        """A batch of one gets the same verdict as approve_order."""
+        order = self.order()
+
+        assert risk_manager.approve_batch([order])[0] == risk_manager.approve_order(order)
+
+    def test_limits_apply_cumulatively_by_expected_value(self, risk_manager):
+        """When positions run out, the lowest expected value is rejected."""
+        risk_manager.set_open_positions(1)  # Balanced max is 3
+        orders = [
+            self.order("BTC/USDT", confidence=0.4),
+            self.order("ETH/USDT", confidence=0.9),
+            self.order("BTC/USDT", confidence=0.7),
+        ]
+
+        results = risk_manager.approve_batch(orders)
+
+        assert [r.approved for r in results] == [False, True, True]
+        assert results[0].reason == RejectionReason.MAX_POSITIONS_REACHED
+        # Nothing is booked into the live portfolio
+        assert risk_manager.portfolio_state.position_count == 0
+
+    def test_deterministic_regardless_of_submission_order(self, risk_manager):
+        """Reordering a batch does not change who is approved."""
+        risk_manager.set_open_positions(2)
+        orders = [self.order("BTC/USDT", 0.6), self.order("ETH/USDT", 0.6)]
+
+        forward = risk_manager.approve_batch(orders)
+        backward = risk_manager.approve_batch(orders[::-1])[::-1]
+
+        assert [r.approved for r in forward] == [r.approved for r in backward] == [True, False]
+
+    def test_expected_value(self):
+        """Expected value weighs reward and risk by confidence."""
+        order = OrderRequest(
+            symbol="BTC/USDT",
+            side="buy",
+            quantity=2.0,
+            entry_price=100.0,
+            stop_loss=90.0,
+            take_profit=120.0,
+            confidence=0.5,
+        )
+
+        assert order.expected_value == pytest.approx((0.5 * 20 - 0.5 * 10) * 2)
+
+
 class TestCircuitBreaker:
     """Tests for circuit breaker integration."""
 
@@ -191,6 +264,27 @@ class TestCircuitBreaker:
         assert result.approved is False
         assert result.reason == RejectionReason.DAILY_DRAWDOWN_EXCEEDED
 
+    def test_daily_reset_follows_clock(self):
+        """Daily PnL starts over when the manager's clock reaches a new day."""
+        from datetime import UTC, datetime
+
+        from keryxflow.core.clock import SimulatedClock
+
+        clock = SimulatedClock(datetime(2024, 1, 1, 23, 30, tzinfo=UTC))
+        manager = RiskManager(
+            risk_profile=RiskProfile.BALANCED, initial_balance=10000.0, clock=clock
+        )
+        manager.update_daily_pnl(0.0)
+        manager.update_daily_pnl(-600.0)
+        assert manager.daily_drawdown == pytest.approx(0.06)
+
+        clock.advance(3600)
+        manager.update_daily_pnl(-600.0)
+
+        assert manager._last_reset_date == "2024-01-02"
+        assert manager.daily_drawdown == 0.0
+        assert manager.portfolio_state.daily_reset_date == clock.now().date()
+
 
 class TestPositionSizeCalculation:
     """Tests for safe position size calculation."""
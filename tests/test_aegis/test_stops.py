@@ -0,0 +1,221 @@
+"""Tests for the array-backed stop book."""
+
+import random
+
+import pytest
+
+from keryxflow.aegis.stops import StopBook
+from keryxflow.aegis.trailing import TrailingStopManager
+
+
+class TestStopBookTracking:
+    """Tests for slot management."""
+
+    def test_track_and_levels(self):
+        """Tracked levels read back with unset ones as None."""
+        book = StopBook()
+        book.track("BTC/USDT", "buy", 50000.0, stop_loss=49000.0)
+
+        levels = book.levels("BTC/USDT")
+
+        assert "BTC/USDT" in book
+        assert levels.side == "buy"
+        assert levels.stop_loss == 49000.0
+        assert levels.take_profit is None
+        assert levels.trail_pct is None
+        assert levels.trailing_stop is None
+        assert book.levels("ETH/USDT") is None
+
+    def test_grows_past_capacity_and_reuses_slots(self):
+        """Arrays grow on demand and removed slots are recycled."""
+        book = StopBook(capacity=2)
+        for i in range(5):
+            book.track(f"S{i}/USDT", "buy", 100.0 + i, stop_loss=90.0)
+
+        assert len(book) == 5
+        assert book.levels("S4/USDT").entry_price == 104.0
+
+        assert book.remove("S1/USDT")
+        assert not book.remove("S1/USDT")
+        book.track("NEW/USDT", "sell", 10.0, take_profit=8.0)
+
+        assert len(book) == 5
+        assert book.levels("NEW/USDT").side == "sell"
+        assert book.levels("S0/USDT").stop_loss == 90.0
+
+    def test_clear(self):
+        """clear() forgets every symbol."""
+        book = StopBook()
+        book.track("BTC/USDT", "buy", 50000.0, stop_loss=49000.0)
+        book.track("ETH/USDT", "sell", 3000.0, stop_loss=3100.0)
+
+        book.clear()
+
+        assert len(book) == 0
+        assert book.evaluate({"BTC/USDT": 1.0, "ETH/USDT": 9999.0}) == []
+
+
+class TestStopBookEvaluate:
+    """Tests for batch evaluation."""
+
+    def test_fixed_levels_long_and_short(self):
+        """Stop-loss and take-profit fire on the correct side for each direction."""
+        book = StopBook()
+        book.track("LSL/USDT", "buy", 100.0, stop_loss=95.0, take_profit=110.0)
+        book.track("LTP/USDT", "buy", 100.0, stop_loss=95.0, take_profit=110.0)
+        book.track("SSL/USDT", "sell", 100.0, stop_loss=105.0, take_profit=90.0)
+        book.track("STP/USDT", "sell", 100.0, stop_loss=105.0, take_profit=90.0)
+        book.track("HOLD/USDT", "buy", 100.0, stop_loss=95.0, take_profit=110.0)
+
+        triggers = book.evaluate(
+            {
+                "LSL/USDT": 95.0,
+                "LTP/USDT": 111.0,
+                "SSL/USDT": 106.0,
+                "STP/USDT": 90.0,
+                "HOLD/USDT": 100.0,
+            }
+        )
+
+        assert [(t.symbol, t.reason, t.stop_price) for t in triggers] == [
+            ("LSL/USDT", "stop_loss", 95.0),
+            ("LTP/USDT", "take_profit", 110.0),
+            ("SSL/USDT", "stop_loss", 105.0),
+            ("STP/USDT", "take_profit", 90.0),
+        ]
+
+    def test_untracked_symbols_ignored(self):
+        """Prices for symbols without stops are skipped."""
+        book = StopBook()
+        book.track("BTC/USDT", "buy", 50000.0, stop_loss=49000.0)
+
+        assert book.evaluate({"ETH/USDT": 1.0}) == []
+        assert book.evaluate({}) == []
+
+    def test_trailing_matches_manager_semantics(self):
+        """Batch trailing updates match the per-symbol manager path."""
+        book = StopBook()
+        manager = TrailingStopManager()
+        paths = {
+            "LONG/USDT": ("buy", [100.0, 100.5, 102.0, 104.0, 103.0, 101.9]),
+            "SHORT/USDT": ("sell", [100.0, 99.5, 98.0, 97.0, 98.0, 99.0]),
+        }
+        for symbol, (side, _) in paths.items():
+            book.track(symbol, side, 100.0, trail_pct=0.02, activation_pct=0.01)
+            manager.start_tracking(symbol, side, 100.0, trail_pct=0.02, activation_pct=0.01)
+
+        fired: dict[str, int] = {}
+        for step in range(6):
+            prices = {symbol: path[step] for symbol, (_, path) in paths.items()}
+            for trigger in book.evaluate(prices):
+                fired.setdefault(trigger.symbol, step)
+            for symbol, price in prices.items():
+                manager.update_price(symbol, price)
+                assert book.levels(symbol).trailing_stop == manager.get_stop_price(symbol)
+                if manager.should_trigger_stop(symbol, price):
+                    assert fired.get(symbol) is not None
+
+        # Long trails 104 -> 101.92 and fires at 101.9; short trails 97 -> 98.94
+        assert fired == {"LONG/USDT": 5, "SHORT/USDT": 5}
+        assert book.levels("LONG/USDT").trailing_stop == pytest.approx(104.0 * 0.98)
+        assert book.levels("SHORT/USDT").trailing_stop == pytest.approx(97.0 * 1.02)
+
+    def test_vectorized_batch_matches_scalar(self):
+        """Large batches take the array path and agree with per-symbol evaluation."""
+        rng = random.Random(3)
+        batch_book, scalar_book = StopBook(), StopBook()
+        prices = {}
+        for i in range(64):
+            symbol = f"S{i}/USDT"
+            side = "buy" if i % 2 else "sell"
+            sign = 1 if side == "buy" else -1
+            for book in (batch_book, scalar_book):
+                book.track(
+                    symbol,
+                    side,
+                    100.0,
+                    trail_pct=0.03 if i % 3 else None,
+                    activation_pct=0.01,
+                    stop_loss=100.0 * (1 - sign * 0.08) if i % 4 else None,
+                    take_profit=100.0 * (1 + sign * 0.1) if i % 5 else None,
+                )
+            prices[symbol] = 100.0
+
+        fired = 0
+        for _ in range(40):
+            prices = {s: p * (1 + rng.gauss(0, 0.01)) for s, p in prices.items()}
+            batch = batch_book.evaluate(prices)
+            scalar = [t for s, p in prices.items() for t in scalar_book.evaluate({s: p})]
+
+            assert [(t.symbol, t.reason) for t in batch] == [(t.symbol, t.reason) for t in scalar]
+            fired += len(batch)
+            for trigger in batch:
+                batch_book.remove(trigger.symbol)
+                scalar_book.remove(trigger.symbol)
+                del prices[trigger.symbol]
+
+        assert 0 < fired < 64
+        for symbol in batch_book.symbols:
+            assert batch_book.levels(symbol) == scalar_book.levels(symbol)
+
+    def test_trailing_inactive_below_activation(self):
+        """No trailing stop exists until the activation threshold is reached."""
+        book = StopBook()
+        book.track("BTC/USDT", "buy", 100.0, trail_pct=0.02, activation_pct=0.05)
+
+        assert book.evaluate({"BTC/USDT": 104.0}) == []
+        assert book.evaluate({"BTC/USDT": 90.0}) == []
+        assert book.levels("BTC/USDT").activated is False
+
+    def test_stop_loss_takes_precedence(self):
+        """When several levels are crossed the stop-loss is reported."""
+        book = StopBook()
+        book.track("BTC/USDT", "buy", 100.0, trail_pct=0.02, activation_pct=0.0, stop_loss=99.0)
+
+        (trigger,) = book.evaluate({"BTC/USDT": 98.0})
+
+        assert trigger.reason == "stop_loss"
+        assert trigger.price == 98.0
+
+    def test_triggered_slots_stay_tracked(self):
+        """Evaluation does not remove triggered symbols."""
+        book = StopBook()
+        book.track("BTC/USDT", "buy", 100.0, stop_loss=95.0)
+
+        book.evaluate({"BTC/USDT": 90.0})
+
+        assert "BTC/USDT" in book
+
+
+class TestTrailingManagerOnBook:
+    """Tests for TrailingStopManager sharing a stop book."""
+
+    def test_start_tracking_keeps_fixed_levels(self):
+        """Adding a trailing stop keeps same-side fixed levels."""
+        book = StopBook()
+        book.track("BTC/USDT", "buy", 100.0, stop_loss=95.0, take_profit=120.0)
+        manager = TrailingStopManager(book)
+
+        manager.start_tracking("BTC/USDT", "buy", 100.0)
+
+        levels = book.levels("BTC/USDT")
+        assert levels.stop_loss == 95.0
+        assert levels.take_profit == 120.0
+        assert manager.is_tracking("BTC/USDT")
+
+    def test_fixed_only_slots_not_reported_as_trailing(self):
+        """Symbols with only fixed levels are not trailing-tracked."""
+        manager = TrailingStopManager()
+        manager.book.track("BTC/USDT", "buy", 100.0, stop_loss=95.0)
+
+        assert not manager.is_tracking("BTC/USDT")
+        assert manager.get_all_states() == {}
+
+    def test_update_prices_returns_trailing_triggers(self):
+        """Batch update reports only trailing-stop triggers."""
+        manager = TrailingStopManager()
+        manager.start_tracking("BTC/USDT", "buy", 100.0, trail_pct=0.02, activation_pct=0.0)
+        manager.book.track("ETH/USDT", "buy", 100.0, stop_loss=95.0)
+
+        assert manager.update_prices({"BTC/USDT": 110.0, "ETH/USDT": 100.0}) == []
+        assert manager.update_prices({"BTC/USDT": 107.0, "ETH/USDT": 90.0}) == ["BTC/USDT"]
@@ -0,0 +1,73 @@
+"""Tests for cron expressions."""
+
+from datetime import UTC, datetime
+
+import pytest
+
+from keryxflow.agent.cron import CronExpression
+
+# A Monday
+T0 = datetime(2024, 1, 1, 12, 7, 30, tzinfo=UTC)
+
+
+class TestParse:
+    """Tests for parsing."""
+
+    def test_fields(self):
+        """Lists, ranges, steps and names expand to sorted values."""
+        cron = CronExpression.parse("0,30 9-11 */10 jan-mar mon,wed,7")
+
+        assert cron.minutes == (0, 30)
+        assert cron.hours == (9, 10, 11)
+        assert cron.days == (1, 11, 21, 31)
+        assert cron.months == (1, 2, 3)
+        assert cron.weekdays == (0, 1, 3)
+
+    def test_aliases(self):
+        """Shortcuts expand to their five-field form."""
+        assert CronExpression.parse("@daily").hours == (0,)
+        assert CronExpression.parse("@weekly").weekdays == (0,)
+
+    @pytest.mark.parametrize(
+        "expression",
+        ["* * *", "60 * * * *", "* 24 * * *", "*/0 * * * *", "x * * * *", "5-1 * * * *"],
+    )
+    def test_invalid(self, expression):
+        """Malformed expressions raise ValueError."""
+        with pytest.raises(ValueError):
+            CronExpression.parse(expression)
+
+
+class TestNextAfter:
+    """Tests for finding the next matching time."""
+
+    @pytest.mark.parametrize(
+        ("expression", "expected"),
+        [
+            ("* * * * *", datetime(2024, 1, 1, 12, 8, tzinfo=UTC)),
+            ("*/15 * * * *", datetime(2024, 1, 1, 12, 15, tzinfo=UTC)),
+            ("5 * * * *", datetime(2024, 1, 1, 13, 5, tzinfo=UTC)),
+            ("0 9-17 * * mon-fri", datetime(2024, 1, 1, 13, 0, tzinfo=UTC)),
+            ("30 23 * * sun", datetime(2024, 1, 7, 23, 30, tzinfo=UTC)),
+            ("0 0 1 * *", datetime(2024, 2, 1, 0, 0, tzinfo=UTC)),
+            ("0 0 29 2 *", datetime(2024, 2, 29, 0, 0, tzinfo=UTC)),
+            ("0 0 31 12 *", datetime(2024, 12, 31, 0, 0, tzinfo=UTC)),
+        ],
+    )
+    def test_next_after(self, expression, expected):
+        """The first matching minute strictly after the reference time."""
+        assert CronExpression.parse(expression).next_after(T0) == expected
+
+    def test_day_or_weekday(self):
+        """With both day fields restricted, either one matching is enough."""
+        cron = CronExpression.parse("0 0 15 * fri")
+
+        assert cron.next_after(T0) == datetime(2024, 1, 5, tzinfo=UTC)
+        assert cron.next_after(datetime(2024, 1, 12, 1, tzinfo=UTC)) == datetime(
+            2024, 1, 15, tzinfo=UTC
+        )
+
+    def test_never_matches(self):
+        """An impossible date raises instead of searching forever."""
+        with pytest.raises(ValueError, match="never matches"):
+            CronExpression.parse("0 0 30 2 *").next_after(T0)
@@ -1,5 +1,6 @@
 """Tests for the AgentOrchestrator and multi-agent coordination."""
 
+import asyncio
 from unittest.mock import AsyncMock
 
 import pytest
@@ -11,6 +12,32 @@ from keryxflow.agent.base_agent import (
 )
 from keryxflow.agent.cognitive import CycleResult, CycleStatus, DecisionType
 from keryxflow.agent.orchestrator import AgentOrchestrator, get_agent_orchestrator
+from keryxflow.config import AgentSettings
+
+SYMBOLS = ["BTC/USDT", "ETH/USDT", "SOL/USDT", "XRP/USDT", "ADA/USDT", "DOT/USDT"]
+
+
+def make_orchestrator(signals: dict[str, str], **settings) -> AgentOrchestrator:
+    """Orchestrator whose analyst answers per symbol after a short delay."""
+    orchestrator = AgentOrchestrator(settings=AgentSettings(**settings))
+    orchestrator._initialized = True
+    orchestrator._build_context = AsyncMock(
+        return_value={"symbols": list(signals), "market_data": {}, "memory_context": {}}
+    )
+    orchestrator.running = 0
+    orchestrator.max_running = 0
+
+    async def analyze(symbol, _context):
+        orchestrator.running += 1
+        orchestrator.max_running = max(orchestrator.max_running, orchestrator.running)
+        await asyncio.sleep(0.02)
+        orchestrator.running -= 1
+        return MarketAnalysis(
+            symbol=symbol, signal=signals[symbol], confidence=0.8, tokens_used=100
+        )
+
+    orchestrator.analyst.analyze = AsyncMock(side_effect=analyze)
+    return orchestrator
 
 
 class TestAgentOrchestrator:
@@ -345,6 +372,132 @@ class TestAgentOrchestrator:
         assert result.status == CycleStatus.NO_ACTION
 
 
+class TestParallelPipelines:
+    """Tests for concurrent analyst stages and the serialized trade queue."""
+
+    @pytest.mark.asyncio
+    async def test_analysts_run_concurrently_up_to_limit(self):
+        """All symbols are analyzed, at most analyst_concurrency at once."""
+        orchestrator = make_orchestrator(dict.fromkeys(SYMBOLS, "hold"), analyst_concurrency=3)
+
+        result = await orchestrator.run_cycle(SYMBOLS)
+
+        assert result.status == CycleStatus.NO_ACTION
+        assert orchestrator.analyst.analyze.await_count == 6
+        assert orchestrator.max_running == 3
+        assert result.tokens_used == 600
+
+    @pytest.mark.asyncio
+    async def test_trades_are_serialized_and_see_each_other(self):
+        """Risk and execution run one trade at a time with earlier fills in context."""
+        signals = {"BTC/USDT": "long", "ETH/USDT": "hold", "SOL/USDT": "short"}
+        orchestrator = make_orchestrator(signals)
+        in_risk = []
+        seen_trades = []
+
+        async def assess(analysis, context):
+            in_risk.append(analysis.symbol)
+            seen_trades.append(list(context.get("cycle_trades", [])))
+            await asyncio.sleep(0.01)
+            return RiskAssessment(approved=True, position_size=0.5, tokens_used=10)
+
+        async def execute_trade(analysis, assessment, _context):
+            side = "buy" if analysis.signal == "long" else "sell"
+            return ExecutionResult(
+                executed=True,
+                symbol=analysis.symbol,
+                side=side,
+                quantity=assessment.position_size,
+                tokens_used=5,
+            )
+
+        orchestrator.risk_agent.assess = AsyncMock(side_effect=assess)
+        orchestrator.executor_agent.execute_trade = AsyncMock(side_effect=execute_trade)
+
+        result = await orchestrator.run_cycle(list(signals))
+
+        first = in_risk[0]
+        assert sorted(in_risk) == ["BTC/USDT", "SOL/USDT"]
+        assert seen_trades[0] == []
+        assert seen_trades[1] == [
+            {"symbol": first, "side": "buy" if first == "BTC/USDT" else "sell", "quantity": 0.5}
+        ]
+        assert result.status == CycleStatus.SUCCESS
+        assert result.decision.symbol == in_risk[0]
+        assert result.tokens_used == 3 * 100 + 2 * 10 + 2 * 5
+
+    @pytest.mark.asyncio
+    async def test_token_budget_limits_analyses(self):
+        """No analysis starts once the cycle would exceed the daily budget."""
+        orchestrator = make_orchestrator(
+            dict.fromkeys(SYMBOLS[:5], "hold"), analyst_concurrency=1, daily_token_budget=250
+        )
+
+        result = await orchestrator.run_cycle(SYMBOLS[:5])
+
+        assert result.status == CycleStatus.NO_ACTION
+        assert orchestrator.analyst.analyze.await_count == 2
+        assert orchestrator.get_stats()["analyses_skipped_budget"] == 3
+
+        result = await orchestrator.run_cycle(SYMBOLS[:5])
+
+        assert result.status == CycleStatus.RATE_LIMITED
+        assert orchestrator.analyst.analyze.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_exhausted_budget_skips_cycle(self):
+        """Once the budget is spent, cycles are rate limited without analysis."""
+        orchestrator = make_orchestrator({"BTC/USDT": "hold"}, daily_token_budget=100)
+
+        await orchestrator.run_cycle(["BTC/USDT"])
+        result = await orchestrator.run_cycle(["BTC/USDT"])
+
+        assert orchestrator.budget_exceeded
+        assert result.status == CycleStatus.RATE_LIMITED
+        assert orchestrator.analyst.analyze.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_stage_latency_in_stats(self):
+        """Each stage reports runs, latency and tokens."""
+        orchestrator = make_orchestrator({"BTC/USDT": "long", "ETH/USDT": "hold"})
+        orchestrator.risk_agent.assess = AsyncMock(
+            return_value=RiskAssessment(approved=False, reasoning="Too risky", tokens_used=10)
+        )
+
+        result = await orchestrator.run_cycle(["BTC/USDT", "ETH/USDT"])
+
+        assert result.decision.reasoning == "Risk rejected: Too risky"
+        stages = orchestrator.get_stats()["stages"]
+        assert stages["analyst"]["runs"] == 2
+        assert stages["analyst"]["avg_ms"] >= 20
+        assert stages["analyst"]["tokens"] == 200
+        assert stages["risk"]["runs"] == 1
+        assert stages["executor"]["runs"] == 0
+        assert stages["queue_wait"]["runs"] == 1
+        assert stages["cycle"]["runs"] == 1
+
+    @pytest.mark.asyncio
+    async def test_close_shuts_down_request_pool(self):
+        """close() stops the request threads and initialize() starts new ones."""
+        orchestrator = make_orchestrator({})
+        pool = orchestrator._request_pool
+
+        orchestrator.close()
+
+        assert pool._shutdown
+        assert orchestrator._request_pool is None
+        assert orchestrator.analyst.request_executor is None
+        assert not orchestrator._initialized
+
+        for agent in (orchestrator.analyst, orchestrator.risk_agent, orchestrator.executor_agent):
+            agent.initialize = AsyncMock()
+        await orchestrator.initialize()
+
+        assert orchestrator._request_pool is not None
+        assert orchestrator.risk_agent.request_executor is orchestrator._request_pool
+        orchestrator.close()
+
+
 class TestGetAgentOrchestrator:
     """Tests for get_agent_orchestrator function."""
 
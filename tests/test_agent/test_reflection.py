@@ -1,5 +1,9 @@
 """Tests for the Reflection Engine."""
 
+import json
+import re
+from datetime import UTC, datetime, timedelta
+from types import SimpleNamespace
 
 import pytest
 
@@ -11,7 +15,88 @@ from keryxflow.agent.reflection import (
     WeeklyReflectionResult,
     get_reflection_engine,
 )
-from keryxflow.core.models import TradeOutcome
+from keryxflow.core.models import TradeEpisode, TradeOutcome
+
+T0 = datetime(2024, 1, 1, 9, tzinfo=UTC)
+
+
+def make_episode(episode_id: int, pnl_percentage: float = 2.0, day: int = 0) -> TradeEpisode:
+    """A closed trade episode."""
+    entry = T0 + timedelta(days=day, minutes=episode_id)
+    return TradeEpisode(
+        id=episode_id,
+        trade_id=episode_id,
+        symbol="BTC/USDT",
+        entry_timestamp=entry,
+        entry_price=100.0,
+        entry_reasoning="Breakout above resistance",
+        entry_confidence=0.7,
+        technical_context=json.dumps({"rsi": 55}),
+        exit_timestamp=entry + timedelta(hours=1),
+        exit_price=100.0 + pnl_percentage,
+        outcome=TradeOutcome.WIN if pnl_percentage > 0 else TradeOutcome.LOSS,
+        pnl=pnl_percentage * 10,
+        pnl_percentage=pnl_percentage,
+    )
+
+
+class StubClient:
+    """Anthropic client stand-in answering batch prompts with canned JSON."""
+
+    def __init__(self, answer=None):
+        self.answer = answer
+        self.prompts: list[str] = []
+        self.messages = SimpleNamespace(create=self.create)
+
+    def create(self, **kwargs):
+        prompt = kwargs["messages"][0]["content"]
+        self.prompts.append(prompt)
+        if self.answer is not None:
+            text = self.answer
+        else:
+            ids = [int(i) for i in re.findall(r"^Trade (\d+):", prompt, re.MULTILINE)]
+            text = "Here you go:\n" + json.dumps(
+                [
+                    {
+                        "episode_id": i,
+                        "lessons_learned": f"Lesson {i}",
+                        "what_went_well": "Entry",
+                        "what_went_wrong": "Exit",
+                        "would_take_again": "yes",
+                    }
+                    for i in ids
+                ]
+            )
+        return SimpleNamespace(
+            content=[SimpleNamespace(type="text", text=text)],
+            usage=SimpleNamespace(input_tokens=100, output_tokens=50),
+        )
+
+
+@pytest.fixture
+def memories(mocker):
+    """Episodic and semantic memory mocks over a set of episodes."""
+    episodes = {i: make_episode(i, 2.0 if i % 2 else -1.0) for i in range(1, 11)}
+    episodic = mocker.MagicMock()
+    episodic.get_episode = mocker.AsyncMock(side_effect=lambda i: episodes.get(i))
+    episodic.record_lessons = mocker.AsyncMock()
+    semantic = mocker.MagicMock()
+    semantic.create_rule = mocker.AsyncMock(return_value=42)
+    semantic.get_active_rules = mocker.AsyncMock(return_value=[])
+    return episodic, semantic
+
+
+@pytest.fixture
+def make_engine(memories):
+    """Factory for initialized engines using a stub client."""
+
+    def factory(client=None, **kwargs) -> ReflectionEngine:
+        engine = ReflectionEngine(*memories, **kwargs)
+        engine._initialized = True
+        engine._client = client
+        return engine
+
+    return factory
 
 
 class TestReflectionType:
@@ -344,6 +429,185 @@ Mistakes:
         assert len(weekly) == 1
 
 
+class TestBatchedPostMortems:
+    """Tests for queued post-mortems analyzed in batches."""
+
+    async def test_one_request_per_batch(self, make_engine, memories):
+        """Several episodes are analyzed with a single LLM call."""
+        client = StubClient()
+        engine = make_engine(client)
+
+        results = await engine.post_mortem_batch([1, 2, 3])
+
+        assert len(client.prompts) == 1
+        assert "Trade 2:" in client.prompts[0]
+        assert [r.lessons_learned for r in results] == ["Lesson 1", "Lesson 2", "Lesson 3"]
+        assert all(r.would_take_again for r in results)
+        assert memories[0].record_lessons.await_count == 3
+        memories[0].record_lessons.assert_any_await(
+            episode_id=2,
+            lessons_learned="Lesson 2",
+            what_went_well="Entry",
+            what_went_wrong="Exit",
+            would_take_again=True,
+        )
+        stats = engine.get_stats()
+        assert stats["batch_requests"] == 1
+        assert stats["batched_post_mortems"] == 3
+        assert stats["total_post_mortems"] == 3
+        assert stats["total_tokens_used"] == 150
+
+    async def test_missing_results_fall_back(self, make_engine):
+        """Episodes the response leaves out get the basic post-mortem."""
+        answer = json.dumps([{"episode_id": 1, "lessons_learned": "Lesson 1"}, "junk"])
+        engine = make_engine(StubClient(answer))
+
+        results = await engine.post_mortem_batch([1, 2])
+
+        assert results[0].lessons_learned == "Lesson 1"
+        assert "Loss on BTC/USDT" in results[1].lessons_learned
+        assert engine.get_stats()["fallback_post_mortems"] == 1
+
+    async def test_unparseable_response_falls_back(self, make_engine):
+        """A response without a JSON array falls back for the whole batch."""
+        engine = make_engine(StubClient("I cannot answer in JSON."))
+
+        results = await engine.post_mortem_batch([1, 2])
+
+        assert len(results) == 2
+        assert engine.get_stats()["fallback_post_mortems"] == 2
+
+    async def test_rules_from_response(self, make_engine, memories):
+        """Suggested rules with a name and condition are created."""
+        answer = json.dumps(
+            [
+                {
+                    "episode_id": 1,
+                    "lessons_learned": "Wait for the retest",
+                    "would_take_again": False,
+                    "new_rules": [{"name": "Retest", "condition": "price retests"}, "junk"],
+                    "pattern_observations": ["breakout"],
+                }
+            ]
+        )
+        engine = make_engine(StubClient(answer))
+
+        [result] = await engine.post_mortem_batch([1])
+
+        assert result.would_take_again is False
+        assert result.pattern_observations == ["breakout"]
+        memories[1].create_rule.assert_awaited_once()
+        assert engine.get_stats()["rules_created"] == 1
+
+    async def test_skips_unknown_and_open_episodes(self, make_engine, memories):
+        """Episodes that do not exist or are still open are not analyzed."""
+        open_episode = make_episode(99)
+        open_episode.exit_timestamp = None
+        memories[0].get_episode.side_effect = lambda i: open_episode if i == 99 else None
+        client = StubClient()
+        engine = make_engine(client)
+
+        assert await engine.post_mortem_batch([99, 100]) == []
+        assert client.prompts == []
+
+    async def test_flush_sends_batches(self, make_engine):
+        """The queue is drained in batches of batch_size."""
+        client = StubClient()
+        engine = make_engine(client, batch_size=2)
+        for episode_id in [1, 2, 3, 4, 5, 3]:
+            assert engine.enqueue_post_mortem(episode_id)
+        assert engine.pending_post_mortems == 5
+
+        results = await engine.flush_post_mortems()
+
+        assert [r.episode_id for r in results] == [1, 2, 3, 4, 5]
+        assert len(client.prompts) == 3
+        assert engine.pending_post_mortems == 0
+
+    async def test_overflow_gets_basic_post_mortem(self, make_engine):
+        """Episodes queued beyond max_pending skip the LLM."""
+        client = StubClient()
+        engine = make_engine(client, max_pending=2)
+
+        assert engine.enqueue_post_mortem(1)
+        assert engine.enqueue_post_mortem(2)
+        assert not engine.enqueue_post_mortem(3)
+
+        results = await engine.flush_post_mortems()
+
+        assert len(client.prompts) == 1
+        assert "Trade 3:" not in client.prompts[0]
+        assert "Profitable trade" in results[2].lessons_learned
+        stats = engine.get_stats()
+        assert stats["batched_post_mortems"] == 2
+        assert stats["fallback_post_mortems"] == 1
+
+    async def test_results_are_cached(self, make_engine, memories):
+        """A reflected episode is not fetched or analyzed again."""
+        client = StubClient()
+        engine = make_engine(client, cache_size=2)
+        await engine.post_mortem_batch([1, 2])
+        memories[0].get_episode.reset_mock()
+
+        cached = await engine.post_mortem(1)
+        engine.enqueue_post_mortem(2)
+
+        assert cached.lessons_learned == "Lesson 1"
+        assert engine.pending_post_mortems == 0
+        memories[0].get_episode.assert_not_awaited()
+        assert engine.get_stats()["cache_hits"] == 1
+
+        await engine.post_mortem_batch([3])
+        assert list(engine._cache) == [1, 3]
+
+    async def test_fallbacks_are_not_cached(self, make_engine):
+        """Episodes that got the basic post-mortem are analyzed again later."""
+        client = StubClient("I cannot answer in JSON.")
+        engine = make_engine(client)
+        await engine.post_mortem_batch([1, 2])
+
+        assert list(engine._cache) == []
+        assert engine.enqueue_post_mortem(1)
+        assert engine.pending_post_mortems == 1
+
+        client.answer = None
+        [result] = await engine.flush_post_mortems()
+
+        assert result.lessons_learned == "Lesson 1"
+        assert list(engine._cache) == [1]
+
+    async def test_single_post_mortem_records_lessons(self, make_engine, memories):
+        """Without a client, post_mortem stores the basic analysis."""
+        engine = make_engine()
+
+        result = await engine.post_mortem(1)
+
+        assert result.episode_id == 1
+        memories[0].record_lessons.assert_awaited_once()
+        assert memories[0].record_lessons.await_args.kwargs["lessons_learned"]
+        assert list(engine._cache) == []
+
+    async def test_weekly_reflection_queries_once(self, make_engine, memories, mocker):
+        """Daily summaries come from the episodes fetched for the week."""
+        week = [make_episode(1, day=0), make_episode(2, -1.0, day=0), make_episode(3, day=2)]
+
+        async def history(**_kwargs):
+            for episode in week:
+                yield episode
+
+        memories[0].iter_episode_history = mocker.MagicMock(side_effect=history)
+        engine = make_engine()
+
+        result = await engine.weekly_reflection(week_end=T0 + timedelta(days=6))
+
+        memories[0].iter_episode_history.assert_called_once()
+        assert result.total_trades == 3
+        assert result.daily_summaries == [
+            "2024-01-01: 2 trades, 1 wins, +1.00%",
+            "2024-01-03: 1 trades, 1 wins, +2.00%",
+        ]
+
+
 class TestGetReflectionEngine:
     """Tests for get_reflection_engine function."""
 
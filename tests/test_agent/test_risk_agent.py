@@ -132,6 +132,21 @@ class TestRiskAgent:
         assert result.risk_reward_ratio == 3.0
         assert result.tokens_used == 400
 
+    @pytest.mark.asyncio
+    async def test_assess_includes_cycle_trades(self):
+        """Trades executed earlier in the cycle are part of the risk prompt."""
+        agent = RiskAgent()
+        agent._initialized = True
+        agent._call_claude = AsyncMock(return_value=("Decision: REJECTED", [], 100))
+
+        analysis = MarketAnalysis(symbol="ETH/USDT", signal="long", confidence=0.8)
+        context = {"cycle_trades": [{"symbol": "BTC/USDT", "side": "buy", "quantity": 0.1}]}
+
+        await agent.assess(analysis, context)
+
+        prompt = agent._call_claude.await_args.args[0]
+        assert "- buy 0.1 BTC/USDT" in prompt
+
     def test_get_tool_schemas(self):
         """Test that tool schemas only include allowed categories."""
         agent = RiskAgent()
@@ -13,6 +13,7 @@ from keryxflow.agent.scheduler import (
     TaskStatus,
     get_task_scheduler,
 )
+from keryxflow.core.clock import SimulatedClock
 
 
 class TestTaskFrequency:
@@ -415,6 +416,37 @@ class TestTaskScheduler:
         assert next_run.hour == 14
         assert next_run.minute == 30
 
+    @pytest.mark.asyncio
+    async def test_run_due_follows_simulated_clock(self):
+        """Tasks come due as a simulated clock is advanced, without waiting."""
+        clock = SimulatedClock(datetime(2024, 1, 1, 22, 0, tzinfo=UTC))
+        scheduler = TaskScheduler(clock=clock)
+        runs: list[datetime] = []
+
+        async def callback():
+            runs.append(clock.now())
+
+        scheduler.add_task(
+            id="daily",
+            name="Daily",
+            frequency=TaskFrequency.DAILY,
+            callback=callback,
+            run_at_time=time(23, 0),
+        )
+
+        assert await scheduler.run_due() == []
+
+        clock.advance(3600)
+        results = await scheduler.run_due()
+
+        assert [r.success for r in results] == [True]
+        assert results[0].started_at == clock.now()
+        assert runs == [datetime(2024, 1, 1, 23, 0, tzinfo=UTC)]
+        assert scheduler.get_task("daily").next_run == datetime(2024, 1, 2, 23, 0, tzinfo=UTC)
+
+        clock.advance(12 * 3600)
+        assert await scheduler.run_due() == []
+
     def test_get_stats(self):
         """Test getting scheduler statistics."""
         scheduler = TaskScheduler()
@@ -459,6 +491,221 @@ class TestTaskScheduler:
         assert all(h["task_id"] == "test" for h in history)
 
 
+class TestTimerHeapScheduling:
+    """Tests for deadline-driven, concurrent scheduling."""
+
+    @pytest.mark.asyncio
+    async def test_sleeps_until_earliest_deadline(self):
+        """Sub-second tasks run on time even with a long check interval."""
+        scheduler = TaskScheduler(check_interval_seconds=60)
+        runs = 0
+
+        async def callback():
+            nonlocal runs
+            runs += 1
+
+        scheduler.add_task(
+            id="tick",
+            name="Tick",
+            frequency=TaskFrequency.INTERVAL,
+            callback=callback,
+            interval_seconds=0.05,
+        )
+        await scheduler.start()
+        await asyncio.sleep(0.32)
+        await scheduler.stop()
+
+        assert 4 <= runs <= 7
+        # One wakeup per deadline, not a busy loop
+        assert scheduler.get_stats()["wakeups"] <= 2 * runs + 2
+
+    @pytest.mark.asyncio
+    async def test_added_task_wakes_the_loop(self):
+        """A task added while the loop sleeps is picked up at once."""
+        scheduler = TaskScheduler(check_interval_seconds=60)
+        done = asyncio.Event()
+
+        async def callback():
+            done.set()
+
+        await scheduler.start()
+        await asyncio.sleep(0.01)
+        scheduler.add_task(id="once", name="Once", frequency=TaskFrequency.ONCE, callback=callback)
+
+        await asyncio.wait_for(done.wait(), timeout=1.0)
+        await scheduler.stop()
+
+        assert scheduler.get_task("once").next_run is None
+
+    @pytest.mark.asyncio
+    async def test_slow_task_does_not_block_others(self):
+        """Due tasks run concurrently; overlapping runs past the limit are skipped."""
+        scheduler = TaskScheduler(check_interval_seconds=60)
+        fast_runs = 0
+
+        async def slow():
+            await asyncio.sleep(10)
+
+        async def fast():
+            nonlocal fast_runs
+            fast_runs += 1
+
+        scheduler.add_task(
+            id="slow",
+            name="Slow",
+            frequency=TaskFrequency.INTERVAL,
+            callback=slow,
+            interval_seconds=0.05,
+            max_concurrency=2,
+        )
+        scheduler.add_task(
+            id="fast",
+            name="Fast",
+            frequency=TaskFrequency.INTERVAL,
+            callback=fast,
+            interval_seconds=0.05,
+        )
+        await scheduler.start()
+        await asyncio.sleep(0.3)
+
+        slow_task = scheduler.get_task("slow")
+        assert fast_runs >= 3
+        assert slow_task.active_runs == 2
+        assert slow_task.skipped_count >= 1
+        assert scheduler.get_stats()["tasks_skipped"] == slow_task.skipped_count
+
+        await scheduler.stop()
+        assert slow_task.active_runs == 0
+
+    @pytest.mark.asyncio
+    async def test_timeout(self):
+        """A run longer than its timeout is cancelled and reported."""
+        scheduler = TaskScheduler()
+
+        async def hang():
+            await asyncio.sleep(10)
+
+        scheduler.add_task(
+            id="hang",
+            name="Hang",
+            frequency=TaskFrequency.DAILY,
+            callback=hang,
+            timeout_seconds=0.05,
+        )
+
+        result = await scheduler.run_task_now("hang")
+
+        assert result.success is False
+        assert result.error == "Timed out after 0.05s"
+        assert scheduler.get_stats()["tasks_timed_out"] == 1
+        assert scheduler.get_task("hang").active_runs == 0
+
+    @pytest.mark.asyncio
+    async def test_interval_keeps_phase_and_reports_drift(self):
+        """Late dispatches skip missed occurrences and record drift."""
+        start = datetime(2024, 1, 1, tzinfo=UTC)
+        clock = SimulatedClock(start)
+        scheduler = TaskScheduler(clock=clock)
+
+        async def callback():
+            pass
+
+        task = scheduler.add_task(
+            id="tick",
+            name="Tick",
+            frequency=TaskFrequency.INTERVAL,
+            callback=callback,
+            interval_seconds=10,
+        )
+        assert task.next_run == start + timedelta(seconds=10)
+
+        clock.advance(25)
+        assert len(await scheduler.run_due()) == 1
+
+        assert task.next_run == start + timedelta(seconds=30)
+        assert task.last_drift_ms == 15000
+        stats = scheduler.get_stats()
+        assert stats["avg_drift_ms"] == 15000
+        assert stats["max_drift_ms"] == 15000
+        assert stats["next_run"] == (start + timedelta(seconds=30)).isoformat()
+
+    @pytest.mark.asyncio
+    async def test_disable_and_remove_drop_pending_runs(self):
+        """Disabled and removed tasks leave the heap; enabling reschedules."""
+        clock = SimulatedClock(datetime(2024, 1, 1, tzinfo=UTC))
+        scheduler = TaskScheduler(clock=clock)
+        ran: list[str] = []
+
+        def make(name):
+            async def callback():
+                ran.append(name)
+
+            return callback
+
+        for name in ("a", "b", "c"):
+            scheduler.add_task(
+                id=name,
+                name=name,
+                frequency=TaskFrequency.INTERVAL,
+                callback=make(name),
+                interval_seconds=60,
+            )
+        scheduler.disable_task("a")
+        scheduler.remove_task("b")
+
+        clock.advance(60)
+        await scheduler.run_due()
+        assert ran == ["c"]
+
+        scheduler.enable_task("a")
+        clock.advance(60)
+        await scheduler.run_due()
+        assert sorted(ran) == ["a", "c", "c"]
+
+    @pytest.mark.asyncio
+    async def test_cron_task(self):
+        """CRON tasks run at the expression's times."""
+        clock = SimulatedClock(datetime(2024, 1, 1, 12, 7, tzinfo=UTC))
+        scheduler = TaskScheduler(clock=clock)
+
+        async def callback():
+            pass
+
+        task = scheduler.add_task(
+            id="quarter",
+            name="Quarter hour",
+            frequency=TaskFrequency.CRON,
+            callback=callback,
+            cron="*/15 * * * *",
+        )
+        assert task.next_run == datetime(2024, 1, 1, 12, 15, tzinfo=UTC)
+
+        clock.advance(8 * 60)
+        await scheduler.run_due()
+        assert task.run_count == 1
+        assert task.next_run == datetime(2024, 1, 1, 12, 30, tzinfo=UTC)
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"frequency": TaskFrequency.INTERVAL},
+            {"frequency": TaskFrequency.INTERVAL, "interval_seconds": 0},
+            {"frequency": TaskFrequency.CRON},
+            {"frequency": TaskFrequency.CRON, "cron": "61 * * * *"},
+            {"frequency": TaskFrequency.DAILY, "max_concurrency": 0},
+        ],
+    )
+    def test_invalid_schedule(self, kwargs):
+        """Incomplete or malformed schedules are rejected."""
+        scheduler = TaskScheduler()
+
+        async def callback():
+            pass
+
+        with pytest.raises(ValueError):
+            scheduler.add_task(id="bad", name="Bad", callback=callback, **kwargs)
+
+
 class TestGetTaskScheduler:
     """Tests for get_task_scheduler function."""
 
@@ -0,0 +1,194 @@
+"""Tests for the shared WebSocket event broadcaster."""
+
+import asyncio
+import json
+
+import pytest
+
+from keryxflow.api.broadcast import EventBroadcaster, parse_symbols, parse_topics
+from keryxflow.core.events import Event, EventBus, EventType
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def price(symbol: str, value: float) -> Event:
+    """Create a PRICE_UPDATE event."""
+    return Event(type=EventType.PRICE_UPDATE, data={"symbol": symbol, "price": value})
+
+
+@pytest.fixture
+def bus() -> EventBus:
+    """Private event bus so tests don't touch the global one."""
+    return EventBus()
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    """Fake clock for coalescing tests."""
+    return FakeClock()
+
+
+class TestFanOut:
+    """Tests for subscription and encoding."""
+
+    async def test_single_subscription_for_many_clients(self, bus):
+        """The bus sees one handler however many clients connect."""
+        broadcaster = EventBroadcaster(event_bus=bus)
+        clients = [broadcaster.register() for _ in range(5)]
+
+        assert bus._subscribers[EventType.ORDER_FILLED] == [broadcaster.on_event]
+
+        for client in clients:
+            broadcaster.unregister(client)
+        assert bus._subscribers[EventType.ORDER_FILLED] == []
+
+    async def test_encoded_once_per_event(self, bus):
+        """Each event is JSON-encoded once and shared by all clients."""
+        broadcaster = EventBroadcaster(event_bus=bus)
+        clients = [broadcaster.register() for _ in range(3)]
+
+        await bus.publish_sync(Event(type=EventType.ORDER_FILLED, data={"id": 1}))
+
+        frames = [await c.next_frame() for c in clients]
+        assert broadcaster.frames_encoded == 1
+        assert frames[0] is frames[1] is frames[2]
+        assert json.loads(frames[0])["type"] == "order_filled"
+
+    async def test_topic_filter(self, bus):
+        """Clients only receive the topics they asked for."""
+        broadcaster = EventBroadcaster(event_bus=bus)
+        orders = broadcaster.register(topics={EventType.ORDER_FILLED})
+
+        await bus.publish_sync(Event(type=EventType.RISK_ALERT))
+        await bus.publish_sync(Event(type=EventType.ORDER_FILLED))
+
+        assert orders.queue.qsize() == 1
+        assert json.loads(await orders.next_frame())["type"] == "order_filled"
+
+    async def test_symbol_filter(self, bus):
+        """Symbol filters drop events for other symbols."""
+        broadcaster = EventBroadcaster(event_bus=bus, coalesce_interval=0)
+        eth = broadcaster.register(symbols={"ETH/USDT"})
+
+        await bus.publish_sync(price("BTC/USDT", 1.0))
+        await bus.publish_sync(price("ETH/USDT", 2.0))
+        await bus.publish_sync(Event(type=EventType.SYSTEM_PAUSED))
+
+        assert eth.queue.qsize() == 2
+
+    async def test_no_encoding_without_matching_clients(self, bus):
+        """Events nobody wants are not encoded."""
+        broadcaster = EventBroadcaster(event_bus=bus)
+        broadcaster.register(topics={EventType.ORDER_FILLED})
+
+        await bus.publish_sync(Event(type=EventType.RISK_ALERT))
+
+        assert broadcaster.frames_encoded == 0
+
+    async def test_slow_client_drops_oldest(self, bus):
+        """A full queue drops the oldest frame and counts it."""
+        broadcaster = EventBroadcaster(event_bus=bus, queue_size=2)
+        client = broadcaster.register()
+
+        for i in range(4):
+            await bus.publish_sync(Event(type=EventType.ORDER_FILLED, data={"id": i}))
+
+        assert client.stats.dropped == 2
+        assert json.loads(await client.next_frame())["data"]["id"] == 2
+
+    async def test_lag_reported(self, bus):
+        """Per-client stats include send counts and lag."""
+        broadcaster = EventBroadcaster(event_bus=bus)
+        client = broadcaster.register()
+
+        await bus.publish_sync(Event(type=EventType.ORDER_FILLED))
+        await asyncio.sleep(0.01)
+        await client.next_frame()
+
+        stats = broadcaster.get_stats()["clients"][0]
+        assert stats["sent"] == 1
+        assert stats["last_lag_ms"] >= 10
+
+
+class TestCoalescing:
+    """Tests for per-symbol price coalescing."""
+
+    async def test_burst_coalesced_to_latest(self, bus, clock):
+        """A burst within the interval yields the first and the latest update."""
+        broadcaster = EventBroadcaster(event_bus=bus, coalesce_interval=0.05, clock=clock)
+        client = broadcaster.register()
+
+        for value in (1.0, 2.0, 3.0, 4.0):
+            await bus.publish_sync(price("BTC/USDT", value))
+
+        assert client.queue.qsize() == 1
+        clock.now += 0.05
+        await asyncio.sleep(0.07)
+
+        frames = [json.loads(await client.next_frame()) for _ in range(2)]
+        assert [f["data"]["price"] for f in frames] == [1.0, 4.0]
+        assert broadcaster.events_coalesced == 2
+
+    async def test_symbols_coalesced_independently(self, bus, clock):
+        """Different symbols do not suppress each other."""
+        broadcaster = EventBroadcaster(event_bus=bus, coalesce_interval=10, clock=clock)
+        client = broadcaster.register()
+
+        await bus.publish_sync(price("BTC/USDT", 1.0))
+        await bus.publish_sync(price("ETH/USDT", 2.0))
+
+        assert client.queue.qsize() == 2
+        broadcaster.unregister(client)
+
+    async def test_after_interval_sent_immediately(self, bus, clock):
+        """Updates spaced beyond the interval are not delayed."""
+        broadcaster = EventBroadcaster(event_bus=bus, coalesce_interval=0.25, clock=clock)
+        client = broadcaster.register()
+
+        await bus.publish_sync(price("BTC/USDT", 1.0))
+        clock.now += 0.3
+        await bus.publish_sync(price("BTC/USDT", 2.0))
+
+        assert client.queue.qsize() == 2
+
+    async def test_detach_cancels_pending(self, bus, clock):
+        """Pending coalesced frames are discarded when the last client leaves."""
+        broadcaster = EventBroadcaster(event_bus=bus, coalesce_interval=10, clock=clock)
+        client = broadcaster.register()
+
+        await bus.publish_sync(price("BTC/USDT", 1.0))
+        await bus.publish_sync(price("BTC/USDT", 2.0))
+        broadcaster.unregister(client)
+
+        assert broadcaster._timers == {}
+        assert broadcaster._pending == {}
+
+
+class TestParsing:
+    """Tests for query parameter parsing."""
+
+    def test_parse_topics(self):
+        """Topics are parsed into EventType values."""
+        assert parse_topics("price_update, order_filled") == {
+            EventType.PRICE_UPDATE,
+            EventType.ORDER_FILLED,
+        }
+        assert parse_topics(None) is None
+
+    def test_parse_unknown_topic(self):
+        """Unknown topics raise ValueError."""
+        with pytest.raises(ValueError):
+            parse_topics("nonsense")
+
+    def test_parse_symbols(self):
+        """Symbols are split and stripped."""
+        assert parse_symbols("BTC/USDT,ETH/USDT") == {"BTC/USDT", "ETH/USDT"}
+        assert parse_symbols("") is None
@@ -0,0 +1,134 @@
+"""Tests for the trade history and export endpoints."""
+
+import csv
+import io
+import json
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+from keryxflow.api.server import create_app
+from keryxflow.core.database import get_session_factory
+from keryxflow.core.models import Trade, TradeEpisode, TradeSide
+
+BASE = datetime(2024, 1, 1, tzinfo=UTC)
+
+
+@pytest.fixture
+async def client(init_db):  # noqa: ARG001
+    """Client with 12 trades and their episodes in the database."""
+    async with get_session_factory()() as session:
+        for i in range(12):
+            symbol = "BTC/USDT" if i % 2 == 0 else "ETH/USDT"
+            trade = Trade(
+                symbol=symbol,
+                side=TradeSide.BUY,
+                quantity=1.0,
+                entry_price=100.0 + i,
+                created_at=BASE + timedelta(hours=i),
+            )
+            session.add(trade)
+            await session.flush()
+            session.add(
+                TradeEpisode(
+                    trade_id=trade.id,
+                    symbol=symbol,
+                    entry_price=trade.entry_price,
+                    entry_reasoning="test",
+                    entry_confidence=0.5,
+                    entry_timestamp=trade.created_at,
+                )
+            )
+        await session.commit()
+
+    transport = ASGITransport(app=create_app())
+    async with AsyncClient(transport=transport, base_url="http://test") as c:
+        yield c
+
+
+class TestHistoryEndpoints:
+    """Tests for /api/trades/history and /api/episodes/history."""
+
+    async def test_paginates_with_cursor(self, client):
+        """Pages chain through next_cursor until exhausted."""
+        first = (await client.get("/api/trades/history?limit=5")).json()
+        second = (
+            await client.get(f"/api/trades/history?limit=5&cursor={first['next_cursor']}")
+        ).json()
+
+        assert [t["entry_price"] for t in first["items"]] == [111.0, 110.0, 109.0, 108.0, 107.0]
+        assert second["items"][0]["entry_price"] == 106.0
+        assert first["items"][0]["side"] == "buy"
+
+    async def test_filters(self, client):
+        """Symbol, time range and order filters apply."""
+        resp = await client.get(
+            "/api/trades/history",
+            params={
+                "symbol": "BTC/USDT",
+                "start": "2024-01-01T04:00:00Z",
+                "end": "2024-01-01T10:00:00Z",
+                "order": "asc",
+            },
+        )
+
+        assert [t["entry_price"] for t in resp.json()["items"]] == [104.0, 106.0, 108.0]
+        assert resp.json()["next_cursor"] is None
+
+    async def test_bad_cursor(self, client):
+        """A malformed cursor is a 400."""
+        resp = await client.get("/api/trades/history?cursor=bogus")
+
+        assert resp.status_code == 400
+
+    async def test_limit_bounds(self, client):
+        """Page size is validated."""
+        resp = await client.get("/api/trades/history?limit=0")
+
+        assert resp.status_code == 422
+
+    async def test_episode_history(self, client):
+        """Episodes paginate the same way."""
+        resp = await client.get("/api/episodes/history?limit=3&symbol=ETH/USDT")
+
+        body = resp.json()
+        assert [e["entry_price"] for e in body["items"]] == [111.0, 109.0, 107.0]
+        assert body["next_cursor"] is not None
+
+
+class TestExportEndpoints:
+    """Tests for the streaming export endpoints."""
+
+    async def test_ndjson(self, client):
+        """NDJSON export streams one object per line, oldest first."""
+        resp = await client.get("/api/trades/export")
+
+        assert resp.headers["content-type"].startswith("application/x-ndjson")
+        rows = [json.loads(line) for line in resp.text.splitlines()]
+        assert [r["entry_price"] for r in rows] == [100.0 + i for i in range(12)]
+
+    async def test_csv(self, client):
+        """CSV export has a header row and honours filters."""
+        resp = await client.get("/api/trades/export?format=csv&symbol=ETH/USDT")
+
+        assert resp.headers["content-type"].startswith("text/csv")
+        assert 'filename="trades.csv"' in resp.headers["content-disposition"]
+        rows = list(csv.DictReader(io.StringIO(resp.text)))
+        assert len(rows) == 6
+        assert rows[0]["symbol"] == "ETH/USDT"
+        assert rows[0]["side"] == "buy"
+
+    async def test_episode_export(self, client):
+        """Episodes export with their own columns."""
+        resp = await client.get("/api/episodes/export?format=csv")
+
+        rows = list(csv.DictReader(io.StringIO(resp.text)))
+        assert len(rows) == 12
+        assert "entry_reasoning" in rows[0]
+
+    async def test_unknown_format(self, client):
+        """Unknown formats are rejected."""
+        resp = await client.get("/api/trades/export?format=xml")
+
+        assert resp.status_code == 422
@@ -0,0 +1,204 @@
+"""Tests for the cached REST read model."""
+
+import asyncio
+import json
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+from keryxflow.api.read_model import BALANCE, POSITIONS, TRADES, ReadModel
+from keryxflow.api.server import create_app
+from keryxflow.core.events import Event, EventBus, EventType
+
+
+class CountingLoader:
+    """Loader stand-in that counts calls and returns configurable data."""
+
+    def __init__(self, data):
+        self.data = data
+        self.calls = 0
+
+    async def __call__(self):
+        self.calls += 1
+        return self.data
+
+
+def make_position(symbol: str = "BTC/USDT", side: str = "buy") -> dict:
+    """Create a serialized position."""
+    return {
+        "id": 1,
+        "symbol": symbol,
+        "side": side,
+        "quantity": 0.5,
+        "entry_price": 50000.0,
+        "current_price": 50000.0,
+        "unrealized_pnl": 0.0,
+        "unrealized_pnl_percentage": 0.0,
+        "stop_loss": None,
+        "take_profit": None,
+        "opened_at": None,
+    }
+
+
+@pytest.fixture
+def bus() -> EventBus:
+    """Private event bus."""
+    return EventBus()
+
+
+@pytest.fixture
+def positions() -> CountingLoader:
+    """Positions loader stand-in."""
+    return CountingLoader([make_position()])
+
+
+@pytest.fixture
+def model(bus, positions) -> ReadModel:
+    """Read model with stand-in loaders."""
+    return ReadModel(
+        event_bus=bus,
+        loaders={
+            POSITIONS: positions,
+            TRADES: CountingLoader([]),
+            BALANCE: CountingLoader({"total": {"USDT": 1000.0}, "free": {}, "used": {}}),
+        },
+        refresh_delay=0.01,
+    )
+
+
+class TestReadModel:
+    """Tests for caching and invalidation."""
+
+    async def test_loaded_once(self, model, positions):
+        """Repeated reads are served from memory."""
+        for _ in range(10):
+            await model.get(POSITIONS)
+
+        assert positions.calls == 1
+        assert model.hits == 9
+
+    async def test_concurrent_reads_single_load(self, model, positions):
+        """Concurrent cold reads trigger a single load."""
+        await asyncio.gather(*(model.get(POSITIONS) for _ in range(20)))
+
+        assert positions.calls == 1
+
+    async def test_event_invalidates(self, model, positions, bus):
+        """ORDER_FILLED forces a reload on next read."""
+        await model.get(POSITIONS)
+        await bus.publish_sync(Event(type=EventType.ORDER_FILLED, data={"symbol": "BTC/USDT"}))
+        await model.get(POSITIONS)
+
+        assert positions.calls == 2
+
+    async def test_unrelated_event_keeps_cache(self, model, positions, bus):
+        """Events that don't change state leave the cache alone."""
+        await model.get(POSITIONS)
+        await bus.publish_sync(Event(type=EventType.SIGNAL_GENERATED))
+        await model.get(POSITIONS)
+
+        assert positions.calls == 1
+
+    async def test_stale_section_reloaded(self, bus, positions):
+        """Sections older than max_age are reloaded."""
+        now = [0.0]
+        model = ReadModel(event_bus=bus, loaders={POSITIONS: positions}, clock=lambda: now[0])
+
+        await model.get(POSITIONS)
+        now[0] = 31.0
+        await model.get(POSITIONS)
+
+        assert positions.calls == 2
+
+    async def test_price_update_reprices_in_memory(self, model, positions, bus):
+        """PRICE_UPDATE updates PnL without reloading."""
+        before = await model.get(POSITIONS)
+        await bus.publish_sync(
+            Event(type=EventType.PRICE_UPDATE, data={"symbol": "BTC/USDT", "price": 51000.0})
+        )
+        after = await model.get(POSITIONS)
+
+        assert positions.calls == 1
+        assert after.etag != before.etag
+        assert after.data[0]["unrealized_pnl"] == pytest.approx(500.0)
+        assert after.data[0]["unrealized_pnl_percentage"] == pytest.approx(2.0)
+
+    async def test_same_content_same_etag(self, model):
+        """A reload with unchanged data keeps the ETag."""
+        first = await model.get(POSITIONS)
+        model.invalidate([POSITIONS])
+        second = await model.get(POSITIONS)
+
+        assert second.version != first.version
+        assert second.etag == first.etag
+
+    async def test_failed_load_serves_previous(self, model, positions):
+        """Loader errors fall back to the last good snapshot."""
+        await model.get(POSITIONS)
+
+        async def broken():
+            raise RuntimeError("db down")
+
+        model._loaders[POSITIONS] = broken
+        model.invalidate([POSITIONS])
+        snapshot = await model.get(POSITIONS)
+
+        assert snapshot.data == positions.data
+
+    async def test_stream_pushes_changes(self, model, positions, bus):
+        """The SSE stream sends the initial snapshot, then changed sections."""
+        stream = model.stream([POSITIONS], heartbeat=1.0)
+        first = await anext(stream)
+        assert first.startswith("event: positions\n")
+
+        positions.data = [make_position("ETH/USDT")]
+        await bus.publish_sync(Event(type=EventType.POSITION_OPENED))
+        second = await asyncio.wait_for(anext(stream), timeout=1.0)
+
+        payload = json.loads(second.split("data: ", 1)[1])
+        assert payload[0]["symbol"] == "ETH/USDT"
+        await stream.aclose()
+        assert model.get_stats()["subscribers"] == 0
+
+
+class TestCachedEndpoints:
+    """Tests for ETag handling on the REST endpoints."""
+
+    @pytest.fixture
+    async def client(self):
+        """Client for an app whose read model uses stand-in loaders."""
+        app = create_app()
+        app.state.read_model = ReadModel(
+            event_bus=EventBus(), loaders={POSITIONS: CountingLoader([make_position()])}
+        )
+        transport = ASGITransport(app=app)
+        async with AsyncClient(transport=transport, base_url="http://test") as c:
+            yield c
+
+    async def test_etag_returned(self, client):
+        """Responses carry an ETag."""
+        resp = await client.get("/api/positions")
+
+        assert resp.status_code == 200
+        assert resp.headers["etag"].startswith('"')
+        assert resp.json()[0]["symbol"] == "BTC/USDT"
+
+    async def test_if_none_match_returns_304(self, client):
+        """A matching If-None-Match yields 304 with no body."""
+        etag = (await client.get("/api/positions")).headers["etag"]
+        resp = await client.get("/api/positions", headers={"If-None-Match": etag})
+
+        assert resp.status_code == 304
+        assert resp.content == b""
+
+    async def test_stale_etag_returns_body(self, client):
+        """A non-matching ETag returns the full body."""
+        resp = await client.get("/api/positions", headers={"If-None-Match": '"old"'})
+
+        assert resp.status_code == 200
+
+    async def test_stream_rejects_unknown_section(self, client):
+        """Unknown stream sections are rejected."""
+        resp = await client.get("/api/stream?sections=nope")
+
+        assert resp.status_code == 400
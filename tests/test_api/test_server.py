@@ -108,6 +108,15 @@ async def test_balance_returns_dict(client):
     assert "used" in data
 
 
+async def test_ws_clients_returns_stats(client):
+    """GET /api/ws/clients returns broadcaster statistics."""
+    resp = await client.get("/api/ws/clients")
+    assert resp.status_code == 200
+    data = resp.json()
+    assert data["clients"] == []
+    assert data["coalesce_interval_ms"] == 250
+
+
 async def test_trades_with_data(client, init_db):  # noqa: ARG001
     """GET /api/trades returns trade data when trades exist."""
     from keryxflow.core.repository import get_trade_repository
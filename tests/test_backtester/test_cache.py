@@ -0,0 +1,229 @@
+"""Tests for the persistent backtest result cache."""
+
+import os
+from datetime import UTC
+
+import pandas as pd
+import pytest
+
+from keryxflow.backtester.cache import (
+    BacktestCache,
+    engine_modules,
+    fingerprint_data,
+    get_code_version,
+)
+from keryxflow.backtester.engine import BacktestEngine
+from keryxflow.backtester.report import BacktestResult
+from keryxflow.config import get_settings
+
+
+def make_data(periods: int = 100, base_price: float = 50000.0) -> dict[str, pd.DataFrame]:
+    """Create simple trending OHLCV data."""
+    dates = pd.date_range("2024-01-01", periods=periods, freq="h", tz=UTC)
+    prices = [base_price + (i * 50) for i in range(periods)]
+
+    return {
+        "BTC/USDT": pd.DataFrame(
+            {
+                "datetime": dates,
+                "open": [p - 10 for p in prices],
+                "high": [p + 50 for p in prices],
+                "low": [p - 100 for p in prices],
+                "close": prices,
+                "volume": [1000.0] * periods,
+            }
+        )
+    }
+
+
+def make_result(final_balance: float = 11000.0) -> BacktestResult:
+    """Create a minimal BacktestResult."""
+    return BacktestResult(
+        initial_balance=10000.0,
+        final_balance=final_balance,
+        total_return=(final_balance - 10000.0) / 10000.0,
+        total_trades=0,
+        winning_trades=0,
+        losing_trades=0,
+        win_rate=0.0,
+        avg_win=0.0,
+        avg_loss=0.0,
+        expectancy=0.0,
+        profit_factor=0.0,
+        max_drawdown=0.0,
+        max_drawdown_duration=0,
+        sharpe_ratio=0.0,
+        equity_curve=[10000.0, final_balance],
+    )
+
+
+class TestFingerprint:
+    """Tests for data and code fingerprints."""
+
+    def test_same_content_same_fingerprint(self):
+        """Identical data hashes identically."""
+        assert fingerprint_data(make_data()) == fingerprint_data(make_data())
+
+    def test_different_content_different_fingerprint(self):
+        """Changing a price changes the fingerprint."""
+        data = make_data()
+        changed = make_data()
+        changed["BTC/USDT"].loc[10, "close"] += 1.0
+
+        assert fingerprint_data(data) != fingerprint_data(changed)
+
+    def test_mtf_data_fingerprint(self):
+        """Nested MTF data is hashed per timeframe."""
+        single = make_data()["BTC/USDT"]
+        mtf_a = {"BTC/USDT": {"1h": single, "4h": single.iloc[::4]}}
+        mtf_b = {"BTC/USDT": {"1h": single, "4h": single.iloc[::2]}}
+
+        assert fingerprint_data(mtf_a) != fingerprint_data(mtf_b)
+
+    def test_code_version_is_stable(self):
+        """Code version is computed once and reused."""
+        assert get_code_version() == get_code_version()
+        assert len(get_code_version()) == 16
+
+    def test_code_version_covers_import_closure(self):
+        """Modules the engine reaches only through other modules are hashed too."""
+        modules = engine_modules()
+
+        for name in [
+            "keryxflow.backtester.engine",
+            "keryxflow.aegis.risk",
+            "keryxflow.aegis.guardrails",
+            "keryxflow.aegis.portfolio",
+            "keryxflow.aegis.profiles",
+            "keryxflow.aegis.circuit",
+            "keryxflow.oracle.signals",
+        ]:
+            assert name in modules
+        assert list(modules) == sorted(modules)
+
+
+class TestBacktestCache:
+    """Tests for BacktestCache storage and eviction."""
+
+    def test_miss_then_hit(self, tmp_path):
+        """Stored results are returned on the next lookup."""
+        cache = BacktestCache(tmp_path)
+
+        assert cache.get("abc") is None
+        cache.put("abc", make_result())
+        cached = cache.get("abc")
+
+        assert cached is not None
+        assert cached.final_balance == 11000.0
+        assert cache.hits == 1
+        assert cache.misses == 1
+
+    def test_key_depends_on_settings(self, tmp_path):
+        """Changing an oracle setting produces a different key."""
+        cache = BacktestCache(tmp_path)
+        data = make_data()
+        params = {"initial_balance": 10000.0}
+
+        key_a = cache.make_key(data, None, None, params)
+        object.__setattr__(get_settings().oracle, "rsi_period", 21)
+        key_b = cache.make_key(data, None, None, params)
+
+        assert key_a != key_b
+
+    def test_key_depends_on_engine_params(self, tmp_path):
+        """Changing slippage produces a different key."""
+        cache = BacktestCache(tmp_path)
+        data = make_data()
+
+        key_a = cache.make_key(data, None, None, {"slippage": 0.001})
+        key_b = cache.make_key(data, None, None, {"slippage": 0.002})
+
+        assert key_a != key_b
+
+    def test_lru_eviction_by_count(self, tmp_path):
+        """Least recently used entries are dropped past max_entries."""
+        cache = BacktestCache(tmp_path, max_entries=2)
+
+        cache.put("a", make_result())
+        os.utime(cache._path("a"), (1, 1))
+        cache.put("b", make_result())
+        os.utime(cache._path("b"), (2, 2))
+
+        # Touch "a" so "b" becomes least recently used
+        assert cache.get("a") is not None
+        cache.put("c", make_result())
+
+        assert len(cache) == 2
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+        assert cache.get("c") is not None
+
+    def test_eviction_by_size(self, tmp_path):
+        """Entries are dropped when the size cap is exceeded."""
+        cache = BacktestCache(tmp_path)
+        cache.put("a", make_result())
+        entry_size = cache.size_bytes()
+
+        cache.max_bytes = entry_size * 2
+        cache.put("b", make_result())
+        cache.put("c", make_result())
+
+        assert cache.size_bytes() <= cache.max_bytes
+
+    def test_stale_versions_purged(self, tmp_path):
+        """Entries from another code version are removed on first use."""
+        stale = tmp_path / "0000000000000000"
+        stale.mkdir()
+        (stale / "old.pkl").write_bytes(b"stale")
+
+        cache = BacktestCache(tmp_path)
+        cache.get("anything")
+
+        assert not stale.exists()
+        assert cache.directory.exists()
+
+    def test_corrupt_entry_is_miss(self, tmp_path):
+        """Unreadable entries are discarded and count as a miss."""
+        cache = BacktestCache(tmp_path)
+        cache.get("warmup")
+        cache._path("bad").write_bytes(b"not a pickle")
+
+        assert cache.get("bad") is None
+        assert not cache._path("bad").exists()
+
+    def test_clear(self, tmp_path):
+        """Clear removes all entries."""
+        cache = BacktestCache(tmp_path)
+        cache.put("a", make_result())
+        cache.clear()
+
+        assert len(cache) == 0
+
+
+class TestBacktestEngineCache:
+    """Tests for BacktestEngine cache integration."""
+
+    @pytest.mark.asyncio
+    async def test_second_run_served_from_cache(self, tmp_path):
+        """An identical run is served from the cache."""
+        cache = BacktestCache(tmp_path)
+        data = make_data()
+
+        first = await BacktestEngine(min_candles=20, cache=cache).run(data)
+        second = await BacktestEngine(min_candles=20, cache=cache).run(data)
+
+        assert cache.hits == 1
+        assert second.final_balance == first.final_balance
+        assert second.equity_curve == first.equity_curve
+
+    @pytest.mark.asyncio
+    async def test_different_params_not_shared(self, tmp_path):
+        """Runs with different engine parameters do not share entries."""
+        cache = BacktestCache(tmp_path)
+        data = make_data()
+
+        await BacktestEngine(min_candles=20, cache=cache).run(data)
+        await BacktestEngine(min_candles=20, commission=0.002, cache=cache).run(data)
+
+        assert cache.hits == 0
+        assert len(cache) == 2
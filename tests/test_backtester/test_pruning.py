@@ -0,0 +1,100 @@
+"""Tests for early-abort pruning rules."""
+
+from datetime import UTC
+
+import pandas as pd
+import pytest
+
+from keryxflow.backtester.engine import BacktestEngine
+from keryxflow.backtester.pruning import PruningRules
+
+
+def make_data(periods: int = 120, step: float = 50.0) -> dict[str, pd.DataFrame]:
+    """Create linear OHLCV data trending by `step` per candle."""
+    dates = pd.date_range("2024-01-01", periods=periods, freq="h", tz=UTC)
+    prices = [50000.0 + (i * step) for i in range(periods)]
+
+    return {
+        "BTC/USDT": pd.DataFrame(
+            {
+                "datetime": dates,
+                "open": [p - 10 for p in prices],
+                "high": [p + 50 for p in prices],
+                "low": [p - 100 for p in prices],
+                "close": prices,
+                "volume": [1000.0] * periods,
+            }
+        )
+    }
+
+
+class TestPruningRules:
+    """Tests for PruningRules.check."""
+
+    def test_disabled_by_default(self):
+        """Rules with no bounds never prune."""
+        rules = PruningRules()
+
+        assert rules.enabled is False
+        assert rules.check(50, 100, 100.0, 10000.0, 10000.0, 0) is None
+
+    def test_max_drawdown(self):
+        """Drawdown beyond the bound prunes."""
+        rules = PruningRules(max_drawdown=0.2)
+
+        assert rules.check(10, 100, 8500.0, 10000.0, 10000.0, 0) is None
+        assert rules.check(10, 100, 7900.0, 10000.0, 10000.0, 0) == "max_drawdown"
+
+    def test_min_equity(self):
+        """Equity below the fraction of initial balance prunes."""
+        rules = PruningRules(min_equity_pct=0.5)
+
+        assert rules.check(10, 100, 6000.0, 6000.0, 10000.0, 0) is None
+        assert rules.check(10, 100, 4000.0, 4000.0, 10000.0, 0) == "min_equity"
+
+    def test_min_trades_only_after_checkpoint(self):
+        """Trade count is enforced only once the checkpoint is reached."""
+        rules = PruningRules(min_trades=5, checkpoint_pct=0.5)
+
+        assert rules.check(40, 100, 10000.0, 10000.0, 10000.0, 0) is None
+        assert rules.check(50, 100, 10000.0, 10000.0, 10000.0, 2) == "min_trades"
+        assert rules.check(50, 100, 10000.0, 10000.0, 10000.0, 5) is None
+
+    def test_min_periods_grace(self):
+        """No rule fires before min_periods candles."""
+        rules = PruningRules(max_drawdown=0.1, min_periods=20)
+
+        assert rules.check(10, 100, 5000.0, 10000.0, 10000.0, 0) is None
+        assert rules.check(20, 100, 5000.0, 10000.0, 10000.0, 0) == "max_drawdown"
+
+
+class TestBacktestEnginePruning:
+    """Tests for pruning inside BacktestEngine.run."""
+
+    @pytest.mark.asyncio
+    async def test_run_pruned_on_trade_checkpoint(self):
+        """A run without trades by the checkpoint stops early."""
+        data = make_data(step=0.0)
+        engine = BacktestEngine(
+            min_candles=20,
+            pruning=PruningRules(min_trades=1_000, checkpoint_pct=0.5),
+        )
+
+        result = await engine.run(data)
+
+        assert result.pruned is True
+        assert result.prune_reason == "min_trades"
+        # equity_curve holds the initial balance plus one point per processed candle
+        assert len(result.equity_curve) == 61
+
+    @pytest.mark.asyncio
+    async def test_run_not_pruned_without_breach(self):
+        """A run within bounds completes normally."""
+        data = make_data()
+        engine = BacktestEngine(min_candles=20, pruning=PruningRules(max_drawdown=0.99))
+
+        result = await engine.run(data)
+
+        assert result.pruned is False
+        assert result.prune_reason is None
+        assert len(result.equity_curve) == 121
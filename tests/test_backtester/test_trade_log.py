@@ -0,0 +1,200 @@
+"""Tests for array-backed trade and equity storage."""
+
+import pickle
+from datetime import UTC, datetime
+
+import numpy as np
+import pytest
+
+from keryxflow.backtester.engine import BacktestTrade
+from keryxflow.backtester.report import BacktestResult
+from keryxflow.backtester.trade_log import EquityCurve, TradeLog
+
+
+def make_trade(pnl: float = 100.0, **kwargs) -> BacktestTrade:
+    """Create a closed trade."""
+    defaults = {
+        "symbol": "BTC/USDT",
+        "side": "buy",
+        "quantity": 0.1,
+        "entry_price": 50000.0,
+        "entry_time": datetime(2024, 1, 1, tzinfo=UTC),
+        "exit_price": 51000.0,
+        "exit_time": datetime(2024, 1, 2, tzinfo=UTC),
+        "stop_loss": 49000.0,
+        "take_profit": None,
+        "pnl": pnl,
+        "pnl_percentage": 0.02,
+        "exit_reason": "take_profit",
+    }
+    defaults.update(kwargs)
+    return BacktestTrade(**defaults)
+
+
+def make_result(trades: list, equity_curve: list) -> BacktestResult:
+    """Create a minimal BacktestResult."""
+    return BacktestResult(
+        initial_balance=10000.0,
+        final_balance=10000.0,
+        total_return=0.0,
+        total_trades=len(trades),
+        winning_trades=0,
+        losing_trades=0,
+        win_rate=0.0,
+        avg_win=0.0,
+        avg_loss=0.0,
+        expectancy=0.0,
+        profit_factor=0.0,
+        max_drawdown=0.0,
+        max_drawdown_duration=0,
+        sharpe_ratio=0.0,
+        trades=trades,
+        equity_curve=equity_curve,
+    )
+
+
+class TestTradeLog:
+    """Tests for TradeLog."""
+
+    def test_round_trip(self):
+        """Stored trades are materialized with their original values."""
+        trade = make_trade()
+        log = TradeLog([trade])
+
+        assert len(log) == 1
+        assert log[0] == trade
+        assert log[-1].take_profit is None
+        assert log[0].entry_time.tzinfo is not None
+
+    def test_naive_times_preserved(self):
+        """Naive datetimes come back naive."""
+        trade = make_trade(
+            entry_time=datetime(2024, 1, 1),
+            exit_time=datetime(2024, 1, 2),
+        )
+        log = TradeLog([trade])
+
+        assert log[0].entry_time == datetime(2024, 1, 1)
+        assert log[0].entry_time.tzinfo is None
+
+    def test_open_fields_are_none(self):
+        """Missing exit data round-trips as None."""
+        trade = make_trade(exit_price=None, exit_time=None, exit_reason=None)
+        restored = TradeLog([trade])[0]
+
+        assert restored.exit_price is None
+        assert restored.exit_time is None
+        assert restored.exit_reason is None
+
+    def test_pnl_column_is_view(self):
+        """The pnl column shares memory with the log."""
+        log = TradeLog(make_trade(pnl=p) for p in (10.0, -5.0, 20.0))
+
+        assert np.array_equal(log.pnl, [10.0, -5.0, 20.0])
+        assert np.shares_memory(log.pnl, log.array)
+
+    def test_growth_and_slicing(self):
+        """Appending past capacity keeps every trade."""
+        log = TradeLog()
+        for i in range(100):
+            log.append(make_trade(pnl=float(i), symbol=f"S{i % 3}/USDT"))
+
+        assert len(log) == 100
+        assert [t.pnl for t in log[-3:]] == [97.0, 98.0, 99.0]
+        assert log.symbols == ["S0/USDT", "S1/USDT", "S2/USDT"]
+
+    def test_custom_exit_reason(self):
+        """Unknown exit reasons are added to the lookup table."""
+        log = TradeLog([make_trade(exit_reason="manual")])
+
+        assert log[0].exit_reason == "manual"
+
+    def test_equality_with_list(self):
+        """A log compares equal to the list of trades it holds."""
+        trades = [make_trade(pnl=1.0), make_trade(pnl=2.0, side="sell")]
+
+        assert TradeLog(trades) == trades
+        assert TradeLog() == []
+        assert not TradeLog()
+
+    def test_pickle_trims_buffer(self):
+        """Pickled logs hold only the used rows."""
+        log = TradeLog([make_trade()])
+        restored = pickle.loads(pickle.dumps(log))
+
+        assert len(restored._data) == 1
+        assert restored == log
+
+
+class TestEquityCurve:
+    """Tests for EquityCurve."""
+
+    def test_list_like_access(self):
+        """Indexing, iteration and equality behave like a list."""
+        curve = EquityCurve([10000, 10100.0])
+        curve.append(10200.0)
+        curve[-1] = 10300.0
+
+        assert curve == [10000.0, 10100.0, 10300.0]
+        assert curve[0] == 10000.0
+        assert list(curve) == [10000.0, 10100.0, 10300.0]
+        assert curve[1:] == [10100.0, 10300.0]
+
+    def test_asarray_is_zero_copy(self):
+        """np.asarray returns the backing buffer."""
+        curve = EquityCurve()
+        for i in range(50):
+            curve.append(float(i))
+
+        arr = np.asarray(curve)
+
+        assert arr.dtype == np.float64
+        assert np.shares_memory(arr, curve.values)
+        assert len(arr) == 50
+
+    def test_empty_is_falsy(self):
+        """An empty curve is falsy."""
+        assert not EquityCurve()
+        assert EquityCurve([1.0])
+
+
+class TestBacktestResultStorage:
+    """Tests for BacktestResult normalization."""
+
+    def test_lists_converted(self):
+        """List inputs are converted to array-backed storage."""
+        result = make_result([make_trade()], [10000.0, 10100.0])
+
+        assert isinstance(result.trades, TradeLog)
+        assert isinstance(result.equity_curve, EquityCurve)
+        assert result.trades[0].pnl == 100.0
+        assert result.equity_curve[-1] == 10100.0
+
+    def test_defaults_are_empty(self):
+        """Omitted raw data defaults to empty storage."""
+        result = BacktestResult(
+            initial_balance=1.0,
+            final_balance=1.0,
+            total_return=0.0,
+            total_trades=0,
+            winning_trades=0,
+            losing_trades=0,
+            win_rate=0.0,
+            avg_win=0.0,
+            avg_loss=0.0,
+            expectancy=0.0,
+            profit_factor=0.0,
+            max_drawdown=0.0,
+            max_drawdown_duration=0,
+            sharpe_ratio=0.0,
+        )
+
+        assert len(result.trades) == 0
+        assert len(result.equity_curve) == 0
+
+    def test_metric_helpers(self):
+        """Underwater and rolling Sharpe are computed from the equity array."""
+        result = make_result([], [100.0, 110.0, 99.0, 105.0, 120.0])
+
+        assert result.underwater_curve() == pytest.approx([0.0, 0.0, -0.1, -(5 / 110), 0.0])
+        assert len(result.rolling_sharpe(window=2)) == 4
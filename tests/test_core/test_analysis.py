@@ -0,0 +1,216 @@
+"""Tests for the analysis scheduler."""
+
+import asyncio
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from keryxflow.core.analysis import (
+    AnalysisScheduler,
+    create_analysis_executor,
+    latency_summary,
+)
+from keryxflow.oracle.signals import SignalGenerator
+
+
+@pytest.fixture
+def sample_ohlcv() -> pd.DataFrame:
+    """Random-walk OHLCV data long enough for every indicator."""
+    rng = np.random.default_rng(7)
+    close = 50000 + np.cumsum(rng.normal(0, 100, 250))
+    return pd.DataFrame(
+        {
+            "open": close,
+            "high": close + 50,
+            "low": close - 50,
+            "close": close,
+            "volume": rng.uniform(1, 10, 250),
+        },
+        index=pd.date_range("2024-01-01", periods=250, freq="1h"),
+    )
+
+
+class Recorder:
+    """Analysis callback that records calls and can be held open."""
+
+    def __init__(self):
+        self.calls: list[tuple[str, float]] = []
+        self.gate = asyncio.Event()
+        self.gate.set()
+        self.active: set[str] = set()
+        self.overlap = False
+        self.result: bool | None = None
+
+    async def __call__(self, symbol: str, price: float, _deadline_at: float) -> bool | None:
+        if symbol in self.active:
+            self.overlap = True
+        self.active.add(symbol)
+        self.calls.append((symbol, price))
+        try:
+            await self.gate.wait()
+        finally:
+            self.active.discard(symbol)
+        return self.result
+
+
+async def drain(scheduler: AnalysisScheduler) -> None:
+    """Wait until nothing is pending or running."""
+    for _ in range(200):
+        await asyncio.sleep(0)
+        stats = scheduler.get_stats()
+        if not stats["pending"] and not stats["in_flight"]:
+            return
+    raise AssertionError("scheduler did not drain")
+
+
+class TestAnalysisScheduler:
+    """Tests for AnalysisScheduler."""
+
+    async def test_runs_submitted_analysis(self):
+        """A submitted request is analyzed with its price."""
+        recorder = Recorder()
+        scheduler = AnalysisScheduler(recorder, concurrency=2)
+        scheduler.start()
+
+        scheduler.submit("BTC/USDT", 50000.0)
+        await drain(scheduler)
+        await scheduler.stop()
+
+        assert recorder.calls == [("BTC/USDT", 50000.0)]
+        assert scheduler.stats.completed == 1
+
+    async def test_coalesces_to_newest_price(self):
+        """Only the newest pending request per symbol is analyzed."""
+        recorder = Recorder()
+        scheduler = AnalysisScheduler(recorder)
+
+        scheduler.submit("BTC/USDT", 1.0)
+        scheduler.submit("BTC/USDT", 2.0)
+        scheduler.submit("BTC/USDT", 3.0)
+        scheduler.start()
+        await drain(scheduler)
+        await scheduler.stop()
+
+        assert recorder.calls == [("BTC/USDT", 3.0)]
+        assert scheduler.stats.submitted == 3
+        assert scheduler.stats.coalesced == 2
+
+    async def test_same_symbol_never_overlaps(self):
+        """A request arriving mid-analysis waits for the running one."""
+        recorder = Recorder()
+        recorder.gate.clear()
+        scheduler = AnalysisScheduler(recorder, concurrency=4)
+        scheduler.start()
+
+        scheduler.submit("BTC/USDT", 1.0)
+        await asyncio.sleep(0.01)
+        scheduler.submit("BTC/USDT", 2.0)
+        scheduler.submit("ETH/USDT", 3.0)
+        await asyncio.sleep(0.01)
+
+        # ETH runs alongside BTC; the second BTC request is parked
+        assert recorder.active == {"BTC/USDT", "ETH/USDT"}
+        assert scheduler.get_stats()["pending"] == 1
+
+        recorder.gate.set()
+        await drain(scheduler)
+        await scheduler.stop()
+
+        assert not recorder.overlap
+        assert [c for c in recorder.calls if c[0] == "BTC/USDT"] == [
+            ("BTC/USDT", 1.0),
+            ("BTC/USDT", 2.0),
+        ]
+
+    async def test_stale_requests_dropped(self):
+        """Requests that waited past the deadline are not analyzed."""
+        now = [0.0]
+        recorder = Recorder()
+        scheduler = AnalysisScheduler(recorder, deadline=5.0, clock=lambda: now[0])
+
+        scheduler.submit("BTC/USDT", 1.0)
+        now[0] = 6.0
+        scheduler.submit("ETH/USDT", 2.0)
+        scheduler.start()
+        await drain(scheduler)
+        await scheduler.stop()
+
+        assert recorder.calls == [("ETH/USDT", 2.0)]
+        assert scheduler.stats.dropped_stale == 1
+
+    async def test_expired_and_failed_counted(self):
+        """False results count as expired and exceptions as failures."""
+
+        async def analyze(symbol: str, _price: float, _deadline_at: float) -> bool:
+            if symbol == "BAD/USDT":
+                raise RuntimeError("boom")
+            return False
+
+        scheduler = AnalysisScheduler(analyze, concurrency=2)
+        scheduler.start()
+        scheduler.submit("BTC/USDT", 1.0)
+        scheduler.submit("BAD/USDT", 1.0)
+        await drain(scheduler)
+        await scheduler.stop()
+
+        stats = scheduler.get_stats()
+        assert stats["expired"] == 1
+        assert stats["failed"] == 1
+        assert stats["completed"] == 0
+        assert stats["compute"]["max_ms"] is not None
+
+    async def test_stop_discards_pending(self):
+        """stop() cancels workers and forgets queued requests."""
+        recorder = Recorder()
+        recorder.gate.clear()
+        scheduler = AnalysisScheduler(recorder)
+        scheduler.start()
+        scheduler.submit("BTC/USDT", 1.0)
+        scheduler.submit("ETH/USDT", 2.0)
+        await asyncio.sleep(0.01)
+
+        assert scheduler.running
+        await scheduler.stop()
+
+        assert not scheduler.running
+        assert scheduler.get_stats()["pending"] == 0
+
+
+class TestHelpers:
+    """Tests for module helpers."""
+
+    def test_latency_summary(self):
+        """Samples in seconds are summarized in milliseconds."""
+        summary = latency_summary([0.001, 0.002, 0.003])
+
+        assert summary == {"avg_ms": 2.0, "p95_ms": 3.0, "max_ms": 3.0}
+        assert latency_summary([])["avg_ms"] is None
+
+    def test_create_executor(self):
+        """Pools are built by kind; zero workers means none."""
+        assert create_analysis_executor(0) is None
+
+        thread_pool = create_analysis_executor(2)
+        process_pool = create_analysis_executor(1, "process")
+        try:
+            assert isinstance(thread_pool, ThreadPoolExecutor)
+            assert isinstance(process_pool, ProcessPoolExecutor)
+        finally:
+            thread_pool.shutdown()
+            process_pool.shutdown()
+
+    async def test_signal_in_process_pool(self, sample_ohlcv):
+        """Technical analysis survives the trip to a worker process."""
+        pool = create_analysis_executor(1, "process")
+        generator = SignalGenerator(executor=pool)
+        try:
+            signal = await generator.generate_signal(
+                "BTC/USDT", sample_ohlcv, include_news=False, include_llm=False
+            )
+        finally:
+            pool.shutdown()
+
+        assert signal.symbol == "BTC/USDT"
+        assert signal.technical_data is not None
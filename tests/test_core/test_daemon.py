@@ -0,0 +1,133 @@
+"""Tests for the headless runtime."""
+
+import asyncio
+import sys
+
+import pytest
+
+from keryxflow.core.daemon import HeadlessRunner, event_loop_factory
+from keryxflow.core.engine import TradingEngine
+from keryxflow.core.events import EventBus, EventType
+from keryxflow.exchange.demo import DemoExchangeClient
+from keryxflow.exchange.paper import PaperTradingEngine
+from keryxflow.main import parse_args
+
+
+@pytest.fixture
+async def stack(init_db):  # noqa: ARG001
+    """Engine, demo exchange, paper engine and bus, not yet started."""
+    bus = EventBus()
+    exchange = DemoExchangeClient()
+    paper = PaperTradingEngine(initial_balance=10000.0)
+    await paper.initialize()
+    engine = TradingEngine(exchange_client=exchange, paper_engine=paper, event_bus=bus)
+    return engine, exchange, paper, bus
+
+
+def make_runner(stack, **kwargs) -> HeadlessRunner:
+    """Build a fast-polling runner over the stack."""
+    engine, exchange, paper, bus = stack
+    kwargs.setdefault("poll_interval", 0.01)
+    return HeadlessRunner(
+        trading_engine=engine,
+        exchange_client=exchange,
+        event_bus=bus,
+        paper_engine=paper,
+        symbols=["BTC/USDT", "ETH/USDT"],
+        **kwargs,
+    )
+
+
+class TestHeadlessRunner:
+    """Tests for HeadlessRunner."""
+
+    async def test_run_for_duration(self, stack):
+        """run() polls prices into the engine and shuts everything down."""
+        engine, exchange, paper, bus = stack
+        received = []
+
+        async def on_price(event):
+            received.append(event.data["symbol"])
+
+        bus.subscribe(EventType.PRICE_UPDATE, on_price)
+        runner = make_runner(stack)
+
+        await runner.run(duration=0.2)
+
+        stats = runner.get_stats()
+        assert stats["ticks"] >= 4
+        assert stats["ticks_per_sec"] > 0
+        assert "dropped_stale" in stats["analysis"]
+        assert "BTC/USDT" in received
+        assert set(paper._prices) == {"BTC/USDT", "ETH/USDT"}
+        assert not runner.running
+        assert not engine._running
+        assert not exchange.is_connected
+        assert not bus.is_running
+        assert engine.signals.executor is None
+
+    async def test_request_stop(self, stack):
+        """request_stop() ends an open-ended run."""
+        runner = make_runner(stack)
+        task = asyncio.create_task(runner.run())
+        await asyncio.sleep(0.05)
+
+        assert runner.running
+        runner.request_stop()
+        await asyncio.wait_for(task, 2)
+
+        assert not runner.running
+
+    async def test_fetch_errors_counted(self, stack, mocker):
+        """A failing ticker is skipped and counted."""
+        exchange = stack[1]
+        mocker.patch.object(exchange, "get_ticker", side_effect=RuntimeError("down"))
+        runner = make_runner(stack)
+
+        published = await runner.poll_once()
+
+        assert published == 0
+        assert runner.get_stats()["fetch_errors"] == 2
+
+    async def test_session_started_when_requested(self, stack, mocker):
+        """An agent TradingSession is started and stopped with the runner."""
+        session = mocker.MagicMock(is_running=True, is_paused=False)
+        session.start = mocker.AsyncMock(return_value=True)
+        session.stop = mocker.AsyncMock(return_value=True)
+        mocker.patch("keryxflow.agent.session.TradingSession", return_value=session)
+        runner = make_runner(stack, start_session=True)
+
+        await runner.start()
+        await runner.stop()
+
+        session.start.assert_awaited_once()
+        session.stop.assert_awaited_once()
+
+
+class TestEventLoopFactory:
+    """Tests for event_loop_factory."""
+
+    def test_disabled(self):
+        """uvloop can be turned off."""
+        assert event_loop_factory(use_uvloop=False) is None
+
+    def test_missing_uvloop(self, monkeypatch):
+        """Without uvloop installed the default loop is used."""
+        monkeypatch.setitem(sys.modules, "uvloop", None)
+
+        assert event_loop_factory() is None
+
+
+class TestCli:
+    """Tests for the headless CLI flags."""
+
+    def test_headless_flags(self):
+        """--headless and --duration are parsed."""
+        args = parse_args(["--headless", "--duration", "5"])
+
+        assert args.headless
+        assert args.duration == 5.0
+
+    def test_tui_default(self):
+        """The TUI is the default."""
+        assert not parse_args([]).headless
@@ -1,8 +1,13 @@
 """Tests for the trading engine."""
 
+import asyncio
+import time
+from datetime import UTC, datetime
+
 import pytest
 from pydantic import SecretStr
 
+from keryxflow.core.clock import SimulatedClock
 from keryxflow.core.engine import OHLCVBuffer, TradingEngine
 from keryxflow.core.events import Event, EventBus, EventType
 
@@ -153,6 +158,21 @@ class TestTradingEngineInit:
         await engine.stop()
         assert not engine._running
 
+    @pytest.mark.asyncio
+    async def test_stop_closes_orchestrator(self, mocker, mock_exchange, mock_paper, event_bus):
+        """Stopping releases the multi-agent orchestrator's request threads."""
+        engine = TradingEngine(
+            exchange_client=mock_exchange,
+            paper_engine=mock_paper,
+            event_bus=event_bus,
+        )
+        engine._orchestrator = mocker.MagicMock()
+
+        await engine.start()
+        await engine.stop()
+
+        engine._orchestrator.close.assert_called_once()
+
 
 class TestTradingEngineAnalysis:
     """Tests for trading engine analysis flow."""
@@ -218,6 +238,90 @@ class TestTradingEngineAnalysis:
         assert "paused" in status
         assert "auto_trade" in status
         assert "risk_status" in status
+        assert status["analysis"]["submitted"] == 0
+
+    async def test_price_update_queues_analysis(self, mock_exchange, mock_paper, event_bus, mocker):
+        """While running, price updates hand analysis to the scheduler."""
+        engine = TradingEngine(
+            exchange_client=mock_exchange,
+            paper_engine=mock_paper,
+            event_bus=event_bus,
+        )
+        engine._min_candles = 1
+        engine._analysis_interval = 0
+        engine._ohlcv_buffer._candles["BTC/USDT"].append({"close": 1.0})
+        release = asyncio.Event()
+
+        async def blocked(*_args):
+            await release.wait()
+
+        analyze = mocker.patch.object(engine._analysis, "_analyze", side_effect=blocked)
+
+        await engine.start()
+        try:
+            for price in (50000.0, 50001.0, 50002.0):
+                # Returns immediately although the analysis is blocked
+                await asyncio.wait_for(
+                    engine._on_price_update(
+                        Event(
+                            type=EventType.PRICE_UPDATE,
+                            data={"symbol": "BTC/USDT", "price": price},
+                        )
+                    ),
+                    1,
+                )
+                await asyncio.sleep(0.01)
+            release.set()
+            await asyncio.sleep(0.01)
+
+            stats = engine.get_status()["analysis"]
+            assert stats["submitted"] == 3
+            assert stats["coalesced"] == 1
+            assert [c.args[:2] for c in analyze.call_args_list] == [
+                ("BTC/USDT", 50000.0),
+                ("BTC/USDT", 50002.0),
+            ]
+        finally:
+            await engine.stop()
+
+    async def test_start_creates_analysis_pool(self, mock_exchange, mock_paper, event_bus):
+        """The engine owns the indicator pool for its lifetime."""
+        engine = TradingEngine(
+            exchange_client=mock_exchange,
+            paper_engine=mock_paper,
+            event_bus=event_bus,
+        )
+
+        await engine.start()
+        pool = engine.signals.executor
+        assert pool is not None
+        assert engine._analysis.running
+
+        await engine.stop()
+        assert engine.signals.executor is None
+        assert not engine._analysis.running
+
+    async def test_expired_signal_discarded(self, mock_exchange, mock_paper, event_bus, mocker):
+        """A signal finished after its deadline is neither published nor traded."""
+        engine = TradingEngine(
+            exchange_client=mock_exchange,
+            paper_engine=mock_paper,
+            event_bus=event_bus,
+        )
+        engine._min_candles = 1
+        engine._ohlcv_buffer._candles["BTC/USDT"].append(
+            {"timestamp": 0, "open": 1.0, "high": 1.0, "low": 1.0, "close": 1.0, "volume": 0.0}
+        )
+        mocker.patch.object(engine.signals, "generate_signal", mocker.AsyncMock())
+        publish = mocker.patch.object(event_bus, "publish", mocker.AsyncMock())
+        process = mocker.patch.object(engine, "_process_signal", mocker.AsyncMock())
+
+        result = await engine._analyze_symbol("BTC/USDT", 1.0, deadline=time.monotonic() - 1)
+
+        assert result is False
+        engine.signals.generate_signal.assert_awaited_once()
+        publish.assert_not_awaited()
+        process.assert_not_awaited()
 
 
 class TestTradingEngineEvents:
@@ -396,6 +500,35 @@ class TestTradingEngineLiveMode:
         assert balance.get("USDT") == 500.0
         assert engine._last_balance_sync is not None
 
+    @pytest.mark.asyncio
+    async def test_sync_balance_records_venue_balances(
+        self, mock_exchange, mock_paper, event_bus, mocker
+    ):
+        """Per-venue balances from a multi-venue client land in the portfolio state."""
+        mock_exchange.get_balance = mocker.AsyncMock(
+            return_value={
+                "free": {"USDT": 800.0},
+                "total": {"USDT": 800.0},
+                "venues": {
+                    "binance": {"free": {"USDT": 500.0}, "total": {"USDT": 500.0}},
+                    "bybit": {"free": {"USDT": 300.0}, "total": {"USDT": 300.0}},
+                },
+            }
+        )
+        engine = TradingEngine(
+            exchange_client=mock_exchange,
+            paper_engine=mock_paper,
+            event_bus=event_bus,
+        )
+
+        balance = await engine._sync_balance_from_exchange()
+
+        assert balance["USDT"] == 800.0
+        assert engine.risk.portfolio_state.venue_balances == {
+            "binance": {"USDT": 500.0},
+            "bybit": {"USDT": 300.0},
+        }
+
     @pytest.mark.asyncio
     async def test_verify_live_mode_fails_without_credentials(
         self, mock_exchange, mock_paper, event_bus
@@ -488,6 +621,7 @@ class TestTradingEngineLiveMode:
         mock_notifier = mocker.MagicMock()
         mock_notifier.subscribe_to_events = mocker.MagicMock()
         mock_notifier.notify_system_start = mocker.AsyncMock()
+        mock_notifier.stop = mocker.AsyncMock()
 
         engine = TradingEngine(
             exchange_client=mock_exchange,
@@ -499,10 +633,13 @@ class TestTradingEngineLiveMode:
         await engine.start()
 
         mock_notifier.subscribe_to_events.assert_called_once()
+        mock_notifier.start.assert_called_once()
         mock_notifier.notify_system_start.assert_called_once()
 
         await engine.stop()
 
+        mock_notifier.stop.assert_awaited_once()
+
     @pytest.mark.asyncio
     async def test_verify_live_mode_queries_paper_trade_count_from_db(
         self, mock_exchange, mock_paper, event_bus, tmp_path, mocker
@@ -556,3 +693,154 @@ class TestTradingEngineLiveMode:
         await engine_obj._verify_live_mode_safe()
         spy.assert_called_once()
         assert spy.call_args.kwargs["paper_trade_count"] == 35
+
+
+class TestWarmStart:
+    """Tests for restoring OHLCV buffers from the on-disk snapshot."""
+
+    @pytest.fixture
+    def mock_paper(self, mocker):
+        """Create mock paper trading engine."""
+        mock = mocker.MagicMock()
+        mock.get_balance = mocker.AsyncMock(
+            return_value={"total": {"USDT": 10000.0}, "free": {"USDT": 10000.0}}
+        )
+        mock.get_positions = mocker.AsyncMock(return_value=[])
+        return mock
+
+    @staticmethod
+    def rows(start_ms: int, count: int) -> list[list[float]]:
+        """Consecutive one-minute candle rows."""
+        return [
+            [float(start_ms + i * 60_000), 100.0, 101.0, 99.0, 100.0 + i, 1.0] for i in range(count)
+        ]
+
+    def make_engine(self, mocker, mock_paper, clock=None):
+        """Engine for one symbol with a mocked exchange."""
+        engine = TradingEngine(
+            exchange_client=mocker.MagicMock(),
+            paper_engine=mock_paper,
+            event_bus=EventBus(),
+            clock=clock,
+        )
+        engine.settings.system.symbols = ["BTC/USDT"]
+        engine.exchange.get_ohlcv = mocker.AsyncMock(return_value=[])
+        return engine
+
+    async def test_restores_snapshot_and_fetches_gap(self, mocker, mock_paper):
+        """A recent snapshot is restored and only candles since it are fetched."""
+        now_ms = 1_700_000_040_000
+        clock = SimulatedClock(datetime.fromtimestamp(now_ms / 1000 + 1, UTC))
+        snapshot = self.rows(now_ms - 52 * 60_000, 50)
+        engine = self.make_engine(mocker, mock_paper, clock)
+        engine._snapshot.save({("BTC/USDT", "1m"): snapshot})
+        engine.exchange.get_ohlcv.return_value = self.rows(now_ms - 3 * 60_000, 4)
+
+        await engine._preload_ohlcv()
+
+        call = engine.exchange.get_ohlcv.await_args
+        assert call.kwargs["since"] == snapshot[-1][0]
+        assert call.kwargs["limit"] == 4
+        assert engine._ohlcv_buffer.to_rows("BTC/USDT")[:49] == snapshot[:49]
+        assert engine._ohlcv_buffer.candle_count("BTC/USDT") == 53
+
+    async def test_current_snapshot_needs_no_fetch(self, mocker, mock_paper):
+        """A snapshot whose last candle is still open is used as is."""
+        now_ms = 1_700_000_040_000
+        clock = SimulatedClock(datetime.fromtimestamp(now_ms / 1000 + 1, UTC))
+        engine = self.make_engine(mocker, mock_paper, clock)
+        engine._snapshot.save({("BTC/USDT", "1m"): self.rows(now_ms - 49 * 60_000, 50)})
+
+        await engine._preload_ohlcv()
+
+        engine.exchange.get_ohlcv.assert_not_awaited()
+        assert engine._ohlcv_buffer.candle_count("BTC/USDT") == 50
+
+    async def test_stale_snapshot_falls_back_to_full_fetch(self, mocker, mock_paper):
+        """A snapshot older than one fetch window is ignored."""
+        engine = self.make_engine(mocker, mock_paper)
+        engine._snapshot.save({("BTC/USDT", "1m"): self.rows(0, 50)})
+        engine.exchange.get_ohlcv.return_value = self.rows(1_700_000_000_000, 60)
+
+        await engine._preload_ohlcv()
+
+        assert "since" not in engine.exchange.get_ohlcv.await_args.kwargs
+        assert engine._ohlcv_buffer.candle_count("BTC/USDT") == 60
+
+    async def test_stop_saves_snapshot_after_preload(self, mocker, mock_paper):
+        """Stopping writes the buffers, but never before the preload filled them."""
+        engine = self.make_engine(mocker, mock_paper)
+        engine.exchange.get_ohlcv.return_value = self.rows(1_700_000_000_000, 60)
+
+        assert await engine.save_ohlcv_snapshot() == 0
+
+        await engine.start()
+        await engine._preload_task
+        await engine.stop()
+
+        saved = engine._snapshot.load()
+        assert saved[("BTC/USDT", "1m")].shape == (60, 6)
+
+
+class TestPostMortemQueue:
+    """Tests for queueing closed trades for batched post-mortems."""
+
+    @pytest.fixture
+    def reflection(self, mocker):
+        """Reflection engine stand-in with a batch size of two."""
+        mock = mocker.MagicMock(batch_size=2, pending_post_mortems=1)
+        mock.flush_post_mortems = mocker.AsyncMock(return_value=[])
+        mocker.patch("keryxflow.agent.reflection.get_reflection_engine", return_value=mock)
+        return mock
+
+    def make_engine(self, mocker, agent_mode=True):
+        """Engine in agent mode with one open trade episode."""
+        memory = mocker.MagicMock()
+        memory.record_trade_exit = mocker.AsyncMock(return_value=True)
+        engine = TradingEngine(
+            exchange_client=mocker.MagicMock(),
+            paper_engine=mocker.MagicMock(),
+            event_bus=EventBus(),
+            memory_manager=memory,
+        )
+        engine._agent_mode = agent_mode
+        engine._episode_by_order["BTC/USDT_50000"] = 7
+        return engine
+
+    async def exit_trade(self, engine) -> None:
+        """Close the open trade episode with a profit."""
+        await engine.record_trade_exit(
+            order_id="BTC/USDT_50000",
+            exit_price=51000.0,
+            exit_reasoning="Take profit hit",
+            pnl=100.0,
+            pnl_percentage=2.0,
+        )
+
+    async def test_closed_episode_is_queued(self, mocker, reflection):
+        """A recorded exit queues the episode; a partial batch waits."""
+        engine = self.make_engine(mocker)
+
+        await self.exit_trade(engine)
+
+        reflection.enqueue_post_mortem.assert_called_once_with(7)
+        assert engine._post_mortem_task is None
+
+    async def test_full_batch_is_flushed(self, mocker, reflection):
+        """Once a batch is full it is analyzed without waiting for the scheduler."""
+        reflection.pending_post_mortems = 2
+        engine = self.make_engine(mocker)
+
+        await self.exit_trade(engine)
+        await engine._post_mortem_task
+
+        reflection.flush_post_mortems.assert_awaited_once()
+
+    async def test_not_queued_outside_agent_mode(self, mocker, reflection):
+        """Without the agent there is no reflection to feed."""
+        engine = self.make_engine(mocker, agent_mode=False)
+
+        await self.exit_trade(engine)
+
+        engine.memory.record_trade_exit.assert_awaited_once()
+        reflection.enqueue_post_mortem.assert_not_called()
@@ -282,3 +282,85 @@ class TestEngineTrailingStopIntegration:
             assert tsm.get_stop_price("BTC/USDT") is None
 
             await engine.stop()
+
+
+class TestEngineFixedStops:
+    """Fixed stop-loss/take-profit evaluation in the TradingEngine price loop."""
+
+    @pytest.mark.asyncio
+    async def test_filled_order_stop_loss_closes_position(
+        self,
+        event_bus: EventBus,
+        mock_paper_engine: AsyncMock,
+        mock_exchange: AsyncMock,
+        mock_risk_manager: MagicMock,
+    ) -> None:
+        """A paper fill registers its stop-loss, and crossing it closes the position."""
+        from keryxflow.aegis.risk import ApprovalResult, OrderRequest
+        from keryxflow.core.engine import TradingEngine
+
+        mock_paper_engine.execute_market_order = AsyncMock(
+            return_value={"id": "o1", "price": 50000.0}
+        )
+        engine = TradingEngine(
+            exchange_client=mock_exchange,
+            paper_engine=mock_paper_engine,
+            event_bus=event_bus,
+            risk_manager=mock_risk_manager,
+        )
+        engine._record_trade_episode = AsyncMock()
+        engine.record_trade_exit = AsyncMock()
+        await engine.start()
+
+        order = OrderRequest(
+            symbol="BTC/USDT",
+            side="buy",
+            quantity=0.1,
+            entry_price=50000.0,
+            stop_loss=49000.0,
+            take_profit=53000.0,
+        )
+        await engine._execute_order(order, MagicMock(), ApprovalResult(approved=True))
+        assert "BTC/USDT" in engine._stop_book
+
+        closed = []
+        event_bus.subscribe(EventType.POSITION_CLOSED, lambda e: closed.append(e.data))
+        stopped = await engine.check_stops({"BTC/USDT": 48900.0})
+
+        assert stopped == {"BTC/USDT"}
+        mock_paper_engine.close_position.assert_called_once_with("BTC/USDT", 48900.0)
+        assert "BTC/USDT" not in engine._stop_book
+        engine.record_trade_exit.assert_awaited_once()
+        assert engine.record_trade_exit.call_args.kwargs["exit_reasoning"] == "Stop loss hit"
+
+        await engine.stop()
+
+    @pytest.mark.asyncio
+    async def test_batch_closes_only_crossed_symbols(
+        self,
+        event_bus: EventBus,
+        mock_paper_engine: AsyncMock,
+        mock_exchange: AsyncMock,
+        mock_risk_manager: MagicMock,
+    ) -> None:
+        """One batch evaluation closes every crossed position and nothing else."""
+        from keryxflow.core.engine import TradingEngine
+
+        engine = TradingEngine(
+            exchange_client=mock_exchange,
+            paper_engine=mock_paper_engine,
+            event_bus=event_bus,
+            risk_manager=mock_risk_manager,
+        )
+        engine.record_trade_exit = AsyncMock()
+        engine._stop_book.track("BTC/USDT", "buy", 50000.0, take_profit=52000.0)
+        engine._stop_book.track("ETH/USDT", "sell", 3000.0, stop_loss=3100.0)
+        engine._stop_book.track("SOL/USDT", "buy", 100.0, stop_loss=95.0)
+
+        stopped = await engine.check_stops(
+            {"BTC/USDT": 52100.0, "ETH/USDT": 2990.0, "SOL/USDT": 94.0}
+        )
+
+        assert stopped == {"BTC/USDT", "SOL/USDT"}
+        assert engine._stop_book.symbols == ["ETH/USDT"]
+        assert mock_paper_engine.close_position.await_count == 2
@@ -0,0 +1,138 @@
+"""Tests for keyset-paginated trade history."""
+
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from sqlalchemy import inspect
+
+from keryxflow.core.history import decode_cursor, encode_cursor
+from keryxflow.core.models import Trade, TradeSide, TradeStatus
+from keryxflow.core.repository import TradeRepository
+
+BASE = datetime(2024, 1, 1, tzinfo=UTC)
+
+
+async def seed(session, count: int, symbols=("BTC/USDT", "ETH/USDT")) -> None:
+    """Insert trades one minute apart, alternating symbols."""
+    for i in range(count):
+        session.add(
+            Trade(
+                symbol=symbols[i % len(symbols)],
+                side=TradeSide.BUY,
+                quantity=1.0,
+                entry_price=100.0 + i,
+                status=TradeStatus.CLOSED,
+                created_at=BASE + timedelta(minutes=i),
+            )
+        )
+    await session.commit()
+
+
+@pytest.fixture
+async def repo(db_session):
+    """Repository with seeded trades."""
+    await seed(db_session, 25)
+    return TradeRepository(session=db_session)
+
+
+class TestCursor:
+    """Tests for cursor encoding."""
+
+    def test_roundtrip(self):
+        """Cursors decode to the UTC key they were built from."""
+        cursor = encode_cursor(BASE + timedelta(seconds=1.5), 42)
+
+        assert decode_cursor(cursor) == (datetime(2024, 1, 1, 0, 0, 1, 500000, tzinfo=UTC), 42)
+
+    def test_invalid(self):
+        """Garbage cursors raise ValueError."""
+        with pytest.raises(ValueError):
+            decode_cursor("not-a-cursor")
+
+
+class TestTradeHistory:
+    """Tests for TradeRepository.get_trade_history and iter_trade_history."""
+
+    async def test_pages_cover_everything_once(self, repo):
+        """Following next_cursor visits every trade exactly once, newest first."""
+        seen, cursor = [], None
+        while True:
+            page = await repo.get_trade_history(limit=10, cursor=cursor)
+            seen.extend(t.id for t in page.items)
+            cursor = page.next_cursor
+            if cursor is None:
+                break
+
+        assert len(seen) == 25
+        assert seen == sorted(seen, reverse=True)
+
+    async def test_last_page_has_no_cursor(self, repo):
+        """An exactly-full final page does not advertise another page."""
+        page = await repo.get_trade_history(limit=25)
+
+        assert len(page.items) == 25
+        assert page.next_cursor is None
+
+    async def test_ties_on_timestamp(self, db_session):
+        """Rows sharing a timestamp are split across pages by id."""
+        for _ in range(5):
+            db_session.add(
+                Trade(
+                    symbol="BTC/USDT",
+                    side=TradeSide.BUY,
+                    quantity=1,
+                    entry_price=1,
+                    created_at=BASE,
+                )
+            )
+        await db_session.commit()
+        repo = TradeRepository(session=db_session)
+
+        first = await repo.get_trade_history(limit=3)
+        second = await repo.get_trade_history(limit=3, cursor=first.next_cursor)
+
+        ids = [t.id for t in first.items + second.items]
+        assert sorted(ids) == [1, 2, 3, 4, 5]
+
+    async def test_symbol_and_time_filters(self, repo):
+        """Symbol and [start, end) filters combine."""
+        page = await repo.get_trade_history(
+            symbol="ETH/USDT",
+            start=BASE + timedelta(minutes=5),
+            end=BASE + timedelta(minutes=11),
+            ascending=True,
+        )
+
+        assert [t.entry_price for t in page.items] == [105.0, 107.0, 109.0]
+
+    async def test_aware_bounds_normalized(self, repo):
+        """Timezone-aware bounds are compared in UTC."""
+        from datetime import timezone
+
+        plus_two = timezone(timedelta(hours=2))
+        start = datetime(2024, 1, 1, 2, 20, tzinfo=plus_two)
+        page = await repo.get_trade_history(start=start)
+
+        assert len(page.items) == 5
+
+    async def test_iter_streams_in_batches(self, repo):
+        """iter_trade_history yields all rows oldest first."""
+        prices = [t.entry_price async for t in repo.iter_trade_history(batch_size=4)]
+
+        assert prices == [100.0 + i for i in range(25)]
+
+
+class TestIndexes:
+    """Tests for the history indexes."""
+
+    async def test_indexes_created(self, db_session):
+        """Trades are indexed on created_at and (symbol, created_at)."""
+
+        def names(conn):
+            return {ix["name"] for ix in inspect(conn).get_indexes("trades")}
+
+        conn = await db_session.connection()
+        indexes = await conn.run_sync(names)
+
+        assert "ix_trades_created_at" in indexes
+        assert "ix_trades_symbol_created_at" in indexes
@@ -0,0 +1,178 @@
+"""Tests for the binary event journal."""
+
+from datetime import UTC, datetime
+
+import pytest
+
+from keryxflow.core.events import Event, EventBus, EventType, price_update_event
+from keryxflow.core.journal import (
+    MAGIC,
+    EventJournal,
+    encode_event,
+    journal_files,
+    read_journal,
+)
+
+T0 = datetime(2024, 1, 1, 12, 0, 0, 123456, tzinfo=UTC)
+
+
+def price_event(price: float = 50000.0, volume: float | None = 1.5) -> Event:
+    """Price update at a fixed time."""
+    event = price_update_event("BTC/USDT", price, volume)
+    event.timestamp = T0
+    return event
+
+
+def write_file(path, events) -> None:
+    """Write a journal file directly."""
+    path.write_bytes(MAGIC + b"".join(encode_event(e) for e in events))
+
+
+class TestEncoding:
+    """Tests for frame encoding."""
+
+    def test_price_round_trip(self, tmp_path):
+        """Price updates keep symbol, price, volume and microsecond timestamps."""
+        path = tmp_path / "a.kxj"
+        write_file(path, [price_event(), price_event(volume=None)])
+
+        first, second = read_journal(path)
+
+        assert first.type == EventType.PRICE_UPDATE
+        assert first.timestamp == T0
+        assert first.data == {"symbol": "BTC/USDT", "price": 50000.0, "volume": 1.5}
+        assert second.data["volume"] is None
+
+    def test_price_frames_are_compact(self):
+        """The packed price codec is far smaller than JSON."""
+        frame = encode_event(price_event())
+
+        assert len(frame) < 60
+
+    def test_other_events_use_json(self, tmp_path):
+        """Arbitrary data round-trips; values JSON cannot hold become strings."""
+        event = Event(
+            type=EventType.ORDER_FILLED,
+            timestamp=T0,
+            data={"symbol": "ETH/USDT", "quantity": 0.5, "filled_at": T0, "tags": ["a"]},
+        )
+        path = tmp_path / "a.kxj"
+        write_file(path, [event])
+
+        (decoded,) = read_journal(path)
+
+        assert decoded.type == EventType.ORDER_FILLED
+        assert decoded.data["quantity"] == 0.5
+        assert decoded.data["filled_at"] == str(T0)
+        assert decoded.data["tags"] == ["a"]
+
+    def test_torn_tail_ends_the_read(self, tmp_path):
+        """A frame cut short or corrupted by a crash is not returned."""
+        path = tmp_path / "a.kxj"
+        write_file(path, [price_event(1.0), price_event(2.0)])
+        data = path.read_bytes()
+
+        path.write_bytes(data[:-3])
+        assert [e.data["price"] for e in read_journal(path)] == [1.0]
+
+        corrupted = bytearray(data)
+        corrupted[-1] ^= 0xFF
+        path.write_bytes(bytes(corrupted))
+        assert [e.data["price"] for e in read_journal(path)] == [1.0]
+
+
+class TestEventJournal:
+    """Tests for recording a bus."""
+
+    async def test_records_subscribed_types_from_bus(self, tmp_path):
+        """Configured event types published on the bus are written in order."""
+        bus = EventBus()
+        journal = EventJournal(tmp_path, flush_interval=0.01)
+        journal.attach(bus)
+        await journal.start()
+
+        for price in (1.0, 2.0, 3.0):
+            await bus.publish_sync(price_event(price))
+        await bus.publish_sync(Event(type=EventType.NEWS_FETCHED, data={"n": 1}))
+        await journal.stop()
+
+        events = list(read_journal(tmp_path))
+        assert [e.data["price"] for e in events] == [1.0, 2.0, 3.0]
+        stats = journal.get_stats()
+        assert stats["written"] == 3
+        assert stats["pending"] == 0
+        assert stats["bytes"] > 0
+
+    async def test_detached_on_stop(self, tmp_path):
+        """Events after stop() are not recorded."""
+        bus = EventBus()
+        journal = EventJournal(tmp_path)
+        journal.attach(bus)
+        await journal.start()
+        await journal.stop()
+
+        await bus.publish_sync(price_event())
+
+        assert journal.get_stats()["recorded"] == 0
+
+    async def test_rotation(self, tmp_path):
+        """Files roll over at max_file_bytes and read back as one stream."""
+        journal = EventJournal(tmp_path, max_file_bytes=200)
+        for i in range(12):
+            journal.record(price_event(float(i)))
+            await journal.flush()
+        await journal.stop()
+
+        files = journal_files(tmp_path)
+        assert len(files) > 1
+        assert all(f.stat().st_size <= 200 for f in files)
+        assert [e.data["price"] for e in read_journal(tmp_path)] == [float(i) for i in range(12)]
+
+    async def test_runs_in_the_same_second_get_separate_files(self, mocker, tmp_path):
+        """A second run never appends to a file an earlier run started."""
+
+        class FrozenDatetime(datetime):
+            @classmethod
+            def now(cls, tz=None):
+                return T0.astimezone(tz)
+
+        mocker.patch("keryxflow.core.journal.datetime", FrozenDatetime)
+        for price in (1.0, 2.0):
+            journal = EventJournal(tmp_path)
+            journal.record(price_event(price))
+            await journal.flush()
+            await journal.stop()
+
+        files = journal_files(tmp_path)
+        assert len(files) == 2
+        assert all(f.read_bytes().count(MAGIC) == 1 for f in files)
+        assert [e.data["price"] for e in read_journal(tmp_path)] == [1.0, 2.0]
+
+    async def test_backlog_limit_drops_new_events(self, tmp_path):
+        """A full backlog drops events rather than growing without bound."""
+        journal = EventJournal(tmp_path, max_pending=2)
+        for _ in range(5):
+            journal.record(price_event())
+
+        assert journal.get_stats()["dropped"] == 3
+        assert await journal.flush() == 2
+        await journal.stop()
+
+    @pytest.mark.parametrize("enabled", [False, True])
+    def test_engine_journal_from_settings(self, mocker, tmp_path, enabled):
+        """The engine creates a journal only when it is enabled."""
+        from keryxflow.config import get_settings
+        from keryxflow.core.engine import TradingEngine
+
+        settings = get_settings()
+        settings.journal.enabled = enabled
+        settings.journal.directory = str(tmp_path)
+
+        engine = TradingEngine(
+            exchange_client=mocker.MagicMock(),
+            paper_engine=mocker.MagicMock(),
+            event_bus=EventBus(),
+        )
+
+        assert (engine._journal is not None) is enabled
+        assert ("journal" in engine.get_status()) is enabled
@@ -0,0 +1,196 @@
+"""Tests for replaying a recorded journal through the trading engine."""
+
+import math
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from keryxflow.agent.scheduler import TaskFrequency, TaskScheduler
+from keryxflow.core.clock import Clock, SimulatedClock
+from keryxflow.core.engine import TradingEngine
+from keryxflow.core.events import Event, EventBus, EventType, price_update_event
+from keryxflow.core.journal import EventJournal
+from keryxflow.core.replay import JournalReplayer
+
+T0 = datetime(2024, 1, 1, tzinfo=UTC)
+
+
+def session(minutes: int, step: int = 5) -> list[Event]:
+    """One symbol oscillating around 100, one tick every ``step`` seconds."""
+    events = []
+    for i in range(minutes * 60 // step):
+        event = price_update_event("BTC/USDT", 100.0 + 5 * math.sin(i / 7), 1.0)
+        event.timestamp = T0 + timedelta(seconds=i * step)
+        events.append(event)
+    return events
+
+
+@pytest.fixture
+def mock_paper(mocker):
+    """Paper engine with a fixed balance."""
+    mock = mocker.MagicMock()
+    mock.get_balance = mocker.AsyncMock(
+        return_value={"total": {"USDT": 10000.0}, "free": {"USDT": 10000.0}}
+    )
+    mock.get_positions = mocker.AsyncMock(return_value=[])
+    return mock
+
+
+@pytest.fixture
+def make_engine(mocker, mock_paper):
+    """Factory for engines on a simulated clock that do not place orders."""
+
+    def factory(clock: Clock | None = None) -> TradingEngine:
+        engine = TradingEngine(
+            exchange_client=mocker.MagicMock(),
+            paper_engine=mock_paper,
+            event_bus=EventBus(),
+            clock=clock or SimulatedClock(T0),
+        )
+        engine._auto_trade = False
+        return engine
+
+    return factory
+
+
+class TestSimulatedClock:
+    """Tests for the clock replay moves."""
+
+    def test_set_and_advance(self):
+        """The clock moves forward only."""
+        clock = SimulatedClock(T0)
+        clock.advance(90)
+        assert clock.now() == T0 + timedelta(seconds=90)
+
+        clock.set(T0)
+        assert clock.now() == T0 + timedelta(seconds=90)
+
+        clock.set(datetime(2024, 1, 2))
+        assert clock.now() == datetime(2024, 1, 2, tzinfo=UTC)
+
+    def test_default_clock_first_set_moves_back(self):
+        """Without a start time the first set() may go into the past."""
+        clock = SimulatedClock()
+
+        clock.set(T0)
+        assert clock.now() == T0
+
+        clock.set(T0 - timedelta(hours=1))
+        assert clock.now() == T0
+
+
+class TestJournalReplayer:
+    """Tests for driving the engine from recorded events."""
+
+    def test_requires_simulated_clock(self, make_engine):
+        """A wall-clock engine cannot be replayed faster than real time."""
+        with pytest.raises(ValueError, match="SimulatedClock"):
+            JournalReplayer(make_engine(Clock()))
+
+    def test_scheduler_must_share_clock(self, make_engine):
+        """A scheduler on another clock would not follow the session."""
+        with pytest.raises(ValueError, match="clock"):
+            JournalReplayer(make_engine(), scheduler=TaskScheduler())
+
+    async def test_session_time_drives_risk_and_scheduler(self, make_engine):
+        """Daily risk resets and scheduled tasks happen at recorded times."""
+        clock = SimulatedClock(T0 - timedelta(minutes=1))
+        engine = make_engine(clock)
+        scheduler = TaskScheduler(clock=clock)
+        runs = []
+
+        async def hourly():
+            runs.append(clock.now())
+
+        scheduler.add_task(id="h", name="Hourly", frequency=TaskFrequency.HOURLY, callback=hourly)
+        engine.risk.update_daily_pnl(0.0)
+        assert engine.risk._last_reset_date == "2023-12-31"
+
+        result = await JournalReplayer(engine, scheduler=scheduler).run(session(65))
+
+        assert engine.risk.clock is clock
+        engine.risk.update_daily_pnl(0.0)
+        assert engine.risk._last_reset_date == "2024-01-01"
+        assert result.tasks_run == 2
+        assert runs == [T0, T0 + timedelta(hours=1)]
+
+    async def test_default_clock_replays_past_session(self, make_engine):
+        """A default SimulatedClock is moved back to the recorded session."""
+        clock = SimulatedClock()
+        engine = make_engine(clock)
+        scheduler = TaskScheduler(clock=clock)
+        runs = []
+
+        async def hourly():
+            runs.append(clock.now())
+
+        scheduler.add_task(id="h", name="Hourly", frequency=TaskFrequency.HOURLY, callback=hourly)
+
+        result = await JournalReplayer(engine, scheduler=scheduler).run(session(65))
+
+        assert result.events == 780
+        assert engine._ohlcv_buffer.candle_count("BTC/USDT") == 64
+        assert engine.risk.portfolio_state.hour_start == T0
+        assert runs == [T0 + timedelta(hours=1)]
+
+    async def test_candles_follow_session_time(self, make_engine, mock_paper):
+        """Candles and analysis intervals come from event timestamps."""
+        engine = make_engine()
+
+        result = await JournalReplayer(engine).run(session(30))
+
+        assert result.events == 360
+        assert result.session_seconds == 30 * 60 - 5
+        assert result.speedup > 1
+        assert engine._ohlcv_buffer.candle_count("BTC/USDT") == 29
+        assert engine.clock.now() == T0 + timedelta(seconds=30 * 60 - 5)
+        # Analysis from the 20th candle on, every 10 s of session time
+        assert 55 <= result.produced["signal_generated"] <= 65
+        assert mock_paper.update_price.call_count == 360
+
+    async def test_replay_is_deterministic(self, make_engine):
+        """The same journal produces the same output."""
+        first = await JournalReplayer(make_engine()).run(session(25))
+        second = await JournalReplayer(make_engine()).run(session(25))
+
+        assert first.produced == second.produced
+
+    async def test_recorded_output_is_counted_not_replayed(self, make_engine):
+        """Engine output in the journal is reported next to the replay's own."""
+        events = session(2)
+        events.insert(3, Event(type=EventType.ORDER_FILLED, timestamp=T0, data={}))
+
+        result = await JournalReplayer(make_engine()).run(events, limit=10)
+
+        assert result.events == 10
+        assert result.recorded == {"order_filled": 1}
+        assert result.produced == {}
+
+    async def test_pause_events_are_replayed(self, make_engine):
+        """Recorded pauses stop trading until the recorded resume."""
+        engine = make_engine()
+        events = session(30)
+        paused = Event(type=EventType.SYSTEM_PAUSED, timestamp=events[0].timestamp)
+        events.insert(0, paused)
+
+        result = await JournalReplayer(engine).run(events)
+
+        assert engine._paused
+        assert result.produced == {}
+        assert engine._ohlcv_buffer.candle_count("BTC/USDT") == 0
+
+    async def test_replays_journal_directory(self, make_engine, tmp_path):
+        """A journal recorded from a bus replays from disk."""
+        bus = EventBus()
+        journal = EventJournal(tmp_path)
+        journal.attach(bus)
+        await journal.start()
+        for event in session(25):
+            await bus.publish_sync(event)
+        await journal.stop()
+
+        from_disk = await JournalReplayer(make_engine()).run(tmp_path)
+        in_memory = await JournalReplayer(make_engine()).run(session(25))
+
+        assert from_disk.events == 300
+        assert from_disk.produced == in_memory.produced
@@ -0,0 +1,103 @@
+"""Tests for OHLCV warm-start snapshots."""
+
+import pickle
+
+import numpy as np
+
+from keryxflow.core.engine import OHLCVBuffer
+from keryxflow.core.mtf_buffer import MultiTimeframeBuffer, TimeframeConfig
+from keryxflow.core.snapshot import OHLCVSnapshotStore, merge_candles, missing_candles
+
+MINUTE_MS = 60_000
+
+
+def make_rows(start_ms: int, count: int, step_ms: int = MINUTE_MS) -> list[list[float]]:
+    """Build ``count`` consecutive candle rows."""
+    return [
+        [float(start_ms + i * step_ms), 100.0 + i, 101.0 + i, 99.0 + i, 100.5 + i, 10.0]
+        for i in range(count)
+    ]
+
+
+class TestSnapshotStore:
+    """Tests for reading and writing the snapshot file."""
+
+    def test_round_trip(self, tmp_path):
+        """Saved series load back as (n, 6) arrays; empty series are dropped."""
+        store = OHLCVSnapshotStore(tmp_path / "cache" / "ohlcv.pkl")
+        rows = make_rows(0, 3)
+
+        written = store.save({("BTC/USDT", "1m"): rows, ("ETH/USDT", "1m"): []})
+        loaded = store.load()
+
+        assert written == 1
+        assert set(loaded) == {("BTC/USDT", "1m")}
+        assert loaded[("BTC/USDT", "1m")].shape == (3, 6)
+        np.testing.assert_array_equal(loaded[("BTC/USDT", "1m")], np.array(rows))
+        assert not (tmp_path / "cache" / "ohlcv.tmp").exists()
+
+    def test_missing_corrupt_or_old_snapshot_is_empty(self, tmp_path):
+        """Anything unreadable means a cold start, not an error."""
+        path = tmp_path / "ohlcv.pkl"
+        store = OHLCVSnapshotStore(path)
+        assert store.load() == {}
+
+        path.write_bytes(b"not a pickle")
+        assert store.load() == {}
+
+        path.write_bytes(pickle.dumps({"version": 0, "series": {}}))
+        assert store.load() == {}
+
+    def test_failed_write_keeps_previous_snapshot(self, tmp_path):
+        """A failed write leaves the last good snapshot in place."""
+        store = OHLCVSnapshotStore(tmp_path / "ohlcv.pkl")
+        store.save({("BTC/USDT", "1m"): make_rows(0, 2)})
+
+        assert store.save({("BTC/USDT", "1m"): [[1.0, 2.0]]}) == 0
+        assert store.load()[("BTC/USDT", "1m")].shape == (2, 6)
+
+
+class TestGapAndMerge:
+    """Tests for bridging a snapshot to the present."""
+
+    def test_missing_candles_since_snapshot(self):
+        """Candles opened after the last snapshot candle are counted."""
+        rows = np.array(make_rows(0, 5))
+        last = 4 * MINUTE_MS
+
+        assert missing_candles(None, 60) is None
+        assert missing_candles(rows, 60, now_ms=last + 30_000) == 0
+        assert missing_candles(rows, 60, now_ms=last + 10 * MINUTE_MS + 5) == 10
+        assert missing_candles(rows, 3600, now_ms=last + 10 * MINUTE_MS) == 0
+
+    def test_merge_replaces_overlap(self):
+        """Fetched candles replace snapshot candles from their first timestamp."""
+        rows = np.array(make_rows(0, 4))
+        fetched = make_rows(3 * MINUTE_MS, 3)
+        fetched[0][4] = 999.0
+
+        merged = merge_candles(rows, fetched)
+
+        assert [r[0] for r in merged] == [i * MINUTE_MS for i in range(6)]
+        assert merged[3][4] == 999.0
+        assert len(merge_candles(rows, fetched, max_candles=4)) == 4
+        assert merge_candles(rows, []) == rows.tolist()
+
+
+class TestBufferRows:
+    """Tests for exporting buffers as snapshot rows."""
+
+    def test_buffers_export_ccxt_rows(self):
+        """Candles added from rows come back out as the same rows."""
+        rows = make_rows(1_700_000_000_000, 3)
+        single = OHLCVBuffer()
+        mtf = MultiTimeframeBuffer([TimeframeConfig("1h", 3600, is_primary=True)])
+        for row in rows:
+            single.add_candle("BTC/USDT", *row)
+            mtf.add_candle("BTC/USDT", "1h", *row)
+
+        assert single.symbols == ["BTC/USDT"]
+        assert single.to_rows("BTC/USDT") == rows
+        assert mtf.symbols == ["BTC/USDT"]
+        assert mtf.to_rows("BTC/USDT", "1h") == rows
+        assert mtf.to_rows("ETH/USDT", "1h") == []
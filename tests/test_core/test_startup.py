@@ -0,0 +1,141 @@
+"""Tests for lazy package exports and CLI startup cost."""
+
+import subprocess
+import sys
+import types
+
+import pytest
+
+from keryxflow.core.lazy import lazy_exports
+
+# Console scripts from pyproject.toml: (module, function)
+ENTRY_POINTS = [
+    ("keryxflow.main", "run"),
+    ("keryxflow.backtester.runner", "main"),
+    ("keryxflow.optimizer.runner", "main"),
+]
+
+# Top-level packages that must not be imported just to print --help
+HEAVY = {
+    "aiohttp",
+    "anthropic",
+    "ccxt",
+    "fastapi",
+    "langchain",
+    "langchain_core",
+    "matplotlib",
+    "numpy",
+    "pandas",
+    "pandas_ta",
+    "sqlalchemy",
+    "sqlmodel",
+    "textual",
+}
+
+# Cumulative self-time of all imports for --help, in microseconds. Generous
+# so slow CI machines pass; the eager imports this guards against cost ~3s.
+IMPORT_BUDGET_US = 1_000_000
+
+
+def run_help(module: str, func: str) -> subprocess.CompletedProcess:
+    """Run an entry point with --help under ``-X importtime``."""
+    code = (
+        "import sys\n"
+        "sys.argv = ['prog', '--help']\n"
+        f"from {module} import {func}\n"
+        "try:\n"
+        f"    {func}()\n"
+        "except SystemExit as e:\n"
+        "    assert e.code == 0, e.code\n"
+        "print(','.join(sorted({m.split('.')[0] for m in sys.modules})))\n"
+    )
+    return subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        timeout=60,
+    )
+
+
+def import_self_time_us(stderr: str) -> int:
+    """Sum the self-time column of ``-X importtime`` output."""
+    total = 0
+    for line in stderr.splitlines():
+        if line.startswith("import time:") and "|" in line:
+            self_us = line.split(":", 1)[1].split("|")[0].strip()
+            if self_us.isdigit():
+                total += int(self_us)
+    return total
+
+
+class TestLazyExports:
+    """Tests for lazy_exports."""
+
+    @pytest.fixture
+    def package(self, monkeypatch):
+        """Throwaway package re-exporting OrderedDict from collections."""
+        module = types.ModuleType("lazy_pkg")
+        monkeypatch.setitem(sys.modules, "lazy_pkg", module)
+        monkeypatch.setitem(sys.modules, "lazy_pkg.sub", __import__("collections"))
+        module.__getattr__, module.__dir__ = lazy_exports("lazy_pkg", {"OrderedDict": "sub"})
+        return module
+
+    def test_resolves_and_caches(self, package):
+        """Names resolve on first access and are cached on the module."""
+        from collections import OrderedDict
+
+        assert "OrderedDict" not in vars(package)
+        assert package.OrderedDict is OrderedDict
+        assert vars(package)["OrderedDict"] is OrderedDict
+
+    def test_unknown_name(self, package):
+        """Unknown names raise AttributeError."""
+        with pytest.raises(AttributeError, match="Missing"):
+            package.Missing  # noqa: B018
+
+    def test_dir_lists_exports(self, package):
+        """dir() includes names not yet loaded."""
+        assert "OrderedDict" in dir(package)
+
+    def test_packages_still_export(self):
+        """Re-exported names resolve through the lazy package inits."""
+        import keryxflow.agent
+        import keryxflow.backtester
+        import keryxflow.optimizer
+        import keryxflow.oracle
+        from keryxflow.backtester.engine import BacktestEngine
+
+        assert keryxflow.backtester.BacktestEngine is BacktestEngine
+        for package in (
+            keryxflow.agent,
+            keryxflow.backtester,
+            keryxflow.optimizer,
+            keryxflow.oracle,
+        ):
+            for name in package.__all__:
+                assert getattr(package, name) is not None
+
+
+class TestStartup:
+    """Tests that --help stays cheap for every console script."""
+
+    @pytest.mark.parametrize(("module", "func"), ENTRY_POINTS)
+    def test_help_is_light(self, module, func):
+        """--help exits cleanly without importing heavy dependencies."""
+        result = run_help(module, func)
+
+        assert result.returncode == 0, result.stderr[-2000:]
+        loaded = set(result.stdout.strip().splitlines()[-1].split(","))
+        assert not loaded & HEAVY
+        assert import_self_time_us(result.stderr) < IMPORT_BUDGET_US
+
+    def test_optimizer_runner_imports(self):
+        """The optimizer runner imports without a circular-import error."""
+        result = subprocess.run(
+            [sys.executable, "-c", "import keryxflow.optimizer.runner"],
+            capture_output=True,
+            text=True,
+            timeout=60,
+        )
+
+        assert result.returncode == 0, result.stderr
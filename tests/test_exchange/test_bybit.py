@@ -293,7 +293,7 @@ class TestExchangeFactory:
 
         # Mock settings to return 'bybit' for exchange
         with patch("keryxflow.config.get_settings") as mock_settings:
-            mock_system = type("System", (), {"exchange": "bybit", "mode": "paper"})()
+            mock_system = type("System", (), {"exchange": "bybit", "mode": "paper", "venues": []})()
             mock_settings.return_value = type("Settings", (), {"system": mock_system})()
             adapter = get_exchange_adapter(sandbox=True)
             assert isinstance(adapter, BybitClient)
@@ -304,7 +304,7 @@ class TestExchangeFactory:
 
         with patch("keryxflow.config.get_settings") as mock_settings:
             mock_system = type(
-                "System", (), {"exchange": "unsupported_exchange", "mode": "paper"}
+                "System", (), {"exchange": "unsupported_exchange", "mode": "paper", "venues": []}
             )()
             mock_settings.return_value = type("Settings", (), {"system": mock_system})()
             with pytest.raises(ValueError, match="Unsupported exchange"):
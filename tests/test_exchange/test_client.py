@@ -202,25 +202,22 @@ class TestGetTicker:
 class TestGetOHLCV:
     """Tests for get_ohlcv()."""
 
-    @patch("keryxflow.exchange.client.ccxt.binance")
-    async def test_sandbox_uses_temp_client(self, mock_binance_cls, client):
-        """In sandbox mode, OHLCV fetches via a temporary non-sandbox client."""
+    async def test_sandbox_uses_shared_market_data_client(self, client):
+        """In sandbox mode, OHLCV goes through the shared public client, kept open."""
         fake_ohlcv = [[1700000000000, 50000, 51000, 49000, 50500, 100]]
-        temp_exchange = AsyncMock()
-        temp_exchange.fetch_ohlcv = AsyncMock(return_value=fake_ohlcv)
-        temp_exchange.close = AsyncMock()
-        mock_binance_cls.return_value = temp_exchange
+        public = AsyncMock()
+        public.markets = {"BTC/USDT": {}}
+        public.fetch_ohlcv = AsyncMock(return_value=fake_ohlcv)
 
-        result = await client.get_ohlcv("BTC/USDT", "1h", limit=50)
+        with patch("keryxflow.exchange.market_data.ccxt.binance", return_value=public) as cls:
+            result = await client.get_ohlcv("BTC/USDT", "1h", limit=50)
+            await client.get_ohlcv("ETH/USDT", "4h", limit=10)
 
         assert result == fake_ohlcv
-        temp_exchange.fetch_ohlcv.assert_awaited_once_with(
-            "BTC/USDT",
-            "1h",
-            since=None,
-            limit=50,
-        )
-        temp_exchange.close.assert_awaited_once()
+        cls.assert_called_once_with({"enableRateLimit": True})
+        public.load_markets.assert_awaited_once()
+        public.fetch_ohlcv.assert_any_await("BTC/USDT", "1h", since=None, limit=50)
+        public.close.assert_not_awaited()
 
     async def test_non_sandbox_uses_main_exchange(self, mock_exchange):
         fake_ohlcv = [[1700000000000, 50000, 51000, 49000, 50500, 100]]
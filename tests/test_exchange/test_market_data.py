@@ -0,0 +1,122 @@
+"""Tests for the shared market data client."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from keryxflow.exchange.market_data import (
+    MarketDataClient,
+    close_market_data_clients,
+    get_market_data_client,
+)
+
+
+def fake_exchange(delay: float = 0.0) -> MagicMock:
+    """A ccxt-like exchange whose fetches take ``delay`` seconds."""
+    exchange = MagicMock()
+    exchange.markets = {"BTC/USDT": {}, "ETH/USDT": {}}
+    exchange.load_markets = AsyncMock()
+    exchange.close = AsyncMock()
+    active = {"now": 0, "peak": 0}
+
+    async def fetch_ohlcv(_symbol, _timeframe, since=None, limit=None):  # noqa: ARG001
+        active["now"] += 1
+        active["peak"] = max(active["peak"], active["now"])
+        await asyncio.sleep(delay)
+        active["now"] -= 1
+        return [[0, 1.0, 1.0, 1.0, 1.0, 1.0]] * (limit or 1)
+
+    exchange.fetch_ohlcv = AsyncMock(side_effect=fetch_ohlcv)
+    exchange.active = active
+    return exchange
+
+
+class TestMarketDataClient:
+    """Tests for MarketDataClient."""
+
+    async def test_opens_once_for_concurrent_callers(self):
+        """Concurrent first requests share one instance and one market load."""
+        exchange = fake_exchange(delay=0.01)
+        factory = MagicMock(return_value=exchange)
+        client = MarketDataClient("binance", factory=factory)
+
+        results = await asyncio.gather(
+            *(client.fetch_ohlcv("BTC/USDT", "1m", limit=2) for _ in range(10))
+        )
+
+        assert all(len(r) == 2 for r in results)
+        factory.assert_called_once_with({"enableRateLimit": True})
+        exchange.load_markets.assert_awaited_once()
+        assert client.markets.keys() == {"BTC/USDT", "ETH/USDT"}
+        assert client.get_stats()["requests"] == 10
+
+    async def test_bounded_concurrency(self):
+        """No more than max_concurrency requests run at once."""
+        exchange = fake_exchange(delay=0.01)
+        client = MarketDataClient("binance", max_concurrency=3, factory=lambda _cfg: exchange)
+
+        await asyncio.gather(*(client.fetch_ohlcv("BTC/USDT") for _ in range(12)))
+
+        assert exchange.active["peak"] == 3
+        assert client.get_stats()["peak_in_flight"] == 3
+
+    async def test_errors_counted_and_raised(self):
+        """Failed requests propagate and are counted."""
+        exchange = fake_exchange()
+        exchange.fetch_ticker = AsyncMock(side_effect=RuntimeError("429"))
+        client = MarketDataClient("binance", factory=lambda _cfg: exchange)
+
+        with pytest.raises(RuntimeError):
+            await client.fetch_ticker("BTC/USDT")
+
+        assert client.get_stats()["errors"] == 1
+
+    async def test_failed_market_load_closes_instance(self):
+        """A failed open is retried on the next request."""
+        broken = fake_exchange()
+        broken.load_markets = AsyncMock(side_effect=RuntimeError("down"))
+        healthy = fake_exchange()
+        factory = MagicMock(side_effect=[broken, healthy])
+        client = MarketDataClient("binance", factory=factory)
+
+        with pytest.raises(RuntimeError):
+            await client.fetch_ohlcv("BTC/USDT")
+        broken.close.assert_awaited_once()
+
+        assert await client.fetch_ohlcv("BTC/USDT", limit=1)
+        assert client.get_stats()["opens"] == 1
+
+    async def test_close_and_reopen(self):
+        """close() releases the session; a later request opens a new one."""
+        factory = MagicMock(side_effect=[fake_exchange(), fake_exchange()])
+        client = MarketDataClient("binance", factory=factory)
+
+        await client.fetch_ohlcv("BTC/USDT")
+        await client.close()
+        assert not client.is_open
+
+        await client.fetch_ohlcv("BTC/USDT")
+        assert factory.call_count == 2
+
+
+class TestMarketDataPool:
+    """Tests for the module-level pool."""
+
+    async def test_one_client_per_exchange(self):
+        """The same exchange id returns the same client."""
+        assert get_market_data_client("binance") is get_market_data_client("binance")
+        assert get_market_data_client("binance") is not get_market_data_client("kraken")
+        assert get_market_data_client("binance").max_concurrency == 4
+
+    async def test_close_all(self):
+        """close_market_data_clients() closes and forgets every client."""
+        client = get_market_data_client("binance")
+        exchange = fake_exchange()
+        client._factory = lambda _cfg: exchange
+        await client.fetch_ohlcv("BTC/USDT")
+
+        await close_market_data_clients()
+
+        exchange.close.assert_awaited_once()
+        assert get_market_data_client("binance") is not client
@@ -0,0 +1,102 @@
+"""Tests for the paper limit order book."""
+
+import pytest
+
+from keryxflow.exchange.orderbook import LimitOrderBook
+from keryxflow.exchange.orders import Order, OrderStatus, OrderType
+
+
+def limit(order_id: str, side: str, price: float, amount: float = 1.0) -> Order:
+    """An open limit order."""
+    return Order(
+        id=order_id,
+        symbol="BTC/USDT",
+        order_type=OrderType.LIMIT,
+        side=side,
+        amount=amount,
+        price=price,
+        status=OrderStatus.OPEN,
+        remaining=amount,
+    )
+
+
+class TestLimitOrderBook:
+    """Tests for LimitOrderBook."""
+
+    def test_only_crossed_orders_match(self):
+        """Buys fill at or above the price, sells at or below it."""
+        book = LimitOrderBook("BTC/USDT")
+        for order in (
+            limit("b100", "buy", 100.0),
+            limit("b99", "buy", 99.0),
+            limit("s101", "sell", 101.0),
+            limit("s98", "sell", 98.0),
+        ):
+            book.add(order)
+
+        fills = book.match(99.0)
+
+        assert [f.order.id for f in fills] == ["b100", "b99", "s98"]
+        assert book.orders()[0].id == "s101"
+        assert book.best_bid() is None
+        assert book.best_ask() == 101.0
+
+    def test_price_time_priority(self):
+        """Better prices fill first, then earlier orders at the same price."""
+        book = LimitOrderBook("BTC/USDT")
+        book.add(limit("first", "buy", 100.0))
+        book.add(limit("better", "buy", 101.0))
+        book.add(limit("second", "buy", 100.0))
+
+        assert [f.order.id for f in book.match(90.0)] == ["better", "first", "second"]
+
+    def test_liquidity_cap_partial_fill(self):
+        """The last order within the cap fills partially and stays at the head."""
+        book = LimitOrderBook("BTC/USDT")
+        book.add(limit("a", "buy", 100.0, amount=1.0))
+        book.add(limit("b", "buy", 100.0, amount=2.0))
+
+        fills = book.match(100.0, liquidity=1.5)
+
+        assert [(f.order.id, f.amount, f.is_partial) for f in fills] == [
+            ("a", 1.0, False),
+            ("b", 0.5, True),
+        ]
+        assert "b" in book
+        assert "a" not in book
+
+    def test_cancel_is_skipped(self):
+        """Cancelled orders never match, and the ladders get compacted."""
+        book = LimitOrderBook("BTC/USDT")
+        for i in range(100):
+            book.add(limit(f"o{i}", "sell", 100.0 + i))
+        for i in range(99):
+            assert book.cancel(f"o{i}") is not None
+
+        assert book.cancel("o0") is None
+        assert len(book._asks) < 50
+        assert [f.order.id for f in book.match(500.0)] == ["o99"]
+
+    def test_restore_keeps_priority(self):
+        """An order put back after a rejected fill keeps its place."""
+        book = LimitOrderBook("BTC/USDT")
+        book.add(limit("early", "sell", 100.0))
+        book.add(limit("late", "sell", 100.0))
+
+        (first, second) = book.match(100.0)
+        book.restore(second)
+        book.restore(first)
+
+        assert [f.order.id for f in book.match(100.0)] == ["early", "late"]
+
+    def test_rejects_bad_orders(self):
+        """Orders without a price or already resting are refused."""
+        book = LimitOrderBook("BTC/USDT")
+        book.add(limit("a", "buy", 100.0))
+
+        with pytest.raises(ValueError):
+            book.add(limit("a", "buy", 100.0))
+        with pytest.raises(ValueError):
+            book.add(
+                Order(id="x", symbol="BTC/USDT", order_type=OrderType.LIMIT, side="buy", amount=1)
+            )
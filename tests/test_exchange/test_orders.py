@@ -0,0 +1,85 @@
+"""Tests for OrderManager limit orders in paper mode."""
+
+import pytest
+
+from keryxflow.exchange.orders import OrderManager, OrderStatus
+from keryxflow.exchange.paper import get_paper_engine
+
+
+@pytest.fixture
+async def manager(init_db):  # noqa: ARG001
+    """Order manager on a fresh paper engine with BTC priced."""
+    order_manager = OrderManager()
+    await order_manager.initialize()
+    get_paper_engine().update_price("BTC/USDT", 50000.0)
+    return order_manager
+
+
+class TestPaperLimitOrders:
+    """Tests for resting paper limit orders."""
+
+    async def test_resting_order_fills_when_crossed(self, manager):
+        """A buy below the market rests until the price reaches it."""
+        order = await manager.place_limit_order("BTC/USDT", "buy", 0.01, 49000.0)
+        assert order.status == OrderStatus.OPEN
+
+        assert await manager.check_pending_orders() == []
+
+        get_paper_engine().update_price("BTC/USDT", 48900.0)
+        filled = await manager.check_pending_orders(symbols=["BTC/USDT"])
+
+        assert filled == [order]
+        assert order.status == OrderStatus.FILLED
+        assert order.remaining == 0.0
+        assert manager.get_pending_orders() == []
+
+    async def test_grid_fills_batch(self, manager):
+        """Only crossed grid levels fill, all in one check."""
+        for i in range(10):
+            await manager.place_limit_order("BTC/USDT", "buy", 0.001, 49900.0 - i * 100)
+
+        get_paper_engine().update_price("BTC/USDT", 49550.0)
+        filled = await manager.check_pending_orders()
+
+        assert sorted(o.price for o in filled) == [49600.0, 49700.0, 49800.0, 49900.0]
+        assert len(manager.get_pending_orders()) == 6
+        balance = await get_paper_engine().get_balance()
+        assert balance["total"]["BTC"] == pytest.approx(0.004)
+
+    async def test_partial_fill_with_liquidity(self, manager):
+        """A liquidity cap fills part of an order and leaves the rest resting."""
+        await manager.place_market_order("BTC/USDT", "buy", 0.03)
+        order = await manager.place_limit_order("BTC/USDT", "sell", 0.03, 51000.0)
+        get_paper_engine().update_price("BTC/USDT", 51000.0)
+
+        filled = await manager.check_pending_orders(liquidity={"BTC/USDT": 0.01})
+
+        assert filled == [order]
+        assert order.status == OrderStatus.PARTIALLY_FILLED
+        assert order.filled == pytest.approx(0.01)
+        assert order.remaining == pytest.approx(0.02)
+        assert order in manager.get_pending_orders()
+
+        filled = await manager.check_pending_orders(liquidity={"BTC/USDT": 1.0})
+        assert order.status == OrderStatus.FILLED
+        assert order.filled == pytest.approx(0.03)
+        assert order.average_price == pytest.approx(51000.0 * 0.999)
+
+    async def test_rejected_fill_keeps_order_resting(self, manager):
+        """An unaffordable fill leaves the order pending."""
+        order = await manager.place_limit_order("BTC/USDT", "buy", 10.0, 49000.0)
+
+        get_paper_engine().update_price("BTC/USDT", 48000.0)
+        assert await manager.check_pending_orders() == []
+
+        assert order.status == OrderStatus.OPEN
+        assert manager.get_pending_orders() == [order]
+
+    async def test_cancel_removes_from_book(self, manager):
+        """Cancelled orders never fill."""
+        order = await manager.place_limit_order("BTC/USDT", "buy", 0.01, 49000.0)
+
+        assert await manager.cancel_order(order.id, "BTC/USDT")
+        get_paper_engine().update_price("BTC/USDT", 48000.0)
+
+        assert await manager.check_pending_orders() == []
@@ -207,3 +207,41 @@ class TestPaperTradingEngine:
         sell_result = await paper_engine.execute_market_order("BTC/USDT", "sell", 0.1)
         expected_sell_price = 50000.0 * 0.999  # 0.1% slippage
         assert abs(sell_result["price"] - expected_sell_price) < 0.01
+
+
+class TestPaperBatchFills:
+    """Tests for execute_fills."""
+
+    async def test_batch_books_all_fills(self, paper_engine):
+        """Fills are booked together and each one sees the balances before it."""
+        results = await paper_engine.execute_fills(
+            [
+                {"symbol": "BTC/USDT", "side": "buy", "amount": 0.1, "price": 50000.0},
+                {"symbol": "BTC/USDT", "side": "sell", "amount": 0.05, "price": 51000.0},
+            ]
+        )
+
+        assert [r["side"] for r in results] == ["buy", "sell"]
+        assert results[0]["price"] == pytest.approx(50000.0 * 1.001)
+        balance = await paper_engine.get_balance()
+        assert balance["total"]["BTC"] == pytest.approx(0.05)
+
+    async def test_rejected_fill_skipped(self, paper_engine):
+        """An unaffordable fill is None and does not undo the others."""
+        results = await paper_engine.execute_fills(
+            [
+                {"symbol": "BTC/USDT", "side": "buy", "amount": 0.1, "price": 50000.0},
+                {"symbol": "BTC/USDT", "side": "buy", "amount": 1.0, "price": 50000.0},
+                {"symbol": "ETH/USDT", "side": "sell", "amount": 1.0, "price": 3000.0},
+            ]
+        )
+
+        assert results[0] is not None
+        assert results[1] is None
+        assert results[2] is None
+        balance = await paper_engine.get_balance()
+        assert balance["total"]["BTC"] == pytest.approx(0.1)
+
+    async def test_empty_batch(self, paper_engine):
+        """No fills, no transaction."""
+        assert await paper_engine.execute_fills([]) == []
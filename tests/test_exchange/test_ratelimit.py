@@ -0,0 +1,282 @@
+"""Tests for the per-exchange request scheduler and the shared adapter core."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import ccxt.async_support as ccxt
+import pytest
+
+from keryxflow.exchange.base import CCXTExchangeClient
+from keryxflow.exchange.bybit import BybitClient
+from keryxflow.exchange.client import ExchangeClient
+from keryxflow.exchange.kraken import KrakenClient
+from keryxflow.exchange.okx import OKXClient
+from keryxflow.exchange.ratelimit import RequestPriority, RequestScheduler
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestTokenBucket:
+    """Tests for budget accounting."""
+
+    async def test_burst_runs_immediately(self):
+        """Requests within capacity run without queueing."""
+        scheduler = RequestScheduler("test", rate=10.0, capacity=5.0, order_reserve=0.0)
+        call = AsyncMock(return_value="ok")
+
+        results = [await scheduler.submit(call, cost=1.0) for _ in range(5)]
+
+        assert results == ["ok"] * 5
+        assert scheduler.get_stats()["queued"] == 0
+
+    async def test_order_reserve_held_back_from_reads(self):
+        """Reads leave the reserve untouched; orders may spend it."""
+        clock = FakeClock()
+        scheduler = RequestScheduler("test", rate=1.0, capacity=10.0, clock=clock)
+
+        for _ in range(8):
+            await scheduler.submit(AsyncMock(), priority=RequestPriority.TICKER)
+        waiting = asyncio.create_task(
+            scheduler.submit(AsyncMock(), priority=RequestPriority.TICKER)
+        )
+        await asyncio.sleep(0)
+        assert scheduler.queued == 1
+
+        for _ in range(2):
+            await scheduler.submit(AsyncMock(), priority=RequestPriority.ORDER)
+        assert scheduler.get_stats()["tokens"] == 0.0
+        assert scheduler.queued == 1
+        waiting.cancel()
+        scheduler._dispatcher.cancel()
+
+    async def test_refill_follows_clock(self):
+        """Spent budget comes back at ``rate`` per second, capped at capacity."""
+        clock = FakeClock()
+        scheduler = RequestScheduler("test", rate=2.0, capacity=4.0, clock=clock)
+        await scheduler.submit(AsyncMock(), cost=4.0)
+        assert scheduler.get_stats()["tokens"] == 0.0
+
+        clock.now = 1.0
+        scheduler._refill()
+        assert scheduler.get_stats()["tokens"] == 2.0
+
+        clock.now = 100.0
+        scheduler._refill()
+        assert scheduler.get_stats()["tokens"] == 4.0
+
+    async def test_cost_clamped_to_capacity(self):
+        """A call heavier than the bucket still runs once the bucket is full."""
+        scheduler = RequestScheduler("test", rate=100.0, capacity=2.0)
+
+        assert await scheduler.submit(AsyncMock(return_value=1), cost=50.0) == 1
+
+    async def test_paces_when_exhausted(self):
+        """Requests past the burst wait for refill."""
+        scheduler = RequestScheduler("test", rate=100.0, capacity=1.0)
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+
+        await asyncio.gather(*(scheduler.submit(AsyncMock(), cost=1.0) for _ in range(5)))
+
+        # One from the burst, four more at 10 ms each
+        assert loop.time() - start >= 0.035
+        assert scheduler.get_stats()["queued"] == 4
+
+
+class TestPriority:
+    """Tests for queue ordering."""
+
+    async def test_orders_jump_queued_history(self):
+        """Queued requests are released by priority, FIFO within a level."""
+        scheduler = RequestScheduler("test", rate=200.0, capacity=1.0)
+        await scheduler.submit(AsyncMock(), cost=1.0)  # drain the burst
+        order: list[str] = []
+
+        def call(name):
+            async def run():
+                order.append(name)
+
+            return run
+
+        await asyncio.gather(
+            scheduler.submit(call("ohlcv-1"), priority=RequestPriority.HISTORY),
+            scheduler.submit(call("ticker"), priority=RequestPriority.TICKER),
+            scheduler.submit(call("ohlcv-2"), priority=RequestPriority.HISTORY),
+            scheduler.submit(call("balance"), priority=RequestPriority.BALANCE),
+            scheduler.submit(call("order"), priority=RequestPriority.ORDER),
+        )
+
+        assert order == ["order", "balance", "ticker", "ohlcv-1", "ohlcv-2"]
+
+    async def test_cancelled_waiter_is_skipped(self):
+        """A caller cancelled in the queue does not consume budget."""
+        scheduler = RequestScheduler("test", rate=100.0, capacity=1.0)
+        await scheduler.submit(AsyncMock(), cost=1.0)
+        skipped = AsyncMock()
+
+        waiter = asyncio.create_task(scheduler.submit(skipped))
+        await asyncio.sleep(0)
+        waiter.cancel()
+        result = await scheduler.submit(AsyncMock(return_value="next"))
+
+        assert result == "next"
+        skipped.assert_not_awaited()
+        assert scheduler.queued == 0
+
+
+class TestCoalescing:
+    """Tests for sharing identical in-flight requests."""
+
+    async def test_identical_keys_share_one_call(self):
+        """Concurrent submissions with the same key run the call once."""
+        scheduler = RequestScheduler("test", rate=100.0)
+        calls = 0
+
+        async def fetch():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return {"last": 1.0}
+
+        results = await asyncio.gather(
+            *(scheduler.submit(fetch, key=("fetch_ticker", "BTC/USDT")) for _ in range(4))
+        )
+
+        assert calls == 1
+        assert all(r is results[0] for r in results)
+        stats = scheduler.get_stats()
+        assert stats["requests"] == 4
+        assert stats["executed"] == 1
+        assert stats["coalesced"] == 3
+        assert stats["in_flight_shared"] == 0
+
+    async def test_distinct_or_sequential_calls_not_shared(self):
+        """Different keys, unkeyed calls and later calls all run."""
+        scheduler = RequestScheduler("test", rate=100.0)
+        call = AsyncMock(return_value=1)
+
+        await asyncio.gather(
+            scheduler.submit(call, key="a"),
+            scheduler.submit(call, key="b"),
+            scheduler.submit(call),
+            scheduler.submit(call),
+        )
+        await scheduler.submit(call, key="a")
+
+        assert call.await_count == 5
+
+    async def test_errors_reach_every_waiter(self):
+        """A failed shared request raises in each caller."""
+        scheduler = RequestScheduler("test", rate=100.0)
+
+        async def fail():
+            await asyncio.sleep(0.01)
+            raise ccxt.NetworkError("down")
+
+        results = await asyncio.gather(
+            *(scheduler.submit(fail, key="k") for _ in range(3)), return_exceptions=True
+        )
+
+        assert all(isinstance(r, ccxt.NetworkError) for r in results)
+
+
+class TestRateLimitResponse:
+    """Tests for backing off after the exchange pushes back."""
+
+    async def test_rate_limit_error_pauses_dispatch(self):
+        """A 429 empties the bucket and holds later requests for the cooldown."""
+        scheduler = RequestScheduler("test", rate=1000.0, capacity=10.0, cooldown=0.05)
+        loop = asyncio.get_running_loop()
+
+        with pytest.raises(ccxt.RateLimitExceeded):
+            await scheduler.submit(AsyncMock(side_effect=ccxt.RateLimitExceeded("429")))
+        start = loop.time()
+        await scheduler.submit(AsyncMock())
+
+        assert loop.time() - start >= 0.04
+        assert scheduler.get_stats()["rate_limited"] == 1
+
+    async def test_other_errors_do_not_pause(self):
+        """Ordinary exchange errors leave the budget alone."""
+        scheduler = RequestScheduler("test", rate=10.0, capacity=10.0)
+
+        with pytest.raises(ccxt.ExchangeError):
+            await scheduler.submit(AsyncMock(side_effect=ccxt.ExchangeError("bad symbol")))
+
+        assert scheduler.get_stats()["rate_limited"] == 0
+        assert scheduler.get_stats()["tokens"] >= 8.0
+
+
+class TestSharedAdapterCore:
+    """Tests for CCXTExchangeClient routing through the scheduler."""
+
+    @pytest.mark.parametrize("cls", [ExchangeClient, BybitClient, KrakenClient, OKXClient])
+    def test_adapters_share_core(self, cls):
+        """Every live adapter is built on the shared core with its own scheduler."""
+        client = cls(sandbox=True)
+
+        assert isinstance(client, CCXTExchangeClient)
+        assert client.scheduler.name == cls.label
+
+    async def test_connect_configures_rate_from_ccxt(self):
+        """ccxt's per-cost-unit delay becomes the bucket refill rate."""
+        exchange = AsyncMock()
+        exchange.set_sandbox_mode = MagicMock()
+        exchange.rateLimit = 20
+        client = BybitClient(sandbox=True)
+        client._create_exchange = MagicMock(return_value=exchange)
+
+        assert await client.connect()
+
+        config = client._create_exchange.call_args.args[0]
+        assert config["enableRateLimit"] is False
+        assert client.scheduler.rate == 50.0
+
+    async def test_concurrent_tickers_coalesce(self):
+        """Concurrent identical ticker reads hit the exchange once."""
+        exchange = AsyncMock()
+
+        async def fetch_ticker(symbol):
+            await asyncio.sleep(0.01)
+            return {
+                "symbol": symbol,
+                "last": 1.0,
+                "bid": 1.0,
+                "ask": 1.0,
+                "high": 1.0,
+                "low": 1.0,
+                "baseVolume": 1.0,
+                "quoteVolume": 1.0,
+                "timestamp": 0,
+                "datetime": "",
+            }
+
+        exchange.fetch_ticker = AsyncMock(side_effect=fetch_ticker)
+        client = KrakenClient(sandbox=True)
+        client._exchange = exchange
+
+        tickers = await asyncio.gather(*(client.get_ticker("BTC/USDT") for _ in range(5)))
+
+        assert exchange.fetch_ticker.await_count == 1
+        assert {t["symbol"] for t in tickers} == {"BTC/USDT"}
+
+    async def test_orders_never_coalesce(self):
+        """Identical concurrent orders are each sent."""
+        exchange = AsyncMock()
+        exchange.create_market_order = AsyncMock(return_value={"id": "1"})
+        client = OKXClient(sandbox=True)
+        client._exchange = exchange
+
+        await asyncio.gather(
+            *(client.create_market_order("BTC/USDT", "buy", 0.1) for _ in range(3))
+        )
+
+        assert exchange.create_market_order.await_count == 3
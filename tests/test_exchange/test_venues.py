@@ -0,0 +1,307 @@
+"""Tests for the multi-venue exchange client."""
+
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from keryxflow.config import get_settings
+from keryxflow.core.events import EventType
+from keryxflow.exchange import BybitClient, get_exchange_adapter
+from keryxflow.exchange.adapter import ExchangeAdapter
+from keryxflow.exchange.venues import MultiVenueClient, get_multi_venue_client
+
+
+class FakeVenue(ExchangeAdapter):
+    """In-memory adapter with fixed quotes and balances."""
+
+    def __init__(self, quotes=None, balance=None, connect_ok=True):
+        self.quotes = quotes or {}
+        self.balance = balance or {"total": {}, "free": {}, "used": {}}
+        self.connect_ok = connect_ok
+        self.connected = False
+        self.orders: list[tuple] = []
+        self.ticker_calls = 0
+        self.ohlcv = AsyncMock(return_value=[[0, 1.0, 1.0, 1.0, 1.0, 1.0]])
+
+    async def connect(self) -> bool:
+        self.connected = self.connect_ok
+        return self.connect_ok
+
+    async def disconnect(self) -> None:
+        self.connected = False
+
+    @property
+    def is_connected(self) -> bool:
+        return self.connected
+
+    async def get_ticker(self, symbol):
+        self.ticker_calls += 1
+        if symbol not in self.quotes:
+            raise RuntimeError(f"{symbol} not listed")
+        bid, ask = self.quotes[symbol]
+        return {"symbol": symbol, "bid": bid, "ask": ask, "last": bid, "volume": 10.0}
+
+    async def get_ohlcv(self, symbol, timeframe="1h", limit=100, since=None):
+        return await self.ohlcv(symbol, timeframe, limit=limit, since=since)
+
+    async def get_balance(self):
+        return self.balance
+
+    async def get_order_book(self, symbol, _limit=10):
+        bid, ask = self.quotes[symbol]
+        return {"symbol": symbol, "bids": [[bid, 1.0]], "asks": [[ask, 1.0]], "timestamp": 0}
+
+    async def create_market_order(self, symbol, side, amount):
+        self.orders.append(("market", symbol, side, amount))
+        return {"id": f"m{len(self.orders)}", "symbol": symbol}
+
+    async def create_limit_order(self, symbol, side, amount, price):
+        self.orders.append(("limit", symbol, side, amount, price))
+        return {"id": f"l{len(self.orders)}", "symbol": symbol}
+
+    async def cancel_order(self, order_id, _symbol):
+        self.orders.append(("cancel", order_id))
+        return {"id": order_id, "status": "canceled"}
+
+    async def get_order(self, order_id, _symbol):
+        return {"id": order_id}
+
+    async def get_open_orders(self, symbol):
+        return [{"id": "open-1", "symbol": symbol}]
+
+    async def start_price_feed(self, symbols=None, interval=1.0):
+        pass
+
+    async def stop_price_feed(self):
+        pass
+
+
+@pytest.fixture
+def venues():
+    """Two venues quoting BTC at different prices; only one lists SOL."""
+    return {
+        "binance": FakeVenue(
+            quotes={"BTC/USDT": (50000.0, 50010.0), "SOL/USDT": (100.0, 100.1)},
+            balance={
+                "total": {"USDT": 1000.0, "BTC": 0.0},
+                "free": {"USDT": 1000.0, "BTC": 0.0},
+                "used": {},
+            },
+        ),
+        "bybit": FakeVenue(
+            quotes={"BTC/USDT": (50005.0, 50008.0)},
+            balance={
+                "total": {"USDT": 500.0, "BTC": 0.2},
+                "free": {"USDT": 400.0, "BTC": 0.2},
+                "used": {"USDT": 100.0},
+            },
+        ),
+    }
+
+
+@pytest.fixture
+async def client(venues):
+    """Connected multi-venue client."""
+    multi = MultiVenueClient(venues)
+    await multi.connect()
+    return multi
+
+
+class TestConnection:
+    """Tests for connecting several venues."""
+
+    async def test_partial_connect_keeps_working_venues(self, venues):
+        """A venue that fails to connect is left out; the rest trade."""
+        venues["bybit"].connect_ok = False
+        multi = MultiVenueClient(venues)
+
+        assert await multi.connect() is True
+        assert multi.connected_venues == ["binance"]
+
+    async def test_connect_failures_logged_with_reason(self, venues, monkeypatch):
+        """A False return and an exception are logged with distinct reasons."""
+        venues["bybit"].connect_ok = False
+        venues["binance"].connect = AsyncMock(side_effect=ConnectionError("timeout"))
+        warnings = []
+        monkeypatch.setattr(
+            "keryxflow.exchange.venues.logger.warning",
+            lambda event, **kw: warnings.append((event, kw)),
+        )
+
+        assert await MultiVenueClient(venues).connect() is False
+        errors = {kw["venue"]: kw["error"] for event, kw in warnings}
+        assert errors == {"binance": "timeout", "bybit": "connect() returned False"}
+
+    async def test_not_connected_raises(self, venues):
+        """Calls before connect() raise like the single-venue adapters."""
+        with pytest.raises(RuntimeError, match="Not connected"):
+            await MultiVenueClient(venues).get_ticker("BTC/USDT")
+
+    def test_unknown_primary_rejected(self, venues):
+        """The primary venue must be one of the venues."""
+        with pytest.raises(ValueError, match="Primary venue"):
+            MultiVenueClient(venues, primary="kraken")
+
+
+class TestConsolidatedView:
+    """Tests for merged quotes, books and balances."""
+
+    async def test_best_bid_and_ask_across_venues(self, client):
+        """The ticker carries the best side from each venue and their names."""
+        ticker = await client.get_ticker("BTC/USDT")
+
+        assert ticker["bid"] == 50005.0
+        assert ticker["bid_venue"] == "bybit"
+        assert ticker["ask"] == 50008.0
+        assert ticker["ask_venue"] == "bybit"
+        assert ticker["last"] == pytest.approx(50006.5)
+        assert ticker["volume"] == 20.0
+        assert set(ticker["venues"]) == {"binance", "bybit"}
+
+    async def test_symbol_on_one_venue(self, client):
+        """A venue that does not list a symbol is skipped."""
+        quotes = await client.refresh_quotes(["SOL/USDT"])
+
+        assert set(quotes["SOL/USDT"].quotes) == {"binance"}
+
+    async def test_unlisted_everywhere_raises(self, client):
+        """A symbol no venue quotes raises."""
+        with pytest.raises(RuntimeError, match="No venue"):
+            await client.get_ticker("DOGE/USDT")
+
+    async def test_merged_order_book(self, client):
+        """Levels from every venue are merged best first with their venue."""
+        book = await client.get_order_book("BTC/USDT", limit=2)
+
+        assert book["bids"] == [[50005.0, 1.0, "bybit"], [50000.0, 1.0, "binance"]]
+        assert book["asks"] == [[50008.0, 1.0, "bybit"], [50010.0, 1.0, "binance"]]
+
+    async def test_balances_summed_with_venue_split(self, client):
+        """Balances are summed per currency and kept per venue."""
+        balance = await client.get_balance()
+
+        assert balance["total"]["USDT"] == 1500.0
+        assert balance["free"]["USDT"] == 1400.0
+        assert balance["free"]["BTC"] == 0.2
+        assert balance["venues"]["bybit"]["free"]["USDT"] == 400.0
+        assert set(client.get_venue_balances()) == {"binance", "bybit"}
+
+    async def test_ohlcv_from_primary_with_fallback(self, client, venues):
+        """History comes from the primary venue, else the next one."""
+        await client.get_ohlcv("BTC/USDT", "1h", limit=5)
+        venues["binance"].ohlcv.assert_awaited_once()
+        venues["bybit"].ohlcv.assert_not_awaited()
+
+        venues["binance"].ohlcv.side_effect = RuntimeError("down")
+        await client.get_ohlcv("BTC/USDT", "1h", limit=5)
+        venues["bybit"].ohlcv.assert_awaited_once()
+
+
+class TestRouting:
+    """Tests for choosing the venue of an order."""
+
+    async def test_best_price_routing(self, client):
+        """Buys go to the lowest ask and sells to the highest bid."""
+        await client.refresh_quotes(["BTC/USDT"])
+
+        assert client.route("BTC/USDT", "buy") == "bybit"
+        assert client.route("BTC/USDT", "sell") == "bybit"
+
+    async def test_routing_skips_venues_short_of_funds(self, client):
+        """Known balances exclude venues that cannot pay for the order."""
+        await client.refresh_quotes(["BTC/USDT"])
+        await client.get_balance()
+
+        # bybit has 400 USDT free: 0.007 BTC fits, 0.01 BTC does not
+        assert client.route("BTC/USDT", "buy", 0.007) == "bybit"
+        assert client.route("BTC/USDT", "buy", 0.01) == "binance"
+        # Only bybit holds BTC to sell
+        assert client.route("BTC/USDT", "sell", 0.1) == "bybit"
+
+    async def test_primary_routing_and_unquoted_fallback(self, venues):
+        """Primary routing, or no quote yet, sends orders to the primary venue."""
+        multi = MultiVenueClient(venues, primary="binance", routing="primary")
+        await multi.connect()
+        await multi.refresh_quotes(["BTC/USDT"])
+
+        assert multi.route("BTC/USDT", "buy") == "binance"
+        assert MultiVenueClient(venues).route("ETH/USDT", "buy") == "binance"
+
+    async def test_orders_remember_their_venue(self, client, venues):
+        """Orders are tagged with their venue and later calls go back to it."""
+        await client.refresh_quotes(["BTC/USDT"])
+
+        order = await client.create_market_order("BTC/USDT", "buy", 0.001)
+        await client.cancel_order(order["id"], "BTC/USDT")
+
+        assert order["venue"] == "bybit"
+        assert venues["bybit"].orders == [
+            ("market", "BTC/USDT", "buy", 0.001),
+            ("cancel", order["id"]),
+        ]
+        assert venues["binance"].orders == []
+
+    async def test_explicit_venue_and_open_orders(self, client, venues):
+        """Callers can pin a venue; open orders come from all venues."""
+        order = await client.create_limit_order("BTC/USDT", "sell", 0.1, 51000.0, venue="binance")
+        open_orders = await client.get_open_orders("BTC/USDT")
+
+        assert order["venue"] == "binance"
+        assert venues["binance"].orders[0][0] == "limit"
+        assert sorted(o["venue"] for o in open_orders) == ["binance", "bybit"]
+
+        with pytest.raises(ValueError, match="Unknown venue"):
+            await client.create_market_order("BTC/USDT", "buy", 0.1, venue="kraken")
+
+
+class TestPriceFeed:
+    """Tests for the consolidated price feed."""
+
+    async def test_one_update_per_symbol(self, client):
+        """Each symbol is published once per round, at the consolidated price."""
+        published = []
+
+        async def capture(event):
+            published.append(event)
+
+        client.event_bus.publish = capture
+        await client.start_price_feed(symbols=["BTC/USDT", "SOL/USDT"], interval=0.5)
+        await asyncio.sleep(0.05)
+        await client.stop_price_feed()
+
+        assert [e.type for e in published] == [EventType.PRICE_UPDATE] * 2
+        by_symbol = {e.data["symbol"]: e.data["price"] for e in published}
+        assert by_symbol["BTC/USDT"] == pytest.approx(50006.5)
+        assert by_symbol["SOL/USDT"] == pytest.approx(100.05)
+
+
+class TestFactory:
+    """Tests for selecting multi-venue mode from settings."""
+
+    def test_adapter_factory_selects_multi_venue(self, monkeypatch):
+        """Two or more configured venues give the multi-venue client."""
+        settings = get_settings()
+        monkeypatch.setattr(settings.system, "venues", ["bybit", "okx"])
+
+        adapter = get_exchange_adapter(sandbox=True)
+
+        assert isinstance(adapter, MultiVenueClient)
+        assert list(adapter.venues) == ["bybit", "okx"]
+        assert adapter is get_multi_venue_client()
+
+    def test_single_venue_keeps_single_adapter(self, monkeypatch):
+        """A single venue selects that exchange's plain adapter."""
+        settings = get_settings()
+        monkeypatch.setattr(settings.system, "exchange", "binance")
+        monkeypatch.setattr(settings.system, "venues", ["bybit"])
+
+        assert isinstance(get_exchange_adapter(sandbox=True), BybitClient)
+
+    def test_unknown_venue_rejected(self, monkeypatch):
+        """Unsupported venue names fail early."""
+        settings = get_settings()
+        monkeypatch.setattr(settings.system, "venues", ["binance", "nowhere"])
+
+        with pytest.raises(ValueError, match="Unsupported exchange"):
+            get_multi_venue_client()
@@ -0,0 +1,264 @@
+"""Tests for the background notification pipeline."""
+
+import asyncio
+import json
+import time
+
+import httpx
+import pytest
+
+from keryxflow.core.events import Event, EventBus, EventType
+from keryxflow.notifications.base import (
+    BaseNotifier,
+    NotificationLevel,
+    NotificationMessage,
+    NotificationType,
+)
+from keryxflow.notifications.discord import DiscordNotifier
+from keryxflow.notifications.manager import NotificationManager
+from keryxflow.notifications.pipeline import NotificationChannel, RateLimiter, build_digest
+from keryxflow.notifications.telegram import TelegramNotifier
+
+
+class SlowNotifier(BaseNotifier):
+    """Notifier that takes a while to send and records what it got."""
+
+    RATE_LIMIT = (100, 1.0)
+
+    def __init__(self, name: str = "Slow", delay: float = 0.0, limited_once: bool = False):
+        super().__init__()
+        self._name = name
+        self._delay = delay
+        self._limited = limited_once
+        self.sent: list[NotificationMessage] = []
+
+    async def send(self, message: NotificationMessage) -> bool:
+        await asyncio.sleep(self._delay)
+        if self._limited:
+            self._limited = False
+            self.retry_after = 0.01
+            return False
+        self.sent.append(message)
+        return True
+
+    async def test_connection(self) -> bool:
+        return True
+
+    def get_name(self) -> str:
+        return self._name
+
+
+def fill(i: int, level: NotificationLevel = NotificationLevel.SUCCESS) -> NotificationMessage:
+    """Create an order-filled notification."""
+    return NotificationMessage(
+        title=f"Order Filled #{i}",
+        body="filled",
+        level=level,
+        notification_type=NotificationType.ORDER_FILLED,
+    )
+
+
+class TestRateLimiter:
+    """Tests for the token bucket."""
+
+    async def test_burst_then_wait(self):
+        """Tokens run out after the burst and refill over time."""
+        now = [0.0]
+        limiter = RateLimiter(2, 1.0, clock=lambda: now[0])
+
+        await limiter.acquire()
+        await limiter.acquire()
+        assert not limiter.available()
+
+        now[0] = 0.5
+        assert limiter.available()
+
+    async def test_block(self):
+        """block() holds sends regardless of tokens."""
+        now = [0.0]
+        limiter = RateLimiter(5, 1.0, clock=lambda: now[0])
+
+        limiter.block(3.0)
+        assert not limiter.available()
+        now[0] = 3.0
+        assert limiter.available()
+
+    async def test_paces_real_time(self):
+        """acquire() sleeps until the next token."""
+        limiter = RateLimiter(1, 0.05)
+        start = time.perf_counter()
+        for _ in range(3):
+            await limiter.acquire()
+
+        assert time.perf_counter() - start >= 0.09
+
+
+class TestDigest:
+    """Tests for digest building."""
+
+    def test_digest_summarizes(self):
+        """Digests list every title and take the most severe level."""
+        messages = [fill(i) for i in range(3)] + [fill(3, NotificationLevel.WARNING)]
+        digest = build_digest(messages)
+
+        assert digest.title == "📬 4 notifications"
+        assert all(f"Order Filled #{i}" in digest.body for i in range(4))
+        assert digest.level == NotificationLevel.WARNING
+        assert digest.metadata == {"Order Filled": 4}
+
+    def test_digest_truncated(self):
+        """Very large digests stay under provider message limits."""
+        digest = build_digest([fill(i) for i in range(1000)])
+
+        assert len(digest.body) < 4000
+        assert "more" in digest.body
+
+
+class TestNotificationChannel:
+    """Tests for per-notifier channels."""
+
+    async def test_burst_becomes_one_digest(self):
+        """20 fills queued within the batch window go out as one message."""
+        notifier = SlowNotifier()
+        channel = NotificationChannel(notifier, batch_window=0.05)
+        channel.start()
+
+        for i in range(20):
+            channel.put(fill(i))
+        await channel.stop()
+
+        assert len(notifier.sent) == 1
+        assert notifier.sent[0].title == "📬 20 notifications"
+        stats = channel.get_stats()
+        assert stats["delivered"] == 20
+        assert stats["digests"] == 1
+        assert stats["latency"]["p95_ms"] >= 50
+
+    async def test_urgent_not_digested(self):
+        """Critical alerts skip the batch window and are sent on their own."""
+        notifier = SlowNotifier()
+        channel = NotificationChannel(notifier, batch_window=10)
+        channel.start()
+
+        channel.put(fill(0, NotificationLevel.CRITICAL))
+        await asyncio.sleep(0.02)
+
+        assert [m.title for m in notifier.sent] == ["Order Filled #0"]
+        await channel.stop(timeout=0)
+
+    async def test_full_queue_drops_oldest(self):
+        """A full queue drops the oldest pending message."""
+        channel = NotificationChannel(SlowNotifier(), queue_size=3)
+
+        for i in range(5):
+            channel.put(fill(i))
+
+        stats = channel.get_stats()
+        assert stats["dropped"] == 2
+        assert stats["queued"] == 3
+
+    async def test_retry_after_honoured(self):
+        """A rate-limited send is retried after the provider's retry_after."""
+        notifier = SlowNotifier(limited_once=True)
+        channel = NotificationChannel(notifier, batch_window=0)
+        channel.start()
+
+        channel.put(fill(0))
+        await channel.stop()
+
+        assert len(notifier.sent) == 1
+        assert channel.get_stats()["retries"] == 1
+
+
+class TestManagerPipeline:
+    """Tests for NotificationManager background delivery."""
+
+    async def test_notify_is_concurrent(self):
+        """notify() sends to providers in parallel."""
+        manager = NotificationManager()
+        manager.add_notifier(SlowNotifier("A", delay=0.1))
+        manager.add_notifier(SlowNotifier("B", delay=0.1))
+
+        start = time.perf_counter()
+        results = await manager.notify(fill(0))
+
+        assert results == {"A": True, "B": True}
+        assert time.perf_counter() - start < 0.18
+
+    async def test_event_handlers_do_not_block(self):
+        """With the pipeline running, bus dispatch does not wait on providers."""
+        bus = EventBus()
+        slow = SlowNotifier(delay=0.5)
+        manager = NotificationManager(event_bus=bus, batch_window=0)
+        manager.add_notifier(slow)
+        manager.subscribe_to_events()
+        manager.start()
+
+        start = time.perf_counter()
+        await bus.publish_sync(Event(type=EventType.ORDER_FILLED, data={"symbol": "BTC/USDT"}))
+
+        assert time.perf_counter() - start < 0.1
+        assert manager.get_stats()["Slow"]["enqueued"] == 1
+
+        await manager.stop()
+        assert len(slow.sent) == 1
+        assert not manager.running
+
+
+class TestHttpStandIns:
+    """End-to-end delivery against local stand-ins for the provider APIs."""
+
+    @pytest.fixture
+    def telegram_api(self):
+        """Telegram Bot API stand-in that rate-limits the first request."""
+        state = {"calls": [], "limited": False}
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            if not state["limited"]:
+                state["limited"] = True
+                return httpx.Response(
+                    429,
+                    json={"ok": False, "parameters": {"retry_after": 0.01}},
+                )
+            state["calls"].append(json.loads(request.content))
+            return httpx.Response(200, json={"ok": True, "result": {"message_id": 1}})
+
+        state["client"] = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        return state
+
+    @pytest.fixture
+    def discord_api(self):
+        """Discord webhook stand-in."""
+        state = {"calls": []}
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            state["calls"].append(json.loads(request.content))
+            return httpx.Response(204)
+
+        state["client"] = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        return state
+
+    async def test_burst_delivered_to_both(self, telegram_api, discord_api):
+        """A burst of fills reaches each service as one digest."""
+        telegram = TelegramNotifier(
+            "token", "chat", api_base="http://telegram.local", client=telegram_api["client"]
+        )
+        discord = DiscordNotifier(
+            "http://discord.local/api/webhooks/1/x", client=discord_api["client"]
+        )
+        manager = NotificationManager(telegram=telegram, discord=discord, batch_window=0.05)
+        manager.start()
+
+        for i in range(20):
+            await manager.notify_order_filled("BTC/USDT", "buy", 0.01, 50000.0 + i)
+        await manager.stop()
+
+        assert len(telegram_api["calls"]) == 1
+        assert telegram_api["calls"][0]["text"].startswith("✅ **📬 20 notifications**")
+        assert len(discord_api["calls"]) == 1
+        assert discord_api["calls"][0]["embeds"][0]["title"] == "📬 20 notifications"
+
+        stats = manager.get_stats()
+        assert stats["Telegram"]["retries"] == 1
+        assert stats["Discord"]["delivered"] == 20
+        await manager.close()
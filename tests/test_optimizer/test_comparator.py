@@ -16,6 +16,7 @@ def make_result(
     total_trades: int = 10,
     rsi_period: int = 14,
     risk_per_trade: float = 0.01,
+    prune_reason: str | None = None,
 ) -> OptimizationResult:
     """Helper to create OptimizationResult for testing."""
     metrics = BacktestResult(
@@ -35,6 +36,8 @@ def make_result(
         sharpe_ratio=sharpe,
         trades=[],
         equity_curve=[10000.0],
+        pruned=prune_reason is not None,
+        prune_reason=prune_reason,
     )
 
     return OptimizationResult(
@@ -220,3 +223,57 @@ class TestResultComparator:
         assert comparator.all_sensitivities() == {}
         assert comparator.metrics_summary() == {}
         assert comparator.best_parameters() == {}
+
+
+class TestResultComparatorPruning:
+    """Tests for handling pruned results."""
+
+    def test_pruned_rank_last(self):
+        """Pruned runs rank after completed runs regardless of metric."""
+        results = [
+            make_result(sharpe=3.0, prune_reason="max_drawdown"),
+            make_result(sharpe=1.0),
+            make_result(sharpe=2.0),
+        ]
+
+        ranked = ResultComparator(results).rank_by_metric("sharpe_ratio")
+
+        assert [r.metrics.sharpe_ratio for r in ranked] == [2.0, 1.0, 3.0]
+        assert ranked[-1].pruned is True
+
+    def test_pruned_rank_last_lower_is_better(self):
+        """Pruned runs rank last for lower-is-better metrics too."""
+        results = [
+            make_result(max_drawdown=0.01, prune_reason="min_trades"),
+            make_result(max_drawdown=0.1),
+        ]
+
+        ranked = ResultComparator(results).rank_by_metric("max_drawdown")
+
+        assert ranked[0].pruned is False
+        assert ranked[1].pruned is True
+
+    def test_completed_and_pruned_split(self):
+        """Results are split into completed and pruned groups."""
+        results = [
+            make_result(),
+            make_result(prune_reason="min_equity"),
+        ]
+
+        comparator = ResultComparator(results)
+
+        assert len(comparator.completed()) == 1
+        assert len(comparator.pruned()) == 1
+        assert comparator.pruned()[0].metrics.prune_reason == "min_equity"
+
+    def test_filter_excludes_pruned(self):
+        """filter_by can drop pruned runs."""
+        results = [
+            make_result(),
+            make_result(prune_reason="max_drawdown"),
+        ]
+
+        comparator = ResultComparator(results)
+
+        assert len(comparator.filter_by()) == 2
+        assert len(comparator.filter_by(include_pruned=False)) == 1
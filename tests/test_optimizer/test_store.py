@@ -0,0 +1,151 @@
+"""Tests for the streaming optimization result store."""
+
+from datetime import UTC, datetime
+
+import pytest
+
+from keryxflow.backtester.report import BacktestResult
+from keryxflow.optimizer.comparator import ResultComparator
+from keryxflow.optimizer.engine import OptimizationEngine, OptimizationResult
+from keryxflow.optimizer.grid import ParameterGrid, ParameterRange
+from keryxflow.optimizer.report import OptimizationReport
+from keryxflow.optimizer.store import ResultStore, rank_key
+from tests.test_optimizer.test_engine import generate_sample_data
+
+
+def make_result(
+    run_index: int,
+    sharpe: float = 1.0,
+    max_drawdown: float = 0.1,
+    prune_reason: str | None = None,
+) -> OptimizationResult:
+    """Helper to create an OptimizationResult with raw data attached."""
+    metrics = BacktestResult(
+        initial_balance=10000.0,
+        final_balance=11000.0,
+        total_return=0.1,
+        total_trades=10,
+        winning_trades=6,
+        losing_trades=4,
+        win_rate=0.6,
+        avg_win=100.0,
+        avg_loss=50.0,
+        expectancy=40.0,
+        profit_factor=2.0,
+        max_drawdown=max_drawdown,
+        max_drawdown_duration=5,
+        sharpe_ratio=sharpe,
+        trades=[],
+        equity_curve=[10000.0, 10500.0, 11000.0],
+        pruned=prune_reason is not None,
+        prune_reason=prune_reason,
+    )
+
+    return OptimizationResult(
+        parameters={"oracle": {"rsi_period": 7 + run_index}, "risk": {}},
+        metrics=metrics,
+        run_time=0.5,
+        run_index=run_index,
+    )
+
+
+class TestRankKey:
+    """Tests for rank_key ordering."""
+
+    def test_higher_is_better(self):
+        """Higher Sharpe ranks higher."""
+        assert rank_key(make_result(0, sharpe=2.0), "sharpe_ratio") > rank_key(
+            make_result(1, sharpe=1.0), "sharpe_ratio"
+        )
+
+    def test_lower_is_better(self):
+        """Lower drawdown ranks higher."""
+        assert rank_key(make_result(0, max_drawdown=0.05), "max_drawdown") > rank_key(
+            make_result(1, max_drawdown=0.2), "max_drawdown"
+        )
+
+    def test_pruned_below_completed(self):
+        """Pruned runs rank below completed runs."""
+        pruned = make_result(0, sharpe=5.0, prune_reason="max_drawdown")
+        completed = make_result(1, sharpe=0.1)
+
+        assert rank_key(completed, "sharpe_ratio") > rank_key(pruned, "sharpe_ratio")
+
+
+class TestResultStore:
+    """Tests for ResultStore."""
+
+    def test_leaderboard_bounded(self, tmp_path):
+        """Only top_k results are kept in memory."""
+        with ResultStore(tmp_path / "opt.jsonl", top_k=3) as store:
+            for i, sharpe in enumerate([0.5, 2.0, 1.0, 3.0, 0.1, 1.5]):
+                store.add(make_result(i, sharpe=sharpe))
+
+            board = store.leaderboard()
+
+        assert len(store) == 6
+        assert [r.metrics.sharpe_ratio for r in board] == [3.0, 2.0, 1.5]
+
+    def test_file_round_trip(self, tmp_path):
+        """All runs are readable from the file; top-K keep raw data."""
+        path = tmp_path / "opt.jsonl"
+        with ResultStore(path, top_k=1) as store:
+            store.add(make_result(0, sharpe=1.0))
+            store.add(make_result(1, sharpe=2.0, prune_reason="min_trades"))
+            store.add(make_result(2, sharpe=3.0))
+
+        loaded = ResultStore.load(path)
+
+        assert [r.run_index for r in loaded] == [0, 1, 2]
+        assert loaded[1].pruned is True
+        assert loaded[1].metrics.prune_reason == "min_trades"
+        # Run 2 is the top-1 and keeps its equity curve
+        assert loaded[2].metrics.equity_curve == [10000.0, 10500.0, 11000.0]
+        assert loaded[0].metrics.equity_curve == []
+        assert loaded[0].parameters == {"oracle": {"rsi_period": 7}, "risk": {}}
+
+    def test_infinite_metric_round_trip(self, tmp_path):
+        """Infinite profit factor survives serialization."""
+        path = tmp_path / "opt.jsonl"
+        result = make_result(0)
+        result.metrics.profit_factor = float("inf")
+
+        with ResultStore(path, top_k=0) as store:
+            store.add(result)
+
+        assert ResultStore.load(path)[0].metrics.profit_factor == float("inf")
+
+    def test_report_and_comparator_from_file(self, tmp_path):
+        """Report and comparator can be built from the stored file."""
+        path = tmp_path / "opt.jsonl"
+        with ResultStore(path, top_k=2) as store:
+            for i, sharpe in enumerate([1.0, 2.0, 0.5]):
+                store.add(make_result(i, sharpe=sharpe))
+
+        comparator = ResultComparator.from_file(path)
+        report = OptimizationReport.from_file(path)
+
+        assert comparator.top_n(1)[0].metrics.sharpe_ratio == 2.0
+        assert "OPTIMIZATION REPORT" in report.print_summary()
+
+        csv_path = tmp_path / "results.csv"
+        report.save_csv(csv_path)
+        assert len(csv_path.read_text().strip().split("\n")) == 4
+
+
+class TestOptimizationEngineStreaming:
+    """Tests for OptimizationEngine with a ResultStore."""
+
+    @pytest.mark.asyncio
+    async def test_optimize_streams_to_store(self, tmp_path):
+        """Results are written to the store and the leaderboard is returned."""
+        start = datetime(2024, 1, 1, tzinfo=UTC)
+        data = {"BTC/USDT": generate_sample_data(start)}
+        grid = ParameterGrid([ParameterRange("rsi_period", [7, 14, 21], "oracle")])
+        path = tmp_path / "opt.jsonl"
+
+        with ResultStore(path, top_k=2) as store:
+            results = await OptimizationEngine().optimize(data, grid, store=store)
+
+        assert len(results) == 2
+        assert len(ResultStore.load(path)) == 3
@@ -439,6 +439,30 @@ class TestSignalGenerator:
         assert "NO_ACTION" in formatted
         assert "No clear opportunity" in formatted
 
+    async def test_executor_runs_analysis_off_loop(self, sample_ohlcv, bullish_technical, mocker):
+        """With an executor set, technical analysis runs in a worker thread."""
+        import threading
+        from concurrent.futures import ThreadPoolExecutor
+
+        threads = []
+
+        def analyze(_ohlcv, _symbol):
+            threads.append(threading.current_thread().name)
+            return bullish_technical
+
+        technical = mocker.MagicMock()
+        technical.analyze = analyze
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="analysis") as pool:
+            generator = SignalGenerator(
+                technical_analyzer=technical, publish_events=False, executor=pool
+            )
+            signal = await generator.generate_signal(
+                "BTC/USDT", sample_ohlcv, include_news=False, include_llm=False
+            )
+
+        assert signal.signal_type == SignalType.LONG
+        assert threads[0].startswith("analysis")
+
 
 class TestSignalIntegration:
     """Integration tests for signal generation."""